@@ -0,0 +1,135 @@
+"""로그인 폭주 벤치마크
+
+1. 해셔별 비밀번호 확인 한 번의 비용 (Django 기본 PBKDF2와 조정한 scrypt)
+2. 여러 스레드가 같은 사용자 이름으로 잘못된 비밀번호를 계속 보내는 동안
+   다른 스레드가 메모 목록을 요청할 때의 지연시간.
+   보호 없음(시도 제한 없음, 큰 해시 풀)과 기본 설정을 비교합니다.
+
+    python -m benchmarks.login_protection --threads 8 --attempts 20
+"""
+import argparse
+import logging
+import statistics
+import threading
+import time
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def _hash_costs():
+    """해셔별 비밀번호 확인 지연시간"""
+    from django.contrib.auth.hashers import PBKDF2PasswordHasher, get_hasher
+
+    rows = []
+    hashers = (
+        ("pbkdf2 (django default)", PBKDF2PasswordHasher()),
+        ("scrypt (tuned, pooled)", get_hasher("scrypt")),
+    )
+    for label, hasher in hashers:
+        encoded = hasher.encode("benchmark-password", hasher.salt())
+        stats = measure(lambda: hasher.verify("wrong-password", encoded), repeat=10)
+        rows.append((label, f"{stats['median']:.1f}", f"{stats['p95']:.1f}"))
+    print_table(["hasher", "median ms", "p95 ms"], rows)
+
+
+def _flood(user, threads, attempts):
+    """로그인 폭주 중 메모 목록 지연시간과 폭주 처리 결과를 반환"""
+    from django.test import Client
+    from django.urls import reverse
+
+    statuses = []
+    lock = threading.Lock()
+
+    def attacker(index):
+        client = Client(REMOTE_ADDR=f"10.0.0.{index}")
+        for _ in range(attempts):
+            status = client.post(
+                reverse("login"), {"username": user.username, "password": "wrong"}
+            ).status_code
+            with lock:
+                statuses.append(status)
+
+    reader = Client()
+    reader.force_login(user)
+    done = threading.Event()
+    latencies = []
+
+    def read():
+        while not done.is_set():
+            started = time.perf_counter()
+            reader.get(reverse("memo_list"))
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    reader_thread = threading.Thread(target=read)
+    workers = [threading.Thread(target=attacker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    reader_thread.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    reader_thread.join()
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "rejected": sum(1 for status in statuses if status in (429, 503)),
+        "hashed": sum(1 for status in statuses if status == 200),
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95)],
+    }
+
+
+def run(threads, attempts):
+    from django.test import override_settings
+    from memojjang.apps.memos.models import Memo
+    from memojjang.apps.users.hashers import hashing_pool
+    from memojjang.apps.users.ratelimit import memory_limiter
+
+    # 거절된 로그인마다 남는 "Too Many Requests" 경고는 숨김
+    logging.getLogger("django.request").setLevel(logging.ERROR)
+    _hash_costs()
+    print()
+    configs = (
+        ("unprotected", {
+            "MEMO_LOGIN_RATE_LIMITS": {}, "MEMO_PASSWORD_HASH_WORKERS": threads,
+            "MEMO_PASSWORD_HASH_QUEUE": threads,
+        }),
+        ("rate limit + pool", {}),
+    )
+    rows = []
+    with benchmark_database():
+        user = create_bench_user()
+        user.set_password("benchmark-password")
+        user.save()
+        Memo.objects.bulk_create(
+            Memo(user=user, title=f"메모 {i}", content="로그인 폭주 벤치마크") for i in range(50)
+        )
+        for label, overrides in configs:
+            memory_limiter.reset()
+            hashing_pool.shutdown()
+            with override_settings(**overrides):
+                result = _flood(user, threads, attempts)
+            hashing_pool.shutdown()
+            rows.append((
+                label, f"{result['elapsed']:.2f}", result["hashed"], result["rejected"],
+                f"{result['p50']:.1f}", f"{result['p95']:.1f}",
+            ))
+    print_table(
+        ["config", "flood s", "hashed", "rejected", "list p50 ms", "list p95 ms"], rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--attempts", type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+    run(args.threads, args.attempts)
+
+
+if __name__ == "__main__":
+    main()
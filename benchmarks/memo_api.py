@@ -0,0 +1,64 @@
+"""메모 JSON API와 HTML 뷰 비교 벤치마크
+
+같은 사용자의 메모 목록과 상세를 HTML 뷰와 JSON API로 반복 요청해
+요청당 지연시간, 처리량(req/s), 응답 크기를 비교합니다.
+HTML 목록은 목록 캐시를 끈 경우와 켠 경우를 모두 측정합니다.
+
+    python -m benchmarks.memo_api --memos 500 --repeat 200
+"""
+import argparse
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def run(memo_count, repeat):
+    """엔드포인트별 지연시간과 처리량 측정"""
+    from django.core.cache import cache
+    from django.test import Client, override_settings
+    from memojjang.apps.memos.models import Memo
+
+    rows = []
+    with benchmark_database():
+        user = create_bench_user()
+        Memo.objects.bulk_create(
+            Memo(user=user, title=f"메모 {i}", content="API 벤치마크 내용 " * 50)
+            for i in range(memo_count)
+        )
+        memo = Memo.objects.filter(user=user).first()
+        client = Client()
+        client.force_login(user)
+        cases = (
+            ("html list (no cache)", "/memos/", 0),
+            ("html list (cached)", "/memos/", 300),
+            ("json list", "/api/memos/", 0),
+            ("json list ?fields=id,title", "/api/memos/?fields=id,title", 0),
+            ("html detail", f"/memos/{memo.pk}/", 0),
+            ("json detail", f"/api/memos/{memo.pk}/", 0),
+        )
+        for label, url, timeout in cases:
+            cache.clear()
+            with override_settings(MEMO_LIST_CACHE_TIMEOUT=timeout):
+                size = len(client.get(url).content)
+                stats = measure(lambda: client.get(url), repeat=repeat)
+            rows.append((
+                label,
+                f"{stats['median']:.2f}",
+                f"{stats['p95']:.2f}",
+                f"{1000 / stats['median']:.0f}",
+                size,
+            ))
+    print_table(["endpoint", "median ms", "p95 ms", "req/s", "bytes"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memos", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    setup_django()
+    run(args.memos, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
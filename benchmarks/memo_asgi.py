@@ -0,0 +1,216 @@
+"""WSGI와 ASGI 동시 접속 벤치마크
+
+같은 데이터베이스를 WSGI 서버(Django의 스레드 WSGI 서버, 연결당 스레드 하나)와
+ASGI 서버(uvicorn)로 차례로 띄우고, 별도 프로세스의 asyncio 클라이언트가
+keep-alive 연결 1,000개로 동시에 요청해 지연시간 백분위수를 비교합니다.
+ASGI는 동기 뷰 그대로인 경우와 MEMO_ASYNC_VIEWS = True인 경우를 모두 잽니다.
+
+    pip install uvicorn
+    python -m benchmarks.memo_asgi --connections 1000 --duration 10
+"""
+import argparse
+import asyncio
+import importlib
+import multiprocessing
+import resource
+import socket
+import statistics
+import threading
+import time
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, print_table, setup_django
+)
+
+
+async def _connection(host, port, path, cookie, deadline, samples, errors):
+    """연결 하나로 마감 시각까지 요청을 반복하고 지연시간을 기록"""
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nCookie: {cookie}\r\n\r\n"
+    ).encode()
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        errors.append(1)
+        return
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(request)
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            if not status_line.startswith(b"HTTP/1.1 200"):
+                errors.append(1)
+                break
+            samples.append((time.perf_counter() - started) * 1000)
+    except (OSError, asyncio.IncompleteReadError):
+        errors.append(1)
+    finally:
+        writer.close()
+
+
+def _load(host, port, path, cookie, connections, duration, queue):
+    """동시 연결을 열어 부하를 주고 (지연시간 목록, 오류 수)를 큐에 넣음"""
+    async def main():
+        samples, errors = [], []
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(
+            _connection(host, port, path, cookie, deadline, samples, errors)
+            for _ in range(connections)
+        ))
+        return samples, len(errors)
+
+    queue.put(asyncio.run(main()))
+
+
+def _run_load(port, path, cookie, connections, duration):
+    """클라이언트 프로세스로 부하를 주고 (처리량, p50, p95, p99, 오류 수)를 반환"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(
+        target=_load,
+        args=("127.0.0.1", port, path, cookie, connections, duration, queue),
+    )
+    process.start()
+    samples, errors = queue.get()
+    process.join()
+    if not samples:
+        return 0, 0, 0, 0, errors
+    samples.sort()
+    return (
+        len(samples) / duration,
+        statistics.median(samples),
+        samples[int(len(samples) * 0.95)],
+        samples[int(len(samples) * 0.99)],
+        errors,
+    )
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_wsgi(port):
+    """스레드 WSGI 서버를 띄우고 종료 함수를 반환"""
+    from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+    from django.core.wsgi import get_wsgi_application
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    class Server(ThreadedWSGIServer):
+        request_queue_size = 2048
+
+    server = Server(("127.0.0.1", port), QuietHandler)
+    server.set_app(get_wsgi_application())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop():
+        server.shutdown()
+        server.server_close()
+    return stop
+
+
+def _start_asgi(port):
+    """uvicorn으로 ASGI 서버를 띄우고 종료 함수를 반환"""
+    import uvicorn
+    from django.core.asgi import get_asgi_application
+
+    config = uvicorn.Config(
+        get_asgi_application(), host="127.0.0.1", port=port,
+        backlog=2048, lifespan="off", log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    def stop():
+        server.should_exit = True
+        thread.join()
+    return stop
+
+
+def _use_async_views(enabled):
+    """MEMO_ASYNC_VIEWS를 바꾸고 URL 설정을 다시 불러옴"""
+    from django.conf import settings
+    from django.urls import clear_url_caches
+    import memojjang.urls
+
+    settings.MEMO_ASYNC_VIEWS = enabled
+    importlib.reload(memojjang.urls)
+    clear_url_caches()
+
+
+def run(connections, duration, memo_count, paths):
+    """서버 종류별 동시 접속 지연시간 측정"""
+    from django.conf import settings
+    from django.test import Client, override_settings
+    from memojjang.apps.memos.models import Memo
+
+    # 클라이언트 연결과 서버 연결이 모두 파일 디스크립터를 쓰므로 한도를 올림
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    rows = []
+    with benchmark_database(), override_settings(ALLOWED_HOSTS=["127.0.0.1"]):
+        user = create_bench_user()
+        Memo.objects.bulk_create(
+            Memo(user=user, title=f"메모 {i}", content="동시 접속 벤치마크 " * 30)
+            for i in range(memo_count)
+        )
+        client = Client()
+        client.force_login(user)
+        cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+        servers = (
+            ("wsgi", _start_wsgi, False),
+            ("asgi sync views", _start_asgi, False),
+            ("asgi async views", _start_asgi, True),
+        )
+        try:
+            for label, start, async_views in servers:
+                _use_async_views(async_views)
+                port = _free_port()
+                stop = start(port)
+                try:
+                    for path in paths:
+                        throughput, p50, p95, p99, errors = _run_load(
+                            port, path, cookie, connections, duration
+                        )
+                        rows.append((
+                            label, path, f"{throughput:.0f}",
+                            f"{p50:.1f}", f"{p95:.1f}", f"{p99:.1f}", errors,
+                        ))
+                finally:
+                    stop()
+        finally:
+            _use_async_views(False)
+    print_table(["server", "path", "req/s", "p50 ms", "p95 ms", "p99 ms", "errors"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--memos", type=int, default=100)
+    parser.add_argument(
+        "--paths", nargs="+", default=["/memos/", "/api/memos/?fields=id,title"]
+    )
+    args = parser.parse_args()
+    setup_django()
+    run(args.connections, args.duration, args.memos, args.paths)
+
+
+if __name__ == "__main__":
+    main()
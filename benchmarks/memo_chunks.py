@@ -0,0 +1,98 @@
+"""긴 메모 본문 청크 저장 벤치마크
+
+수 MB짜리 메모를 청크로 나누지 않고 저장한 경우와 청크로 나눠 저장한 경우의
+상세 페이지 응답(지연시간, 응답 크기, 요청 중 최대 Python 메모리 할당)과
+본문 일부를 고치는 시간과 최대 메모리를 비교합니다. 청크로 나눈 경우에는 나머지 청크를
+하나 읽는 요청도 잽니다.
+
+    python -m benchmarks.memo_chunks --megabytes 5
+"""
+import argparse
+import time
+import tracemalloc
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def _content(megabytes):
+    """로그를 붙여 넣은 것 같은 긴 본문"""
+    line = "2026-10-17 12:00:00 INFO worker-1 요청 처리 완료 (12ms) 응답 본문 크기 2048바이트\n"
+    return line * (megabytes * 2**20 // len(line.encode()))
+
+
+def _peak_kib(func):
+    """func 실행 중 최대 Python 메모리 할당량(KiB)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(megabytes, repeat):
+    from django.test import Client, override_settings
+    from memojjang.apps.memos import chunks
+    from memojjang.apps.memos.models import Memo
+
+    content = _content(megabytes)
+    rows = []
+    with benchmark_database():
+        user = create_bench_user()
+        client = Client()
+        client.force_login(user)
+        # 청크 크기를 본문보다 크게 해 청크로 나누지 않은 메모를 만듦
+        with override_settings(MEMO_CONTENT_CHUNK_SIZE=len(content) + 1):
+            whole = Memo.objects.create(user=user, title="통째로 저장", content=content)
+        chunked = Memo.objects.create(user=user, title="청크로 저장", content=content)
+
+        cases = (
+            ("detail (whole)", f"/memos/{whole.pk}/"),
+            ("detail (chunked)", f"/memos/{chunked.pk}/"),
+            ("next chunk", f"/memos/{chunked.pk}/chunks/1/"),
+        )
+        for label, url in cases:
+            size = len(client.get(url).content)
+            stats = measure(lambda: client.get(url), repeat=repeat, warmup=1)
+            peak = _peak_kib(lambda: client.get(url))
+            rows.append((
+                label, f"{stats['median']:.1f}", f"{stats['p95']:.1f}", f"{size // 1024}", peak
+            ))
+        print(f"content: {len(content.encode()) / 2**20:.1f} MB, chunks: {chunked.chunk_count}")
+        print()
+        print_table(["request", "median ms", "p95 ms", "response KiB", "peak KiB"], rows)
+        print()
+
+        # 본문 가운데 한 줄을 고치는 시간과 최대 메모리 (검색 색인과 수정 기록 저장 포함)
+        def edit_whole():
+            memo = Memo.objects.get(pk=whole.pk)
+            middle = len(memo.content) // 2
+            memo.content = memo.content[:middle] + "고친 줄\n" + memo.content[middle:]
+            with override_settings(MEMO_CONTENT_CHUNK_SIZE=len(memo.content) + 1):
+                memo.save()
+
+        def edit_chunk():
+            memo = Memo.objects.only("id", "user_id", "title", "chunk_count").get(pk=chunked.pk)
+            number = memo.chunk_count // 2
+            chunks.write_chunk(memo, number, "고친 줄" + chunks.read_chunk(memo, number))
+
+        rows = []
+        for label, edit in (("whole body", edit_whole), ("one chunk", edit_chunk)):
+            started = time.perf_counter()
+            edit()
+            elapsed = (time.perf_counter() - started) * 1000
+            rows.append((label, f"{elapsed:.1f}", _peak_kib(edit)))
+        print_table(["edit", "ms", "peak KiB"], rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    setup_django()
+    run(args.megabytes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
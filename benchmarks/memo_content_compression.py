@@ -0,0 +1,120 @@
+"""큰 메모 본문 압축 저장 벤치마크
+
+로그처럼 큰 본문을 가진 메모를 압축 없이 저장한 뒤, compress_memo_content
+명령으로 압축하기 전과 후의 데이터베이스 크기와 조회 시간을 비교합니다.
+
+- table scan: 본문 뒤에 있는 컬럼(excerpt)으로 memos 테이블 전체를 훑는 조회
+  (SQLite는 앞 컬럼의 오버플로 페이지를 따라가야 뒤 컬럼을 읽을 수 있음)
+- list page: 목록 첫 페이지 (for_list, 본문을 읽지 않음)
+- detail: 메모 한 건의 본문 읽기 (압축 해제 포함)
+
+    python -m benchmarks.memo_content_compression --memos 2000 --kilobytes 20
+"""
+import argparse
+import random
+import time
+from io import StringIO
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def _content(index, kilobytes):
+    """로그를 붙여 넣은 것 같은 본문"""
+    lines = []
+    size = 0
+    line_number = 0
+    while size < kilobytes * 1024:
+        line = (
+            f"2026-10-17 12:{line_number // 60 % 60:02d}:{line_number % 60:02d} "
+            f"INFO worker-{index % 8} 요청 {line_number} 처리 완료 ({line_number * 7 % 997}ms)"
+        )
+        lines.append(line)
+        size += len(line.encode()) + 1
+        line_number += 1
+    return "\n".join(lines)
+
+
+def _table_size(connection):
+    """VACUUM 후 memos 테이블이 차지하는 바이트 수 (dbstat 가상 테이블)"""
+    with connection.cursor() as cursor:
+        cursor.execute("VACUUM")
+        cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = 'memos'")
+        return cursor.fetchone()[0]
+
+
+def _measure_queries(user, pks, repeat):
+    from memojjang.apps.memos.models import Memo
+    from memojjang.apps.memos.pagination import CursorPaginator
+
+    picker = random.Random(0)
+    results = {}
+    results["table scan"] = measure(
+        lambda: Memo.objects.filter(excerpt__contains="없는 문자열").count(), repeat=repeat
+    )
+    results["list page"] = measure(
+        lambda: list(CursorPaginator(Memo.objects.for_list().filter(user=user)).page()),
+        repeat=repeat,
+    )
+    results["detail"] = measure(
+        lambda: Memo.objects.get(pk=picker.choice(pks)).content, repeat=repeat
+    )
+    return results
+
+
+def run(memo_count, kilobytes, repeat):
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test import override_settings
+    from memojjang.apps.memos.models import Memo
+
+    with benchmark_database():
+        user = create_bench_user()
+        with override_settings(MEMO_CONTENT_COMPRESS_MIN_BYTES=None):
+            for start in range(0, memo_count, 500):
+                Memo.objects.bulk_create(
+                    Memo(user=user, title=f"로그 {i}", content=_content(i, kilobytes))
+                    for i in range(start, min(start + 500, memo_count))
+                )
+        pks = list(Memo.objects.values_list("pk", flat=True))
+
+        size_before = _table_size(connection)
+        before = _measure_queries(user, pks, repeat)
+        started = time.perf_counter()
+        call_command("compress_memo_content", stdout=StringIO())
+        backfill_seconds = time.perf_counter() - started
+        size_after = _table_size(connection)
+        after = _measure_queries(user, pks, repeat)
+
+    print(f"memos: {memo_count}, content: {kilobytes} KB, backfill: {backfill_seconds:.2f}s")
+    print()
+    print_table(
+        ["storage", "memos table MB"],
+        [("text", f"{size_before / 2**20:.1f}"), ("compressed", f"{size_after / 2**20:.1f}")],
+    )
+    print()
+    print_table(
+        ["query", "text median ms", "compressed median ms", "text p95", "compressed p95"],
+        [
+            (
+                name,
+                f"{before[name]['median']:.2f}", f"{after[name]['median']:.2f}",
+                f"{before[name]['p95']:.2f}", f"{after[name]['p95']:.2f}",
+            )
+            for name in before
+        ],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memos", type=int, default=2000)
+    parser.add_argument("--kilobytes", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    setup_django()
+    run(args.memos, args.kilobytes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
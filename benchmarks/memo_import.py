@@ -0,0 +1,72 @@
+"""메모 가져오기 벤치마크
+
+합성 NDJSON 파일을 만든 뒤 배치 크기별로 가져오기 처리량(rows/s)과
+tracemalloc으로 잰 최대 메모리 사용량을 비교합니다.
+
+    python -m benchmarks.memo_import --rows 50000 --batch-sizes 100 1000 5000
+"""
+import argparse
+import json
+import tempfile
+import tracemalloc
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, print_table, setup_django
+)
+
+
+def _write_file(file, rows):
+    """합성 메모를 NDJSON으로 기록하고 파일 크기를 반환"""
+    content = "가져오기 벤치마크용 메모 본문입니다. " * 20
+    for i in range(rows):
+        record = {"title": f"메모 {i}", "content": content, "is_reminded": False}
+        file.write((json.dumps(record, ensure_ascii=False) + "\n").encode())
+    file.flush()
+    return file.tell()
+
+
+def run(rows, batch_sizes, trace):
+    """배치 크기별 가져오기 처리량 측정"""
+    from memojjang.apps.memos import importer
+    from memojjang.apps.memos.models import Memo
+
+    result_rows = []
+    with benchmark_database(), tempfile.NamedTemporaryFile(suffix=".ndjson") as file:
+        size = _write_file(file, rows)
+        print(f"입력 파일: {rows}행, {size / 1024 / 1024:.1f}MB")
+        for batch_size in batch_sizes:
+            user = create_bench_user(f"bench{batch_size}")
+            if trace:
+                tracemalloc.start()
+            with open(file.name, "rb") as stream:
+                result = importer.import_memos(
+                    user, importer.read_records(stream), batch_size=batch_size
+                )
+            peak = tracemalloc.get_traced_memory()[1] if trace else 0
+            if trace:
+                tracemalloc.stop()
+            assert result.created == Memo.objects.filter(user=user).count() == rows
+            result_rows.append((
+                batch_size,
+                f"{result.elapsed:.2f}",
+                f"{result.rows_per_second:.0f}",
+                f"{peak / 1024 / 1024:.1f}" if trace else "-",
+            ))
+    print_table(["batch", "seconds", "rows/s", "peak MB"], result_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument(
+        "--no-trace",
+        action="store_true",
+        help="tracemalloc 없이 측정 (처리량이 더 정확함)"
+    )
+    args = parser.parse_args()
+    setup_django()
+    run(args.rows, args.batch_sizes, not args.no_trace)
+
+
+if __name__ == "__main__":
+    main()
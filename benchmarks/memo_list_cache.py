@@ -0,0 +1,102 @@
+"""메모 목록 캐시 부하 테스트
+
+로그인한 사용자들이 메모 목록 첫 페이지를 반복 요청할 때의 처리량(req/s)과
+지연시간을 목록 캐시를 끈 경우와 켠 경우로 비교합니다.
+
+    python -m benchmarks.memo_list_cache --users 20 --memos 500 --duration 5
+"""
+import argparse
+import statistics
+import threading
+import time
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, print_table, setup_django
+)
+
+
+def _worker(user, deadline, samples, lock):
+    """마감 시각까지 목록을 반복 요청하고 지연시간을 기록"""
+    from django.db import connection
+    from django.test import Client
+
+    client = Client()
+    client.force_login(user)
+    local = []
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = client.get("/memos/")
+        assert response.status_code == 200
+        local.append((time.perf_counter() - started) * 1000)
+    with lock:
+        samples.extend(local)
+    connection.close()
+
+
+def _run_load(users, concurrency, duration):
+    """동시 요청을 실행하고 (처리량, p50, p95)를 반환"""
+    samples = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=_worker, args=(users[i % len(users)], deadline, samples, lock)
+        )
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    samples.sort()
+    return (
+        len(samples) / duration,
+        statistics.median(samples),
+        samples[int(len(samples) * 0.95)],
+    )
+
+
+def run(user_count, memos_per_user, concurrency, duration):
+    """캐시 사용 여부별 부하 테스트"""
+    from django.core.cache import cache
+    from django.test import override_settings
+    from memojjang.apps.memos.models import Memo
+    from memojjang.apps.memos.cache import list_cache_stats
+
+    rows = []
+    with benchmark_database():
+        users = [create_bench_user(f"bench{i}") for i in range(user_count)]
+        for user in users:
+            Memo.objects.bulk_create(
+                Memo(user=user, title=f"메모 {i}", content="부하 테스트 내용 " * 50)
+                for i in range(memos_per_user)
+            )
+        for label, timeout in (("cache off", 0), ("cache on", 300)):
+            cache.clear()
+            list_cache_stats.reset()
+            with override_settings(MEMO_LIST_CACHE_TIMEOUT=timeout):
+                throughput, p50, p95 = _run_load(users, concurrency, duration)
+            stats = list_cache_stats.as_dict()
+            rows.append((
+                label,
+                f"{throughput:.1f}",
+                f"{p50:.2f}",
+                f"{p95:.2f}",
+                stats["hits"],
+                stats["misses"],
+            ))
+    print_table(["mode", "req/s", "p50 ms", "p95 ms", "hits", "misses"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--memos", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+    setup_django()
+    run(args.users, args.memos, args.concurrency, args.duration)
+
+
+if __name__ == "__main__":
+    main()
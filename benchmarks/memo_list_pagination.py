@@ -0,0 +1,82 @@
+"""메모 목록 페이지네이션 벤치마크
+
+사용자 한 명의 메모 수를 늘려가며 첫 페이지, 중간 페이지, 마지막 페이지의
+조회 지연시간을 커서(키셋) 방식과 OFFSET 방식으로 비교합니다.
+커서 방식은 메모 수와 페이지 위치에 관계없이 지연시간이 일정해야 합니다.
+
+    python -m benchmarks.memo_list_pagination --sizes 1000 10000 100000
+"""
+import argparse
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def _fill_memos(user, count, start):
+    """사용자에게 count개의 메모를 추가"""
+    from memojjang.apps.memos.models import Memo
+    Memo.objects.bulk_create(
+        (
+            Memo(user=user, title=f"메모 {i}", content=f"벤치마크 메모 {i} 내용 " * 10)
+            for i in range(start, start + count)
+        ),
+        batch_size=2000,
+    )
+
+
+def run(sizes, page_size, repeat):
+    """메모 수별로 페이지 조회 지연시간을 측정"""
+    from memojjang.apps.memos.models import Memo
+    from memojjang.apps.memos.pagination import CursorPaginator, encode_cursor
+
+    rows = []
+    with benchmark_database():
+        user = create_bench_user()
+        # 다른 사용자의 메모도 섞어 두어 사용자 필터가 실제로 동작하도록 함
+        _fill_memos(create_bench_user("noise"), 10000, 0)
+        total = 0
+        for size in sorted(sizes):
+            _fill_memos(user, size - total, total)
+            total = size
+            queryset = Memo.objects.filter(user=user)
+            paginator = CursorPaginator(queryset, page_size=page_size)
+            ordered = queryset.order_by("-created_at", "-id")
+            for label, position in (
+                ("first", 0),
+                ("middle", size // 2),
+                ("last", max(size - page_size, 0)),
+            ):
+                cursor = encode_cursor(ordered[position - 1]) if position else None
+                cursor_stats = measure(
+                    lambda: list(paginator.page(cursor)), repeat=repeat
+                )
+                offset_stats = measure(
+                    lambda: list(ordered[position:position + page_size]),
+                    repeat=repeat,
+                )
+                rows.append((
+                    size,
+                    label,
+                    f"{cursor_stats['median']:.2f}",
+                    f"{cursor_stats['p95']:.2f}",
+                    f"{offset_stats['median']:.2f}",
+                    f"{offset_stats['p95']:.2f}",
+                ))
+    print_table(
+        ["memos", "page", "cursor p50", "cursor p95", "offset p50", "offset p95"],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--page-size", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+    run(args.sizes, args.page_size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""메모 수정 기록 저장 공간과 복원 시간 벤치마크
+
+큰 메모 하나를 조금씩 여러 번 수정하면서 수정 기록이 쓰는 공간을
+버전마다 전체 내용을 (압축해) 복사했을 때와 비교하고, 버전 하나를 복원하는
+시간과 수정 한 번에 기록을 남기는 시간을 잽니다.
+
+    python -m benchmarks.memo_revisions --paragraphs 2000 --edits 200
+"""
+import argparse
+import itertools
+import zlib
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def run(paragraphs, edits, repeat):
+    from django.db.models import Sum
+    from django.db.models.functions import Length
+    from memojjang.apps.memos import revisions
+    from memojjang.apps.memos.models import Memo, MemoRevision
+
+    lines = [f"{i}번째 문단: 수정 기록 벤치마크용 본문입니다." for i in range(paragraphs)]
+    with benchmark_database():
+        user = create_bench_user()
+        memo = Memo.objects.create(user=user, title="큰 메모", content="\n".join(lines))
+        full_copies = len(memo.content.encode())
+        compressed_copies = len(zlib.compress(memo.content.encode()))
+        for edit in range(edits):
+            index = edit * 7 % paragraphs
+            lines[index] = f"{index}번째 문단: {edit}번째 수정으로 바뀐 내용입니다."
+            memo.content = "\n".join(lines)
+            memo.save()
+            full_copies += len(memo.content.encode())
+            compressed_copies += len(zlib.compress(memo.content.encode()))
+
+        stored = MemoRevision.objects.filter(memo=memo).aggregate(
+            total=Sum(Length("data"))
+        )["total"]
+        print_table(
+            ["storage", "bytes", "per version"],
+            [
+                (label, size, size // (edits + 1))
+                for label, size in (
+                    ("full copies", full_copies),
+                    ("zlib full copies", compressed_copies),
+                    ("revisions", stored),
+                )
+            ],
+        )
+        print()
+
+        interval = revisions.get_snapshot_interval()
+        farthest = (edits + 1) // interval * interval or 1
+        rows = []
+        for label, number in (
+            ("restore snapshot", farthest - interval + 1 if farthest > interval else 1),
+            (f"restore {interval - 1} deltas", farthest),
+        ):
+            stats = measure(lambda: revisions.revision_state(memo.pk, number), repeat=repeat)
+            rows.append((label, f"{stats['median']:.2f}", f"{stats['p95']:.2f}"))
+
+        counter = itertools.count()
+
+        def record():
+            lines[0] = f"0번째 문단: {next(counter)}"
+            memo.content = "\n".join(lines)
+            revisions.record_revision(memo)
+
+        stats = measure(record, repeat=repeat)
+        rows.append(("record edit", f"{stats['median']:.2f}", f"{stats['p95']:.2f}"))
+        print_table(["operation", "median ms", "p95 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+    run(args.paragraphs, args.edits, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""메모 전문 검색 벤치마크
+
+합성 메모(기본 100만 개)를 여러 사용자에게 나눠 만든 뒤, 한 사용자의
+검색 지연시간을 검색어 유형별로 측정합니다. 색인은 bulk_create 시그널로
+점진적으로 채워지며, 메모 한 건 저장 시 색인 갱신 비용도 함께 측정합니다.
+
+    python -m benchmarks.memo_search --rows 1000000
+"""
+import argparse
+import random
+import time
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+VOCABULARY = (
+    "회의 일정 장보기 우유 계란 프로젝트 마감 보고서 여행 항공권 호텔 예약 "
+    "운동 독서 영화 음악 공부 시험 과제 생일 선물 병원 약속 점심 저녁 "
+    "meeting budget release deploy review design backlog invoice travel"
+).split()
+RARE_WORD = "희귀단어"
+
+
+def _fill_memos(users, rows, batch_size):
+    """사용자들에게 합성 메모를 나눠 생성"""
+    from memojjang.apps.memos.models import Memo
+    rng = random.Random(42)
+    created = 0
+    while created < rows:
+        count = min(batch_size, rows - created)
+        batch = []
+        for i in range(created, created + count):
+            words = rng.choices(VOCABULARY, k=40)
+            if i % 10000 == 0:
+                words.append(RARE_WORD)
+            batch.append(Memo(
+                user=users[i % len(users)],
+                title=" ".join(rng.choices(VOCABULARY, k=3)),
+                content=" ".join(words),
+            ))
+        Memo.objects.bulk_create(batch)
+        created += count
+
+
+def run(rows, user_count, repeat):
+    """검색어 유형별 지연시간 측정"""
+    from memojjang.apps.memos.models import Memo
+    from memojjang.apps.memos.search import search_memos
+
+    with benchmark_database():
+        users = [create_bench_user(f"bench{i}") for i in range(user_count)]
+        started = time.perf_counter()
+        _fill_memos(users, rows, batch_size=5000)
+        elapsed = time.perf_counter() - started
+        print(f"{rows}개 메모 생성 및 색인: {elapsed:.1f}s ({rows / elapsed:.0f} rows/s)")
+
+        user = users[0]
+        result_rows = []
+        for label, query in (
+            ("common word", "회의"),
+            ("two words", "회의 마감"),
+            ("prefix", "프로"),
+            ("rare word", RARE_WORD),
+            ("no match", "없는단어"),
+        ):
+            stats = measure(lambda: search_memos(user, query), repeat=repeat)
+            hits = len(search_memos(user, query, page_size=1000))
+            result_rows.append(
+                (label, query, hits, f"{stats['median']:.2f}", f"{stats['p95']:.2f}")
+            )
+        print_table(["query", "text", "hits", "p50 ms", "p95 ms"], result_rows)
+
+        memo = Memo.objects.filter(user=user).first()
+
+        def save_memo():
+            memo.content += " 추가"
+            memo.save()
+
+        stats = measure(save_memo, repeat=repeat)
+        print(f"메모 한 건 저장(색인 갱신 포함): p50 {stats['median']:.2f}ms, p95 {stats['p95']:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+    run(args.rows, args.users, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
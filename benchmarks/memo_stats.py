@@ -0,0 +1,128 @@
+"""사용자별 메모 통계 벤치마크
+
+메모가 많은 사용자의 메모 수, 대기 중인 리마인드 수, 본문 사용량을 읽는 비용을
+미리 쌓아 둔 통계 행(MemoStats) 조회와 memos를 COUNT/SUM으로 세는 경우로
+비교하고, 통계를 갱신하는 memos 트리거가 쓰기에 더하는 비용과 통계를 다시 세어
+확인하는 reconcile()의 시간을 잽니다.
+
+    python -m benchmarks.memo_stats --memos 100000
+"""
+import argparse
+import importlib
+import time
+from datetime import timedelta
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def _memos(user, count, prefix="메모"):
+    from django.utils import timezone
+    from memojjang.apps.memos.models import Memo
+
+    soon = timezone.now() + timedelta(days=1)
+    return [
+        Memo(
+            user=user,
+            title=f"{prefix} {i}",
+            content=f"벤치마크 {prefix} {i} 내용 " * 10,
+            reminder_date=soon if i % 10 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def _set_triggers(enabled):
+    """통계 트리거를 만들거나 지움 (마이그레이션의 SQL을 그대로 씀)"""
+    from django.db import connection
+
+    migration = importlib.import_module("memojjang.apps.memos.migrations.0012_memo_stats")
+    with connection.cursor() as cursor:
+        for sql in migration.CREATE_TRIGGERS_SQL if enabled else migration.DROP_TRIGGERS_SQL:
+            cursor.execute(sql)
+
+
+def _write_costs(user, count):
+    """메모 하나 생성/수정/삭제와 일괄 생성의 (건당 ms, 일괄 생성 ms)"""
+    from memojjang.apps.memos.models import Memo
+
+    started = time.perf_counter()
+    for memo in _memos(user, count, prefix="쓰기"):
+        memo.save()
+        memo.content += " 수정"
+        memo.save()
+        memo.delete()
+    single = (time.perf_counter() - started) * 1000 / count
+
+    started = time.perf_counter()
+    created = Memo.objects.bulk_create(_memos(user, count * 10, prefix="일괄"), batch_size=2000)
+    bulk = (time.perf_counter() - started) * 1000
+    Memo.objects.filter(pk__in=[memo.pk for memo in created]).delete()
+    return single, bulk
+
+
+def run(memo_count, repeat):
+    from django.db import connection
+    from django.db.models import Count, Sum
+    from django.db.models.functions import Length
+    from memojjang.apps.memos import stats
+    from memojjang.apps.memos.models import Memo
+
+    with benchmark_database():
+        user = create_bench_user()
+        # 다른 사용자의 메모도 섞어 두어 사용자 필터가 실제로 동작하도록 함
+        noise = create_bench_user("noise")
+        Memo.objects.bulk_create(_memos(noise, memo_count // 10), batch_size=2000)
+        Memo.objects.bulk_create(_memos(user, memo_count), batch_size=2000)
+        connection.cursor().execute("ANALYZE")
+
+        memos = Memo.objects.filter(user=user).order_by()
+        cases = (
+            ("MemoStats row", lambda: stats.get_stats(user.pk)),
+            ("COUNT + SUM(size)", lambda: stats.count_stats([user.pk])),
+            ("COUNT + SUM(LENGTH(content))", lambda: memos.aggregate(
+                memo_count=Count("id"),
+                pending=Count("id", filter=stats.PENDING_REMINDER),
+                content_bytes=Sum(Length("content")),
+            )),
+            ("COUNT(*) only", lambda: memos.aggregate(memo_count=Count("id"))),
+            ("pending only", lambda: memos.filter(stats.PENDING_REMINDER).count()),
+        )
+        rows = []
+        for label, func in cases:
+            result = measure(func, repeat=repeat)
+            rows.append((label, f"{result['median']:.2f}", f"{result['p95']:.2f}"))
+        values = stats.count_stats([user.pk])[user.pk]
+        print(f"memos: {memo_count} (+{memo_count // 10} noise), stats: {values}")
+        print()
+        print_table(["read", "median ms", "p95 ms"], rows)
+        print()
+
+        writer = create_bench_user("writer")
+        rows = []
+        for label, enabled in (("with triggers", True), ("without triggers", False)):
+            if not enabled:
+                _set_triggers(False)
+            single, bulk = _write_costs(writer, 500)
+            rows.append((label, f"{single:.3f}", f"{bulk:.1f}"))
+        _set_triggers(True)
+        print_table(["writes", "create+edit+delete ms/memo", "bulk_create 5000 ms"], rows)
+        print()
+
+        started = time.perf_counter()
+        drift = stats.reconcile([user.pk, noise.pk], repair=False)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"reconcile {memo_count + memo_count // 10} memos: {elapsed:.1f} ms, drift: {drift}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memos", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    setup_django()
+    run(args.memos, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""태그 필터 목록과 태그 요약 벤치마크
+
+메모 10만 개를 가진 사용자에게 자주 쓰는 태그부터 드문 태그까지 붙여 두고,
+태그 필터 목록 첫 페이지와 중간 페이지의 지연시간을 잽니다.
+태그별 메모 수로 실행 계획을 고르는 tagged_memos와, 항상 목록 인덱스를
+따라가는 계획(walk), 항상 memo_tags에서 출발하는 계획(drive)을 비교합니다.
+태그 요약은 미리 세어 둔 Tag.memo_count 조회와 GROUP BY 집계를 비교합니다.
+
+    python -m benchmarks.memo_tags --memos 100000
+"""
+import argparse
+import random
+from unittest import mock
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+# 태그 이름과 메모에 붙을 확률 (rare는 전체의 0.05%)
+TAG_RATES = [(f"tag{k:02d}", 0.4 / (k + 1)) for k in range(30)] + [("rare", 0.0005)]
+CASES = (
+    ("tag00 (40%)", ["tag00"], True),
+    ("tag04 (8%)", ["tag04"], True),
+    ("tag29 (1.3%)", ["tag29"], True),
+    ("rare (0.05%)", ["rare"], True),
+    ("tag00 AND tag01", ["tag00", "tag01"], True),
+    ("tag00 AND tag29", ["tag00", "tag29"], True),
+    ("tag29 AND rare", ["tag29", "rare"], True),
+    ("tag00 OR tag01", ["tag00", "tag01"], False),
+    ("tag29 OR rare", ["tag29", "rare"], False),
+)
+
+
+def _fill(user, count, seed=0):
+    """메모 count개를 만들고 TAG_RATES 확률로 태그를 붙임"""
+    from django.db import connection, transaction
+    from memojjang.apps.memos.models import Memo, Tag
+
+    Memo.objects.bulk_create(
+        (
+            Memo(user=user, title=f"메모 {i}", content=f"벤치마크 메모 {i} 내용 " * 10)
+            for i in range(count)
+        ),
+        batch_size=2000,
+    )
+    tag_ids = [
+        Tag.objects.create(user=user, name=name).pk for name, _ in TAG_RATES
+    ]
+    picker = random.Random(seed)
+    rows = [
+        (memo_id, tag_id)
+        for memo_id in Memo.objects.filter(user=user).values_list("pk", flat=True).iterator()
+        for tag_id, (_, rate) in zip(tag_ids, TAG_RATES)
+        if picker.random() < rate
+    ]
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany("INSERT INTO memo_tags (memo_id, tag_id) VALUES (%s, %s)", rows)
+    return len(rows)
+
+
+def _page(user, names, match_all, cursor=None):
+    from memojjang.apps.memos import tags
+    from memojjang.apps.memos.pagination import CursorPaginator
+    return CursorPaginator(tags.tagged_memos(user, names, match_all).for_list()).page(cursor)
+
+
+def run(memo_count, repeat):
+    from django.db import connection
+    from memojjang.apps.memos import tags
+    from memojjang.apps.memos.pagination import encode_cursor
+
+    with benchmark_database():
+        user = create_bench_user()
+        # 다른 사용자의 메모도 섞어 두어 사용자 필터가 실제로 동작하도록 함
+        _fill(create_bench_user("noise"), memo_count // 10, seed=1)
+        links = _fill(user, memo_count)
+
+        rows = []
+        for label, names, match_all in CASES:
+            # 결과의 중간쯤에서 시작하는 페이지
+            queryset = tags.tagged_memos(user, names, match_all).for_list()
+            total = queryset.count()
+            middle = None
+            if total > 60:
+                middle = encode_cursor(queryset.order_by("-created_at", "-id")[total // 2])
+            row = [label, total]
+            for cursor in (None, middle):
+                for drive_max in (tags.DRIVE_MAX_MEMOS, -1, memo_count):
+                    with mock.patch.object(tags, "DRIVE_MAX_MEMOS", drive_max):
+                        stats = measure(
+                            lambda: _page(user, names, match_all, cursor), repeat=repeat
+                        )
+                    row.append(f"{stats['median']:.2f}")
+            rows.append(row)
+        print(f"memos: {memo_count} (+{memo_count // 10} noise), memo_tags rows: {links}")
+        print()
+        print_table(
+            [
+                "filter", "matches",
+                "first auto", "first walk", "first drive",
+                "middle auto", "middle walk", "middle drive",
+            ],
+            rows,
+        )
+        print()
+
+        def group_by():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT tags.name, COUNT(*) FROM memo_tags "
+                    "JOIN tags ON tags.id = memo_tags.tag_id "
+                    "WHERE tags.user_id = %s GROUP BY tags.id ORDER BY 2 DESC",
+                    [user.pk],
+                )
+                return cursor.fetchall()
+
+        summary = measure(lambda: list(tags.tag_summary(user)), repeat=repeat)
+        counted = measure(group_by, repeat=repeat)
+        print_table(
+            ["tag summary", "median ms", "p95 ms"],
+            [
+                ("Tag.memo_count", f"{summary['median']:.2f}", f"{summary['p95']:.2f}"),
+                ("GROUP BY", f"{counted['median']:.2f}", f"{counted['p95']:.2f}"),
+            ],
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memos", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    setup_django()
+    run(args.memos, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
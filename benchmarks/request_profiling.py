@@ -0,0 +1,58 @@
+"""요청 프로파일링 오버헤드 벤치마크
+
+메모 목록과 상세를 프로파일링 비율별(0, 1%, 100%)로 반복 요청해
+프로파일링 미들웨어가 더하는 지연시간을 측정합니다. 로그는 버립니다.
+
+    python -m benchmarks.request_profiling --repeat 300
+"""
+import argparse
+import logging
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, measure, print_table, setup_django
+)
+
+
+def run(repeat, rates):
+    """프로파일링 비율별 지연시간 측정"""
+    from django.test import Client, override_settings
+    from memojjang.apps.memos.models import Memo
+
+    logging.getLogger("memojjang.profiling").handlers = [logging.NullHandler()]
+    rows = []
+    with benchmark_database():
+        user = create_bench_user()
+        Memo.objects.bulk_create(
+            Memo(user=user, title=f"메모 {i}", content="프로파일링 벤치마크 " * 20)
+            for i in range(100)
+        )
+        memo = Memo.objects.filter(user=user).first()
+        for label, url in (("memo_list", "/memos/"), ("memo_detail", f"/memos/{memo.pk}/")):
+            baseline = None
+            for rate in rates:
+                with override_settings(MEMO_PROFILING_SAMPLE_RATE=rate, MEMO_LIST_CACHE_TIMEOUT=0):
+                    # 미들웨어 체인은 클라이언트마다 만들어지므로 설정마다 새로 만듦
+                    client = Client()
+                    client.force_login(user)
+                    stats = measure(lambda: client.get(url), repeat=repeat)
+                baseline = baseline or stats["median"]
+                rows.append((
+                    label,
+                    f"{rate:.0%}",
+                    f"{stats['median']:.3f}",
+                    f"{stats['p95']:.3f}",
+                    f"{(stats['median'] / baseline - 1) * 100:+.1f}%",
+                ))
+    print_table(["view", "sampled", "median ms", "p95 ms", "overhead"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=300)
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.0, 0.01, 1.0])
+    args = parser.parse_args()
+    setup_django()
+    run(args.repeat, args.rates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""SQLite 동시 쓰기/읽기 경합 벤치마크
+
+여러 프로세스가 같은 SQLite 파일에 동시에 쓰고 읽을 때의 처리량, 지연시간,
+"database is locked" 오류 수를 기본 설정(롤백 저널, DEFERRED 트랜잭션)과
+settings.SQLITE_PRAGMAS + IMMEDIATE 트랜잭션 설정으로 비교합니다.
+쓰기 작업은 gunicorn 작업자의 메모 수정처럼 한 트랜잭션에서 읽은 뒤 씁니다.
+
+    python -m benchmarks.sqlite_contention --writers 4 --readers 4 --duration 5
+"""
+import argparse
+import multiprocessing
+import statistics
+import time
+from benchmarks.utils import (
+    benchmark_database, create_bench_user, print_table, setup_django
+)
+
+BASELINE_OPTIONS = {"init_command": "PRAGMA journal_mode=DELETE"}
+
+
+def _percentile(samples, ratio):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * ratio))] if samples else 0.0
+
+
+def _worker(role, db_path, options, user_id, memo_ids, duration, queue):
+    """한 프로세스에서 마감 시각까지 쓰기 또는 읽기를 반복"""
+    setup_django()
+    from django.conf import settings
+    from django.db import OperationalError, transaction
+    from memojjang.apps.memos.models import Memo
+
+    settings.DATABASES["default"]["NAME"] = db_path
+    settings.DATABASES["default"]["OPTIONS"] = options
+    samples = []
+    locked = 0
+    index = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        index += 1
+        started = time.perf_counter()
+        try:
+            if role == "writer":
+                with transaction.atomic():
+                    memo = Memo.objects.get(pk=memo_ids[index % len(memo_ids)])
+                    memo.content = f"경합 테스트 {index}"
+                    memo.save()
+            else:
+                list(Memo.objects.for_list().filter(user_id=user_id)[:30])
+        except OperationalError as error:
+            if "locked" not in str(error):
+                raise
+            locked += 1
+            continue
+        samples.append((time.perf_counter() - started) * 1000)
+    queue.put((role, samples, locked))
+
+
+def _run(db_path, options, user_id, memo_ids, writers, readers, duration):
+    """작업자 프로세스를 띄우고 역할별 결과를 모음"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    roles = ["writer"] * writers + ["reader"] * readers
+    processes = [
+        context.Process(
+            target=_worker,
+            args=(role, db_path, options, user_id, memo_ids, duration, queue),
+        )
+        for role in roles
+    ]
+    for process in processes:
+        process.start()
+    results = {"writer": ([], 0), "reader": ([], 0)}
+    for _ in processes:
+        role, samples, locked = queue.get()
+        total_samples, total_locked = results[role]
+        results[role] = (total_samples + samples, total_locked + locked)
+    for process in processes:
+        process.join()
+    return results
+
+
+def run(writers, readers, duration):
+    """기본 설정과 조정된 설정의 경합 비교"""
+    from django.conf import settings
+    from django.db import connection
+    from memojjang.apps.memos.models import Memo
+
+    tuned_options = settings.DATABASES["default"]["OPTIONS"]
+    rows = []
+    with benchmark_database():
+        db_path = connection.settings_dict["NAME"]
+        user = create_bench_user()
+        Memo.objects.bulk_create(
+            Memo(user=user, title=f"메모 {i}", content="경합 테스트") for i in range(500)
+        )
+        memo_ids = list(Memo.objects.values_list("pk", flat=True))
+        connection.close()
+        for label, options in (("default", BASELINE_OPTIONS), ("tuned", tuned_options)):
+            results = _run(db_path, options, user.pk, memo_ids, writers, readers, duration)
+            writes, write_locked = results["writer"]
+            reads, read_locked = results["reader"]
+            rows.append((
+                label,
+                f"{len(writes) / duration:.0f}",
+                f"{statistics.median(writes) if writes else 0:.2f}",
+                f"{_percentile(writes, 0.99):.2f}",
+                f"{len(reads) / duration:.0f}",
+                f"{_percentile(reads, 0.99):.2f}",
+                write_locked + read_locked,
+            ))
+    print_table(
+        ["mode", "writes/s", "write p50", "write p99", "reads/s", "read p99", "locked"],
+        rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+    setup_django()
+    run(args.writers, args.readers, args.duration)
+
+
+if __name__ == "__main__":
+    main()
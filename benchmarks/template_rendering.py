@@ -0,0 +1,98 @@
+"""메모 카드 렌더링 마이크로 벤치마크
+
+메모 카드 1,000개로 memo_list_items.html을 렌더링하는 시간을 비교합니다.
+
+- parse only: 템플릿 파싱만 (cached 로더가 요청마다 아끼는 비용)
+- before: 요청마다 템플릿을 다시 읽고 파싱, 카드 조각 캐시 없음
+  (cached 로더가 없던 DEBUG 환경과 같은 조건)
+- cached loader: 컴파일한 템플릿을 재사용, 카드 조각 캐시 없음
+- fragments cold: 컴파일한 템플릿 + 비어 있는 카드 조각 캐시
+- fragments warm: 컴파일한 템플릿 + 모든 카드가 조각 캐시에 있음
+- one card changed: 카드 하나만 updated_at이 바뀐 경우
+
+    python -m benchmarks.template_rendering --cards 1000
+"""
+import argparse
+import re
+from datetime import timedelta
+from benchmarks.utils import measure, print_table, setup_django
+
+TEMPLATE_NAME = "memos/memo_list_items.html"
+_CACHE_TAGS = re.compile(r"{% (?:load cache|cache [^%]*|endcache) %}")
+
+
+def _memos(count):
+    """데이터베이스 없이 목록 렌더링에 쓸 메모 객체를 만듦"""
+    from django.utils import timezone
+    from memojjang.apps.memos.models import Memo
+
+    now = timezone.now()
+    return [
+        Memo(
+            pk=i, title=f"메모 {i}", excerpt="템플릿 렌더링 벤치마크 " * 10,
+            reminder_date=now + timedelta(days=i % 7) if i % 3 == 0 else None,
+            is_reminded=i % 2 == 0, created_at=now, updated_at=now,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def run(cards, repeat):
+    from django.core.cache import caches
+    from django.template import engines
+    from django.template.loader import render_to_string
+
+    engine = engines.all()[0]
+    source = engine.engine.find_template(TEMPLATE_NAME)[0].source
+    uncached_source = _CACHE_TAGS.sub("", source)
+    memos = _memos(cards)
+    context = {"memos": memos}
+    fragment_cache = caches["templates"]
+
+    def before():
+        engine.from_string(uncached_source).render(context)
+
+    compiled_plain = engine.from_string(uncached_source)
+
+    def cached_loader():
+        compiled_plain.render(context)
+
+    def cold():
+        fragment_cache.clear()
+        render_to_string(TEMPLATE_NAME, context)
+
+    def warm():
+        render_to_string(TEMPLATE_NAME, context)
+
+    def one_changed():
+        memos[0].updated_at += timedelta(microseconds=1)
+        render_to_string(TEMPLATE_NAME, context)
+
+    def parse_only():
+        engine.from_string(uncached_source)
+
+    rows = []
+    for label, func in (
+        ("parse only", parse_only),
+        ("before", before),
+        ("cached loader", cached_loader),
+        ("fragments cold", cold),
+        ("fragments warm", warm),
+        ("one card changed", one_changed),
+    ):
+        stats = measure(func, repeat=repeat)
+        rows.append((label, f"{stats['median']:.1f}", f"{stats['p95']:.1f}"))
+    print_table(["config", "median ms", "p95 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    setup_django()
+    run(args.cards, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
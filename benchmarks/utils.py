@@ -0,0 +1,77 @@
+"""벤치마크 공통 유틸리티
+
+벤치마크는 임시 SQLite 파일에 만든 별도 데이터베이스에서 실행되므로
+개발용 db.sqlite3에는 영향을 주지 않습니다.
+
+    python -m benchmarks.memo_list_pagination
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """Django 설정을 불러오고 앱을 초기화"""
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "memojjang.settings")
+    import django
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """임시 파일에 마이그레이션된 데이터베이스를 만들고 종료 시 삭제"""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        connection.settings_dict["TEST"]["NAME"] = str(Path(tmp_dir) / "bench.sqlite3")
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+
+def create_bench_user(username="bench"):
+    """비밀번호 해싱 없이 벤치마크용 사용자 생성"""
+    from django.contrib.auth import get_user_model
+    return get_user_model().objects.create(username=username, email=f"{username}@example.com")
+
+
+def measure(func, repeat=20, warmup=2):
+    """함수를 반복 실행해 밀리초 단위 지연시간 통계를 반환"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "median": statistics.median(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def print_table(headers, rows):
+    """결과를 고정 폭 표로 출력"""
+    widths = [
+        max(len(str(header)), *(len(str(row[i])) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+    line = "  ".join(str(h).rjust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths)))
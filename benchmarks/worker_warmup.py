@@ -0,0 +1,94 @@
+"""워커 예열 전후의 첫 요청 지연시간 벤치마크
+
+새 프로세스(새 워커)를 띄워 첫 요청과 두 번째 요청의 시간을 잽니다.
+
+- cold: 예열 없이 바로 첫 요청 (URL 설정 import, 템플릿 컴파일,
+  데이터베이스 연결을 첫 요청이 치름)
+- warm: memojjang.warmup.warm_up()을 마친 뒤 첫 요청 (gunicorn의
+  post_worker_init과 같은 조건, 예열 시간은 따로 표시)
+
+각 경우를 --runs번 새 프로세스로 반복해 중앙값과 최댓값을 보여 줍니다.
+
+    python -m benchmarks.worker_warmup --path /login/ --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from benchmarks.utils import ROOT_DIR, print_table
+
+# 새 프로세스에서 (예열 여부에 따라) 예열, 첫 요청, 두 번째 요청 시간(ms)을 출력
+FIRST_REQUEST = """
+import json, sys, time
+import django
+django.setup()
+from django.test import Client
+warmup_ms = 0.0
+if sys.argv[1] == "warm":
+    from memojjang.warmup import warm_up
+    started = time.perf_counter()
+    warm_up()
+    warmup_ms = (time.perf_counter() - started) * 1000
+client = Client()
+timings = []
+for _ in range(2):
+    started = time.perf_counter()
+    status = client.get(sys.argv[2]).status_code
+    timings.append((time.perf_counter() - started) * 1000)
+print(json.dumps({"status": status, "warmup": warmup_ms, "first": timings[0], "second": timings[1]}))
+"""
+
+
+def _first_request(mode, path, db_path):
+    environ = {
+        **os.environ, "DJANGO_SETTINGS_MODULE": "memojjang.settings",
+        "MEMO_ENV_FILE": os.devnull, "MEMO_SQLITE_PATH": db_path, "ALLOWED_HOSTS": "testserver",
+        "PYTHONPATH": str(ROOT_DIR),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST, mode, path],
+        capture_output=True, text=True, env=environ, cwd=ROOT_DIR, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(path, runs):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / "warmup.sqlite3")
+        # 파이썬 바이트코드와 OS 파일 캐시를 채워 첫 실행만 느려지지 않도록 한 번 버림
+        _first_request("cold", path, db_path)
+        rows = []
+        for mode in ("cold", "warm"):
+            results = [_first_request(mode, path, db_path) for _ in range(runs)]
+            statuses = {result["status"] for result in results}
+            first = [result["first"] for result in results]
+            rows.append((
+                mode,
+                ",".join(str(status) for status in sorted(statuses)),
+                f"{statistics.median(result['warmup'] for result in results):.1f}",
+                f"{statistics.median(first):.1f}",
+                f"{max(first):.1f}",
+                f"{statistics.median(result['second'] for result in results):.1f}",
+            ))
+    print(f"path: {path}, runs: {runs}")
+    print()
+    print_table(
+        ["worker", "status", "warm-up ms", "first median ms", "first max ms", "second median ms"],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="/login/")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    run(args.path, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +0,0 @@
-INSTALLED_APPS = [
-    // ...existing apps...
-    "memojjang.apps.MemojjangConfig",
-]
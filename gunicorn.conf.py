@@ -0,0 +1,65 @@
+"""gunicorn 설정
+
+    MEMO_ENV=prod gunicorn memojjang.wsgi
+
+gunicorn은 현재 디렉터리의 gunicorn.conf.py를 자동으로 읽습니다.
+모든 값은 환경 변수로 바꿀 수 있습니다.
+
+preload_app(GUNICORN_PRELOAD, 기본값 켜짐)이면 마스터가 애플리케이션을 한 번
+불러오고 URL과 템플릿을 예열한 뒤 워커를 fork하므로, 워커는 컴파일된 상태를
+복사 시 쓰기(copy-on-write)로 공유합니다. 데이터베이스 연결은 fork 뒤 워커마다
+새로 열고, 워커는 예열이 끝난 뒤에야 요청을 받습니다.
+"""
+import multiprocessing
+import os
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 1))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+# 메모리 누수나 단편화에 대비해 일정 요청마다 워커를 교체 (여러 워커가 동시에 재시작하지 않도록 지터)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+preload_app = _env_bool("GUNICORN_PRELOAD", True)
+# 예열하는 동안 요청이 대기열에 쌓이지 않도록 예열을 끄려면 MEMO_WARMUP=false
+warmup = _env_bool("MEMO_WARMUP", True)
+
+accesslog = os.environ.get("GUNICORN_ACCESSLOG", "-")
+errorlog = "-"
+
+
+def when_ready(server):
+    """preload_app이면 마스터에서 URL과 템플릿을 예열 (워커가 fork로 물려받음)"""
+    if preload_app and warmup:
+        from memojjang.warmup import warm_up
+        timings = warm_up(databases=False)
+        server.log.info("마스터 예열 완료: %s", timings)
+
+
+def post_fork(server, worker):
+    """마스터에서 열린 데이터베이스 연결을 워커가 같이 쓰지 않도록 닫음"""
+    if preload_app:
+        from django.db import connections
+        for connection in connections.all(initialized_only=True):
+            connection.close()
+
+
+def post_worker_init(worker):
+    """워커가 요청을 받기 전에 데이터베이스 연결을 열고 (preload가 아니면) URL과 템플릿도 예열
+
+    preload_app이면 URL과 템플릿은 when_ready에서 마스터가 예열해 물려받았으므로
+    데이터베이스 연결만 엽니다.
+    """
+    if warmup:
+        from memojjang.warmup import warm_up
+        timings = warm_up(code=not preload_app)
+        worker.log.info("워커 %s 예열 완료: %s", worker.pid, timings)
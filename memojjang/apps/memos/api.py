@@ -0,0 +1,439 @@
+"""메모 JSON API
+
+요청과 응답 본문은 모두 JSON이며, 세션 로그인과 CSRF 토큰이 필요합니다.
+조회 엔드포인트는 ?fields=로 요청한 컬럼만 .only()로 읽어 폼이나 템플릿을
+거치지 않고 직렬화하며, 목록은 HTML 목록과 같은 커서 페이지네이션과
+태그 필터(?tag=...&match=any)를 씁니다.
+일괄 처리 엔드포인트는 한 요청에 최대 settings.MEMO_BATCH_MAX_ITEMS개를
+한 트랜잭션으로 처리하고 항목별 결과를 돌려줍니다.
+가져오기 엔드포인트만 JSON 본문 대신 multipart 파일 업로드를 받습니다.
+"""
+import csv
+import json
+from functools import wraps
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET, require_http_methods, require_POST
+from . import chunks, importer, revisions, tags
+from .models import LIST_FIELDS, Memo, MemoChunk, MemoRevision
+from .pagination import CursorPaginator, InvalidCursor
+from ...forms import MemoForm, MemoReminderForm
+
+DEFAULT_BATCH_MAX_ITEMS = 500
+# ?fields=로 요청할 수 있는 필드
+# 청크로 나눠 저장한 긴 메모의 content는 첫 청크이며, 나머지는 청크 API로 읽음
+# tags는 컬럼이 아니라 memo_tags에서 따로 읽음 (model_fields 참고)
+MEMO_FIELDS = (
+    "id", "title", "content", "excerpt", "reminder_date", "is_reminded",
+    "created_at", "updated_at", "chunk_count", "tags",
+)
+
+
+class ApiError(Exception):
+    """API 요청 오류 (JSON 오류 응답으로 변환됨)"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def json_response(data, status=200):
+    """한글을 이스케이프하지 않는 JSON 응답"""
+    return JsonResponse(
+        data, status=status, safe=False, json_dumps_params={"ensure_ascii": False}
+    )
+
+
+def api_view(view):
+    """로그인 확인과 ApiError 처리를 담당하는 API 뷰 데코레이터
+
+    로그인 페이지로 리다이렉트하는 대신 401 JSON 응답을 반환합니다.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return json_response({"error": "로그인이 필요합니다."}, status=401)
+        try:
+            return view(request, *args, **kwargs)
+        except ApiError as error:
+            return json_response({"error": error.message}, status=error.status)
+    return wrapper
+
+
+def parse_json_body(request):
+    """요청 본문을 JSON으로 해석"""
+    try:
+        return json.loads(request.body)
+    except (UnicodeDecodeError, ValueError):
+        raise ApiError("요청 본문이 올바른 JSON이 아닙니다.")
+
+
+def _batch_items(request, key):
+    """요청 본문에서 일괄 처리 항목 목록을 꺼내고 개수를 검사"""
+    body = parse_json_body(request)
+    items = body.get(key) if isinstance(body, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ApiError(f"'{key}'에 처리할 항목 목록이 필요합니다.")
+    max_items = getattr(settings, "MEMO_BATCH_MAX_ITEMS", DEFAULT_BATCH_MAX_ITEMS)
+    if len(items) > max_items:
+        raise ApiError(f"한 번에 최대 {max_items}개까지 처리할 수 있습니다.")
+    return items
+
+
+def _form_errors(form):
+    """폼 오류를 {필드: [메시지, ...]} 형태로 변환"""
+    return {
+        field: [error["message"] for error in errors]
+        for field, errors in form.errors.get_json_data().items()
+    }
+
+
+def _memo_id(value):
+    """항목의 메모 id를 정수로 변환, 올바르지 않으면 None"""
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def requested_fields(request, default):
+    """?fields=title,excerpt 형태의 요청 필드 목록 (id는 항상 포함)"""
+    value = request.GET.get("fields")
+    if not value:
+        return default
+    fields = ["id"]
+    for field in value.split(","):
+        field = field.strip()
+        if field not in MEMO_FIELDS:
+            raise ApiError(f"알 수 없는 필드입니다: {field}")
+        if field not in fields:
+            fields.append(field)
+    return tuple(fields)
+
+
+def model_fields(fields):
+    """요청 필드 중 .only()로 읽을 메모 컬럼"""
+    return tuple(field for field in fields if field != "tags")
+
+
+def serialize_memo(memo, fields=MEMO_FIELDS):
+    """메모를 요청한 필드만 담은 딕셔너리로 변환 (tags는 attach_tag_names로 붙인 값)"""
+    data = {}
+    for field in fields:
+        value = memo.tag_names if field == "tags" else getattr(memo, field)
+        data[field] = value.isoformat() if hasattr(value, "isoformat") else value
+    return data
+
+
+def _revision_number(value):
+    """?before= 같은 버전 번호를 정수로 변환"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ApiError("올바르지 않은 버전 번호입니다.")
+
+
+def _get_memo(request, pk, fields=MEMO_FIELDS):
+    """요청한 사용자의 메모를 필요한 필드만 읽어 반환"""
+    try:
+        memo = Memo.objects.only(*model_fields(fields)).get(pk=pk, user=request.user)
+    except Memo.DoesNotExist:
+        raise ApiError("메모를 찾을 수 없습니다.", status=404)
+    if "tags" in fields:
+        tags.attach_tag_names([memo])
+    return memo
+
+
+def _save_form(request, form, status):
+    """폼을 검증해 저장하고 메모 JSON을, 실패하면 필드별 오류를 반환"""
+    if not form.is_valid():
+        return json_response({"errors": _form_errors(form)}, status=400)
+    memo = form.save(commit=False)
+    memo.user = request.user
+    memo.save()
+    form.save_m2m()
+    return json_response(serialize_memo(memo), status=status)
+
+
+@require_http_methods(["GET", "POST"])
+@api_view
+def memo_collection(request):
+    """메모 목록 조회(GET)와 생성(POST)
+
+    GET ?fields=...&cursor=...&tag=...&tag=...&match=all|any
+    {"results": [...], "next_cursor": "..." 또는 null}
+    """
+    if request.method == "POST":
+        body = parse_json_body(request)
+        return _save_form(request, MemoForm(data=body if isinstance(body, dict) else {}), 201)
+
+    fields = requested_fields(request, LIST_FIELDS)
+    names, match_all = tags.filter_params(request.GET)
+    # 커서를 만들려면 created_at이 필요하므로 요청하지 않았어도 함께 읽음
+    queryset = tags.tagged_memos(request.user, names, match_all).only(
+        *model_fields(fields), "created_at"
+    )
+    try:
+        page = CursorPaginator(queryset).page(request.GET.get("cursor"))
+    except InvalidCursor:
+        raise ApiError("올바르지 않은 커서입니다.")
+    if "tags" in fields:
+        tags.attach_tag_names(page.object_list)
+    return json_response({
+        "results": [serialize_memo(memo, fields) for memo in page],
+        "next_cursor": page.next_cursor,
+    })
+
+
+@require_http_methods(["GET", "PUT", "PATCH", "DELETE"])
+@api_view
+def memo_resource(request, pk):
+    """메모 상세 조회(GET), 수정(PUT/PATCH), 삭제(DELETE)
+
+    PATCH는 보낸 필드만 바꾸고, PUT은 보내지 않은 필드를 비웁니다.
+    """
+    if request.method == "GET":
+        fields = requested_fields(request, MEMO_FIELDS)
+        return json_response(serialize_memo(_get_memo(request, pk, fields), fields))
+
+    if request.method == "DELETE":
+        memo = _get_memo(request, pk, ("id", "user_id"))
+        memo.delete()
+        return HttpResponse(status=204)
+
+    body = parse_json_body(request)
+    if not isinstance(body, dict):
+        raise ApiError("요청 본문은 JSON 객체여야 합니다.")
+    memo = _get_memo(request, pk)
+    if request.method == "PATCH":
+        data = {field: getattr(memo, field) for field in MemoForm._meta.fields}
+        data["tags"] = memo.tag_names
+        data.update(body)
+    else:
+        data = body
+    return _save_form(request, MemoForm(data=data, instance=memo), 200)
+
+
+@require_http_methods(["GET", "PUT"])
+@api_view
+def memo_chunk(request, pk, number):
+    """긴 메모 본문의 number번 청크 조회(GET)와 수정(PUT)
+
+    GET  {"number": ..., "content": ..., "chunk_count": ...}
+    PUT  {"content": ...} 이 청크만 바꿈 (빈 문자열이면 1번 이후 청크는 삭제)
+    """
+    memo = _get_memo(request, pk, ("id", "user_id", "chunk_count"))
+    try:
+        if request.method == "GET":
+            content = chunks.read_chunk(memo, number)
+            return json_response({
+                "number": number, "content": content, "chunk_count": memo.chunk_count
+            })
+        body = parse_json_body(request)
+        content = body.get("content") if isinstance(body, dict) else None
+        if not isinstance(content, str):
+            raise ApiError("'content'에 문자열이 필요합니다.")
+        chunks.write_chunk(memo, number, content)
+    except MemoChunk.DoesNotExist:
+        raise ApiError("본문 청크를 찾을 수 없습니다.", status=404)
+    return json_response({"number": number, "chunk_count": memo.chunk_count})
+
+
+@require_GET
+@api_view
+def memo_revisions(request, pk):
+    """메모 수정 기록 목록 (최신순)
+
+    GET ?before=<버전 번호>
+    {"results": [{"number": ..., "is_snapshot": ..., "size": ..., "created_at": ...}, ...],
+     "next_before": 다음 페이지의 before 값 또는 null}
+    size는 압축해 저장한 바이트 수입니다.
+    """
+    memo = _get_memo(request, pk, ("id",))
+    before = request.GET.get("before")
+    page, next_before = revisions.revision_page(
+        memo.pk, None if before is None else _revision_number(before)
+    )
+    return json_response({
+        "results": [
+            {
+                "number": revision.number,
+                "is_snapshot": revision.is_snapshot,
+                "size": revision.size,
+                "created_at": revision.created_at.isoformat(),
+            }
+            for revision in page
+        ],
+        "next_before": next_before,
+    })
+
+
+@require_GET
+@api_view
+def memo_revision(request, pk, number):
+    """메모의 number 버전 제목과 본문"""
+    memo = _get_memo(request, pk, ("id",))
+    try:
+        title, content = revisions.revision_state(memo.pk, number)
+    except MemoRevision.DoesNotExist:
+        raise ApiError("수정 기록을 찾을 수 없습니다.", status=404)
+    return json_response({"number": number, "title": title, "content": content})
+
+
+@require_POST
+@api_view
+def restore_revision(request, pk, number):
+    """메모의 제목과 본문을 number 버전으로 되돌리고 메모를 반환
+
+    되돌린 내용은 새 버전으로 기록됩니다.
+    """
+    memo = _get_memo(request, pk)
+    try:
+        revisions.restore_revision(memo, number)
+    except MemoRevision.DoesNotExist:
+        raise ApiError("수정 기록을 찾을 수 없습니다.", status=404)
+    return json_response(serialize_memo(memo))
+
+
+@require_GET
+@api_view
+def tag_list(request):
+    """사용자의 태그별 메모 수 (많은 순)
+
+    {"results": [{"name": ..., "memo_count": ...}, ...]}
+    """
+    return json_response({
+        "results": [
+            {"name": tag.name, "memo_count": tag.memo_count}
+            for tag in tags.tag_summary(request.user)
+        ],
+    })
+
+
+@require_POST
+@api_view
+def batch_create(request):
+    """메모 일괄 생성
+
+    {"memos": [{"title": ..., "content": ..., "reminder_date": ..., "tags": [...]}, ...]}
+    각 항목을 MemoForm으로 검증하고, 유효한 항목만 bulk_create로 생성합니다.
+    """
+    items = _batch_items(request, "memos")
+    results = []
+    memos = []
+    forms = []
+    for index, item in enumerate(items):
+        form = MemoForm(data=item if isinstance(item, dict) else {})
+        if form.is_valid():
+            memo = form.save(commit=False)
+            memo.user = request.user
+            memos.append((index, memo))
+            forms.append(form)
+        else:
+            results.append({"index": index, "status": "invalid", "errors": _form_errors(form)})
+    with transaction.atomic():
+        Memo.objects.bulk_create([memo for _, memo in memos])
+        # 태그는 생성된 메모의 id가 있어야 연결할 수 있음 (태그가 없는 항목은 쿼리 없음)
+        for form in forms:
+            form.save_m2m()
+    results.extend(
+        {"index": index, "status": "created", "id": memo.pk} for index, memo in memos
+    )
+    results.sort(key=lambda result: result["index"])
+    return json_response({"created": len(memos), "results": results})
+
+
+@require_POST
+@api_view
+def batch_delete(request):
+    """메모 일괄 삭제
+
+    {"ids": [1, 2, ...]}
+    요청한 사용자의 메모만 한 번의 DELETE ... WHERE id IN으로 삭제합니다.
+    """
+    items = _batch_items(request, "ids")
+    ids = [_memo_id(item) for item in items]
+    with transaction.atomic():
+        queryset = Memo.objects.filter(user=request.user, pk__in=[pk for pk in ids if pk])
+        existing = set(queryset.values_list("pk", flat=True))
+        queryset.delete()
+    results = []
+    for index, (item, pk) in enumerate(zip(items, ids)):
+        if pk is None:
+            status = "invalid"
+        elif pk in existing:
+            status = "deleted"
+        else:
+            status = "not_found"
+        results.append({"index": index, "id": item, "status": status})
+    return json_response({"deleted": len(existing), "results": results})
+
+
+@require_POST
+@api_view
+def batch_update_reminders(request):
+    """메모 리마인드 일괄 수정
+
+    {"memos": [{"id": 1, "reminder_date": ..., "is_reminded": false}, ...]}
+    각 항목을 MemoReminderForm으로 검증하고 bulk_update로 한 번에 저장합니다.
+    항목에 없는 필드는 PATCH처럼 메모의 현재 값을 유지합니다.
+    """
+    items = _batch_items(request, "memos")
+    ids = [_memo_id(item.get("id")) if isinstance(item, dict) else None for item in items]
+    results = []
+    updated = {}
+    now = timezone.now()
+    with transaction.atomic():
+        memos = Memo.objects.filter(user=request.user).only(
+            "id", "user_id", "reminder_date", "is_reminded", "updated_at"
+        ).in_bulk([pk for pk in ids if pk])
+        for index, (item, pk) in enumerate(zip(items, ids)):
+            memo = memos.get(pk)
+            if memo is None:
+                results.append({"index": index, "id": pk, "status": "not_found"})
+                continue
+            data = {field: getattr(memo, field) for field in MemoReminderForm._meta.fields}
+            data.update(item)
+            form = MemoReminderForm(data=data, instance=memo)
+            if not form.is_valid():
+                results.append({
+                    "index": index, "id": pk, "status": "invalid", "errors": _form_errors(form)
+                })
+                continue
+            memo = form.save(commit=False)
+            memo.updated_at = now
+            updated[pk] = memo
+            results.append({"index": index, "id": pk, "status": "updated"})
+        Memo.objects.bulk_update(
+            updated.values(), ["reminder_date", "is_reminded", "updated_at"]
+        )
+    return json_response({"updated": len(updated), "results": results})
+
+
+@require_POST
+@api_view
+def import_memos(request):
+    """메모 가져오기
+
+    multipart 요청의 file(NDJSON 또는 CSV, .gz 가능)을 스트리밍으로 읽어
+    배치 단위로 저장하고, 처리량과 행 단위 오류를 돌려줍니다.
+    형식은 파일 이름으로 추정하며 format 값으로 지정할 수도 있습니다.
+    """
+    upload = request.FILES.get("file")
+    if upload is None:
+        raise ApiError("가져올 파일(file)이 필요합니다.")
+    export_format, compressed = importer.detect_format(upload.name)
+    export_format = request.POST.get("format", export_format)
+    if export_format not in importer.FORMATS:
+        raise ApiError("지원하지 않는 형식입니다.")
+    records = importer.read_records(upload.file, export_format, compressed)
+    try:
+        result = importer.import_memos(request.user, records)
+    except (UnicodeDecodeError, OSError, EOFError, csv.Error):
+        raise ApiError("파일을 읽을 수 없습니다. UTF-8 텍스트 또는 gzip 파일인지 확인하세요.")
+    return json_response(result.as_dict())
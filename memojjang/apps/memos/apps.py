@@ -5,3 +5,7 @@ class MemosConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "memojjang.apps.memos"
     verbose_name = "메모"
+
+    def ready(self):
+        """시그널 수신기 등록"""
+        from . import receivers  # noqa: F401
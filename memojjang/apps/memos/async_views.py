@@ -0,0 +1,167 @@
+"""메모 읽기 뷰의 비동기 버전
+
+settings.MEMO_ASYNC_VIEWS가 True이면 urls.py가 메모 목록/상세와 JSON API의
+목록/상세를 이 모듈의 뷰로 연결합니다. ASGI 서버(uvicorn 등)에서 동기 뷰는
+요청마다 뷰 전체가 sync_to_async 스레드로 넘어가지만, 이 뷰들은 이벤트
+루프에서 실행되고 비동기 ORM(aget, afirst, async for)과 비동기 캐시 API만
+호출합니다. 쓰기 요청(POST/PUT/PATCH/DELETE)은 기존 동기 API 뷰에 넘깁니다.
+
+WSGI에서는 비동기 뷰마다 이벤트 루프를 새로 만들어야 하므로 동기 뷰를
+그대로 쓰는 편이 빠릅니다.
+"""
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
+from django.http import Http404
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import require_http_methods
+from . import api, conditional, stats, tags, views
+from . import cache as list_cache
+from .models import LIST_FIELDS, Memo
+from .pagination import CursorPaginator, InvalidCursor
+
+
+async def _resolve_user(request):
+    """사용자를 비동기로 불러와 request.user를 바꿔 둠
+
+    request.user는 처음 접근할 때 동기로 세션과 사용자를 조회하는 지연 객체라
+    이벤트 루프에서 템플릿({{ user }}) 등이 접근하면 SynchronousOnlyOperation이
+    발생합니다. Django의 login_required는 request.auser()만 확인하므로
+    이미 불러온 사용자로 교체합니다.
+    """
+    request.user = await request.auser()
+    return request.user
+
+
+async def _render(request, template_name, context):
+    """템플릿 렌더링, 컨텍스트 프로세서가 쓰는 메모 통계는 미리 비동기로 불러 둠"""
+    if getattr(request, "memo_stats", None) is None:
+        request.memo_stats = await stats.aget_stats(request.user.pk)
+    return render(request, template_name, context)
+
+
+def async_login_required(view):
+    """비동기 뷰용 login_required"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await _resolve_user(request)
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+def async_api_view(view):
+    """비동기 뷰용 api_view (401 JSON 응답과 ApiError 처리)"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await _resolve_user(request)
+        if not user.is_authenticated:
+            return api.json_response({"error": "로그인이 필요합니다."}, status=401)
+        try:
+            return await view(request, *args, **kwargs)
+        except api.ApiError as error:
+            return api.json_response({"error": error.message}, status=error.status)
+    return wrapper
+
+
+@async_login_required
+async def memo_list(request):
+    """메모 목록 뷰 (views.memo_list의 비동기 버전)"""
+    cursor = request.GET.get("cursor", "")
+    names, match_all = tags.filter_params(request.GET)
+    tag_filter = tags.filter_key(names, match_all)
+    etag, last_modified = await conditional.alist_validators(request, cursor, tag_filter)
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    timeout = list_cache.get_timeout()
+    cache_key = (
+        await list_cache.alist_page_key(request.user.pk, cursor, tag_filter) if timeout else None
+    )
+    items_html = await cache.aget(cache_key) if cache_key else None
+    list_cache.list_cache_stats.record(hit=items_html is not None)
+    context = views.tag_filter_context(names, match_all)
+    if items_html is None:
+        queryset = await tags.atagged_memos(request.user, names, match_all)
+        paginator = CursorPaginator(queryset.for_list())
+        try:
+            page = await paginator.apage(cursor)
+        except InvalidCursor:
+            page = await paginator.apage()
+        # memo_tags는 모델이 없어 SQL로 읽으므로 스레드에서 실행
+        await sync_to_async(tags.attach_tag_names)(page.object_list)
+        context.update({"memos": page.object_list, "page": page})
+        items_html = render_to_string("memos/memo_list_items.html", context, request)
+        if cache_key:
+            await cache.aset(cache_key, items_html, timeout)
+        cache_status = "miss"
+    else:
+        cache_status = "hit"
+    context["items_html"] = mark_safe(items_html)
+    summary = [tag async for tag in tags.tag_summary(request.user)]
+    context["tag_summary"] = views.tag_summary_links(summary, names, match_all)
+    response = await _render(request, "memos/memo_list.html", context)
+    response["X-Memo-List-Cache"] = cache_status
+    return conditional.set_validators(response, etag, last_modified)
+
+
+@async_login_required
+async def memo_detail(request, pk):
+    """메모 상세 뷰 (views.memo_detail의 비동기 버전)"""
+    validators = await conditional.amemo_validators(request.user, pk)
+    if validators is None:
+        raise Http404("메모를 찾을 수 없습니다.")
+    response = conditional.not_modified(request, *validators)
+    if response is not None:
+        return response
+    try:
+        memo = await Memo.objects.aget(pk=pk, user=request.user)
+    except Memo.DoesNotExist:
+        raise Http404("메모를 찾을 수 없습니다.")
+    await sync_to_async(tags.attach_tag_names)([memo])
+    response = await _render(request, "memos/memo_detail.html", {"memo": memo})
+    return conditional.set_validators(response, *validators)
+
+
+@require_http_methods(["GET", "POST"])
+@async_api_view
+async def memo_collection(request):
+    """메모 목록 조회 API (api.memo_collection의 비동기 버전)"""
+    if request.method != "GET":
+        return await sync_to_async(api.memo_collection)(request)
+    fields = api.requested_fields(request, LIST_FIELDS)
+    names, match_all = tags.filter_params(request.GET)
+    queryset = (await tags.atagged_memos(request.user, names, match_all)).only(
+        *api.model_fields(fields), "created_at"
+    )
+    try:
+        page = await CursorPaginator(queryset).apage(request.GET.get("cursor"))
+    except InvalidCursor:
+        raise api.ApiError("올바르지 않은 커서입니다.")
+    if "tags" in fields:
+        await sync_to_async(tags.attach_tag_names)(page.object_list)
+    return api.json_response({
+        "results": [api.serialize_memo(memo, fields) for memo in page],
+        "next_cursor": page.next_cursor,
+    })
+
+
+@require_http_methods(["GET", "PUT", "PATCH", "DELETE"])
+@async_api_view
+async def memo_resource(request, pk):
+    """메모 상세 조회 API (api.memo_resource의 비동기 버전)"""
+    if request.method != "GET":
+        return await sync_to_async(api.memo_resource)(request, pk)
+    fields = api.requested_fields(request, api.MEMO_FIELDS)
+    try:
+        memo = await Memo.objects.only(*api.model_fields(fields)).aget(pk=pk, user=request.user)
+    except Memo.DoesNotExist:
+        raise api.ApiError("메모를 찾을 수 없습니다.", status=404)
+    if "tags" in fields:
+        await sync_to_async(tags.attach_tag_names)([memo])
+    return api.json_response(api.serialize_memo(memo, fields))
@@ -0,0 +1,118 @@
+"""사용자별 메모 목록 캐시
+
+렌더링된 메모 목록 조각(카드와 페이지 이동 링크)을 사용자, 목록 버전,
+커서, 태그 필터별로 캐시합니다. 메모가 저장/삭제/일괄 수정되면 시그널 수신기가
+사용자의 목록 버전을 바꾸므로, 이전 버전의 캐시는 더 이상 조회되지 않고 만료
+시간이 지나면 사라집니다. 버전은 바로 한 번, 트랜잭션이 커밋된 뒤 한 번 더
+바꿉니다. 커밋 전 사이에 다른 요청이 아직 바뀌지 않은 목록을 새 버전으로 캐시해도
+커밋 후의 변경으로 버려집니다.
+
+목록 버전은 default 캐시에 있으므로 여러 프로세스로 실행하면 default 캐시가
+공유 캐시여야 한 프로세스의 변경이 다른 프로세스의 목록 캐시도 무효화합니다
+(prod 프로필). Django 캐시 API(get/set/add)만 사용하므로 locmem, 파일 기반,
+redis 등 설정된 어떤 캐시 백엔드에서도 동작합니다.
+"""
+import hashlib
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+DEFAULT_TIMEOUT = 300
+
+
+def get_timeout():
+    """목록 캐시 만료 시간(초), 0이면 캐시를 사용하지 않음"""
+    return getattr(settings, "MEMO_LIST_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def _version_key(user_id):
+    return f"memos:list-version:{user_id}"
+
+
+def get_list_version(user_id):
+    """사용자의 현재 목록 버전"""
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        # 버전 키가 밀려나도 이전 캐시와 겹치지 않도록 시각 기반 초기값 사용
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_list_version(user_id):
+    """get_list_version()의 비동기 버전"""
+    key = _version_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_list_version(user_id):
+    """사용자의 목록 버전을 새 값으로 바꿔 캐시된 목록을 무효화
+
+    파일 캐시 등의 incr()은 읽고 쓰는 두 단계라 동시에 올리면 한쪽이 사라지므로
+    매번 새 값(시각)을 씁니다.
+    """
+    cache.set(_version_key(user_id), time.time_ns(), None)
+
+
+def invalidate_list(user_id, using=None):
+    """목록 버전을 바로 바꾸고, 트랜잭션 안이면 커밋된 뒤 한 번 더 바꿈"""
+    bump_list_version(user_id)
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(lambda: bump_list_version(user_id), using=using)
+
+
+def list_page_key(user_id, cursor="", tag_filter=""):
+    """목록 한 페이지의 캐시 키 (tag_filter는 tags.filter_key()의 값)"""
+    return _page_key(user_id, get_list_version(user_id), cursor, tag_filter)
+
+
+async def alist_page_key(user_id, cursor="", tag_filter=""):
+    """list_page_key()의 비동기 버전"""
+    return _page_key(user_id, await aget_list_version(user_id), cursor, tag_filter)
+
+
+def _page_key(user_id, version, cursor, tag_filter):
+    cursor_hash = hashlib.md5(f"{cursor}|{tag_filter}".encode()).hexdigest()
+    return f"memos:list:{user_id}:{version}:{cursor_hash}"
+
+
+class CacheStats:
+    """프로세스 단위 캐시 적중/실패 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        """적중 여부를 기록"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def reset(self):
+        """카운터 초기화"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def as_dict(self):
+        """카운터와 적중률을 딕셔너리로 반환"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+list_cache_stats = CacheStats()
@@ -0,0 +1,108 @@
+"""긴 메모 본문의 청크 저장과 부분 읽기
+
+settings.MEMO_CONTENT_CHUNK_SIZE 글자보다 긴 본문은 저장할 때 청크로 나뉩니다
+(Memo.save, MemoQuerySet.bulk_create). 0번 청크는 Memo.content에 그대로 두므로
+목록 요약과 수정 폼은 첫 청크만 다루고, 1번 이후 청크는 MemoChunk에 하나씩
+(큰 청크는 압축해서) 저장됩니다. 검색 색인은 청크마다 한 행이고(search.py),
+수정 기록은 고친 청크 번호와 그 청크의 델타를 남기므로(revisions.py), 청크
+하나를 고칠 때 드는 색인과 기록 비용은 메모 전체가 아니라 그 청크 크기에
+비례합니다. 기록을 복원하면 replace_content()로 청크 전체를 다시 씁니다.
+
+memo_detail은 첫 청크만 렌더링하고 나머지는 청크 읽기 엔드포인트로 하나씩
+불러오므로, 요청 하나가 메모리에 올리는 본문은 청크 하나 분량입니다.
+청크 하나를 고쳐도 그 청크 행만 다시 쓰며, 고친 청크가 청크 크기보다 길어지면
+뒤에 새 청크를 끼워 넣고 비우면 청크를 지웁니다.
+"""
+from django.db import router, transaction
+from .models import Memo, MemoChunk, content_size, split_content
+from .signals import memo_chunk_edited, memo_chunks_written
+
+
+def read_chunk(memo, number):
+    """number번 청크의 본문, 없으면 MemoChunk.DoesNotExist"""
+    if not 0 <= number < memo.chunk_count:
+        raise MemoChunk.DoesNotExist
+    if number == 0:
+        return Memo.objects.filter(pk=memo.pk).values_list("content", flat=True).get()
+    return MemoChunk.objects.filter(memo_id=memo.pk, number=number).values_list(
+        "content", flat=True
+    ).get()
+
+
+def write_chunk(memo, number, text):
+    """number번 청크만 text로 바꾸고 메모의 본문 크기와 수정일시를 갱신
+
+    0번 청크는 Memo.content이므로 save()가 요약, 검색 색인, 수정 기록까지
+    갱신합니다. 1번 이후 청크는 save()가 본문을 다루지 않으므로 바뀐 청크 행을
+    memo_chunks_written으로(검색 색인), 고치기 전후의 청크 본문을
+    memo_chunk_edited로(수정 기록) 알립니다. 빈 문자열로 바꾸면 그 청크를 지웁니다.
+    """
+    if not 0 <= number < memo.chunk_count:
+        raise MemoChunk.DoesNotExist
+    if number == 0:
+        memo.content = text
+        memo.save(update_fields=["content", "updated_at"])
+        return memo
+    with transaction.atomic(using=router.db_for_write(MemoChunk)):
+        chunks = MemoChunk.objects.filter(memo_id=memo.pk)
+        # 본문 크기는 저장된 값에서 바꾸기 전 청크만큼 빼고 새 청크만큼 더함
+        pk, old_text, size = chunks.filter(number=number).values_list(
+            "pk", "content", "memo__size"
+        ).get()
+        memo.size = size - content_size([old_text])
+        if not text:
+            new = []
+            chunks.filter(pk=pk).delete()
+            chunks.shift(memo.pk, number, -1)
+            memo.chunk_count -= 1
+            memo_chunks_written.send(sender=MemoChunk, chunks=[], removed=[pk])
+        else:
+            new = split_content(text)
+            first, *extra = new
+            chunks.filter(pk=pk).update(content=first)
+            memo_chunks_written.send(
+                sender=MemoChunk,
+                chunks=[MemoChunk(pk=pk, memo=memo, number=number, content=first)],
+                removed=[],
+            )
+            if extra:
+                chunks.insert(memo, number, extra)
+                memo.chunk_count += len(extra)
+            memo.size += content_size(new)
+        memo.save(update_fields=["chunk_count", "size", "updated_at"])
+        memo_chunk_edited.send(sender=Memo, memo=memo, number=number, old=old_text, new=new)
+    return memo
+
+
+def replace_content(memo, text, update_fields=()):
+    """본문 전체를 text로 바꿔 저장 (나머지 청크를 지우고 다시 나눔)
+
+    save()는 청크로 나뉜 메모의 content를 첫 청크로 다루므로, 수정 기록 복원처럼
+    전체 본문을 바꿀 때 씁니다. update_fields로 함께 저장할 필드를 더합니다.
+    """
+    with transaction.atomic(using=router.db_for_write(Memo, instance=memo)):
+        if memo.chunk_count > 1:
+            rest = MemoChunk.objects.filter(memo_id=memo.pk)
+            removed = list(rest.values_list("pk", flat=True))
+            rest.delete()
+            memo_chunks_written.send(sender=MemoChunk, chunks=[], removed=removed)
+            memo.chunk_count = 1
+        memo.content = text
+        memo.save(update_fields=[*update_fields, "content", "chunk_count", "updated_at"])
+    return memo
+
+
+def iter_content(memo_id, first):
+    """첫 청크 first 뒤로 나머지 청크를 하나씩 읽어 차례로 반환"""
+    yield first
+    yield from (
+        MemoChunk.objects.filter(memo_id=memo_id)
+        .order_by("number")
+        .values_list("content", flat=True)
+        .iterator(chunk_size=1)
+    )
+
+
+def full_content(memo_id, first):
+    """모든 청크를 이어 붙인 전체 본문 (내보내기 등 전체가 필요한 경우에만 사용)"""
+    return "".join(iter_content(memo_id, first))
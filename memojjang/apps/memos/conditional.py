@@ -0,0 +1,99 @@
+"""메모 페이지의 HTTP 조건부 요청(ETag / Last-Modified) 처리
+
+클라이언트가 가진 사본이 최신이면 템플릿을 렌더링하지 않고 304를 반환합니다.
+
+- 상세: 메모의 updated_at 한 컬럼만 조회해 검증자를 만듭니다.
+- 목록: ETag는 DB 상태인 MAX(updated_at)과 메모 수(MemoStats), 커서, 태그
+  필터로 만들고, Last-Modified는 MAX(updated_at)으로 만듭니다. MAX(updated_at)은
+  (user_id, updated_at) 인덱스를, 메모 수는 user_id 유니크 인덱스를 타므로 매번
+  조회합니다. 프로세스마다 다를 수 있는 캐시(목록 버전)에 기대지 않으므로 다른
+  워커가 바뀐 목록에 304를 돌려주지 않습니다. 수정은 updated_at을, 삭제는 메모
+  수를 바꿉니다.
+"""
+import hashlib
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from . import stats
+from .models import Memo
+
+
+def _etag(*parts):
+    digest = hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value else None
+
+
+def memo_validators(user, pk):
+    """메모 상세의 (ETag, Last-Modified 타임스탬프), 메모가 없으면 None"""
+    updated_at = _memo_updated_at(user, pk).first()
+    return _memo_validators(user, pk, updated_at)
+
+
+async def amemo_validators(user, pk):
+    """memo_validators()의 비동기 버전"""
+    updated_at = await _memo_updated_at(user, pk).afirst()
+    return _memo_validators(user, pk, updated_at)
+
+
+def _memo_updated_at(user, pk):
+    return Memo.objects.filter(pk=pk, user=user).values_list("updated_at", flat=True)
+
+
+def _memo_validators(user, pk, updated_at):
+    if updated_at is None:
+        return None
+    return _etag("memo", user.pk, pk, updated_at.isoformat()), _timestamp(updated_at)
+
+
+def list_validators(request, cursor="", tag_filter=""):
+    """메모 목록 한 페이지의 (ETag, Last-Modified 타임스탬프)
+
+    읽은 통계 행은 request.memo_stats에 두어 컨텍스트 프로세서가 다시 읽지 않게 합니다.
+    """
+    user = request.user
+    last_updated = _last_updated(user).aggregate(last_updated=Max("updated_at"))["last_updated"]
+    request.memo_stats = stats.get_stats(user.pk)
+    return _list_validators(user, cursor, tag_filter, last_updated, request.memo_stats.memo_count)
+
+
+async def alist_validators(request, cursor="", tag_filter=""):
+    """list_validators()의 비동기 버전"""
+    user = request.user
+    last_updated = (await _last_updated(user).aaggregate(
+        last_updated=Max("updated_at")
+    ))["last_updated"]
+    request.memo_stats = await stats.aget_stats(user.pk)
+    return _list_validators(user, cursor, tag_filter, last_updated, request.memo_stats.memo_count)
+
+
+def _last_updated(user):
+    return Memo.objects.filter(user=user).order_by()
+
+
+def _list_validators(user, cursor, tag_filter, last_updated, memo_count):
+    last_modified = last_updated.isoformat() if last_updated else ""
+    etag = _etag("list", user.pk, last_modified, memo_count, cursor, tag_filter)
+    return etag, _timestamp(last_updated)
+
+
+def not_modified(request, etag, last_modified):
+    """클라이언트 사본이 최신이면 304 응답을, 아니면 None을 반환"""
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    """응답에 검증자 헤더를 설정하고 매번 재검증하도록 지정"""
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
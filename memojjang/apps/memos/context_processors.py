@@ -0,0 +1,19 @@
+"""메모 템플릿 컨텍스트 프로세서"""
+from django.utils.functional import SimpleLazyObject
+from . import stats
+
+
+def memo_stats(request):
+    """로그인한 사용자의 메모 통계(MemoStats)를 memo_stats로 제공
+
+    템플릿이 처음 읽을 때 통계 행 하나를 user_id 유니크 인덱스로 조회하고,
+    읽지 않는 페이지에서는 조회하지 않습니다. 비동기 뷰는 이벤트 루프에서
+    동기 조회를 할 수 없으므로 렌더링 전에 request.memo_stats에 불러 둡니다.
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return {}
+    preloaded = getattr(request, "memo_stats", None)
+    if preloaded is not None:
+        return {"memo_stats": preloaded}
+    return {"memo_stats": SimpleLazyObject(lambda: stats.get_stats(user.pk))}
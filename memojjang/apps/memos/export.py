@@ -0,0 +1,100 @@
+"""메모 내보내기 (NDJSON / CSV 스트리밍)
+
+메모를 서버 측 이터레이터(.iterator(chunk_size=...))로 읽어 생성기로 바로
+직렬화하므로, 메모 수와 관계없이 메모리 사용량이 일정합니다.
+청크로 나눠 저장한 긴 본문은 이어 붙여 전체 본문으로 내보냅니다.
+"""
+import csv
+import json
+import zlib
+from . import chunks
+from .models import Memo
+
+EXPORT_FIELDS = (
+    "id", "title", "content", "reminder_date", "is_reminded", "created_at", "updated_at"
+)
+FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+CHUNK_SIZE = 2000
+# 너무 잘게 쪼개 쓰지 않도록 이 크기만큼 모아서 내보냄
+BUFFER_SIZE = 64 * 1024
+
+
+def _value(value):
+    """JSON/CSV로 쓸 수 있는 값으로 변환"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def export_rows(user, chunk_size=CHUNK_SIZE):
+    """사용자의 메모를 id 순서로 한 행씩 읽는 이터레이터"""
+    rows = (
+        Memo.objects.filter(user=user)
+        .order_by("pk")
+        .values_list(*EXPORT_FIELDS, "chunk_count")
+        .iterator(chunk_size=chunk_size)
+    )
+    content_index = EXPORT_FIELDS.index("content")
+    for *row, chunk_count in rows:
+        if chunk_count > 1:
+            row[content_index] = chunks.full_content(row[0], row[content_index])
+        yield row
+
+
+def ndjson_lines(rows):
+    """행마다 JSON 객체 한 줄을 생성"""
+    for row in rows:
+        record = {field: _value(value) for field, value in zip(EXPORT_FIELDS, row)}
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+class _Echo:
+    """csv.writer가 쓴 값을 그대로 돌려주는 의사 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    """헤더와 행마다 CSV 한 줄을 생성 (엑셀 호환을 위해 BOM으로 시작)"""
+    writer = csv.writer(_Echo())
+    yield "\ufeff" + writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([_value(value) for value in row])
+
+
+def encode_chunks(lines, buffer_size=BUFFER_SIZE):
+    """문자열 줄을 UTF-8로 인코딩해 buffer_size 단위로 묶음"""
+    buffer = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= buffer_size:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def gzip_chunks(chunks):
+    """바이트 조각을 gzip 형식으로 스트리밍 압축"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(user, export_format="ndjson", compress=False, chunk_size=CHUNK_SIZE):
+    """사용자의 메모를 지정한 형식의 바이트 스트림으로 내보냄"""
+    rows = export_rows(user, chunk_size=chunk_size)
+    lines = csv_lines(rows) if export_format == "csv" else ndjson_lines(rows)
+    chunks = encode_chunks(lines)
+    return gzip_chunks(chunks) if compress else chunks
@@ -0,0 +1,70 @@
+"""메모 모델 필드
+
+CompressedTextField는 settings.MEMO_CONTENT_COMPRESS_MIN_BYTES 이상인 텍스트를
+zlib으로 압축한 BLOB으로, 그보다 짧은 텍스트는 그대로 TEXT로 같은 컬럼에
+저장합니다. SQLite 컬럼은 행마다 다른 저장 형식을 가질 수 있으므로 스키마는
+TextField와 같고, 기존 행은 compress_memo_content 명령으로 배치 단위로 바꿉니다.
+
+압축은 저장할 때만(get_db_prep_save) 하므로 조회 조건의 값은 그대로 쓰이며,
+압축된 행은 LIKE 등 컬럼 내용에 대한 SQL 조건에 걸리지 않습니다 (검색은 FTS
+색인을 사용). 압축 해제는 컬럼을 읽을 때만 일어나므로 본문을 제외하고 읽는
+목록 조회(for_list, ?fields=)에서는 일어나지 않습니다.
+"""
+import zlib
+from django.conf import settings
+from django.db import models
+
+DEFAULT_COMPRESS_MIN_BYTES = 4096
+COMPRESSION_LEVEL = 6
+
+
+def get_compress_min_bytes():
+    """압축해 저장할 최소 UTF-8 바이트 수 (None이면 압축하지 않음)"""
+    return getattr(settings, "MEMO_CONTENT_COMPRESS_MIN_BYTES", DEFAULT_COMPRESS_MIN_BYTES)
+
+
+def compress_text(value, min_bytes):
+    """min_bytes 이상이고 압축해서 작아지면 압축한 바이트를, 아니면 value를 반환"""
+    # 한 글자는 UTF-8로 최대 4바이트이므로 짧은 텍스트는 인코딩하지 않고 넘김
+    if not isinstance(value, str) or min_bytes is None or len(value) * 4 < min_bytes:
+        return value
+    data = value.encode()
+    if len(data) < min_bytes:
+        return value
+    compressed = zlib.compress(data, COMPRESSION_LEVEL)
+    return compressed if len(compressed) < len(data) else value
+
+
+def decompress_text(value):
+    """압축된 바이트면 풀어서 문자열로, 아니면 그대로 반환"""
+    if isinstance(value, (bytes, memoryview)):
+        return zlib.decompress(value).decode()
+    return value
+
+
+class CompressedTextField(models.TextField):
+    """큰 값을 zlib으로 압축해 저장하는 TextField"""
+
+    description = "큰 값을 압축해 저장하는 텍스트"
+
+    def __init__(self, *args, compress_min_bytes=None, **kwargs):
+        self.compress_min_bytes = compress_min_bytes
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.compress_min_bytes is not None:
+            kwargs["compress_min_bytes"] = self.compress_min_bytes
+        return name, path, args, kwargs
+
+    def get_min_bytes(self):
+        if self.compress_min_bytes is not None:
+            return self.compress_min_bytes
+        return get_compress_min_bytes()
+
+    def from_db_value(self, value, expression, connection):
+        return decompress_text(value)
+
+    def get_db_prep_save(self, value, connection):
+        value = super().get_db_prep_save(value, connection)
+        return compress_text(value, self.get_min_bytes())
@@ -0,0 +1,188 @@
+"""메모 가져오기 (NDJSON / CSV 스트리밍)
+
+업로드된 파일을 한 줄씩 읽어 MemoForm으로 검증하고, batch_size개씩 모아
+bulk_create로 저장합니다. 파일 전체를 메모리에 올리지 않으므로 파일 크기와
+관계없이 메모리 사용량은 배치 하나 분량으로 유지됩니다.
+내보내기(export.py)가 만든 파일(.gz 포함)을 그대로 가져올 수 있습니다.
+"""
+import csv
+import gzip
+import io
+import json
+import time
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from .models import Memo
+from ...forms import MemoForm
+
+FORMATS = ("ndjson", "csv")
+DEFAULT_BATCH_SIZE = 1000
+# 결과에 담는 행 단위 오류의 최대 개수 (전체 실패 수는 따로 셈)
+MAX_REPORTED_ERRORS = 100
+TRUE_VALUES = ("1", "true", "yes", "on")
+# CSV 필드 하나의 최대 글자 수 (csv 모듈 기본값 131072보다 긴 본문도 내보내므로 늘림)
+CSV_FIELD_SIZE_LIMIT = 256 * 1024 * 1024
+
+
+def get_batch_size():
+    """한 번에 저장할 메모 수"""
+    return getattr(settings, "MEMO_IMPORT_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+
+
+def detect_format(filename):
+    """파일 이름으로 (형식, gzip 압축 여부)를 추정"""
+    name = (filename or "").lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    export_format = "csv" if name.endswith(".csv") else "ndjson"
+    return export_format, compressed
+
+
+def open_text(stream, compressed=False):
+    """바이너리 스트림을 한 줄씩 읽을 수 있는 텍스트 스트림으로 감쌈 (BOM 제거)"""
+    if compressed:
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+
+def ndjson_records(lines):
+    """(줄 번호, 레코드 또는 오류 메시지)를 한 줄씩 생성"""
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, "올바른 JSON이 아닙니다."
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "JSON 객체가 아닙니다."
+            continue
+        yield line_number, record
+
+
+def csv_records(lines):
+    """헤더를 기준으로 (줄 번호, 레코드)를 한 행씩 생성
+
+    한도를 넘는 필드나 깨진 행은 csv.Error를 냅니다.
+    """
+    # field_size_limit은 프로세스 전체 값이므로, 다른 스레드가 읽는 중에 되돌려
+    # 한도가 줄어들지 않도록 올리기만 함
+    if csv.field_size_limit() < CSV_FIELD_SIZE_LIMIT:
+        csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
+    reader = csv.DictReader(lines)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def read_records(stream, export_format="ndjson", compressed=False):
+    """바이너리 스트림에서 형식에 맞게 레코드를 읽는 이터레이터"""
+    lines = open_text(stream, compressed)
+    if export_format == "csv":
+        return csv_records(lines)
+    return ndjson_records(lines)
+
+
+def _form_data(record):
+    """레코드에서 MemoForm이 검증할 값만 꺼냄"""
+    return {
+        field: "" if record.get(field) is None else record[field]
+        for field in MemoForm._meta.fields
+    }
+
+
+def _is_reminded(value):
+    """JSON 불리언이나 CSV 문자열을 완료 여부로 변환"""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+class ImportResult:
+    """가져오기 결과와 처리량"""
+
+    def __init__(self, max_errors=MAX_REPORTED_ERRORS):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.max_errors = max_errors
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add_error(self, line, errors):
+        """행 단위 오류를 기록 (최대 max_errors개까지만 보관)"""
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "errors": errors})
+
+    def finish(self):
+        """경과 시간을 기록"""
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self):
+        """초당 처리한 행 수 (진행 중이면 지금까지의 처리량)"""
+        elapsed = self.elapsed or time.perf_counter() - self.started
+        if not elapsed:
+            return 0.0
+        return (self.created + self.failed) / elapsed
+
+    def as_dict(self):
+        """결과를 딕셔너리로 반환"""
+        return {
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def _flush(batch, result):
+    """한 배치를 세이브포인트 안에서 저장, 실패하면 배치의 모든 행을 오류로 기록"""
+    try:
+        with transaction.atomic():
+            Memo.objects.bulk_create([memo for _, memo in batch])
+    except DatabaseError as error:
+        for line, _ in batch:
+            result.add_error(line, {"__all__": [f"저장 실패: {error}"]})
+    else:
+        result.created += len(batch)
+
+
+def import_memos(user, records, batch_size=None, max_errors=MAX_REPORTED_ERRORS, on_batch=None):
+    """레코드를 검증해 사용자의 메모로 저장하고 ImportResult를 반환
+
+    records는 (줄 번호, 레코드 딕셔너리 또는 오류 메시지)의 이터러블입니다.
+    on_batch가 주어지면 배치를 저장할 때마다 결과와 함께 호출합니다.
+    """
+    batch_size = batch_size or get_batch_size()
+    result = ImportResult(max_errors=max_errors)
+    batch = []
+    for line, record in records:
+        if isinstance(record, str):
+            result.add_error(line, {"__all__": [record]})
+            continue
+        form = MemoForm(data=_form_data(record))
+        if not form.is_valid():
+            result.add_error(line, {
+                field: [error["message"] for error in errors]
+                for field, errors in form.errors.get_json_data().items()
+            })
+            continue
+        memo = form.save(commit=False)
+        memo.user = user
+        memo.is_reminded = _is_reminded(record.get("is_reminded"))
+        batch.append((line, memo))
+        if len(batch) >= batch_size:
+            _flush(batch, result)
+            batch = []
+            if on_batch:
+                on_batch(result)
+    if batch:
+        _flush(batch, result)
+        if on_batch:
+            on_batch(result)
+    result.finish()
+    return result
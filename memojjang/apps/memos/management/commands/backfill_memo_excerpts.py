@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from ...models import Memo, make_excerpt
+
+
+class Command(BaseCommand):
+    """요약이 비어 있는 기존 메모의 요약을 배치 단위로 채우는 명령"""
+
+    help = "요약(excerpt)이 비어 있는 메모의 요약을 배치 단위로 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 메모 수 (기본값: 1000)"
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="요약이 이미 있는 메모도 다시 생성"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = Memo.objects.only("id", "content").order_by("pk")
+        if not options["all"]:
+            queryset = queryset.filter(excerpt="")
+
+        # pk 기준으로 구간을 나눠 한 배치씩 읽고 갱신
+        last_pk = 0
+        updated = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            for memo in batch:
+                memo.excerpt = make_excerpt(memo.content)
+            # 요약은 파생 데이터이므로 사용자에게 보이는 수정일시는 바꾸지 않음
+            Memo.objects.bulk_update(batch, ["excerpt"], touch=False)
+            last_pk = batch[-1].pk
+            updated += len(batch)
+            self.stdout.write(f"{updated}개 처리 (마지막 id: {last_pk})")
+
+        self.stdout.write(self.style.SUCCESS(f"요약 생성 완료: {updated}개"))
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import BinaryField, CharField, Func, Value
+from django.db.models.functions import Cast, Length
+from ...fields import compress_text, get_compress_min_bytes
+from ...models import Memo
+
+
+class Command(BaseCommand):
+    """압축하지 않고 저장된 큰 메모 본문을 배치 단위로 압축하는 명령
+
+    QuerySet.update()로 본문 컬럼만 바꾸므로 수정일시, 목록 캐시, 검색 색인,
+    수정 기록은 그대로입니다.
+    """
+
+    help = "MEMO_CONTENT_COMPRESS_MIN_BYTES 이상인 메모 본문을 배치 단위로 압축해 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 메모 수 (기본값: 1000)"
+        )
+
+    def handle(self, *args, **options):
+        min_bytes = get_compress_min_bytes()
+        if min_bytes is None:
+            raise CommandError("MEMO_CONTENT_COMPRESS_MIN_BYTES가 None이면 압축하지 않습니다.")
+        batch_size = options["batch_size"]
+        # 아직 TEXT로 저장된 행 중 UTF-8 크기가 기준 이상인 행만 읽음
+        queryset = Memo.objects.alias(
+            storage=Func("content", function="typeof", output_field=CharField()),
+            stored_bytes=Length(Cast("content", BinaryField())),
+        ).filter(storage="text", stored_bytes__gte=min_bytes).only("id", "content").order_by("pk")
+
+        last_pk = 0
+        compressed = 0
+        before = after = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                for memo in batch:
+                    data = compress_text(memo.content, min_bytes)
+                    if isinstance(data, str):
+                        # 압축해도 작아지지 않는 본문은 그대로 둠
+                        continue
+                    Memo.objects.filter(pk=memo.pk).update(
+                        content=Value(data, output_field=BinaryField())
+                    )
+                    compressed += 1
+                    before += len(memo.content.encode())
+                    after += len(data)
+            last_pk = batch[-1].pk
+            self.stdout.write(f"{compressed}개 압축 (마지막 id: {last_pk})")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"본문 압축 완료: {compressed}개, {before:,}바이트 → {after:,}바이트"
+        ))
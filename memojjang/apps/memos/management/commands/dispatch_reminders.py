@@ -0,0 +1,57 @@
+import logging
+import time
+from django.core.management.base import BaseCommand
+from ... import reminders
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """발송 시각이 지난 메모 리마인드를 발송하는 명령"""
+
+    help = "발송 시각이 지난 리마인드를 배치 단위로 선점해 발송합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="한 번에 선점할 리마인드 수 (기본값: 100)"
+        )
+        parser.add_argument(
+            "--backend",
+            help="리마인드 백엔드 경로 (기본값: settings.MEMO_REMINDER_BACKEND)"
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기적으로 발송하는 작업자로 실행"
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=30.0,
+            help="--loop 실행 시 발송 확인 간격(초) (기본값: 30)"
+        )
+
+    def handle(self, *args, **options):
+        backend = reminders.get_backend(options["backend"])
+        while True:
+            try:
+                sent = reminders.dispatch_due_reminders(
+                    backend=backend, batch_size=options["batch_size"]
+                )
+            except Exception:
+                if not options["loop"]:
+                    raise
+                # 실패한 배치는 선점이 취소되었으므로 작업자를 멈추지 않고 다음 확인 때 다시 시도
+                logger.exception("리마인드 발송 실패, %s초 뒤 다시 시도합니다.", options["interval"])
+                sent = 0
+            if sent or not options["loop"]:
+                self.stdout.write(f"리마인드 {sent}건 발송")
+            if not options["loop"]:
+                break
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                break
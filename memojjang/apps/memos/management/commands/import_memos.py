@@ -0,0 +1,69 @@
+import csv
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from ... import importer
+
+
+class Command(BaseCommand):
+    """NDJSON/CSV 파일의 메모를 사용자에게 가져오는 명령"""
+
+    help = "NDJSON 또는 CSV 파일(.gz 가능)을 스트리밍으로 읽어 메모를 배치 단위로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 파일 경로")
+        parser.add_argument("--user", required=True, help="메모를 소유할 사용자 이름")
+        parser.add_argument(
+            "--format",
+            choices=importer.FORMATS,
+            help="파일 형식 (기본값: 파일 확장자로 추정)"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="한 번에 저장할 메모 수 (기본값: settings.MEMO_IMPORT_BATCH_SIZE)"
+        )
+        parser.add_argument(
+            "--max-errors",
+            type=int,
+            default=importer.MAX_REPORTED_ERRORS,
+            help="출력할 행 단위 오류의 최대 개수 (기본값: 100)"
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"사용자를 찾을 수 없습니다: {options['user']}")
+
+        export_format, compressed = importer.detect_format(options["path"])
+        export_format = options["format"] or export_format
+
+        def report(result):
+            self.stdout.write(
+                f"{result.created}개 저장, {result.failed}개 실패 "
+                f"({result.rows_per_second:.0f} rows/s)"
+            )
+
+        try:
+            with open(options["path"], "rb") as stream:
+                records = importer.read_records(stream, export_format, compressed)
+                result = importer.import_memos(
+                    user,
+                    records,
+                    batch_size=options["batch_size"],
+                    max_errors=options["max_errors"],
+                    on_batch=report,
+                )
+        except (UnicodeDecodeError, OSError, EOFError, csv.Error) as error:
+            raise CommandError(f"파일을 읽을 수 없습니다: {error}")
+
+        for error in result.errors:
+            messages = "; ".join(
+                f"{field}: {' '.join(texts)}" for field, texts in error["errors"].items()
+            )
+            self.stderr.write(f"{error['line']}번째 줄: {messages}")
+        self.stdout.write(self.style.SUCCESS(
+            f"가져오기 완료: {result.created}개 저장, {result.failed}개 실패, "
+            f"{result.elapsed:.1f}초 ({result.rows_per_second:.0f} rows/s)"
+        ))
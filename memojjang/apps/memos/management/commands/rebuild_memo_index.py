@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from ... import search
+
+
+class Command(BaseCommand):
+    """메모 전문 검색 색인을 처음부터 다시 만드는 명령"""
+
+    help = "메모 전문 검색(FTS5) 색인을 비우고 모든 메모를 배치 단위로 다시 색인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 색인할 메모 수 (기본값: 1000)"
+        )
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError("전문 검색은 SQLite 데이터베이스에서만 지원됩니다.")
+
+        indexed = 0
+        for indexed in search.rebuild_index(batch_size=options["batch_size"]):
+            self.stdout.write(f"{indexed}개 색인")
+        self.stdout.write(self.style.SUCCESS(f"색인 재생성 완료: {indexed}개"))
@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from ... import stats
+
+
+class Command(BaseCommand):
+    """사용자별 메모 통계를 memos와 비교해 어긋난 값을 배치 단위로 고치는 명령"""
+
+    help = "사용자별 메모 통계(메모 수, 대기 리마인드 수, 본문 사용량)를 다시 세어 확인하고 고칩니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 확인할 사용자 수 (기본값: 500)"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="어긋난 통계를 보고만 하고 고치지 않음"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        repair = not options["dry_run"]
+        users = get_user_model().objects.order_by("pk").values_list("pk", flat=True)
+
+        # pk 기준으로 사용자를 나눠 한 배치씩 한 트랜잭션에서 비교하고 고침
+        last_pk = 0
+        checked = 0
+        drifted = 0
+        while True:
+            user_ids = list(users.filter(pk__gt=last_pk)[:batch_size])
+            if not user_ids:
+                break
+            for user_id, stored, actual in stats.reconcile(user_ids, repair=repair):
+                self.stdout.write(f"사용자 {user_id}: 저장된 값 {stored}, 실제 값 {actual}")
+                drifted += 1
+            last_pk = user_ids[-1]
+            checked += len(user_ids)
+            self.stdout.write(f"{checked}명 확인 (마지막 id: {last_pk})")
+
+        result = "고침" if repair else "고치지 않음"
+        self.stdout.write(self.style.SUCCESS(
+            f"통계 확인 완료: {checked}명 중 {drifted}명 어긋남 ({result})"
+        ))
@@ -0,0 +1,138 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 새 프로세스에서 django.setup()에 걸린 시간(초)을 출력하는 코드
+SETUP_SCRIPT = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import django\n"
+    "django.setup()\n"
+    "print(time.perf_counter() - started)\n"
+)
+# python -X importtime의 한 줄: "import time: self | cumulative | 모듈"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_import_times(output):
+    """-X importtime 출력을 (모듈, self µs, cumulative µs, 상위 모듈) 목록으로 변환
+
+    importtime은 모듈을 불러온 뒤에 출력하므로 하위 모듈이 먼저, 더 깊게
+    들여쓰여 나옵니다. 상위 모듈은 뒤에 나오는 첫 번째 덜 들여쓴 줄입니다.
+    """
+    parsed = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            parsed.append((match[4], int(match[1]), int(match[2]), len(match[3])))
+    entries = []
+    for index, (module, self_us, cumulative, depth) in enumerate(parsed):
+        parent = next(
+            (other[0] for other in parsed[index + 1:] if other[3] < depth), None
+        )
+        entries.append((module, self_us, cumulative, parent))
+    return entries
+
+
+def _in_app(module, name):
+    return module == name or module.startswith(name + ".")
+
+
+def app_import_costs(entries, app_names):
+    """앱별 (자체 import 시간, 누적 import 시간) µs
+
+    자체 시간은 앱 패키지 아래 모든 모듈의 self 시간 합계이고, 누적 시간은
+    앱 밖에서 불러온 앱 모듈들의 cumulative 합계로, 앱 때문에 처음 불러온
+    의존성까지 포함합니다.
+    """
+    costs = {}
+    for name in app_names:
+        own = cumulative = 0
+        for module, self_us, module_cumulative, parent in entries:
+            if not _in_app(module, name):
+                continue
+            own += self_us
+            if parent is None or not _in_app(parent, name):
+                cumulative += module_cumulative
+        costs[name] = (own, cumulative)
+    return costs
+
+
+class Command(BaseCommand):
+    """워커 시작 비용(django.setup() 시간과 앱별 import 비용)을 측정하는 명령"""
+
+    help = (
+        "새 프로세스에서 django.setup() 시간을 여러 번 재고, python -X importtime으로 "
+        "설치된 앱별 import 비용과 가장 느린 모듈을 보고합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="django.setup() 시간을 잴 횟수 (기본값: 3)"
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="자체 import 시간이 긴 모듈을 몇 개 보여줄지 (기본값: 10)"
+        )
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            help="django.setup() 시간의 중앙값이 이 값(ms)을 넘으면 실패"
+        )
+
+    def _run_setup(self, importtime=False):
+        """새 인터프리터에서 django.setup()을 실행하고 (초, stderr)를 반환"""
+        command = [sys.executable]
+        if importtime:
+            command += ["-X", "importtime"]
+        command += ["-c", SETUP_SCRIPT]
+        environ = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        result = subprocess.run(
+            command, capture_output=True, text=True, env=environ, cwd=settings.BASE_DIR
+        )
+        if result.returncode:
+            raise CommandError(f"django.setup() 실행 실패:\n{result.stderr[-2000:]}")
+        return float(result.stdout.strip().splitlines()[-1]), result.stderr
+
+    def handle(self, *args, **options):
+        timings = [self._run_setup()[0] * 1000 for _ in range(max(1, options["repeat"]))]
+        median = statistics.median(timings)
+        self.stdout.write(
+            f"django.setup(): 중앙값 {median:.1f}ms, 최소 {min(timings):.1f}ms, "
+            f"최대 {max(timings):.1f}ms ({len(timings)}회, {settings.SETTINGS_MODULE})"
+        )
+
+        _, output = self._run_setup(importtime=True)
+        entries = parse_import_times(output)
+        total = sum(entry[1] for entry in entries)
+        self.stdout.write(f"\nimport 합계: {total / 1000:.1f}ms ({len(entries)}개 모듈)")
+
+        app_names = [app_config.name for app_config in apps.get_app_configs()]
+        costs = app_import_costs(entries, app_names)
+        width = max(len(name) for name in app_names)
+        self.stdout.write(f"\n{'앱'.ljust(width)}  {'자체 ms':>8}  {'누적 ms':>8}")
+        for name, (own, cumulative) in sorted(costs.items(), key=lambda item: -item[1][1]):
+            self.stdout.write(f"{name.ljust(width)}  {own / 1000:8.1f}  {cumulative / 1000:8.1f}")
+
+        if options["top"] > 0:
+            self.stdout.write(f"\n자체 import 시간 상위 {options['top']}개 모듈")
+            slowest = sorted(entries, key=lambda entry: -entry[1])[:options["top"]]
+            for module, self_us, _, _ in slowest:
+                self.stdout.write(f"  {self_us / 1000:8.1f}ms  {module}")
+
+        budget = options["budget_ms"]
+        if budget is not None and median > budget:
+            raise CommandError(
+                f"django.setup() 중앙값 {median:.1f}ms가 예산 {budget:.1f}ms를 넘었습니다."
+            )
+        self.stdout.write(self.style.SUCCESS("\n시작 비용 측정 완료"))
@@ -0,0 +1,100 @@
+"""메모 앱 미들웨어"""
+import json
+import logging
+import random
+from contextlib import ExitStack
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.deprecation import MiddlewareMixin
+from . import profiling, routers
+
+PIN_COOKIE_NAME = "memo_primary"
+
+logger = logging.getLogger("memojjang.profiling")
+
+
+class ReplicaPinningMiddleware(MiddlewareMixin):
+    """메모를 쓴 사용자의 읽기를 잠시 primary로 고정하는 미들웨어
+
+    쓰기가 있었던 요청의 응답에 MEMO_REPLICA_PIN_SECONDS초짜리 쿠키를 붙이고,
+    쿠키가 있는 요청의 메모 읽기는 복제본 대신 primary로 보내 자신이 쓴
+    내용을 바로 볼 수 있게 합니다. 쿠키를 쓰므로 여러 작업자 프로세스에서도 동작합니다.
+    """
+
+    def process_request(self, request):
+        routers.start_request(pinned=PIN_COOKIE_NAME in request.COOKIES)
+
+    def process_response(self, request, response):
+        if routers.wrote_to_primary() and routers.get_replicas():
+            response.set_cookie(
+                PIN_COOKIE_NAME,
+                "1",
+                max_age=routers.get_pin_seconds(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class QueryProfilingMiddleware:
+    """요청별 쿼리 수, DB 시간, 반복 SQL, 템플릿 렌더링 시간을 기록하는 미들웨어
+
+    MEMO_PROFILING_SAMPLE_RATE 비율의 요청만 프로파일링하고, 결과를
+    Server-Timing 헤더, "memojjang.profiling" 로거의 JSON 로그,
+    profiling.request_stats 히스토그램으로 내보냅니다.
+    느린 쿼리(MEMO_SLOW_QUERY_MS 이상)는 WARNING으로 따로 기록합니다.
+    비율이 0이면 미들웨어 체인에서 빠집니다.
+    """
+
+    def __init__(self, get_response):
+        if profiling.get_sample_rate() <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= profiling.get_sample_rate():
+            return self.get_response(request)
+        profile = profiling.RequestProfile()
+        token = profile.activate()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            profile.deactivate(token)
+        self._report(request, response, profile)
+        return response
+
+    def _report(self, request, response, profile):
+        total_ms = profile.total_ms
+        match = getattr(request, "resolver_match", None)
+        url_name = (match.url_name if match else None) or "<unresolved>"
+        duplicates = profile.duplicates()
+
+        timings = [
+            f'db;dur={profile.db_ms:.2f};desc="{profile.queries} queries"',
+            f"tpl;dur={profile.template_ms:.2f}",
+            f"total;dur={total_ms:.2f}",
+        ]
+        if duplicates:
+            timings.append(f'dup;desc="{len(duplicates)} repeated queries"')
+        response["Server-Timing"] = ", ".join(timings)
+
+        profiling.request_stats.record(url_name, total_ms, profile.db_ms, profile.queries)
+        logger.info(json.dumps({
+            "event": "request_profile",
+            "method": request.method,
+            "path": request.path,
+            "url_name": url_name,
+            "status": response.status_code,
+            "total_ms": round(total_ms, 2),
+            "db_ms": round(profile.db_ms, 2),
+            "queries": profile.queries,
+            "template_ms": round(profile.template_ms, 2),
+            "duplicates": duplicates,
+        }, ensure_ascii=False))
+        for query in profile.slow_queries:
+            logger.warning(json.dumps(
+                {"event": "slow_query", "url_name": url_name, **query}, ensure_ascii=False
+            ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-17 20:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0002_memo_is_reminded_memo_reminder_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='memo',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name': '메모', 'verbose_name_plural': '메모들'},
+        ),
+        migrations.AddIndex(
+            model_name='memo',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='memos_user_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-17 20:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0003_memo_list_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memo',
+            name='excerpt',
+            field=models.TextField(blank=True, default='', editable=False, help_text='목록에 표시할 본문 앞부분 (저장 시 자동 생성)', verbose_name='요약'),
+        ),
+    ]
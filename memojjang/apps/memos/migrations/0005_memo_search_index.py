@@ -0,0 +1,36 @@
+from django.db import migrations
+
+CREATE_TABLE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS memos_fts USING fts5("
+    "user_key, title, content, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+
+
+def create_search_index(apps, schema_editor):
+    """FTS5 검색 테이블을 만들고 기존 메모를 색인 (SQLite 전용)"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(CREATE_TABLE_SQL)
+    schema_editor.execute(
+        "INSERT INTO memos_fts (rowid, user_key, title, content) "
+        "SELECT id, 'u' || user_id, title, content FROM memos"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    """FTS5 검색 테이블 삭제"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS memos_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0004_memo_excerpt'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-17 20:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0005_memo_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='memo',
+            index=models.Index(condition=models.Q(('is_reminded', False), ('reminder_date__isnull', False)), fields=['reminder_date'], name='memos_due_reminder_idx'),
+        ),
+    ]
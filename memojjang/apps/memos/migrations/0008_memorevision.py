@@ -0,0 +1,32 @@
+# Generated by Django 5.1.7 on 2026-10-17 21:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0007_memo_user_updated_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemoRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField(verbose_name='버전 번호')),
+                ('is_snapshot', models.BooleanField(default=False, help_text='전체 내용을 담은 기록인지, 직전 버전과의 델타인지 여부', verbose_name='스냅숏 여부')),
+                ('data', models.BinaryField(verbose_name='압축된 내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록일시')),
+                ('memo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='memos.memo')),
+            ],
+            options={
+                'verbose_name': '메모 수정 기록',
+                'verbose_name_plural': '메모 수정 기록들',
+                'db_table': 'memo_revisions',
+                'ordering': ['memo', '-number'],
+                'constraints': [models.UniqueConstraint(fields=('memo', 'number'), name='memo_revisions_memo_number_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.1.7 on 2026-10-17 21:59
+
+import zlib
+import memojjang.apps.memos.fields
+from django.db import migrations
+
+
+def decompress_content(apps, schema_editor):
+    """압축해 저장한 본문을 다시 텍스트로 바꿈 (되돌릴 때, 1000개씩)"""
+    last_pk = 0
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            cursor.execute(
+                "SELECT id, content FROM memos WHERE typeof(content) = 'blob' AND id > %s "
+                "ORDER BY id LIMIT 1000",
+                [last_pk],
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            cursor.executemany(
+                "UPDATE memos SET content = %s WHERE id = %s",
+                [(zlib.decompress(content).decode(), pk) for pk, content in rows],
+            )
+            last_pk = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0008_memorevision'),
+    ]
+
+    operations = [
+        # 컬럼 정의는 그대로이므로 SQLite가 테이블을 다시 만들지 않도록 상태만 바꿈
+        # 기존 메모는 compress_memo_content 명령으로 압축
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='memo',
+                    name='content',
+                    field=memojjang.apps.memos.fields.CompressedTextField(verbose_name='내용'),
+                ),
+            ],
+        ),
+        migrations.RunPython(migrations.RunPython.noop, decompress_content),
+    ]
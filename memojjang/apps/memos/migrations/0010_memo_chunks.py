@@ -0,0 +1,36 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:06
+
+import django.db.models.deletion
+import memojjang.apps.memos.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0009_memo_compressed_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memo',
+            name='chunk_count',
+            field=models.PositiveIntegerField(db_default=1, default=1, editable=False, help_text='content에 담긴 첫 청크를 포함한 본문 청크 수 (2 이상이면 MemoChunk에 나머지)', verbose_name='본문 청크 수'),
+        ),
+        migrations.CreateModel(
+            name='MemoChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.IntegerField(verbose_name='청크 번호')),
+                ('content', memojjang.apps.memos.fields.CompressedTextField(verbose_name='내용')),
+                ('memo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='memos.memo')),
+            ],
+            options={
+                'verbose_name': '메모 본문 청크',
+                'verbose_name_plural': '메모 본문 청크들',
+                'db_table': 'memo_chunks',
+                'ordering': ['memo', 'number'],
+                'constraints': [models.UniqueConstraint(fields=('memo', 'number'), name='memo_chunks_memo_number_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# 메모-태그 다대다 테이블: 데이터베이스 규칙대로 (memo_id, tag_id) 복합 기본 키
+# (Django 5.1 모델은 복합 기본 키를 지원하지 않아 SQL로 직접 만듦)
+CREATE_MEMO_TAGS_SQL = [
+    "CREATE TABLE memo_tags ("
+    "memo_id integer NOT NULL REFERENCES memos (id) ON DELETE CASCADE, "
+    "tag_id integer NOT NULL REFERENCES tags (id) ON DELETE CASCADE, "
+    "PRIMARY KEY (memo_id, tag_id)"
+    ") WITHOUT ROWID",
+    # 태그로 메모를 찾는 쪽 인덱스
+    "CREATE INDEX memo_tags_tag_memo_idx ON memo_tags (tag_id, memo_id)",
+    # 태그별 메모 수를 연결이 생기고 지워질 때마다 갱신 (메모/태그 삭제의 CASCADE 포함)
+    "CREATE TRIGGER memo_tags_count_insert AFTER INSERT ON memo_tags BEGIN "
+    "UPDATE tags SET memo_count = memo_count + 1 WHERE id = NEW.tag_id; END",
+    "CREATE TRIGGER memo_tags_count_delete AFTER DELETE ON memo_tags BEGIN "
+    "UPDATE tags SET memo_count = memo_count - 1 WHERE id = OLD.tag_id; END",
+]
+DROP_MEMO_TAGS_SQL = ["DROP TABLE memo_tags"]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0010_memo_chunks'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.TextField(verbose_name='이름')),
+                ('memo_count', models.PositiveIntegerField(db_default=0, default=0, editable=False, help_text='이 태그가 붙은 메모 수 (memo_tags 트리거가 갱신)', verbose_name='메모 수')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tags', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '태그',
+                'verbose_name_plural': '태그들',
+                'db_table': 'tags',
+                'ordering': ['name'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'name'), name='tags_user_name_uniq')],
+            },
+        ),
+        migrations.RunSQL(CREATE_MEMO_TAGS_SQL, DROP_MEMO_TAGS_SQL),
+    ]
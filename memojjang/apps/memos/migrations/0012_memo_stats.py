@@ -0,0 +1,103 @@
+# Generated by Django 5.1.7 on 2026-10-17 22:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# 대기 중인 리마인드 여부 (memos_due_reminder_idx 조건과 같음), 참이면 1
+PENDING_SQL = "({row}.reminder_date IS NOT NULL AND NOT {row}.is_reminded)"
+# 새 행의 값만큼 사용자의 통계에 더함 (통계 행이 없으면 만듦)
+ADD_NEW_ROW_SQL = (
+    "INSERT INTO memo_stats (user_id, memo_count, pending_reminder_count, content_bytes) "
+    f"VALUES (NEW.user_id, 1, {PENDING_SQL.format(row='NEW')}, NEW.size) "
+    "ON CONFLICT (user_id) DO UPDATE SET "
+    "memo_count = memo_count + 1, "
+    "pending_reminder_count = pending_reminder_count + excluded.pending_reminder_count, "
+    "content_bytes = content_bytes + excluded.content_bytes;"
+)
+# 이전 행의 값만큼 사용자의 통계에서 뺌
+SUBTRACT_OLD_ROW_SQL = (
+    "UPDATE memo_stats SET memo_count = memo_count - 1, "
+    f"pending_reminder_count = pending_reminder_count - {PENDING_SQL.format(row='OLD')}, "
+    "content_bytes = content_bytes - OLD.size WHERE user_id = OLD.user_id;"
+)
+# 사용자별 통계를 메모 행이 바뀔 때마다 같은 문장 안에서 갱신
+# (save()를 거치지 않는 일괄 생성/수정, QuerySet.update, 연쇄 삭제 포함)
+CREATE_TRIGGERS_SQL = [
+    f"CREATE TRIGGER memo_stats_insert AFTER INSERT ON memos BEGIN {ADD_NEW_ROW_SQL} END",
+    f"CREATE TRIGGER memo_stats_delete AFTER DELETE ON memos BEGIN {SUBTRACT_OLD_ROW_SQL} END",
+    # 통계에 쓰는 값이 실제로 바뀐 행만 (제목/본문만 고친 저장은 건너뜀)
+    "CREATE TRIGGER memo_stats_update "
+    "AFTER UPDATE OF user_id, reminder_date, is_reminded, size ON memos "
+    "WHEN OLD.user_id != NEW.user_id OR OLD.size != NEW.size "
+    f"OR {PENDING_SQL.format(row='OLD')} != {PENDING_SQL.format(row='NEW')} "
+    f"BEGIN {SUBTRACT_OLD_ROW_SQL} {ADD_NEW_ROW_SQL} END",
+]
+DROP_TRIGGERS_SQL = [
+    "DROP TRIGGER memo_stats_insert",
+    "DROP TRIGGER memo_stats_delete",
+    "DROP TRIGGER memo_stats_update",
+]
+FILL_STATS_SQL = (
+    "INSERT INTO memo_stats (user_id, memo_count, pending_reminder_count, content_bytes) "
+    f"SELECT user_id, COUNT(*), SUM({PENDING_SQL.format(row='memos')}), SUM(size) "
+    "FROM memos GROUP BY user_id"
+)
+
+
+def fill_memo_sizes(apps, schema_editor):
+    """기존 메모의 본문 크기를 모든 청크를 합쳐 계산 (1000개씩)"""
+    Memo = apps.get_model("memos", "Memo")
+    MemoChunk = apps.get_model("memos", "MemoChunk")
+    memos = Memo.objects.using(schema_editor.connection.alias).only("id", "content", "chunk_count")
+    last_pk = 0
+    while True:
+        batch = list(memos.filter(pk__gt=last_pk).order_by("pk")[:1000])
+        if not batch:
+            break
+        for memo in batch:
+            memo.size = len(memo.content.encode())
+            if memo.chunk_count > 1:
+                memo.size += sum(
+                    len(text.encode())
+                    for text in MemoChunk.objects.using(schema_editor.connection.alias)
+                    .filter(memo_id=memo.pk)
+                    .values_list("content", flat=True)
+                    .iterator(chunk_size=1)
+                )
+        Memo.objects.using(schema_editor.connection.alias).bulk_update(batch, ["size"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0011_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memo',
+            name='size',
+            field=models.PositiveBigIntegerField(db_default=0, default=0, editable=False, help_text='모든 청크를 합친 본문의 UTF-8 바이트 수 (저장 시 자동 계산)', verbose_name='본문 크기'),
+        ),
+        migrations.CreateModel(
+            name='MemoStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('memo_count', models.IntegerField(db_default=0, default=0, verbose_name='메모 수')),
+                ('pending_reminder_count', models.IntegerField(db_default=0, default=0, help_text='리마인드 일시가 있고 아직 발송되지 않은 메모 수', verbose_name='대기 중인 리마인드 수')),
+                ('content_bytes', models.BigIntegerField(db_default=0, default=0, help_text='메모 본문 크기(Memo.size)의 합계 (바이트)', verbose_name='본문 사용량')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='memo_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '메모 통계',
+                'verbose_name_plural': '메모 통계들',
+                'db_table': 'memo_stats',
+            },
+        ),
+        migrations.RunPython(fill_memo_sizes, migrations.RunPython.noop),
+        migrations.RunSQL(CREATE_TRIGGERS_SQL, DROP_TRIGGERS_SQL),
+        migrations.RunSQL(FILL_STATS_SQL, migrations.RunSQL.noop),
+    ]
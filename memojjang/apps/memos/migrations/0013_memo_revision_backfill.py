@@ -0,0 +1,64 @@
+import json
+import zlib
+from django.db import migrations
+
+# revisions.encode()와 같은 형식 (앱 코드가 바뀌어도 마이그레이션 결과가 같도록 복사)
+COMPRESSION_LEVEL = 6
+
+
+def _snapshot_data(title, content):
+    return zlib.compress(
+        json.dumps({"t": title, "c": content}, ensure_ascii=False, separators=(",", ":")).encode(),
+        COMPRESSION_LEVEL,
+    )
+
+
+def backfill_revisions(apps, schema_editor):
+    """수정 기록이 없는 기존 메모의 현재 내용을 첫 스냅숏으로 저장 (1000개씩)
+
+    기록은 저장한 뒤에 남기므로, 기록 없이 처음 수정하면 원래 내용을 되돌릴 수
+    없습니다. 청크로 나뉜 메모는 모든 청크를 이어 붙인 전체 본문을 기록합니다.
+    """
+    alias = schema_editor.connection.alias
+    Memo = apps.get_model("memos", "Memo")
+    MemoChunk = apps.get_model("memos", "MemoChunk")
+    MemoRevision = apps.get_model("memos", "MemoRevision")
+    memos = (
+        Memo.objects.using(alias)
+        .filter(revisions__isnull=True)
+        .only("id", "title", "content", "chunk_count")
+        .order_by("pk")
+    )
+    last_pk = 0
+    while True:
+        batch = list(memos.filter(pk__gt=last_pk)[:1000])
+        if not batch:
+            break
+        revisions = []
+        for memo in batch:
+            content = memo.content
+            if memo.chunk_count > 1:
+                content += "".join(
+                    MemoChunk.objects.using(alias)
+                    .filter(memo_id=memo.pk)
+                    .order_by("number")
+                    .values_list("content", flat=True)
+                )
+            revisions.append(MemoRevision(
+                memo_id=memo.pk, number=1, is_snapshot=True,
+                data=_snapshot_data(memo.title, content),
+            ))
+        MemoRevision.objects.using(alias).bulk_create(revisions)
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0012_memo_stats'),
+    ]
+
+    operations = [
+        # 되돌려도 남긴 스냅숏은 올바른 기록이므로 지우지 않음
+        migrations.RunPython(backfill_revisions, migrations.RunPython.noop),
+    ]
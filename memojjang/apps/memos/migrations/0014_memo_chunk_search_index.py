@@ -0,0 +1,97 @@
+from django.db import migrations
+
+# search.py와 같은 형식 (앱 코드가 바뀌어도 마이그레이션 결과가 같도록 복사)
+CREATE_TABLE_SQL = (
+    "CREATE VIRTUAL TABLE memos_fts USING fts5("
+    "user_key, title, content, memo_key, memo_id UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+INSERT_SQL = (
+    "INSERT INTO memos_fts (rowid, user_key, title, content, memo_key, memo_id) "
+    "VALUES (%s, %s, %s, %s, %s, %s)"
+)
+# 0005의 메모당 한 행 형식
+OLD_CREATE_TABLE_SQL = (
+    "CREATE VIRTUAL TABLE memos_fts USING fts5("
+    "user_key, title, content, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+)
+OLD_INSERT_SQL = "INSERT INTO memos_fts (rowid, user_key, title, content) VALUES (%s, %s, %s, %s)"
+BATCH_SIZE = 1000
+
+
+def _memo_batches(apps, alias):
+    Memo = apps.get_model("memos", "Memo")
+    memos = Memo.objects.using(alias).only("id", "user_id", "title", "content", "chunk_count")
+    last_pk = 0
+    while True:
+        batch = list(memos.filter(pk__gt=last_pk).order_by("pk")[:BATCH_SIZE])
+        if not batch:
+            break
+        yield batch
+        last_pk = batch[-1].pk
+
+
+def _chunks(apps, alias, memo_id):
+    MemoChunk = apps.get_model("memos", "MemoChunk")
+    return (
+        MemoChunk.objects.using(alias)
+        .filter(memo_id=memo_id)
+        .order_by("number")
+        .values_list("id", "content")
+        .iterator(chunk_size=1)
+    )
+
+
+def index_chunks(apps, schema_editor):
+    """검색 색인을 청크마다 한 행으로 다시 만듦 (SQLite 전용)
+
+    본문은 압축되어 있을 수 있으므로 SQL이 아니라 모델로 읽습니다.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    alias = connection.alias
+    schema_editor.execute("DROP TABLE IF EXISTS memos_fts")
+    schema_editor.execute(CREATE_TABLE_SQL)
+    with connection.cursor() as cursor:
+        for batch in _memo_batches(apps, alias):
+            cursor.executemany(INSERT_SQL, [
+                (memo.pk, f"u{memo.user_id}", memo.title, memo.content, f"m{memo.pk}", memo.pk)
+                for memo in batch
+            ])
+            for memo in batch:
+                if memo.chunk_count == 1:
+                    continue
+                for pk, content in _chunks(apps, alias, memo.pk):
+                    cursor.execute(INSERT_SQL, (
+                        -pk, f"u{memo.user_id}", memo.title, content, f"m{memo.pk}", memo.pk,
+                    ))
+
+
+def index_memos(apps, schema_editor):
+    """검색 색인을 메모마다 전체 본문 한 행으로 되돌림 (SQLite 전용)"""
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    alias = connection.alias
+    schema_editor.execute("DROP TABLE IF EXISTS memos_fts")
+    schema_editor.execute(OLD_CREATE_TABLE_SQL)
+    with connection.cursor() as cursor:
+        for batch in _memo_batches(apps, alias):
+            for memo in batch:
+                content = memo.content
+                if memo.chunk_count > 1:
+                    content += "".join(text for _, text in _chunks(apps, alias, memo.pk))
+                cursor.execute(OLD_INSERT_SQL, (memo.pk, f"u{memo.user_id}", memo.title, content))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0013_memo_revision_backfill'),
+    ]
+
+    operations = [
+        migrations.RunPython(index_chunks, index_memos),
+    ]
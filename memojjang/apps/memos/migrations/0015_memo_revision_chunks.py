@@ -0,0 +1,71 @@
+import json
+import zlib
+from django.db import migrations
+
+# revisions.encode()와 같은 형식 (앱 코드가 바뀌어도 마이그레이션 결과가 같도록 복사)
+COMPRESSION_LEVEL = 6
+
+
+def _encode(payload):
+    return zlib.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(),
+        COMPRESSION_LEVEL,
+    )
+
+
+def _decode(data):
+    return json.loads(zlib.decompress(data))
+
+
+def record_chunk_boundaries(apps, schema_editor):
+    """청크로 나뉜 메모의 최신 스냅숏에 청크 경계를 남김
+
+    청크 하나를 고친 기록은 그 청크 번호의 델타만 담으므로, 기록을 복원하려면
+    가장 가까운 스냅숏이 청크 경계를 알아야 합니다. 최신 기록이 현재 본문과 같은
+    스냅숏이면 그 스냅숏을 청크 리스트로 바꿔 쓰고, 아니면 현재 청크로 스냅숏을
+    하나 더 남깁니다.
+    """
+    alias = schema_editor.connection.alias
+    Memo = apps.get_model("memos", "Memo")
+    MemoChunk = apps.get_model("memos", "MemoChunk")
+    MemoRevision = apps.get_model("memos", "MemoRevision")
+    memos = (
+        Memo.objects.using(alias)
+        .filter(chunk_count__gt=1)
+        .only("id", "title", "content")
+        .order_by("pk")
+    )
+    for memo in memos.iterator(chunk_size=100):
+        revisions = MemoRevision.objects.using(alias).filter(memo_id=memo.pk)
+        snapshot = revisions.filter(is_snapshot=True).order_by("-number").first()
+        if snapshot is not None:
+            payload = _decode(snapshot.data)
+            if isinstance(payload["c"], list):
+                continue
+        pieces = [memo.content, *(
+            MemoChunk.objects.using(alias)
+            .filter(memo_id=memo.pk)
+            .order_by("number")
+            .values_list("content", flat=True)
+        )]
+        last = revisions.order_by("-number").values_list("number", flat=True).first()
+        if snapshot is not None and snapshot.number == last and payload["c"] == "".join(pieces):
+            snapshot.data = _encode({"t": payload["t"], "c": pieces})
+            snapshot.save(update_fields=["data"])
+            continue
+        MemoRevision.objects.using(alias).create(
+            memo_id=memo.pk, number=(last or 0) + 1, is_snapshot=True,
+            data=_encode({"t": memo.title, "c": pieces}),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0014_memo_chunk_search_index'),
+    ]
+
+    operations = [
+        # 청크 리스트 스냅숏과 청크 델타는 이후 코드만 읽으므로 되돌려도 기록은 그대로 둠
+        migrations.RunPython(record_chunk_boundaries, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,121 @@
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F
 from django.conf import settings
+from django.utils import timezone
+from django.utils.text import Truncator
+from .fields import CompressedTextField
+from .signals import memo_chunks_written, memos_bulk_created, memos_updated
+
+# 목록에 보여줄 요약의 단어 수
+EXCERPT_WORDS = 30
+# 요약을 만들 때 읽는 본문의 최대 길이 (큰 본문 전체를 나누지 않기 위함)
+EXCERPT_SCAN_CHARS = 2000
+# 목록 조회에서 읽어오는 필드 (content는 제외)
+LIST_FIELDS = ("id", "title", "excerpt", "reminder_date", "is_reminded", "created_at")
+# 본문 청크 하나의 최대 글자 수 (이보다 긴 본문은 나눠 저장, chunks.py 참고)
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+def make_excerpt(content):
+    """본문 앞부분으로 목록용 요약을 생성"""
+    head = content[:EXCERPT_SCAN_CHARS]
+    excerpt = Truncator(head).words(EXCERPT_WORDS)
+    if excerpt == head and len(content) > EXCERPT_SCAN_CHARS:
+        # 단어 수로 잘리지 않았더라도 본문을 잘라냈으므로 생략 표시를 붙임
+        excerpt += "…"
+    return excerpt
+
+
+def get_chunk_size():
+    """본문 청크 하나의 최대 글자 수"""
+    return getattr(settings, "MEMO_CONTENT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+
+def content_size(texts):
+    """본문 청크들의 UTF-8 바이트 수 합계"""
+    return sum(len(text.encode()) for text in texts)
+
+
+def split_content(content, size=None):
+    """본문을 size 글자 이하의 청크로 나눔
+
+    문단이 청크 경계에서 갈리지 않도록 청크 뒤쪽 절반 안에 줄바꿈이 있으면
+    그 앞에서 자릅니다. 줄바꿈이 다음 청크의 맨 앞에 오므로 폼이 앞뒤 공백을
+    지워도(strip) 첫 청크를 고칠 때 다음 청크와 줄이 붙지 않습니다.
+    """
+    size = size or get_chunk_size()
+    pieces = []
+    start = 0
+    while len(content) - start > size:
+        end = start + size
+        newline = content.rfind("\n", start + size // 2, end)
+        if newline != -1:
+            end = newline
+        pieces.append(content[start:end])
+        start = end
+    pieces.append(content[start:])
+    return pieces
+
+
+class MemoQuerySet(models.QuerySet):
+    """메모 쿼리셋"""
+
+    def for_list(self):
+        """목록 표시에 필요한 필드만 조회 (본문 제외)
+
+        updated_at은 메모 카드 조각 캐시의 키로 씁니다.
+        """
+        return self.only(*LIST_FIELDS, "updated_at")
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """save()를 거치지 않으므로 긴 본문을 나누고 요약을 채운 뒤 일괄 생성하고 시그널을 보냄"""
+        objs = list(objs)
+        chunk_size = get_chunk_size()
+        extra_chunks = []
+        for memo in objs:
+            memo.size = content_size([memo.content])
+            if len(memo.content) > chunk_size:
+                memo.content, *extra = split_content(memo.content, chunk_size)
+                memo.chunk_count = 1 + len(extra)
+                extra_chunks.append((memo, extra))
+            memo.excerpt = make_excerpt(memo.content)
+        # 생성과 후속 처리(청크, 검색 색인 등)를 한 트랜잭션으로 묶음
+        with transaction.atomic(using=self.db, savepoint=False):
+            created = super().bulk_create(objs, *args, **kwargs)
+            if extra_chunks:
+                memo_chunks = MemoChunk.objects.using(self.db).bulk_create(
+                    MemoChunk(memo=memo, number=number, content=text)
+                    for memo, extra in extra_chunks
+                    for number, text in enumerate(extra, 1)
+                )
+                memo_chunks_written.send(sender=MemoChunk, chunks=memo_chunks, removed=[])
+            memos_bulk_created.send(sender=self.model, memos=created)
+        return created
+
+    def bulk_update(self, objs, fields, *args, touch=True, **kwargs):
+        """일괄 수정 후 시그널을 보냄
+
+        save()의 auto_now처럼 updated_at도 함께 갱신해 메모 카드 조각 캐시와
+        조건부 요청이 변경을 알 수 있게 합니다. 요약 채우기처럼 사용자가 고친
+        것이 아닌 파생 데이터만 쓸 때는 touch=False로 수정일시를 그대로 둡니다.
+        """
+        objs = list(objs)
+        fields = list(fields)
+        if touch and "updated_at" not in fields:
+            now = timezone.now()
+            for obj in objs:
+                obj.updated_at = now
+            fields.append("updated_at")
+        with transaction.atomic(using=self.db, savepoint=False):
+            if "content" in fields:
+                # 일괄 수정은 본문을 나누지 않으므로 content는 첫 청크로 저장됨
+                for obj in objs:
+                    obj.size = obj.stored_rest_size(self.db) + content_size([obj.content])
+                if "size" not in fields:
+                    fields.append("size")
+            updated = super().bulk_update(objs, fields, *args, **kwargs)
+            memos_updated.send(sender=self.model, memos=objs, fields=fields)
+        return updated
 
 
 class Memo(models.Model):
@@ -15,7 +131,8 @@ class Memo(models.Model):
     title = models.TextField(
         verbose_name="제목"
     )
-    content = models.TextField(
+    # 큰 본문은 압축해 저장 (fields.py), 목록 조회는 이 컬럼을 읽지 않음
+    content = CompressedTextField(
         verbose_name="내용"
     )
     created_at = models.DateTimeField(
@@ -37,14 +154,334 @@ class Memo(models.Model):
         default=False,
         help_text="리마인드가 완료되었는지 여부"
     )
+    excerpt = models.TextField(
+        verbose_name="요약",
+        blank=True,
+        default="",
+        editable=False,
+        help_text="목록에 표시할 본문 앞부분 (저장 시 자동 생성)"
+    )
+    chunk_count = models.PositiveIntegerField(
+        verbose_name="본문 청크 수",
+        default=1,
+        db_default=1,
+        editable=False,
+        help_text="content에 담긴 첫 청크를 포함한 본문 청크 수 (2 이상이면 MemoChunk에 나머지)"
+    )
+    size = models.PositiveBigIntegerField(
+        verbose_name="본문 크기",
+        default=0,
+        db_default=0,
+        editable=False,
+        help_text="모든 청크를 합친 본문의 UTF-8 바이트 수 (저장 시 자동 계산)"
+    )
+
+    objects = MemoQuerySet.as_manager()
+
+    # save() 중 첫 청크 뒤에 끼워 넣을 새 청크 (content_chunks() 참고)
+    _new_chunks = ()
+    # 청크로 나뉜 메모의 save() 중 저장 전 (제목, 첫 청크), post_save 수신자가
+    # 전체 본문을 읽지 않고 첫 청크만 색인하고 기록하는 데 씀 (receivers.py)
+    _previous = None
 
     class Meta:
         """메모 모델 메타 클래스"""
         db_table = "memos"
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # 사용자별 최신순 목록의 키셋 페이지네이션용 인덱스
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="memos_user_created_id_idx"
+            ),
+            # 사용자별 최종 수정 시각(MAX(updated_at)) 조회용 인덱스
+            models.Index(
+                fields=["user", "updated_at"],
+                name="memos_user_updated_idx"
+            ),
+            # 발송 대기 중인 리마인드만 담는 부분 인덱스 (전체 메모 수와 무관)
+            models.Index(
+                fields=["reminder_date"],
+                name="memos_due_reminder_idx",
+                condition=models.Q(is_reminded=False, reminder_date__isnull=False)
+            ),
+        ]
         verbose_name = "메모"
         verbose_name_plural = "메모들"
 
     def __str__(self):
         """메모 제목을 문자열로 반환"""
         return self.title
+
+    def save(self, *args, **kwargs):
+        """본문이 로드되어 있으면 요약과 본문 크기를 갱신한 뒤 저장
+
+        청크 크기보다 긴 본문은 첫 청크만 content에 남기고 나머지를 첫 청크
+        바로 뒤의 청크로 끼워 넣습니다. 청크로 나뉜 메모의 content는 첫
+        청크이므로 content를 고쳐도 다른 청크는 다시 쓰지 않으며, 저장 전
+        제목과 첫 청크를 _previous에 두어 수신자가 첫 청크만 다루게 합니다.
+        """
+        update_fields = kwargs.get("update_fields")
+        if "content" in self.get_deferred_fields() or (
+            update_fields is not None and "content" not in update_fields
+        ):
+            super().save(*args, **kwargs)
+            return
+        using = kwargs.get("using") or router.db_for_write(Memo, instance=self)
+        self.content, *extra_chunks = split_content(self.content)
+        self.excerpt = make_excerpt(self.content)
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "excerpt", "size"}
+            if extra_chunks:
+                kwargs["update_fields"].add("chunk_count")
+        if not extra_chunks and (self._state.adding or self.chunk_count == 1):
+            self.size = content_size([self.content])
+            super().save(*args, **kwargs)
+            return
+        with transaction.atomic(using=using):
+            # 나머지 청크는 그대로 두므로 저장된 나머지 청크 크기에 새 청크들을 더함
+            rest_size = 0
+            if not self._state.adding and self.chunk_count > 1:
+                size, title, first = (
+                    Memo.objects.using(using)
+                    .filter(pk=self.pk)
+                    .values_list("size", "title", "content")
+                    .get()
+                )
+                rest_size = size - content_size([first])
+                self._previous = (title, first)
+            self.size = rest_size + content_size([self.content, *extra_chunks])
+            self.chunk_count += len(extra_chunks)
+            # post_save 수신자가 content_chunks()에서 아직 끼워 넣지 않은 청크도 읽도록 둠
+            self._new_chunks = extra_chunks
+            try:
+                super().save(*args, **kwargs)
+            finally:
+                self._new_chunks = ()
+                self._previous = None
+            if extra_chunks:
+                MemoChunk.objects.insert(self, 0, extra_chunks)
+
+    def content_chunks(self):
+        """모든 청크 본문의 리스트 (수정 기록 스냅숏에 사용)
+
+        청크로 나뉘지 않은 메모는 [content]를 반환합니다. save() 중에는 첫 청크
+        바로 뒤에 끼워 넣을 새 청크를 저장된 청크보다 앞에 둡니다.
+        """
+        if self.chunk_count == 1:
+            return [self.content]
+        rest = (
+            MemoChunk.objects.using(self._state.db)
+            .filter(memo_id=self.pk)
+            .order_by("number")
+            .values_list("content", flat=True)
+        )
+        return [self.content, *self._new_chunks, *rest]
+
+    def full_content(self):
+        """모든 청크를 이어 붙인 전체 본문"""
+        return "".join(self.content_chunks())
+
+    def stored_rest_size(self, using=None):
+        """저장된 본문 중 첫 청크(content)를 뺀 나머지 청크들의 크기
+
+        청크로 나뉜 메모만 저장된 size와 첫 청크를 한 번 읽어 계산합니다.
+        """
+        if self._state.adding or self.chunk_count == 1:
+            return 0
+        size, first = (
+            Memo.objects.using(using or router.db_for_write(Memo, instance=self))
+            .filter(pk=self.pk)
+            .values_list("size", "content")
+            .get()
+        )
+        return size - content_size([first])
+
+
+class MemoRevision(models.Model):
+    """메모 수정 기록
+
+    제목/본문의 한 버전을 저장합니다. 스냅숏은 전체 내용을, 나머지는 직전
+    버전과의 델타를 zlib으로 압축해 data에 담습니다 (revisions.py 참고).
+    """
+    memo = models.ForeignKey(
+        Memo,
+        on_delete=models.CASCADE,
+        related_name="revisions"
+    )
+    number = models.PositiveIntegerField(
+        verbose_name="버전 번호"
+    )
+    is_snapshot = models.BooleanField(
+        verbose_name="스냅숏 여부",
+        default=False,
+        help_text="전체 내용을 담은 기록인지, 직전 버전과의 델타인지 여부"
+    )
+    data = models.BinaryField(
+        verbose_name="압축된 내용"
+    )
+    created_at = models.DateTimeField(
+        verbose_name="기록일시",
+        auto_now_add=True
+    )
+
+    class Meta:
+        """메모 수정 기록 메타 클래스"""
+        db_table = "memo_revisions"
+        ordering = ["memo", "-number"]
+        constraints = [
+            # 메모별 버전 번호 조회와 가장 가까운 스냅숏 찾기에도 쓰임
+            models.UniqueConstraint(
+                fields=["memo", "number"],
+                name="memo_revisions_memo_number_uniq"
+            ),
+        ]
+        verbose_name = "메모 수정 기록"
+        verbose_name_plural = "메모 수정 기록들"
+
+    def __str__(self):
+        return f"{self.memo_id}#{self.number}"
+
+
+class MemoChunkQuerySet(models.QuerySet):
+    """메모 본문 청크 쿼리셋"""
+
+    def shift(self, memo_id, after, delta):
+        """after번보다 뒤에 있는 청크의 번호를 delta만큼 옮김"""
+        # 옮기는 도중 (memo, number) 유니크 제약에 걸리지 않도록 음수를 거쳐 옮김
+        self.filter(memo_id=memo_id, number__gt=after).update(
+            number=(F("number") + delta) * -1
+        )
+        self.filter(memo_id=memo_id, number__lt=0).update(number=F("number") * -1)
+
+    def insert(self, memo, after, texts):
+        """after번 청크 바로 뒤에 texts를 차례로 끼워 넣음"""
+        self.shift(memo.pk, after, len(texts))
+        created = self.bulk_create(
+            MemoChunk(memo=memo, number=after + offset, content=text)
+            for offset, text in enumerate(texts, 1)
+        )
+        memo_chunks_written.send(sender=MemoChunk, chunks=created, removed=[])
+        return created
+
+
+class MemoChunk(models.Model):
+    """청크로 나눠 저장한 긴 메모 본문의 두 번째 이후 청크
+
+    0번 청크는 Memo.content이며, 1번부터 Memo.chunk_count - 1번까지 저장됩니다.
+    """
+    memo = models.ForeignKey(
+        Memo,
+        on_delete=models.CASCADE,
+        related_name="chunks"
+    )
+    number = models.IntegerField(
+        verbose_name="청크 번호"
+    )
+    content = CompressedTextField(
+        verbose_name="내용"
+    )
+
+    objects = MemoChunkQuerySet.as_manager()
+
+    class Meta:
+        """메모 본문 청크 메타 클래스"""
+        db_table = "memo_chunks"
+        ordering = ["memo", "number"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["memo", "number"],
+                name="memo_chunks_memo_number_uniq"
+            ),
+        ]
+        verbose_name = "메모 본문 청크"
+        verbose_name_plural = "메모 본문 청크들"
+
+    def __str__(self):
+        return f"{self.memo_id}#{self.number}"
+
+
+class Tag(models.Model):
+    """사용자별 메모 태그
+
+    메모와의 연결은 memo_tags 테이블(복합 기본 키, tags.py 참고)에 있으며,
+    memo_count는 memo_tags의 INSERT/DELETE 트리거가 한 행씩 갱신하므로
+    태그별 메모 수를 GROUP BY로 다시 세지 않고 바로 읽을 수 있습니다.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="tags"
+    )
+    name = models.TextField(
+        verbose_name="이름"
+    )
+    memo_count = models.PositiveIntegerField(
+        verbose_name="메모 수",
+        default=0,
+        db_default=0,
+        editable=False,
+        help_text="이 태그가 붙은 메모 수 (memo_tags 트리거가 갱신)"
+    )
+
+    class Meta:
+        """태그 메타 클래스"""
+        db_table = "tags"
+        ordering = ["name"]
+        constraints = [
+            # 이름으로 태그를 찾을 때와 사용자별 태그 목록 조회에도 쓰임
+            models.UniqueConstraint(
+                fields=["user", "name"],
+                name="tags_user_name_uniq"
+            ),
+        ]
+        verbose_name = "태그"
+        verbose_name_plural = "태그들"
+
+    def __str__(self):
+        return self.name
+
+
+class MemoStats(models.Model):
+    """사용자별 메모 통계 (메모 수, 대기 중인 리마인드 수, 본문 사용량)
+
+    memos 테이블의 INSERT/UPDATE/DELETE 트리거가 바뀐 행만큼 같은 문장
+    안에서 더하고 빼므로(migrations/0012_memo_stats.py), save()를 거치지 않는
+    bulk_create, bulk_update, QuerySet.update, 연쇄 삭제에도 맞게 유지됩니다.
+    트리거는 Django 상태 밖에 있어, SQLite에서 memos 테이블을 다시 만드는
+    마이그레이션이 트리거를 지우면 post_migrate에서 stats.ensure_triggers()가
+    다시 만듭니다. 어긋난 값은 reconcile_memo_stats 명령으로 확인하고 고칩니다
+    (stats.py 참고).
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="memo_stats"
+    )
+    # 어긋난 값이 있어도 트리거가 저장을 막지 않도록 음수를 허용하는 필드를 씀
+    memo_count = models.IntegerField(
+        verbose_name="메모 수",
+        default=0,
+        db_default=0
+    )
+    pending_reminder_count = models.IntegerField(
+        verbose_name="대기 중인 리마인드 수",
+        default=0,
+        db_default=0,
+        help_text="리마인드 일시가 있고 아직 발송되지 않은 메모 수"
+    )
+    content_bytes = models.BigIntegerField(
+        verbose_name="본문 사용량",
+        default=0,
+        db_default=0,
+        help_text="메모 본문 크기(Memo.size)의 합계 (바이트)"
+    )
+
+    class Meta:
+        """메모 통계 메타 클래스"""
+        db_table = "memo_stats"
+        verbose_name = "메모 통계"
+        verbose_name_plural = "메모 통계들"
+
+    def __str__(self):
+        return f"{self.user_id}: {self.memo_count}"
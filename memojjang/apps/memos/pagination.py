@@ -0,0 +1,100 @@
+import base64
+import binascii
+from datetime import datetime
+from django.conf import settings
+from django.db.models import Q
+
+
+DEFAULT_PAGE_SIZE = 30
+
+
+class InvalidCursor(ValueError):
+    """잘못된 형식의 커서 값이 전달되었을 때 발생하는 예외"""
+
+
+def encode_cursor(memo):
+    """메모의 (created_at, id) 위치를 URL에 안전한 커서 문자열로 인코딩"""
+    raw = f"{memo.created_at.isoformat()}|{memo.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value):
+    """커서 문자열을 (created_at, id) 튜플로 디코딩"""
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursor(value) from exc
+
+
+class CursorPage:
+    """커서 페이지네이션의 한 페이지"""
+
+    def __init__(self, object_list, next_cursor, cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.cursor = cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        """다음 페이지가 있는지 여부"""
+        return self.next_cursor is not None
+
+    @property
+    def is_first(self):
+        """첫 페이지인지 여부"""
+        return self.cursor is None
+
+
+class CursorPaginator:
+    """(created_at, id) 기준 키셋(커서) 페이지네이터
+
+    OFFSET 대신 마지막으로 본 행의 위치를 기준으로 다음 페이지를 조회하므로
+    (user_id, created_at DESC, id DESC) 인덱스를 타고 몇 번째 페이지든
+    같은 비용으로 조회됩니다.
+    """
+
+    def __init__(self, queryset, page_size=None):
+        self.queryset = queryset.order_by("-created_at", "-id")
+        self.page_size = page_size or getattr(
+            settings, "MEMO_LIST_PAGE_SIZE", DEFAULT_PAGE_SIZE
+        )
+
+    def get_page_queryset(self, cursor=None):
+        """커서 다음 위치부터 한 페이지(+1건)를 조회하는 쿼리셋을 반환
+
+        잘못된 커서는 InvalidCursor 예외를 발생시킵니다.
+        """
+        queryset = self.queryset
+        if cursor:
+            created_at, pk = decode_cursor(cursor)
+            # created_at 범위 조건으로 인덱스를 타고, 같은 시각은 id로 구분
+            queryset = queryset.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) | Q(id__lt=pk)
+            )
+        # 다음 페이지 존재 여부를 알기 위해 한 건을 더 조회
+        return queryset[:self.page_size + 1]
+
+    def page(self, cursor=None):
+        """커서 다음 위치부터 한 페이지를 조회"""
+        return self._page(list(self.get_page_queryset(cursor)), cursor)
+
+    async def apage(self, cursor=None):
+        """page()의 비동기 버전"""
+        items = [item async for item in self.get_page_queryset(cursor)]
+        return self._page(items, cursor)
+
+    def _page(self, items, cursor):
+        next_cursor = None
+        if len(items) > self.page_size:
+            items = items[:self.page_size]
+            next_cursor = encode_cursor(items[-1])
+        return CursorPage(items, next_cursor, cursor or None)
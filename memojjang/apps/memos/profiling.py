@@ -0,0 +1,189 @@
+"""요청 단위 쿼리 프로파일링
+
+표본으로 뽑힌 요청마다 모든 데이터베이스 연결에 execute_wrapper를 걸어
+쿼리 수, DB 시간, 같은 SQL의 반복(N+1 의심)을 기록하고, TimedDjangoTemplates
+백엔드로 템플릿 렌더링 시간을 잽니다. QueryProfilingMiddleware가 결과를
+Server-Timing 헤더와 JSON 로그로 내보내고 URL 이름별 이동 히스토그램에 쌓습니다.
+
+표본이 아닌 요청은 execute_wrapper도 걸지 않으므로 추가 비용이 거의 없습니다.
+"""
+import hashlib
+import re
+import statistics
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from django.conf import settings
+from django.template.backends.django import DjangoTemplates
+
+DEFAULT_SAMPLE_RATE = 0.0
+DEFAULT_SLOW_QUERY_MS = 100
+DEFAULT_DUPLICATE_THRESHOLD = 3
+DEFAULT_WINDOW = 1000
+# 히스토그램 구간 상한(ms), 마지막 구간은 그 이상 전부
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+_current = ContextVar("memos_request_profile", default=None)
+
+
+def get_sample_rate():
+    """프로파일링할 요청의 비율 (0이면 사용 안 함)"""
+    return getattr(settings, "MEMO_PROFILING_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)
+
+
+def fingerprint(sql):
+    """파라미터 개수가 다른 IN (...) 목록까지 같은 쿼리로 묶는 SQL 지문"""
+    normalized = _SPACES.sub(" ", _IN_LIST.sub("(...)", sql)).strip()
+    return hashlib.md5(normalized.encode()).hexdigest()[:12], normalized
+
+
+class RequestProfile:
+    """요청 하나의 쿼리와 템플릿 렌더링 기록"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+        self.fingerprints = Counter()
+        self.statements = {}
+        self.slow_queries = []
+        self.slow_query_ms = getattr(settings, "MEMO_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper로 쓰이는 쿼리 기록기"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record_query(
+                sql, (time.perf_counter() - started) * 1000, context["connection"].alias
+            )
+
+    def record_query(self, sql, duration_ms, alias="default"):
+        """쿼리 한 건을 기록"""
+        self.queries += 1
+        self.db_ms += duration_ms
+        key, normalized = fingerprint(sql)
+        self.fingerprints[key] += 1
+        self.statements.setdefault(key, normalized)
+        if duration_ms >= self.slow_query_ms:
+            self.slow_queries.append({
+                "alias": alias, "ms": round(duration_ms, 2), "sql": normalized
+            })
+
+    def duplicates(self, threshold=None):
+        """threshold번 이상 반복된 SQL (N+1 의심) 목록"""
+        threshold = threshold or getattr(
+            settings, "MEMO_PROFILING_DUPLICATE_THRESHOLD", DEFAULT_DUPLICATE_THRESHOLD
+        )
+        return [
+            {"fingerprint": key, "count": count, "sql": self.statements[key][:200]}
+            for key, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    @property
+    def total_ms(self):
+        """요청 시작부터 지금까지의 시간"""
+        return (time.perf_counter() - self.started) * 1000
+
+    def activate(self):
+        """현재 컨텍스트의 프로파일로 지정하고 복원용 토큰을 반환"""
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+
+def current_profile():
+    """현재 요청의 프로파일, 표본이 아니면 None"""
+    return _current.get()
+
+
+class RequestStats:
+    """URL 이름별 최근 요청의 이동 히스토그램 (프로세스 단위)"""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self._lock = threading.Lock()
+        self.window = window
+        self._samples = {}
+
+    def record(self, url_name, total_ms, db_ms, queries):
+        """요청 하나를 기록, URL 이름마다 최근 window개만 보관"""
+        with self._lock:
+            samples = self._samples.get(url_name)
+            if samples is None:
+                samples = self._samples[url_name] = deque(maxlen=self.window)
+            samples.append((total_ms, db_ms, queries))
+
+    def reset(self):
+        """기록 초기화"""
+        with self._lock:
+            self._samples.clear()
+
+    def snapshot(self):
+        """URL 이름별 요청 수, 백분위수, 평균 쿼리 수, 구간별 개수"""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+        return {name: self._summarize(values) for name, values in samples.items()}
+
+    @staticmethod
+    def _summarize(values):
+        totals = sorted(value[0] for value in values)
+        buckets = {str(bound): 0 for bound in BUCKETS_MS}
+        buckets["inf"] = 0
+        for total in totals:
+            bound = next((bound for bound in BUCKETS_MS if total <= bound), None)
+            buckets[str(bound) if bound else "inf"] += 1
+        count = len(totals)
+        return {
+            "count": count,
+            "p50_ms": round(statistics.median(totals), 2),
+            "p95_ms": round(totals[min(count - 1, int(count * 0.95))], 2),
+            "p99_ms": round(totals[min(count - 1, int(count * 0.99))], 2),
+            "avg_db_ms": round(sum(value[1] for value in values) / count, 2),
+            "avg_queries": round(sum(value[2] for value in values) / count, 2),
+            "buckets": buckets,
+        }
+
+
+request_stats = RequestStats()
+
+
+class TimedTemplate:
+    """렌더링 시간을 현재 요청의 프로파일에 더하는 템플릿 래퍼"""
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        profile = _current.get()
+        if profile is None:
+            return self.template.render(context, request)
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            profile.template_ms += (time.perf_counter() - started) * 1000
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """최상위 템플릿 렌더링 시간을 기록하는 Django 템플릿 백엔드
+
+    include/extends로 불러오는 하위 템플릿은 최상위 렌더링 시간에 포함됩니다.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
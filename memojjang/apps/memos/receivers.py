@@ -0,0 +1,101 @@
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from . import cache, revisions, search, stats
+from .models import Memo
+from .signals import memo_chunk_edited, memo_chunks_written, memos_bulk_created, memos_updated
+
+
+@receiver(post_save, sender=Memo)
+def index_saved_memo(sender, instance, update_fields=None, **kwargs):
+    """저장된 메모의 첫 청크를 검색 색인에 반영 (제목이 바뀌었으면 나머지 청크 행도)"""
+    if update_fields is not None and not {"title", "content"} & set(update_fields):
+        return
+    previous = instance._previous
+    search.index_memo(instance, retitle=previous is None or previous[0] != instance.title)
+
+
+@receiver(post_delete, sender=Memo)
+def unindex_deleted_memo(sender, instance, **kwargs):
+    """삭제된 메모를 검색 색인에서 제거"""
+    search.unindex_memo(instance.pk)
+
+
+@receiver(memos_bulk_created)
+def index_bulk_created_memos(sender, memos, **kwargs):
+    """일괄 생성된 메모를 검색 색인에 반영"""
+    search.index_memos(memos)
+
+
+@receiver(memos_updated)
+def index_updated_memos(sender, memos, fields, **kwargs):
+    """일괄 수정된 메모의 제목/본문이 바뀌었으면 검색 색인에 반영"""
+    if {"title", "content"} & set(fields):
+        search.index_memos(memos, retitle="title" in fields)
+
+
+@receiver(memo_chunks_written)
+def index_written_chunks(sender, chunks, removed, **kwargs):
+    """쓰거나 지운 청크 행만 검색 색인에 반영"""
+    search.unindex_chunks(removed)
+    search.index_chunks(chunks)
+
+
+@receiver([post_save, post_delete], sender=Memo)
+def invalidate_list_cache(sender, instance, **kwargs):
+    """메모가 바뀐 사용자의 목록 캐시를 무효화 (커밋 후 한 번 더)"""
+    cache.invalidate_list(instance.user_id, using=instance._state.db)
+
+
+@receiver([memos_bulk_created, memos_updated])
+def invalidate_bulk_list_cache(sender, memos, **kwargs):
+    """일괄 처리된 메모 사용자들의 목록 캐시를 무효화 (커밋 후 한 번 더)"""
+    for user_id in {memo.user_id for memo in memos}:
+        cache.invalidate_list(user_id)
+
+
+@receiver(post_save, sender=Memo)
+def record_memo_revision(sender, instance, created, update_fields=None, **kwargs):
+    """제목/본문이 바뀐 메모의 수정 기록을 저장"""
+    if created:
+        revisions.record_created([instance])
+        return
+    if update_fields is not None and not {"title", "content"} & set(update_fields):
+        return
+    # 읽지 않은(defer) 필드는 저장되지 않으므로 둘 다 없으면 바뀐 것이 없음
+    if {"title", "content"} <= instance.get_deferred_fields():
+        return
+    if instance._previous is not None:
+        # 청크로 나뉜 메모의 첫 청크만 바뀌었으므로 그 청크의 델타만 기록
+        title, first = instance._previous
+        revisions.record_chunk_revision(
+            instance, 0, first, [instance.content, *instance._new_chunks], old_title=title
+        )
+        return
+    revisions.record_revision(instance)
+
+
+@receiver(memos_bulk_created)
+def record_bulk_created_revisions(sender, memos, **kwargs):
+    """일괄 생성된 메모의 첫 스냅숏을 저장"""
+    revisions.record_created(memos)
+
+
+@receiver(memos_updated)
+def record_updated_revisions(sender, memos, fields, **kwargs):
+    """일괄 수정으로 제목/본문이 바뀐 메모의 수정 기록을 저장"""
+    if {"title", "content"} & set(fields):
+        for memo in memos:
+            revisions.record_revision(memo)
+
+
+@receiver(memo_chunk_edited)
+def record_edited_chunk_revision(sender, memo, number, old, new, **kwargs):
+    """청크 하나를 고친 메모의 수정 기록을 그 청크의 델타로 저장"""
+    revisions.record_chunk_revision(memo, number, old, new)
+
+
+@receiver(post_migrate)
+def ensure_memo_stats_triggers(sender, using, **kwargs):
+    """memos 테이블을 다시 만든 마이그레이션이 지운 통계 트리거를 다시 만듦"""
+    if sender.label == "memos":
+        stats.ensure_triggers(using)
@@ -0,0 +1,145 @@
+"""메모 리마인드 발송
+
+발송 시각이 지난 리마인드를 배치 단위로 선점(claim)한 뒤 설정된 백엔드로
+전달합니다. 대기 중인 리마인드만 담는 부분 인덱스(memos_due_reminder_idx)를
+사용하므로 조회 비용은 전체 메모 수가 아니라 발송 대상 수에 비례합니다.
+
+백엔드는 settings.MEMO_REMINDER_BACKEND에 점 표기 경로로 지정합니다.
+"""
+import json
+import logging
+import sys
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from .models import Memo
+from .signals import memos_updated
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = "memojjang.apps.memos.reminders.ConsoleReminderBackend"
+
+
+class BaseReminderBackend:
+    """리마인드 발송 백엔드의 기본 클래스
+
+    send_reminders()에서 예외가 발생하면 해당 배치의 선점이 취소되어
+    다음 실행 때 다시 발송됩니다.
+    """
+
+    def send_reminders(self, memos):
+        """메모 목록의 리마인드를 발송"""
+        raise NotImplementedError
+
+    @staticmethod
+    def format_message(memo):
+        """리마인드 메시지 한 줄을 생성"""
+        reminder_date = timezone.localtime(memo.reminder_date)
+        return f"[리마인드] {memo.user.username}: {memo.title} ({reminder_date:%Y-%m-%d %H:%M})"
+
+
+class ConsoleReminderBackend(BaseReminderBackend):
+    """리마인드를 표준 출력에 기록하는 백엔드 (개발용)"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def send_reminders(self, memos):
+        for memo in memos:
+            self.stream.write(self.format_message(memo) + "\n")
+        self.stream.flush()
+
+
+class FileReminderBackend(BaseReminderBackend):
+    """리마인드를 JSON Lines 파일에 추가하는 백엔드 (개발용)
+
+    파일 경로는 settings.MEMO_REMINDER_FILE_PATH로 지정합니다.
+    """
+
+    def __init__(self, file_path=None):
+        self.file_path = file_path or settings.MEMO_REMINDER_FILE_PATH
+
+    def send_reminders(self, memos):
+        with open(self.file_path, "a", encoding="utf-8") as output:
+            for memo in memos:
+                record = {
+                    "memo_id": memo.pk,
+                    "username": memo.user.username,
+                    "email": memo.user.email,
+                    "title": memo.title,
+                    "reminder_date": memo.reminder_date.isoformat(),
+                    "message": self.format_message(memo),
+                }
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def get_backend(path=None, **kwargs):
+    """설정된 리마인드 백엔드 인스턴스를 생성"""
+    path = path or getattr(settings, "MEMO_REMINDER_BACKEND", DEFAULT_BACKEND)
+    return import_string(path)(**kwargs)
+
+
+def due_reminders(now=None):
+    """발송 시각이 지났고 아직 발송되지 않은 메모 쿼리셋"""
+    now = now or timezone.now()
+    return Memo.objects.filter(
+        is_reminded=False, reminder_date__lte=now
+    ).order_by("reminder_date")
+
+
+def claim_due_reminders(limit, now=None):
+    """발송 대상 리마인드를 최대 limit개 선점해 반환
+
+    쓰기 트랜잭션(IMMEDIATE) 안에서 후보 id를 부분 인덱스로 조회하고
+    is_reminded=False 조건부 UPDATE 한 번으로 모두 선점합니다. 트랜잭션을 시작할
+    때 쓰기 잠금을 잡으므로 조회한 후보를 다른 작업자가 그 사이에 선점할 수
+    없어, 조회한 행이 곧 이 작업자가 선점한 행입니다. 쓰기 잠금은 배치 크기와
+    관계없이 문장 두 개 동안만 잡습니다.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        claimed = list(due_reminders(now).values_list("pk", flat=True)[:limit])
+        if not claimed:
+            return []
+        # updated_at도 갱신해 목록 캐시/조건부 요청이 상태 변화를 알 수 있게 함
+        Memo.objects.filter(pk__in=claimed, is_reminded=False).update(
+            is_reminded=True, updated_at=now
+        )
+    memos = list(
+        Memo.objects.filter(pk__in=claimed)
+        .select_related("user")
+        .only("id", "user_id", "title", "reminder_date", "user__username", "user__email")
+        .order_by("reminder_date")
+    )
+    memos_updated.send(sender=Memo, memos=memos, fields=["is_reminded", "updated_at"])
+    return memos
+
+
+def release_reminders(memos):
+    """발송에 실패한 리마인드의 선점을 취소"""
+    Memo.objects.filter(pk__in=[memo.pk for memo in memos]).update(
+        is_reminded=False, updated_at=timezone.now()
+    )
+    memos_updated.send(sender=Memo, memos=memos, fields=["is_reminded", "updated_at"])
+
+
+def dispatch_due_reminders(backend=None, batch_size=100, max_batches=None, now=None):
+    """발송 대상이 없을 때까지 배치 단위로 리마인드를 발송하고 발송 수를 반환"""
+    backend = backend or get_backend()
+    now = now or timezone.now()
+    sent = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        memos = claim_due_reminders(batch_size, now=now)
+        if not memos:
+            break
+        try:
+            backend.send_reminders(memos)
+        except Exception:
+            logger.exception("리마인드 %d건 발송 실패, 선점을 취소합니다.", len(memos))
+            release_reminders(memos)
+            raise
+        sent += len(memos)
+        batches += 1
+    return sent
@@ -0,0 +1,271 @@
+"""메모 수정 기록 (압축된 델타)
+
+메모의 제목이나 본문이 바뀔 때마다 MemoRevision을 하나 저장합니다(receivers.py).
+대부분의 기록은 직전 버전과의 단어 단위 차이(difflib)를 zlib으로 압축해 담으므로
+저장 공간은 메모 크기가 아니라 수정한 분량에 비례합니다. 청크로 나뉜 메모는
+청크 경계를 함께 기록하고, 청크 하나를 고치면(chunks.write_chunk, 첫 청크를 고치는
+save()) 그 청크 번호와 그 청크 안의 델타만 남기므로(record_chunk_revision) 이전
+버전을 복원하거나 전체 본문을 읽지 않습니다.
+
+스냅숏(전체 내용) 사이의 기록 수를 settings.MEMO_REVISION_SNAPSHOT_INTERVAL(K)개로
+제한하므로, 어떤 버전이든 가장 가까운 이전 스냅숏부터 K개 이하의 행을 한 번의
+쿼리로 읽고 델타를 K - 1번 이하로 적용해 복원합니다. 청크 쓰기도 K번째마다
+스냅숏을 남기므로 그때만 모든 청크를 읽습니다.
+
+data는 다음 JSON을 zlib으로 압축한 값입니다.
+- 스냅숏: {"t": 제목, "c": 본문 또는 [청크 본문, ...] (청크로 나뉜 메모)}
+- 델타: {"t": 제목 (바뀐 경우만), "n": 청크 번호 (0이면 생략), "d": [연산, ...],
+  "i": [그 청크 뒤에 끼워 넣은 청크 본문, ...] (있는 경우만)}
+  연산은 ["=", n] (이전 토큰 n개 유지), ["-", n] (n개 삭제), ["+", [토큰, ...]] (삽입)
+- 청크 삭제: {"n": 청크 번호, "x": 1}
+스냅숏의 "c"가 문자열이면 청크 하나로 다룹니다 (청크 경계를 기록하기 전의 기록은
+0015 마이그레이션이 청크로 나뉜 메모의 최신 스냅숏에 경계를 남김).
+"""
+import difflib
+import json
+import re
+import zlib
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Max, Q, Subquery
+from django.db.models.functions import Length
+from . import chunks
+from .models import MemoRevision
+
+DEFAULT_SNAPSHOT_INTERVAL = 20
+# 기록 목록 한 페이지의 기록 수
+PAGE_SIZE = 50
+COMPRESSION_LEVEL = 6
+# 단어와 뒤따르는 공백(줄바꿈 포함)을 한 토큰으로, 이어 붙이면 원문이 됨
+_TOKEN = re.compile(r"\s+|\S+\s*")
+
+
+def get_snapshot_interval():
+    """스냅숏 사이의 최대 기록 수 (K)"""
+    return max(1, getattr(settings, "MEMO_REVISION_SNAPSHOT_INTERVAL", DEFAULT_SNAPSHOT_INTERVAL))
+
+
+def tokenize(text):
+    """텍스트를 단어 단위 토큰 리스트로 나눔"""
+    return _TOKEN.findall(text)
+
+
+def make_delta(old, new):
+    """old를 new로 바꾸는 연산 리스트"""
+    new_tokens = tokenize(new)
+    matcher = difflib.SequenceMatcher(None, tokenize(old), new_tokens)
+    delta = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            delta.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            delta.append(["-", i2 - i1])
+        if j2 > j1:
+            delta.append(["+", new_tokens[j1:j2]])
+    return delta
+
+
+def _apply(tokens, delta):
+    """토큰 리스트에 델타를 적용한 새 토큰 리스트
+
+    결과는 새 내용을 tokenize()한 것과 같으므로, 여러 델타를 이어 적용할 때
+    중간에 문자열로 합치고 다시 나눌 필요가 없습니다.
+    """
+    result = []
+    position = 0
+    for op, value in delta:
+        if op == "=":
+            result.extend(tokens[position:position + value])
+            position += value
+        elif op == "-":
+            position += value
+        else:
+            result.extend(value)
+    return result
+
+
+def apply_delta(old, delta):
+    """make_delta가 만든 연산 리스트를 old에 적용"""
+    return "".join(_apply(tokenize(old), delta))
+
+
+def encode(payload):
+    return zlib.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(),
+        COMPRESSION_LEVEL,
+    )
+
+
+def decode(data):
+    return json.loads(zlib.decompress(data))
+
+
+def snapshot(memo, number=1, pieces=None):
+    """메모의 현재 내용(청크로 나뉜 메모는 청크 리스트)을 담은 스냅숏 기록 (저장하지 않음)"""
+    if pieces is None:
+        pieces = memo.content_chunks()
+    content = pieces[0] if len(pieces) == 1 else pieces
+    return MemoRevision(
+        memo=memo, number=number, is_snapshot=True,
+        data=encode({"t": memo.title, "c": content}),
+    )
+
+
+def _chain(memo_id, number=None):
+    """number 버전(없으면 최신)과 그 앞의 가장 가까운 스냅숏까지의 기록, 번호순"""
+    revisions = MemoRevision.objects.filter(memo_id=memo_id)
+    if number is not None:
+        revisions = revisions.filter(number__lte=number)
+    nearest = revisions.filter(is_snapshot=True).order_by("-number").values("number")[:1]
+    return list(
+        revisions.filter(number__gte=Subquery(nearest))
+        .order_by("number")
+        .only("number", "is_snapshot", "data")
+    )
+
+
+def _replay_pieces(chain):
+    """스냅숏부터 델타를 차례로 적용해 (제목, 청크 본문 리스트)를 복원"""
+    title = ""
+    pieces = [[]]
+    for revision in chain:
+        payload = decode(revision.data)
+        if revision.is_snapshot:
+            content = payload["c"]
+            title = payload["t"]
+            pieces = [tokenize(text) for text in ([content] if isinstance(content, str) else content)]
+            continue
+        title = payload.get("t", title)
+        number = payload.get("n", 0)
+        if "x" in payload:
+            del pieces[number]
+        elif "d" in payload:
+            pieces[number] = _apply(pieces[number], payload["d"])
+            pieces[number + 1:number + 1] = [tokenize(text) for text in payload.get("i", ())]
+    return title, ["".join(tokens) for tokens in pieces]
+
+
+def _replay(chain):
+    """스냅숏부터 델타를 차례로 적용해 (제목, 본문)을 복원"""
+    title, pieces = _replay_pieces(chain)
+    return title, "".join(pieces)
+
+
+def revision_state(memo_id, number):
+    """number 버전의 (제목, 본문), 없으면 MemoRevision.DoesNotExist"""
+    chain = _chain(memo_id, number)
+    if not chain or chain[-1].number != number:
+        raise MemoRevision.DoesNotExist
+    return _replay(chain)
+
+
+def _chain_position(memo_id):
+    """(최신 기록 번호, 가장 가까운 스냅숏부터의 기록 수), 기록이 없으면 (None, 0)
+
+    기록 내용을 읽지 않고 번호만 한 번의 쿼리로 집계합니다.
+    """
+    numbers = MemoRevision.objects.filter(memo_id=memo_id).aggregate(
+        last=Max("number"), snapshot=Max("number", filter=Q(is_snapshot=True)),
+    )
+    if numbers["last"] is None:
+        return None, 0
+    return numbers["last"], numbers["last"] - numbers["snapshot"] + 1
+
+
+def record_revision(memo):
+    """메모의 현재 내용이 최신 기록과 다르면 새 기록을 저장해 반환
+
+    기록 도입 전에 만든 메모는 마이그레이션(0013)이 원래 내용을 첫 스냅숏으로
+    남겨 두며, 그래도 기록이 없는 메모는 현재 내용을 첫 스냅숏으로 저장합니다.
+    최신 버전을 복원해 비교하므로, 청크 하나를 고친 것을 알 때는
+    record_chunk_revision을 씁니다. 청크 수가 달라졌거나 청크로 나뉜 메모는 델타
+    대신 스냅숏을 남깁니다. 최신 버전을 읽고 다음 번호로 쓰는 사이에 다른
+    저장이 끼어들지 않도록 한 트랜잭션(IMMEDIATE)으로 처리합니다.
+    """
+    with transaction.atomic(using=router.db_for_write(MemoRevision)):
+        current = memo.content_chunks()
+        chain = _chain(memo.pk)
+        if not chain:
+            revision = snapshot(memo, pieces=current)
+        else:
+            title, pieces = _replay_pieces(chain)
+            if (title, pieces) == (memo.title, current):
+                return None
+            number = chain[-1].number + 1
+            if len(chain) >= get_snapshot_interval() or len(pieces) != 1 or len(current) != 1:
+                revision = snapshot(memo, number, current)
+            else:
+                payload = {"d": make_delta(pieces[0], current[0])}
+                if title != memo.title:
+                    payload["t"] = memo.title
+                revision = MemoRevision(memo=memo, number=number, data=encode(payload))
+        revision.save()
+    return revision
+
+
+def record_chunk_revision(memo, number, old, new, old_title=None):
+    """number번 청크가 old에서 new(청크 본문 리스트, 비면 청크 삭제)로 바뀐 기록을 저장해 반환
+
+    최신 기록이 바뀌기 전 청크 경계를 담고 있다고 보고, 이전 버전을 복원하지
+    않은 채 그 청크 안의 델타만 남깁니다. 그래서 비용은 메모 크기가 아니라 고친
+    청크 크기에 비례하며, 스냅숏을 남길 차례(K번째)이거나 기록이 없을 때만 모든
+    청크를 읽어 스냅숏을 저장합니다. old_title은 같은 저장에서 바뀌기 전 제목이며
+    None이면 제목은 바뀌지 않은 것으로 봅니다. 바뀐 것이 없으면 None을 반환합니다.
+    """
+    title_changed = old_title is not None and old_title != memo.title
+    if not title_changed and new == [old]:
+        return None
+    with transaction.atomic(using=router.db_for_write(MemoRevision)):
+        last, length = _chain_position(memo.pk)
+        if last is None or length >= get_snapshot_interval():
+            revision = snapshot(memo, 1 if last is None else last + 1)
+        else:
+            if not new:
+                payload = {"x": 1}
+            else:
+                payload = {"d": make_delta(old, new[0])}
+                if len(new) > 1:
+                    payload["i"] = new[1:]
+            if number:
+                payload["n"] = number
+            if title_changed:
+                payload["t"] = memo.title
+            revision = MemoRevision(memo=memo, number=last + 1, data=encode(payload))
+        revision.save()
+    return revision
+
+
+def record_created(memos):
+    """새로 만든 메모들의 첫 스냅숏을 한 번에 저장"""
+    MemoRevision.objects.bulk_create([snapshot(memo) for memo in memos])
+
+
+def list_revisions(memo_id):
+    """메모의 기록 목록 (최신순, 압축된 크기 size 포함, 내용은 읽지 않음)"""
+    return (
+        MemoRevision.objects.filter(memo_id=memo_id)
+        .annotate(size=Length("data"))
+        .defer("data")
+        .order_by("-number")
+    )
+
+
+def revision_page(memo_id, before=None):
+    """before 번호보다 앞선 기록 PAGE_SIZE개와 다음 페이지의 before 값 (없으면 None)"""
+    queryset = list_revisions(memo_id)
+    if before is not None:
+        queryset = queryset.filter(number__lt=before)
+    page = list(queryset[:PAGE_SIZE + 1])
+    next_before = page[PAGE_SIZE - 1].number if len(page) > PAGE_SIZE else None
+    return page[:PAGE_SIZE], next_before
+
+
+def restore_revision(memo, number):
+    """메모의 제목/본문을 number 버전으로 되돌림
+
+    되돌린 내용도 새 버전으로 기록되므로 이후 기록은 지워지지 않습니다.
+    되돌린 버전의 전체 본문으로 청크로 나뉜 메모의 모든 청크를 다시 씁니다.
+    """
+    memo.title, content = revision_state(memo.pk, number)
+    return chunks.replace_content(memo, content, update_fields=["title"])
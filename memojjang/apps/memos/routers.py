@@ -0,0 +1,88 @@
+"""읽기 복제본 / primary 데이터베이스 라우터
+
+settings.MEMO_READ_REPLICAS에 지정한 복제본 별칭으로 메모 앱의 읽기를
+보내고, 쓰기는 모두 default(primary)로 보냅니다.
+
+복제본은 primary보다 늦을 수 있으므로 다음 경우에는 읽기도 primary로 보냅니다.
+- primary의 트랜잭션 안에서 읽는 경우
+- 현재 요청이나 작업에서 메모를 쓴 뒤 (이후의 읽기 전부)
+- 메모를 쓴 사용자의 다음 요청들 (ReplicaPinningMiddleware가 쿠키로
+  settings.MEMO_REPLICA_PIN_SECONDS초 동안 고정)
+
+고정 여부는 contextvar에 두므로 스레드(WSGI)와 태스크(ASGI)별로 따로 관리됩니다.
+"""
+import random
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+DEFAULT_PIN_SECONDS = 5
+ROUTED_APP_LABELS = ("memos",)
+
+_pinned = ContextVar("memos_pinned_to_primary", default=False)
+_wrote = ContextVar("memos_wrote_to_primary", default=False)
+
+
+def get_replicas():
+    """읽기 복제본 데이터베이스 별칭 목록"""
+    return getattr(settings, "MEMO_READ_REPLICAS", [])
+
+
+def get_pin_seconds():
+    """쓰기 후 사용자의 읽기를 primary로 고정하는 시간(초)"""
+    return getattr(settings, "MEMO_REPLICA_PIN_SECONDS", DEFAULT_PIN_SECONDS)
+
+
+def start_request(pinned=False):
+    """요청을 시작할 때 고정 상태를 초기화"""
+    _pinned.set(pinned)
+    _wrote.set(False)
+
+
+def pin_to_primary():
+    """이후의 읽기를 primary로 보냄"""
+    _pinned.set(True)
+
+
+def is_pinned():
+    """읽기가 primary로 고정되어 있는지 여부"""
+    return _pinned.get()
+
+
+def wrote_to_primary():
+    """start_request() 이후 메모를 썼는지 여부"""
+    return _wrote.get()
+
+
+class PrimaryReplicaRouter:
+    """메모 읽기는 복제본으로, 쓰기는 primary로 보내는 라우터"""
+
+    def _routed(self, model):
+        return model._meta.app_label in ROUTED_APP_LABELS
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replicas()
+        if not replicas or not self._routed(model) or is_pinned():
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        if self._routed(model):
+            _wrote.set(True)
+            pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본에서 읽은 객체도 primary와 같은 데이터이므로 관계를 허용
+        pool = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본은 primary에서 복제되므로 직접 마이그레이션하지 않음
+        if db in get_replicas():
+            return False
+        return None
@@ -0,0 +1,253 @@
+"""SQLite FTS5 기반 메모 전문 검색
+
+memos_fts 가상 테이블은 본문 청크마다 한 행이며 (user_key, title, content,
+memo_key, memo_id) 컬럼을 가집니다. 0번 청크(Memo.content) 행은 메모 id를,
+1번 이후 청크 행은 MemoChunk id의 음수를 rowid로 쓰므로 청크를 끼워 넣거나
+지워 번호가 밀려도 다른 청크 행은 다시 쓰지 않습니다. 제목은 모든 청크 행에
+함께 넣습니다. user_key에는 "u<사용자 id>", memo_key에는 "m<메모 id>" 토큰을
+넣어 두어, 사용자 범위 제한과 메모의 모든 행 찾기도 FTS 인덱스 안에서
+처리되도록 합니다.
+
+검색은 청크 행 단위로 일치시킨 뒤 메모마다 가장 점수가 좋은 행 하나로
+묶으므로, 검색어의 모든 단어가 (제목과) 한 청크 안에 있어야 찾습니다.
+
+색인은 메모 저장/삭제와 청크 쓰기 시그널에서 바뀐 행만 갱신되며(receivers.py),
+rebuild_memo_index 명령으로 전체를 다시 만들 수 있습니다.
+"""
+from django.db import connection, connections, router, transaction
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from .models import Memo, MemoChunk
+
+FTS_TABLE = "memos_fts"
+# 하이라이트 구간 표시용 제어 문자 (HTML 이스케이프 후 <mark>로 치환)
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+# bm25 컬럼 가중치 (user_key, title, content, memo_key, memo_id): 제목 일치를 본문보다 높게 평가
+BM25_WEIGHTS = (0.0, 10.0, 1.0, 0.0, 0.0)
+SNIPPET_TOKENS = 24
+# 검색 결과를 넘겨 볼 수 있는 최대 페이지 (OFFSET이 SQLite 정수 범위를 넘지 않고
+# bm25로 정렬할 행 수가 끝없이 늘지 않도록 제한)
+MAX_PAGE = 1000
+
+UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO {FTS_TABLE} (rowid, user_key, title, content, memo_key, memo_id) "
+    "VALUES (%s, %s, %s, %s, %s, %s)"
+)
+DELETE_SQL = f"DELETE FROM {FTS_TABLE} WHERE rowid = %s"
+# 메모의 모든 청크 행 (memo_key 토큰으로 FTS 인덱스에서 찾음)
+MEMO_ROWS_SQL = f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+DELETE_MEMO_SQL = f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({MEMO_ROWS_SQL})"
+# 1번 이후 청크 행(rowid < 0)의 제목만 바꿈
+RETITLE_CHUNKS_SQL = (
+    f"UPDATE {FTS_TABLE} SET title = %s WHERE rowid IN ({MEMO_ROWS_SQL}) AND rowid < 0"
+)
+
+
+def is_available():
+    """현재 데이터베이스에서 FTS5 검색을 사용할 수 있는지 여부"""
+    return connection.vendor == "sqlite"
+
+
+def user_key(user_id):
+    """사용자 범위 제한용 토큰"""
+    return f"u{user_id}"
+
+
+def memo_key(memo_id):
+    """메모의 모든 청크 행을 찾는 토큰"""
+    return f"m{memo_id}"
+
+
+def _memo_match(memo_id):
+    return f'memo_key:"{memo_key(memo_id)}"'
+
+
+def build_match_query(text):
+    """사용자 입력을 FTS5 MATCH 구문으로 변환
+
+    각 단어를 따옴표로 감싸 FTS 연산자로 해석되지 않게 하고, 조사가 붙은
+    한국어 단어도 찾을 수 있도록 접두어 검색(*)으로 만듭니다.
+    단어가 없으면 빈 문자열을 반환합니다.
+    """
+    terms = []
+    for term in text.split():
+        term = term.replace('"', '""')
+        terms.append(f'"{term}"*')
+    return " ".join(terms)
+
+
+def _row(memo):
+    # 0번 청크 행, 나머지 청크 행은 청크를 쓸 때 따로 색인 (index_chunks)
+    return (
+        memo.pk, user_key(memo.user_id), memo.title, memo.content, memo_key(memo.pk), memo.pk,
+    )
+
+
+def _chunk_row(chunk):
+    memo = chunk.memo
+    return (
+        -chunk.pk, user_key(memo.user_id), memo.title, chunk.content, memo_key(memo.pk), memo.pk,
+    )
+
+
+def index_memo(memo, retitle=True):
+    """메모 한 건의 0번 청크 행을 색인에 추가하거나 갱신
+
+    retitle이면 청크로 나뉜 메모의 나머지 청크 행 제목도 바꿉니다
+    (제목이 바뀌지 않은 것을 알면 False로 넘겨 다른 청크 행을 건드리지 않음).
+    """
+    index_memos([memo], retitle)
+
+
+def index_memos(memos, retitle=True):
+    """여러 메모의 0번 청크 행을 한 번에 색인 (retitle은 index_memo 참고)"""
+    if not is_available():
+        return
+    # 자동 커밋 모드에서 행마다 커밋되지 않도록 한 트랜잭션으로 실행
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(UPSERT_SQL, [_row(memo) for memo in memos])
+        if retitle:
+            cursor.executemany(RETITLE_CHUNKS_SQL, [
+                (memo.title, _memo_match(memo.pk)) for memo in memos if memo.chunk_count > 1
+            ])
+
+
+def index_chunks(chunks):
+    """1번 이후 청크 행을 색인에 추가하거나 갱신 (청크의 memo에서 사용자와 제목을 읽음)"""
+    if not is_available() or not chunks:
+        return
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(UPSERT_SQL, [_chunk_row(chunk) for chunk in chunks])
+
+
+def unindex_chunks(pks):
+    """지운 1번 이후 청크 행들을 색인에서 제거"""
+    if not is_available() or not pks:
+        return
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(DELETE_SQL, [(-pk,) for pk in pks])
+
+
+def unindex_memo(pk):
+    """메모 한 건의 모든 청크 행을 색인에서 제거"""
+    if not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(DELETE_MEMO_SQL, [_memo_match(pk)])
+
+
+def rebuild_index(batch_size=1000):
+    """색인을 비우고 모든 메모를 pk 순서로 배치 단위 색인
+
+    청크로 나뉜 메모의 나머지 청크는 하나씩 읽어 색인하므로 메모리에는 청크
+    하나 분량만 올라갑니다. 처리한 메모 수를 배치마다 yield 합니다.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    queryset = Memo.objects.only("id", "user_id", "title", "content", "chunk_count").order_by("pk")
+    last_pk = 0
+    indexed = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            break
+        index_memos(batch, retitle=False)
+        chunked = {memo.pk: memo for memo in batch if memo.chunk_count > 1}
+        rest = MemoChunk.objects.filter(memo_id__in=chunked).only("id", "memo_id", "content")
+        for chunk in rest.iterator(chunk_size=1):
+            chunk.memo = chunked[chunk.memo_id]
+            index_chunks([chunk])
+        last_pk = batch[-1].pk
+        indexed += len(batch)
+        yield indexed
+    with connection.cursor() as cursor:
+        # 세그먼트를 병합해 검색 성능을 회복
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+
+
+def _highlight(text):
+    """하이라이트 표시를 제외한 부분을 이스케이프하고 <mark>로 감쌈"""
+    escaped = conditional_escape(text)
+    return mark_safe(
+        escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+    )
+
+
+class SearchResult:
+    """검색 결과 한 건"""
+
+    def __init__(self, memo, title_html, snippet_html):
+        self.memo = memo
+        self.title_html = title_html
+        self.snippet_html = snippet_html
+
+
+class SearchPage:
+    """검색 결과 한 페이지"""
+
+    def __init__(self, results, number, has_next):
+        self.results = results
+        self.number = number
+        self.has_next = has_next
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def has_previous(self):
+        """이전 페이지가 있는지 여부"""
+        return self.number > 1
+
+
+def search_memos(user, text, page=1, page_size=20):
+    """사용자의 메모를 bm25 순으로 검색해 한 페이지를 반환
+
+    MAX_PAGE보다 뒤의 페이지는 조회하지 않고 빈 페이지로 반환합니다.
+    """
+    match = build_match_query(text)
+    if not match or not is_available():
+        return SearchPage([], 1, False)
+    page = max(page, 1)
+    if page > MAX_PAGE:
+        return SearchPage([], page, False)
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+    # 청크 행마다 점수를 매긴 뒤 메모별로 가장 좋은 행(과 그 하이라이트)을 고름
+    # (보조 함수는 묶기 전에 계산해야 하므로 MATERIALIZED로 하위 쿼리를 펼치지 않게 함)
+    sql = (
+        f"WITH hits AS MATERIALIZED ("
+        f"SELECT memo_id, "
+        f"highlight({FTS_TABLE}, 1, %s, %s) AS title_html, "
+        f"snippet({FTS_TABLE}, 2, %s, %s, '…', {SNIPPET_TOKENS}) AS snippet_html, "
+        f"bm25({FTS_TABLE}, {weights}) AS score "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+        f") SELECT memo_id, title_html, snippet_html, MIN(score) AS best FROM hits "
+        f"GROUP BY memo_id ORDER BY best, memo_id LIMIT %s OFFSET %s"
+    )
+    params = [
+        HIGHLIGHT_START, HIGHLIGHT_END,
+        HIGHLIGHT_START, HIGHLIGHT_END,
+        f"user_key:{user_key(user.pk)} AND {{title content}}: ({match})",
+        page_size + 1,
+        (page - 1) * page_size,
+    ]
+    # 색인과 메모를 같은 데이터베이스(복제본일 수 있음)에서 읽음
+    db = router.db_for_read(Memo)
+    with connections[db].cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    has_next = len(rows) > page_size and page < MAX_PAGE
+    rows = rows[:page_size]
+    # 색인과 실제 테이블이 어긋난 경우를 대비해 사용자 조건으로 다시 확인
+    memos = Memo.objects.using(db).for_list().filter(user=user).in_bulk(
+        [row[0] for row in rows]
+    )
+    results = [
+        SearchResult(memos[pk], _highlight(title), _highlight(snippet))
+        for pk, title, snippet, _ in rows
+        if pk in memos
+    ]
+    return SearchPage(results, page, has_next)
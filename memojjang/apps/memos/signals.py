@@ -0,0 +1,18 @@
+from django.dispatch import Signal
+
+# bulk_create는 post_save를 보내지 않으므로 생성된 메모 목록을 따로 알림
+# 인자: memos (생성된 Memo 인스턴스 리스트)
+memos_bulk_created = Signal()
+
+# bulk_update나 QuerySet.update처럼 save()를 거치지 않는 수정을 알림
+# 인자: memos (수정된 Memo 인스턴스 리스트, pk와 user_id 필요), fields (수정된 필드 이름)
+memos_updated = Signal()
+
+# 1번 이후 청크(MemoChunk) 행을 쓰거나 지운 것을 알림 (검색 색인을 청크 단위로 갱신)
+# 인자: chunks (새로 쓴 MemoChunk 인스턴스 리스트, pk와 memo 필요), removed (지운 청크의 pk 리스트)
+memo_chunks_written = Signal()
+
+# chunks.write_chunk가 1번 이후 청크 하나를 고친 것을 알림 (청크 단위 수정 기록)
+# 인자: memo, number (고친 청크 번호), old (고치기 전 청크 본문),
+#       new (그 자리에 들어간 청크 본문 리스트, 청크를 지웠으면 빈 리스트)
+memo_chunk_edited = Signal()
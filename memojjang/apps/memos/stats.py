@@ -0,0 +1,130 @@
+"""사용자별 메모 통계
+
+메모 수, 대기 중인 리마인드 수, 본문 사용량은 memos 트리거가 MemoStats 행에
+바로 반영하므로(migrations/0012_memo_stats.py) 화면에 보여줄 때는 memos를
+COUNT/SUM으로 세지 않고 user_id 유니크 인덱스로 통계 행 하나만 읽습니다.
+메모를 만든 적이 없어 통계 행이 없는 사용자는 0으로 봅니다.
+
+SQLite에서 Django가 memos 테이블을 다시 만드는 마이그레이션(필드 변경 등)은
+테이블에 걸린 트리거도 지우므로, migrate가 끝날 때마다 ensure_triggers()가
+없어진 트리거를 다시 만듭니다(receivers.py의 post_migrate 수신기).
+
+트리거를 거치지 않은 변경(트리거가 없던 백업으로 복원한 경우 등)으로 생긴
+차이는 reconcile()이 memos를 사용자별로 다시 세어 찾고 고칩니다
+(reconcile_memo_stats 명령).
+"""
+import importlib
+import logging
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+from django.db.models import Count, Q, Sum
+from .models import Memo, MemoStats
+
+logger = logging.getLogger(__name__)
+
+# 통계 값의 순서 (reconcile()이 돌려주는 튜플의 순서)
+STAT_FIELDS = ("memo_count", "pending_reminder_count", "content_bytes")
+# 대기 중인 리마인드 (memos_due_reminder_idx 조건, 트리거와 같음)
+PENDING_REMINDER = Q(reminder_date__isnull=False, is_reminded=False)
+EMPTY = (0, 0, 0)
+# 통계 트리거를 만드는 SQL이 있는 마이그레이션
+TRIGGERS_MIGRATION = "memojjang.apps.memos.migrations.0012_memo_stats"
+
+
+def get_stats(user_id):
+    """사용자의 메모 통계 (통계 행이 없으면 저장하지 않은 0 통계)"""
+    try:
+        return MemoStats.objects.get(user_id=user_id)
+    except MemoStats.DoesNotExist:
+        return MemoStats(user_id=user_id)
+
+
+async def aget_stats(user_id):
+    """get_stats()의 비동기 버전"""
+    try:
+        return await MemoStats.objects.aget(user_id=user_id)
+    except MemoStats.DoesNotExist:
+        return MemoStats(user_id=user_id)
+
+
+def count_stats(user_ids, using=None):
+    """memos를 다시 세어 만든 사용자별 통계 {user_id: (메모 수, 대기 리마인드 수, 본문 사용량)}
+
+    메모가 없는 사용자는 결과에 없습니다.
+    """
+    rows = (
+        Memo.objects.using(using)
+        .filter(user_id__in=user_ids)
+        .order_by()
+        .values("user_id")
+        .annotate(
+            memo_count=Count("id"),
+            pending_reminder_count=Count("id", filter=PENDING_REMINDER),
+            content_bytes=Sum("size"),
+        )
+    )
+    return {row["user_id"]: tuple(row[field] for field in STAT_FIELDS) for row in rows}
+
+
+def reconcile(user_ids, repair=True):
+    """user_ids 사용자의 통계를 memos와 비교해 어긋난 사용자를 찾고 repair이면 고침
+
+    [(user_id, 저장된 값, 실제 값), ...]을 반환하며 값은 STAT_FIELDS 순서의
+    튜플입니다. 비교와 수정을 한 트랜잭션에서 하므로 그 사이에 바뀐 메모가
+    섞이지 않습니다.
+    """
+    using = router.db_for_write(MemoStats)
+    with transaction.atomic(using=using):
+        actual = count_stats(user_ids, using)
+        stored = {
+            user_id: tuple(values)
+            for user_id, *values in MemoStats.objects.using(using)
+            .filter(user_id__in=user_ids)
+            .values_list("user_id", *STAT_FIELDS)
+        }
+        drift = [
+            (user_id, stored.get(user_id, EMPTY), actual.get(user_id, EMPTY))
+            for user_id in user_ids
+            if stored.get(user_id, EMPTY) != actual.get(user_id, EMPTY)
+        ]
+        if repair and drift:
+            MemoStats.objects.using(using).bulk_create(
+                [
+                    MemoStats(user_id=user_id, **dict(zip(STAT_FIELDS, values)))
+                    for user_id, _, values in drift
+                ],
+                update_conflicts=True,
+                unique_fields=["user"],
+                update_fields=STAT_FIELDS,
+            )
+    return drift
+
+
+def ensure_triggers(using=DEFAULT_DB_ALIAS):
+    """memos에서 없어진 통계 트리거를 다시 만들고 만든 트리거 이름 목록을 반환
+
+    통계 테이블이 아직 없으면(0012 이전) 아무것도 하지 않습니다. 트리거가 없던
+    동안의 변경은 통계에 반영되지 않았으므로 다시 만들었으면 경고를 남깁니다.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return []
+    if MemoStats._meta.db_table not in connection.introspection.table_names():
+        return []
+    migration = importlib.import_module(TRIGGERS_MIGRATION)
+    # "CREATE TRIGGER <이름> ..."
+    triggers = {sql.split()[2]: sql for sql in migration.CREATE_TRIGGERS_SQL}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s",
+            [Memo._meta.db_table],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        missing = [name for name in triggers if name not in existing]
+        for name in missing:
+            cursor.execute(triggers[name])
+    if missing:
+        logger.warning(
+            "memos 통계 트리거를 다시 만들었습니다: %s. "
+            "reconcile_memo_stats 명령으로 통계를 확인하세요.", ", ".join(missing)
+        )
+    return missing
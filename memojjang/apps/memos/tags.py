@@ -0,0 +1,197 @@
+"""메모 태그
+
+메모와 태그의 연결은 memo_tags 테이블에 (memo_id, tag_id) 복합 기본 키로
+저장합니다 (migrations/0011_tags.py). Django 5.1 모델은 복합 기본 키를
+지원하지 않으므로 이 테이블은 모델 없이 이 모듈의 SQL로만 다루며, 메모나
+태그를 지우면 외래 키의 ON DELETE CASCADE로 연결도 지워집니다. 테이블과
+외래 키는 Django 상태에 없으므로, 마이그레이션 뒤에도 외래 키, 인덱스,
+트리거가 남아 있는지 test_tags가 확인합니다.
+
+태그별 메모 수(Tag.memo_count)는 memo_tags의 INSERT/DELETE 트리거가 한 행씩
+갱신하므로 태그 요약은 GROUP BY 없이 사용자의 태그 행만 읽습니다.
+
+태그 필터는 태그별 메모 수로 두 가지 실행 계획 중 하나를 고릅니다.
+- 걸러지는 메모가 많을 때: (user_id, created_at, id) 목록 인덱스를 최신순으로
+  따라가며 memo_tags 기본 키로 태그 여부를 확인 (한 페이지를 채우면 멈춤)
+- 걸러지는 메모가 적을 때: memo_tags의 (tag_id, memo_id) 인덱스에서 메모 id를
+  모아 기본 키로 읽은 뒤 정렬 (목록 인덱스를 끝까지 훑지 않음)
+SQLite 플래너는 태그별 메모 수를 모르므로 어느 쪽인지 SQL 모양으로 지정합니다.
+"""
+from django.db import connections, router, transaction
+from django.db.models import BooleanField, F
+from django.db.models.expressions import RawSQL
+from .models import Memo, Tag
+
+# 메모 하나에 붙일 수 있는 태그 수와 태그 이름의 최대 길이
+MAX_TAGS = 20
+MAX_NAME_LENGTH = 50
+# memo_tags에서 메모 id를 모아 읽는 계획을 쓰는 최대 메모 수
+# (이보다 많으면 목록 인덱스를 따라가며 확인하는 편이 빠름)
+DRIVE_MAX_MEMOS = 1000
+
+HAS_TAG_SQL = "EXISTS (SELECT 1 FROM memo_tags WHERE memo_id = memos.id AND tag_id IN ({}))"
+TAGGED_IDS_SQL = "SELECT memo_id FROM memo_tags WHERE tag_id IN ({})"
+
+
+def _placeholders(values):
+    return ", ".join(["%s"] * len(values))
+
+
+def parse_tag_names(value):
+    """"업무, 회의" 같은 문자열이나 이름 목록을 중복 없는 태그 이름 목록으로 변환
+
+    앞의 #과 앞뒤 공백은 지우고 안쪽 공백은 하나로 합칩니다.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    names = []
+    for name in value:
+        name = " ".join(str(name).split()).lstrip("#").strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def filter_params(query):
+    """?tag=...&tag=...&match=any 쿼리의 (태그 이름 목록, 모두 일치 여부)
+
+    match를 주지 않으면 모든 태그가 붙은 메모만 고릅니다.
+    """
+    return parse_tag_names(query.getlist("tag")), query.get("match") != "any"
+
+
+def memo_tag_names(memo_ids, using=None):
+    """메모 id별 태그 이름 목록 {memo_id: [이름, ...]} (이름순)"""
+    memo_ids = list(memo_ids)
+    result = {memo_id: [] for memo_id in memo_ids}
+    if not memo_ids:
+        return result
+    sql = (
+        "SELECT memo_tags.memo_id, tags.name FROM memo_tags "
+        "JOIN tags ON tags.id = memo_tags.tag_id "
+        f"WHERE memo_tags.memo_id IN ({_placeholders(memo_ids)}) ORDER BY tags.name"
+    )
+    with connections[using or router.db_for_read(Memo)].cursor() as cursor:
+        cursor.execute(sql, memo_ids)
+        for memo_id, name in cursor.fetchall():
+            result[memo_id].append(name)
+    return result
+
+
+def attach_tag_names(memos):
+    """메모마다 태그 이름 목록을 tag_names 속성으로 붙임 (쿼리 한 번)"""
+    memos = list(memos)
+    if memos:
+        names = memo_tag_names([memo.pk for memo in memos], using=memos[0]._state.db)
+        for memo in memos:
+            memo.tag_names = names[memo.pk]
+    return memos
+
+
+def _get_or_create_tags(user_id, names, using):
+    """이름별 태그 id {이름: id}, 없는 태그는 만듦"""
+    tags = Tag.objects.using(using).filter(user_id=user_id, name__in=names)
+    ids = dict(tags.values_list("name", "id"))
+    missing = [name for name in names if name not in ids]
+    if missing:
+        # 동시에 같은 태그를 만든 요청이 있어도 유니크 제약에 걸리지 않게 무시하고 다시 읽음
+        Tag.objects.using(using).bulk_create(
+            [Tag(user_id=user_id, name=name) for name in missing], ignore_conflicts=True
+        )
+        ids = dict(tags.values_list("name", "id"))
+    return ids
+
+
+def set_memo_tags(memo, names):
+    """메모의 태그를 names로 바꿈
+
+    바뀐 연결만 넣고 지우며, 태그별 메모 수는 memo_tags 트리거가 갱신합니다.
+    메모 저장(updated_at 갱신)과 함께 호출해야 목록과 카드 캐시가 바뀝니다.
+    """
+    names = parse_tag_names(names)
+    using = router.db_for_write(Tag)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        wanted = set(_get_or_create_tags(memo.user_id, names, using).values()) if names else set()
+        cursor.execute("SELECT tag_id FROM memo_tags WHERE memo_id = %s", [memo.pk])
+        current = {row[0] for row in cursor.fetchall()}
+        removed = list(current - wanted)
+        if removed:
+            cursor.execute(
+                "DELETE FROM memo_tags WHERE memo_id = %s "
+                f"AND tag_id IN ({_placeholders(removed)})",
+                [memo.pk, *removed],
+            )
+        added = sorted(wanted - current)
+        if added:
+            cursor.executemany(
+                "INSERT INTO memo_tags (memo_id, tag_id) VALUES (%s, %s)",
+                [(memo.pk, tag_id) for tag_id in added],
+            )
+    memo.tag_names = sorted(names)
+    return memo
+
+
+def tag_summary(user):
+    """사용자의 태그별 메모 수 (많은 순), 미리 세어 둔 Tag.memo_count를 읽음"""
+    return (
+        Tag.objects.filter(user=user, memo_count__gt=0)
+        .order_by("-memo_count", "name")
+        .only("id", "name", "memo_count")
+    )
+
+
+def filter_key(names, match_all=True):
+    """목록 캐시 키와 ETag에 넣을 태그 필터 문자열 (필터가 없으면 빈 문자열)"""
+    if not names:
+        return ""
+    return ("all:" if match_all else "any:") + ",".join(sorted(names))
+
+
+def tagged_memos(user, names, match_all=True):
+    """names 태그가 모두(match_all) 또는 하나라도 붙은 사용자의 메모 쿼리셋
+
+    names가 비어 있으면 사용자의 모든 메모, 없는 태그가 섞이면 모두 일치는
+    빈 결과를, 하나라도 일치는 나머지 태그로만 거릅니다.
+    """
+    counts = dict(_tag_counts(user, names)) if names else {}
+    return _tagged_memos(user, names, match_all, counts)
+
+
+async def atagged_memos(user, names, match_all=True):
+    """tagged_memos()의 비동기 버전"""
+    counts = {tag_id: count async for tag_id, count in _tag_counts(user, names)} if names else {}
+    return _tagged_memos(user, names, match_all, counts)
+
+
+def _tag_counts(user, names):
+    return Tag.objects.filter(user=user, name__in=names).values_list("id", "memo_count")
+
+
+def _tagged_memos(user, names, match_all, counts):
+    queryset = Memo.objects.filter(user=user)
+    if not names:
+        return queryset
+    if not counts or (match_all and len(counts) < len(names)):
+        return queryset.none()
+    if match_all:
+        # 모두 일치: 가장 적은 태그의 메모 수가 결과 수의 상한, 적은 태그부터 확인
+        estimated = min(counts.values())
+        checks = [[tag_id] for tag_id in sorted(counts, key=counts.get)]
+    else:
+        estimated = sum(counts.values())
+        checks = [list(counts)]
+    if estimated <= DRIVE_MAX_MEMOS:
+        # user_id + 0은 목록 인덱스를 쓰지 않게 해 memo_tags에서 모은 id로 메모를 읽게 함
+        driver, *checks = checks
+        queryset = (
+            Memo.objects.alias(owner_id=F("user_id") + 0)
+            .filter(owner_id=user.pk)
+            .filter(pk__in=RawSQL(TAGGED_IDS_SQL.format(_placeholders(driver)), driver))
+        )
+    for tag_ids in checks:
+        queryset = queryset.filter(
+            RawSQL(HAS_TAG_SQL.format(_placeholders(tag_ids)), tag_ids, output_field=BooleanField())
+        )
+    return queryset
@@ -2,8 +2,22 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, logout, authenticate
 from django.contrib import messages
+from django.core.cache import cache
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.http import urlencode
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import require_POST
+from ..users.hashers import HashingBusy
 from ..users.models import User
-from .models import Memo
+from ..users.ratelimit import check_login_rate
+from . import cache as list_cache
+from . import conditional
+from . import chunks, export, revisions, tags
+from .models import Memo, MemoChunk, MemoRevision
+from .pagination import CursorPaginator, InvalidCursor
+from .search import search_memos
 from ...forms import MemoForm, UserRegistrationForm
 
 
@@ -14,9 +28,114 @@ def home(request):
 
 @login_required
 def memo_list(request):
-    """메모 목록 뷰"""
-    memos = Memo.objects.filter(user=request.user)
-    return render(request, "memos/memo_list.html", {"memos": memos})
+    """메모 목록 뷰 (?tag=...&tag=...&match=any로 태그 필터)
+
+    렌더링된 목록 조각을 사용자별 목록 버전, 커서, 태그 필터로 캐시해,
+    메모가 바뀌지 않았으면 메모를 다시 조회하지 않습니다.
+    """
+    cursor = request.GET.get("cursor", "")
+    names, match_all = tags.filter_params(request.GET)
+    tag_filter = tags.filter_key(names, match_all)
+    etag, last_modified = conditional.list_validators(request, cursor, tag_filter)
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    timeout = list_cache.get_timeout()
+    cache_key = (
+        list_cache.list_page_key(request.user.pk, cursor, tag_filter) if timeout else None
+    )
+    items_html = cache.get(cache_key) if cache_key else None
+    list_cache.list_cache_stats.record(hit=items_html is not None)
+    context = tag_filter_context(names, match_all)
+    if items_html is None:
+        paginator = CursorPaginator(
+            tags.tagged_memos(request.user, names, match_all).for_list()
+        )
+        try:
+            page = paginator.page(cursor)
+        except InvalidCursor:
+            # 잘못된 커서는 첫 페이지로 처리
+            page = paginator.page()
+        tags.attach_tag_names(page.object_list)
+        context.update({"memos": page.object_list, "page": page})
+        items_html = render_to_string("memos/memo_list_items.html", context, request)
+        if cache_key:
+            cache.set(cache_key, items_html, timeout)
+        cache_status = "miss"
+    else:
+        cache_status = "hit"
+    context["items_html"] = mark_safe(items_html)
+    context["tag_summary"] = tag_summary_links(tags.tag_summary(request.user), names, match_all)
+    response = render(request, "memos/memo_list.html", context)
+    response["X-Memo-List-Cache"] = cache_status
+    return conditional.set_validators(response, etag, last_modified)
+
+
+def _tag_query(names, match_all):
+    params = [("tag", name) for name in names]
+    if names and not match_all:
+        params.append(("match", "any"))
+    return urlencode(params)
+
+
+def tag_filter_context(names, match_all):
+    """목록 템플릿의 태그 필터 표시와 페이지 링크용 쿼리 문자열"""
+    return {
+        "tag_names": names,
+        "match_all": match_all,
+        "tag_query": _tag_query(names, match_all),
+        "match_toggle_query": _tag_query(names, not match_all) if len(names) > 1 else "",
+    }
+
+
+def tag_summary_links(summary, names, match_all):
+    """태그 요약의 각 태그에 선택 여부와 누르면 필터에 넣고/빼는 쿼리 문자열을 붙임"""
+    summary = list(summary)
+    for tag in summary:
+        tag.selected = tag.name in names
+        if tag.selected:
+            toggled = [name for name in names if name != tag.name]
+        else:
+            toggled = [*names, tag.name]
+        tag.query = _tag_query(toggled, match_all)
+    return summary
+
+
+@login_required
+def memo_search(request):
+    """메모 검색 뷰"""
+    query = request.GET.get("q", "").strip()
+    try:
+        page_number = int(request.GET.get("page", 1))
+    except ValueError:
+        page_number = 1
+    page = search_memos(request.user, query, page=page_number)
+    return render(
+        request,
+        "memos/memo_search.html",
+        {"query": query, "page": page}
+    )
+
+
+@login_required
+def memo_export(request):
+    """메모 내보내기 뷰 (?format=ndjson|csv, ?gzip=1)"""
+    export_format = request.GET.get("format", "ndjson")
+    if export_format not in export.FORMATS:
+        return HttpResponseBadRequest("지원하지 않는 형식입니다.")
+    compress = request.GET.get("gzip") == "1"
+    content_type, extension = export.FORMATS[export_format]
+    filename = f"memos-{timezone.localdate():%Y%m%d}.{extension}"
+    if compress:
+        content_type = "application/gzip"
+        filename += ".gz"
+    response = StreamingHttpResponse(
+        export.export_stream(request.user, export_format, compress),
+        content_type=content_type
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
 @login_required
@@ -28,6 +147,7 @@ def memo_create(request):
             memo = form.save(commit=False)
             memo.user = request.user
             memo.save()
+            form.save_m2m()
             return redirect("memo_list")
     else:
         form = MemoForm()
@@ -37,8 +157,42 @@ def memo_create(request):
 @login_required
 def memo_detail(request, pk):
     """메모 상세 뷰"""
+    validators = conditional.memo_validators(request.user, pk)
+    if validators is None:
+        raise Http404("메모를 찾을 수 없습니다.")
+    response = conditional.not_modified(request, *validators)
+    if response is not None:
+        return response
     memo = get_object_or_404(Memo, pk=pk, user=request.user)
-    return render(request, "memos/memo_detail.html", {"memo": memo})
+    tags.attach_tag_names([memo])
+    response = render(request, "memos/memo_detail.html", {"memo": memo})
+    return conditional.set_validators(response, *validators)
+
+
+@login_required
+def memo_chunk(request, pk, number):
+    """청크로 나눠 저장한 긴 메모 본문의 number번 청크 HTML 조각
+
+    상세 페이지가 첫 청크 뒤의 청크를 하나씩 불러올 때 씁니다.
+    """
+    validators = conditional.memo_validators(request.user, pk)
+    if validators is None:
+        raise Http404("메모를 찾을 수 없습니다.")
+    response = conditional.not_modified(request, *validators)
+    if response is not None:
+        return response
+    memo = get_object_or_404(Memo.objects.only("id", "user_id", "chunk_count"), pk=pk, user=request.user)
+    try:
+        content = chunks.read_chunk(memo, number)
+    except MemoChunk.DoesNotExist:
+        raise Http404("본문 청크를 찾을 수 없습니다.")
+    next_number = number + 1 if number + 1 < memo.chunk_count else None
+    response = render(
+        request,
+        "memos/memo_chunk.html",
+        {"memo": memo, "content": content, "next_number": next_number}
+    )
+    return conditional.set_validators(response, *validators)
 
 
 @login_required
@@ -55,10 +209,40 @@ def memo_edit(request, pk):
     return render(request, "memos/memo_form.html", {"form": form})
 
 
+@login_required
+def memo_revisions(request, pk):
+    """메모 수정 기록 목록 뷰 (최신순, ?before=로 이전 기록)"""
+    memo = get_object_or_404(Memo.objects.only("id", "user_id", "title"), pk=pk, user=request.user)
+    try:
+        before = int(request.GET["before"])
+    except (KeyError, ValueError):
+        before = None
+    page, next_before = revisions.revision_page(memo.pk, before)
+    return render(
+        request,
+        "memos/memo_revisions.html",
+        {"memo": memo, "revisions": page, "before": before, "next_before": next_before}
+    )
+
+
+@login_required
+@require_POST
+def memo_restore(request, pk, number):
+    """메모를 선택한 버전으로 되돌리는 뷰"""
+    # 본문은 덮어쓰므로 읽지(압축을 풀지) 않음
+    memo = get_object_or_404(Memo.objects.defer("content"), pk=pk, user=request.user)
+    try:
+        revisions.restore_revision(memo, number)
+    except MemoRevision.DoesNotExist:
+        raise Http404("수정 기록을 찾을 수 없습니다.")
+    messages.success(request, f"{number}번째 버전으로 되돌렸습니다.")
+    return redirect("memo_detail", pk=pk)
+
+
 @login_required
 def memo_delete(request, pk):
     """메모 삭제 뷰"""
-    memo = get_object_or_404(Memo, pk=pk, user=request.user)
+    memo = get_object_or_404(Memo.objects.defer("content"), pk=pk, user=request.user)
     if request.method == "POST":
         memo.delete()
         return redirect("memo_list")
@@ -66,11 +250,24 @@ def memo_delete(request, pk):
 
 
 def login_view(request):
-    """로그인 뷰"""
+    """로그인 뷰
+
+    시도 제한을 넘은 요청은 비밀번호를 해시하기 전에 429로 거절하고,
+    해시 풀이 가득 찬 경우에는 503으로 응답합니다.
+    """
     if request.method == "POST":
-        username = request.POST["username"]
-        password = request.POST["password"]
-        user = authenticate(request, username=username, password=password)
+        username = request.POST.get("username", "")
+        password = request.POST.get("password", "")
+        retry_after = check_login_rate(request, username)
+        if retry_after is not None:
+            messages.error(request, "로그인 시도가 너무 많습니다. 잠시 후 다시 시도하세요.")
+            response = render(request, "users/login.html", status=429)
+            response["Retry-After"] = str(retry_after)
+            return response
+        try:
+            user = authenticate(request, username=username, password=password)
+        except HashingBusy:
+            return _busy_response(request, "users/login.html")
         if user is not None:
             login(request, user)
             return redirect("memo_list")
@@ -79,6 +276,14 @@ def login_view(request):
     return render(request, "users/login.html")
 
 
+def _busy_response(request, template_name, context=None):
+    """비밀번호 해시 풀이 가득 찼을 때의 503 응답"""
+    messages.error(request, "요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도하세요.")
+    response = render(request, template_name, context, status=503)
+    response["Retry-After"] = "1"
+    return response
+
+
 @login_required
 def logout_view(request):
     """로그아웃 뷰"""
@@ -91,7 +296,10 @@ def register(request):
     if request.method == "POST":
         form = UserRegistrationForm(request.POST)
         if form.is_valid():
-            user = form.save()
+            try:
+                user = form.save()
+            except HashingBusy:
+                return _busy_response(request, "users/register.html", {"form": form})
             login(request, user)
             return redirect("memo_list")
     else:
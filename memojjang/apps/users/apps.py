@@ -5,3 +5,7 @@ class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "memojjang.apps.users"
     verbose_name = "사용자"
+
+    def ready(self):
+        """시그널 수신기 등록"""
+        from . import receivers  # noqa: F401
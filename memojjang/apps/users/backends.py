@@ -0,0 +1,124 @@
+"""사용자 캐시를 쓰는 인증 백엔드
+
+AuthenticationMiddleware는 요청마다 세션의 사용자 id로 사용자 행을 조회합니다.
+CachedModelBackend는 조회한 사용자를 프로세스 단위 LRU에 버전과 함께 보관하고,
+사용자별 버전은 default 캐시에 둡니다. LRU 항목은 적중할 때마다 default 캐시의
+버전과 비교해 같을 때만 쓰며 그 밖에는 DB를 조회합니다. 사용자가 저장/삭제되면
+수신기가 (커밋 후에도 한 번 더) 버전을 새 값으로 올립니다.
+
+다른 프로세스가 다음 요청에서 최신 행을 다시 읽는 것은 default 캐시를 모든
+프로세스가 공유할 때뿐입니다 (prod 프로필). 버전은 MEMO_USER_CACHE_TIMEOUT초
+(기본 5초) 뒤 만료되어 DB에서 다시 읽으므로, 캐시를 공유하지 않는 프로세스나
+QuerySet.update()처럼 시그널 없이 바꾼 사용자(비활성화 포함)도 그 시간 안에
+반영됩니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_CACHE_TIMEOUT = 5
+
+
+def _version_key(user_id):
+    return f"users:version:{user_id}"
+
+
+def get_timeout():
+    """사용자 버전의 만료 시간(초), 캐시된 사용자가 최신이 아닐 수 있는 최대 시간"""
+    return getattr(settings, "MEMO_USER_CACHE_TIMEOUT", DEFAULT_CACHE_TIMEOUT)
+
+
+class UserCache:
+    """사용자 행을 (버전, 필드 값)으로 보관하는 스레드 안전 LRU
+
+    요청마다 새 인스턴스를 돌려주므로 요청 사이에 객체가 공유되지 않습니다.
+    """
+
+    def __init__(self, maxsize=None):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+
+    @property
+    def maxsize(self):
+        """최대 보관 사용자 수"""
+        return self._maxsize or getattr(settings, "MEMO_USER_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+
+    def get(self, user_id, version):
+        """버전이 같으면 사용자 인스턴스를, 아니면 None을 반환"""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(user_id)
+        _, field_names, values = entry
+        return get_user_model().from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+    def set(self, user_id, version, user):
+        """사용자를 보관하고 오래된 항목을 밀어냄"""
+        field_names = [field.attname for field in user._meta.concrete_fields]
+        values = [getattr(user, name) for name in field_names]
+        with self._lock:
+            self._entries[user_id] = (version, field_names, values)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id):
+        """사용자 항목 삭제"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+user_cache = UserCache()
+
+
+def invalidate_user(user_id):
+    """default 캐시의 사용자 버전을 새 값으로 올리고 이 프로세스의 LRU 항목을 지움
+
+    다른 프로세스의 LRU 항목은 버전이 달라져 더 이상 쓰이지 않습니다
+    (default 캐시가 프로세스 사이에 공유될 때).
+    """
+    cache.set(_version_key(user_id), time.time_ns(), get_timeout())
+    user_cache.discard(user_id)
+
+
+class CachedModelBackend(ModelBackend):
+    """세션 사용자 조회를 프로세스 단위 LRU로 처리하는 ModelBackend"""
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user_id = UserModel._meta.pk.to_python(user_id)
+        except Exception:
+            return None
+        key = _version_key(user_id)
+        version = cache.get(key)
+        user = user_cache.get(user_id, version) if version is not None else None
+        if user is None:
+            try:
+                user = UserModel._default_manager.get(pk=user_id)
+            except UserModel.DoesNotExist:
+                return None
+            if version is None:
+                # 읽는 사이에 다른 프로세스가 버전을 올렸으면 이 행은 보관하지 않음
+                version = time.time_ns()
+                if not cache.add(key, version, get_timeout()):
+                    version = None
+            if version is not None:
+                user_cache.set(user_id, version, user)
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,132 @@
+"""비용을 설정으로 조정하는 비밀번호 해셔와 해시 전용 스레드 풀
+
+settings.MEMO_PASSWORD_HASHER로 새 비밀번호에 쓸 해셔(scrypt/argon2/pbkdf2)를
+고르고, MEMO_SCRYPT_PARAMS / MEMO_ARGON2_PARAMS로 비용을 조정합니다.
+다른 알고리즘이나 이전 비용으로 저장된 비밀번호는 로그인에 성공할 때
+Django가 현재 해셔로 다시 해시해 저장합니다(check_password의 setter).
+
+해시 계산은 hashing_pool에서 실행되므로 동시에 해시하는 스레드는
+MEMO_PASSWORD_HASH_WORKERS개를 넘지 않고, 대기열까지 가득 차면
+HashingBusy를 발생시켜 로그인 폭주가 다른 요청의 워커를 잡아먹지 않게 합니다.
+hashlib의 scrypt/pbkdf2_hmac과 argon2-cffi는 계산 중에 GIL을 놓습니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher
+)
+
+DEFAULT_HASH_WORKERS = 2
+DEFAULT_HASH_QUEUE = 16
+MIN_SCRYPT_MAXMEM = 256 * 1024 * 1024
+
+
+class HashingBusy(Exception):
+    """해시 풀과 대기열이 모두 찬 경우"""
+
+
+class HashingPool:
+    """동시 해시 수를 제한하는 스레드 풀
+
+    실행 중인 작업과 대기 중인 작업을 합쳐 workers + queue개까지만 받고,
+    넘치면 기다리지 않고 HashingBusy를 발생시킵니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+
+    def _ensure(self):
+        with self._lock:
+            if self._executor is None:
+                workers = getattr(settings, "MEMO_PASSWORD_HASH_WORKERS", DEFAULT_HASH_WORKERS)
+                queue = getattr(settings, "MEMO_PASSWORD_HASH_QUEUE", DEFAULT_HASH_QUEUE)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="password-hash"
+                )
+                self._slots = threading.BoundedSemaphore(workers + queue)
+            return self._executor, self._slots
+
+    def run(self, func, *args, **kwargs):
+        """풀에서 func(*args, **kwargs)를 실행하고 결과를 기다림"""
+        executor, slots = self._ensure()
+        if not slots.acquire(blocking=False):
+            raise HashingBusy("비밀번호 해시 요청이 너무 많습니다.")
+        try:
+            return executor.submit(func, *args, **kwargs).result()
+        finally:
+            slots.release()
+
+    def shutdown(self):
+        """풀을 닫음, 다음 run()에서 현재 설정으로 다시 만듦"""
+        with self._lock:
+            executor, self._executor, self._slots = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+hashing_pool = HashingPool()
+
+
+def _param(setting, name, default):
+    return getattr(settings, setting, {}).get(name, default)
+
+
+class PooledHasherMixin:
+    """해시 계산(encode)을 hashing_pool에서 실행
+
+    scrypt와 pbkdf2의 verify()와 harden_runtime()은 encode()를 호출하므로
+    encode만 풀로 보내면 됩니다.
+    """
+
+    def encode(self, password, salt, *args, **kwargs):
+        return hashing_pool.run(super().encode, password, salt, *args, **kwargs)
+
+
+class TunedScryptPasswordHasher(PooledHasherMixin, ScryptPasswordHasher):
+    """MEMO_SCRYPT_PARAMS로 비용을 정하는 scrypt 해셔"""
+
+    @property
+    def work_factor(self):
+        return _param("MEMO_SCRYPT_PARAMS", "work_factor", ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _param("MEMO_SCRYPT_PARAMS", "block_size", ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _param("MEMO_SCRYPT_PARAMS", "parallelism", ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        # OpenSSL 기본 한도(32MiB)는 work_factor 2**15부터 부족하므로 한도를 올림
+        # 이전 비용으로 저장된 비밀번호도 확인할 수 있도록 최소 256MiB를 허용 (할당량이 아닌 상한)
+        needed = 2 * 128 * self.block_size * (self.work_factor + self.parallelism + 2)
+        return max(MIN_SCRYPT_MAXMEM, needed)
+
+
+class TunedArgon2PasswordHasher(PooledHasherMixin, Argon2PasswordHasher):
+    """MEMO_ARGON2_PARAMS로 비용을 정하는 argon2 해셔 (argon2-cffi 필요)"""
+
+    @property
+    def time_cost(self):
+        return _param("MEMO_ARGON2_PARAMS", "time_cost", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _param("MEMO_ARGON2_PARAMS", "memory_cost", Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _param("MEMO_ARGON2_PARAMS", "parallelism", Argon2PasswordHasher.parallelism)
+
+    def verify(self, password, encoded):
+        # argon2의 verify는 encode를 거치지 않으므로 따로 풀에서 실행
+        return hashing_pool.run(super().verify, password, encoded)
+
+
+class PooledPBKDF2PasswordHasher(PooledHasherMixin, PBKDF2PasswordHasher):
+    """hashing_pool에서 실행되는 PBKDF2 해셔 (기존 비밀번호 확인용)"""
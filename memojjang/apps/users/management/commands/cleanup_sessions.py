@@ -0,0 +1,37 @@
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    """만료된 세션을 배치 단위로 삭제하는 명령
+
+    clearsessions는 만료된 세션을 한 번의 DELETE로 지우므로 세션 테이블이 크면
+    오래 쓰기 잠금을 잡습니다. 이 명령은 batch_size개씩 나눠 지웁니다.
+    """
+
+    help = "만료된 세션을 배치 단위로 삭제합니다. cron 등으로 주기적으로 실행하세요."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 삭제할 세션 수 (기본값: 1000)"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        now = timezone.now()
+        expired = Session.objects.filter(expire_date__lt=now).order_by("pk")
+
+        deleted = 0
+        while True:
+            keys = list(expired.values_list("pk", flat=True)[:batch_size])
+            if not keys:
+                break
+            Session.objects.filter(pk__in=keys).delete()
+            deleted += len(keys)
+            self.stdout.write(f"{deleted}개 삭제")
+
+        self.stdout.write(self.style.SUCCESS(f"만료된 세션 삭제 완료: {deleted}개"))
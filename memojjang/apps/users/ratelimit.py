@@ -0,0 +1,103 @@
+"""로그인 시도 제한
+
+IP와 사용자 이름마다 토큰 버킷을 두고, 토큰이 없으면 비밀번호를 해시하기 전에
+로그인 시도를 거절합니다. 버킷은 기본적으로 프로세스 메모리에 두고,
+MEMO_LOGIN_RATE_BACKEND = "cache"이면 여러 프로세스가 공유하도록 Django
+캐시에 둡니다(이때는 고정 구간 카운터로 근사합니다).
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+
+# (허용 횟수, 초): 초마다 허용 횟수만큼 토큰이 다시 참
+DEFAULT_RATES = {"ip": (20, 60), "username": (5, 60)}
+# 메모리 백엔드가 기억하는 최대 키 수
+MAX_BUCKETS = 10000
+
+
+class MemoryRateLimiter:
+    """프로세스 메모리의 토큰 버킷"""
+
+    def __init__(self, max_buckets=MAX_BUCKETS):
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+        self.max_buckets = max_buckets
+
+    def hit(self, key, limit, period):
+        """토큰 하나를 쓰고, 거절되면 다시 시도할 수 있을 때까지의 초를 반환"""
+        rate = limit / period
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (limit, now))
+            tokens = min(limit, tokens + (now - updated) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = None
+            else:
+                wait = math.ceil((1 - tokens) / rate)
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def reset(self):
+        """모든 버킷 초기화"""
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheRateLimiter:
+    """Django 캐시의 고정 구간 카운터 (여러 프로세스가 공유)"""
+
+    def hit(self, key, limit, period):
+        window = int(time.time() // period)
+        cache_key = f"ratelimit:{key}:{window}"
+        cache.add(cache_key, 0, period)
+        try:
+            count = cache.incr(cache_key)
+        except ValueError:
+            # add와 incr 사이에 만료된 경우
+            cache.set(cache_key, 1, period)
+            count = 1
+        if count <= limit:
+            return None
+        return max(1, math.ceil((window + 1) * period - time.time()))
+
+    def reset(self):
+        pass
+
+
+memory_limiter = MemoryRateLimiter()
+cache_limiter = CacheRateLimiter()
+
+
+def get_limiter():
+    """설정된 백엔드의 제한기"""
+    if getattr(settings, "MEMO_LOGIN_RATE_BACKEND", "memory") == "cache":
+        return cache_limiter
+    return memory_limiter
+
+
+def check_login_rate(request, username):
+    """로그인 시도를 기록하고, 제한을 넘었으면 Retry-After 초를 반환
+
+    IP 제한에 걸리면 사용자 이름의 토큰은 쓰지 않습니다.
+    IP는 위조할 수 있는 X-Forwarded-For 대신 REMOTE_ADDR을 씁니다.
+    """
+    rates = getattr(settings, "MEMO_LOGIN_RATE_LIMITS", DEFAULT_RATES)
+    limiter = get_limiter()
+    keys = (
+        ("ip", request.META.get("REMOTE_ADDR", "")),
+        ("username", username.strip().lower()),
+    )
+    for scope, value in keys:
+        rate = rates.get(scope)
+        if not rate:
+            continue
+        wait = limiter.hit(f"login:{scope}:{value}", *rate)
+        if wait is not None:
+            return wait
+    return None
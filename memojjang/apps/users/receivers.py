@@ -0,0 +1,16 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .backends import invalidate_user
+from .models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """사용자가 바뀌면(비밀번호 변경 포함) 캐시된 사용자를 무효화
+
+    커밋 전에 다른 프로세스가 이전 행을 다시 캐시할 수 있으므로 커밋 후 한 번 더 지움
+    """
+    user_id = instance.pk
+    invalidate_user(user_id)
+    transaction.on_commit(lambda: invalidate_user(user_id))
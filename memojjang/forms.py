@@ -1,11 +1,52 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from .apps.users.models import User
+from .apps.memos import tags
 from .apps.memos.models import Memo
 
 
+class TagsField(forms.Field):
+    """쉼표로 구분한 태그 이름(또는 JSON 목록)을 태그 이름 목록으로 받는 폼 필드"""
+
+    widget = forms.TextInput
+
+    def to_python(self, value):
+        if not isinstance(value, (str, list, tuple)) and value is not None:
+            raise forms.ValidationError("태그는 쉼표로 구분한 문자열이나 목록이어야 합니다.")
+        return tags.parse_tag_names(value)
+
+    def validate(self, value):
+        super().validate(value)
+        if len(value) > tags.MAX_TAGS:
+            raise forms.ValidationError(f"태그는 {tags.MAX_TAGS}개까지 붙일 수 있습니다.")
+        for name in value:
+            if len(name) > tags.MAX_NAME_LENGTH:
+                raise forms.ValidationError(
+                    f"태그 이름은 {tags.MAX_NAME_LENGTH}자를 넘을 수 없습니다."
+                )
+
+    def prepare_value(self, value):
+        if isinstance(value, (list, tuple)):
+            return ", ".join(value)
+        return value
+
+    def has_changed(self, initial, data):
+        return tags.parse_tag_names(initial) != self.to_python(data)
+
+
 class MemoForm(forms.ModelForm):
-    """메모 작성 및 수정을 위한 폼"""
+    """메모 작성 및 수정을 위한 폼
+
+    태그는 모델 필드가 아니므로 메모를 저장한 뒤 save_m2m()에서 저장합니다
+    (commit=False로 저장했으면 memo.save() 다음에 form.save_m2m()을 호출).
+    """
+
+    tags = TagsField(
+        label="태그",
+        required=False,
+        help_text="쉼표로 구분해 입력하세요 (예: 업무, 회의)",
+        widget=forms.TextInput(attrs={"class": "form-control"})
+    )
     
     class Meta:
         model = Memo
@@ -21,6 +62,33 @@ class MemoForm(forms.ModelForm):
             ),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk and "tags" not in self.initial:
+            self.initial["tags"] = tags.memo_tag_names([self.instance.pk])[self.instance.pk]
+
+    def save(self, commit=True):
+        """리마인드 일시가 바뀌면 다시 발송되도록 완료 상태를 초기화"""
+        if "reminder_date" in self.changed_data:
+            self.instance.is_reminded = False
+        return super().save(commit)
+
+    def _save_m2m(self):
+        """태그가 바뀌었으면 memo_tags에 저장"""
+        super()._save_m2m()
+        if "tags" in self.changed_data:
+            tags.set_memo_tags(self.instance, self.cleaned_data["tags"])
+        else:
+            self.instance.tag_names = sorted(self.cleaned_data["tags"])
+
+
+class MemoReminderForm(forms.ModelForm):
+    """메모의 리마인드 설정만 수정하기 위한 폼"""
+
+    class Meta:
+        model = Memo
+        fields = ["reminder_date", "is_reminded"]
+
 
 class UserRegistrationForm(UserCreationForm):
     """사용자 회원가입을 위한 폼"""
@@ -0,0 +1,22 @@
+"""설정 프로필 선택
+
+DJANGO_SETTINGS_MODULE이 memojjang.settings이면 .env 파일을 읽은 뒤
+MEMO_ENV 환경 변수에 따라 dev(기본값) 또는 prod 프로필을 불러옵니다.
+DJANGO_SETTINGS_MODULE=memojjang.settings.prod처럼 프로필을 직접 지정할 수도 있습니다.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from .env import env, load_env_file
+
+load_env_file()
+
+PROFILES = ("dev", "prod")
+MEMO_ENV = env("MEMO_ENV", "dev")
+
+if MEMO_ENV == "prod":
+    from .prod import *  # noqa: F401,F403
+elif MEMO_ENV == "dev":
+    from .dev import *  # noqa: F401,F403
+else:
+    raise ImproperlyConfigured(
+        f"MEMO_ENV는 {', '.join(PROFILES)} 중 하나여야 합니다: {MEMO_ENV!r}"
+    )
@@ -0,0 +1,318 @@
+"""
+memojjang 공통 설정 (모든 프로필이 불러옴)
+
+환경마다 달라지는 값은 환경 변수나 프로젝트 루트의 .env 파일에서 읽습니다.
+개발/운영 설정은 dev.py / prod.py에서 이 모듈을 덮어씁니다.
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.1/ref/settings/
+"""
+
+from pathlib import Path
+from .env import env, env_list
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = env("SECRET_KEY", "")
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = False
+
+ALLOWED_HOSTS = env_list("ALLOWED_HOSTS")
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "crispy_forms",
+    "crispy_bootstrap5",
+    "memojjang.apps.users.apps.UsersConfig",
+    "memojjang.apps.memos.apps.MemosConfig",
+    'django_bootstrap5',
+]
+
+# Crispy Forms 설정
+CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
+CRISPY_TEMPLATE_PACK = "bootstrap5"
+
+# 메모 목록 한 페이지에 표시할 메모 수
+MEMO_LIST_PAGE_SIZE = 30
+# 렌더링된 메모 목록의 캐시 만료 시간(초), 0이면 캐시 사용 안 함
+MEMO_LIST_CACHE_TIMEOUT = 300
+
+# 메모 목록/상세와 JSON 읽기 API를 비동기 뷰로 연결 (ASGI 서버로 실행할 때 사용)
+MEMO_ASYNC_VIEWS = False
+
+# 메모 일괄 처리 API가 한 요청에 처리하는 최대 항목 수
+MEMO_BATCH_MAX_ITEMS = 500
+# 메모 가져오기에서 한 번의 bulk_create로 저장하는 메모 수
+MEMO_IMPORT_BATCH_SIZE = 1000
+
+# 메모 수정 기록에서 스냅숏(전체 내용) 사이에 두는 최대 기록 수
+# 클수록 저장 공간이 줄고, 한 버전을 복원할 때 적용하는 델타 수(최대 이 값 - 1)가 늘어남
+MEMO_REVISION_SNAPSHOT_INTERVAL = 20
+# 이 크기(UTF-8 바이트) 이상인 메모 본문은 zlib으로 압축해 저장 (None이면 압축하지 않음)
+# 바꾼 값을 기존 메모에 적용하려면 compress_memo_content 명령을 실행
+MEMO_CONTENT_COMPRESS_MIN_BYTES = 4096
+# 이 글자 수보다 긴 메모 본문은 청크로 나눠 저장하고 상세 페이지에서 청크씩 불러옴
+MEMO_CONTENT_CHUNK_SIZE = 256 * 1024
+
+# 리마인드 발송 백엔드 (ConsoleReminderBackend 또는 FileReminderBackend)
+MEMO_REMINDER_BACKEND = "memojjang.apps.memos.reminders.ConsoleReminderBackend"
+# FileReminderBackend가 기록할 파일 경로
+MEMO_REMINDER_FILE_PATH = BASE_DIR / "reminders.jsonl"
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    # collectstatic 결과(STATIC_ROOT)를 세션/인증 미들웨어보다 먼저 보냄
+    'memojjang.staticfiles.StaticFilesMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'memojjang.apps.memos.middleware.ReplicaPinningMiddleware',
+    'memojjang.apps.memos.middleware.QueryProfilingMiddleware',
+]
+
+# 쿼리 프로파일링할 요청의 비율 (0이면 미들웨어를 쓰지 않음, 운영에서는 0.01 정도)
+MEMO_PROFILING_SAMPLE_RATE = 0.0
+# 이 시간(ms) 이상 걸린 쿼리는 느린 쿼리로 로그에 기록
+MEMO_SLOW_QUERY_MS = 100
+# 한 요청에서 같은 SQL이 이 횟수 이상 반복되면 N+1로 의심해 보고
+MEMO_PROFILING_DUPLICATE_THRESHOLD = 3
+
+ROOT_URLCONF = 'memojjang.urls'
+
+# 워커 예열(memojjang.warmup) 때 내부 GET 요청을 보낼 경로 (로그인 없이 볼 수 있어야 함)
+MEMO_WARMUP_PATHS = ["/", "/login/"]
+
+TEMPLATES = [
+    {
+        # 요청 프로파일링 시 렌더링 시간을 재는 DjangoTemplates
+        'BACKEND': 'memojjang.apps.memos.profiling.TimedDjangoTemplates',
+        'DIRS': [BASE_DIR / 'memojjang' / 'templates'],
+        'OPTIONS': {
+            # 컴파일한 템플릿을 프로세스에 보관 (DEBUG에서는 템플릿 파일이 바뀌면
+            # 개발 서버의 autoreload가 캐시를 비움)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+                'memojjang.apps.memos.context_processors.memo_stats',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'memojjang.wsgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+
+# 연결마다 init_command로 적용할 SQLite PRAGMA
+# - WAL: 읽기와 쓰기가 서로 막지 않음 (WAL에서는 synchronous=NORMAL로도 손상되지 않음)
+# - busy_timeout: 다른 프로세스가 쓰는 중이면 바로 "database is locked"를 내지 않고 대기(ms)
+# - mmap_size / cache_size(음수는 KiB 단위) / temp_store: 읽기와 정렬용 임시 데이터를 메모리에서 처리
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "mmap_size": 128 * 1024 * 1024,
+    "cache_size": -20000,
+    "temp_store": "MEMORY",
+}
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': env("MEMO_SQLITE_PATH", BASE_DIR / 'db.sqlite3'),
+        'OPTIONS': {
+            'init_command': ";".join(
+                f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()
+            ),
+            # 트랜잭션을 처음부터 쓰기 잠금으로 시작해, 읽은 뒤 쓰기로 잠금을
+            # 올리다 교착되어 busy_timeout과 관계없이 실패하는 일을 막음
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+}
+
+# 읽기 복제본의 로컬 대용: 같은 SQLite 파일을 query_only로 여는 별도 연결
+# (WAL 모드라 primary의 쓰기와 서로 막지 않음, 잘못 라우팅된 쓰기는 오류가 남)
+# 실제 복제본을 쓰려면 같은 형식으로 별칭을 추가하고 MEMO_READ_REPLICAS에 넣음
+DATABASES['replica'] = {
+    **DATABASES['default'],
+    'OPTIONS': {
+        'init_command': DATABASES['default']['OPTIONS']['init_command'] + ";PRAGMA query_only=ON",
+    },
+    'TEST': {'MIRROR': 'default'},
+}
+
+DATABASE_ROUTERS = ['memojjang.apps.memos.routers.PrimaryReplicaRouter']
+
+# 메모 읽기를 보낼 복제본 별칭 목록 (비어 있으면 모든 쿼리가 default로 감)
+MEMO_READ_REPLICAS = []
+# 메모를 쓴 사용자의 읽기를 primary로 고정하는 시간(초), 복제 지연보다 길게 설정
+MEMO_REPLICA_PIN_SECONDS = 5
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# locmem은 프로세스마다 따로이므로 한 프로세스로 실행하는 개발 서버와 테스트용
+# 여러 워커로 실행하는 prod 프로필은 default를 공유 캐시(파일, redis, memcached)로 바꿈
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "memojjang",
+    },
+    # 템플릿 조각({% cache ... using="templates" %}) 전용 캐시
+    # 메모 카드는 (pk, updated_at)으로 키가 정해지므로 목록 페이지 캐시와 분리해
+    # 카드가 많아도 목록 캐시 항목을 밀어내지 않게 함
+    "templates": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "memojjang-templates",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
+
+# Sessions / Authentication
+# 세션은 DB에 저장 (default 캐시가 locmem이면 프로세스마다 따로라서, 캐시를 거치는
+# cached_db는 한 프로세스에서 로그아웃해도 다른 프로세스의 캐시에 세션이 남음)
+# default 캐시를 모든 프로세스가 공유하는 prod 프로필은 cached_db를 씀
+# 서버에 저장하지 않으려면 "django.contrib.sessions.backends.signed_cookies"를 쓸 수 있지만
+# 세션 내용이 쿠키에 그대로 실리고 서버에서 개별 세션을 만료시킬 수 없음
+SESSION_ENGINE = "django.contrib.sessions.backends.db"
+
+# 세션 사용자 조회를 프로세스 단위 LRU로 처리하는 인증 백엔드
+# (LRU 항목은 default 캐시의 사용자 버전과 맞을 때만 쓰므로 여러 프로세스로 실행하면
+# default 캐시가 공유 캐시여야 다른 프로세스의 변경을 봄)
+AUTHENTICATION_BACKENDS = ["memojjang.apps.users.backends.CachedModelBackend"]
+# 프로세스마다 보관할 최대 사용자 수
+MEMO_USER_CACHE_SIZE = 1024
+# 사용자 버전 키의 캐시 만료 시간(초), 만료되면 DB에서 다시 읽음
+# (캐시된 사용자가 시그널 없는 변경이나 다른 프로세스의 변경을 놓칠 수 있는 최대 시간)
+MEMO_USER_CACHE_TIMEOUT = 5
+
+
+# Password hashing
+# 새 비밀번호에 쓸 해셔: "scrypt"(표준 라이브러리), "argon2"(argon2-cffi 필요), "pbkdf2"
+# 다른 해셔로 저장된 비밀번호는 로그인에 성공할 때 이 해셔로 다시 저장됨
+MEMO_PASSWORD_HASHER = "scrypt"
+_PASSWORD_HASHERS = {
+    "scrypt": "memojjang.apps.users.hashers.TunedScryptPasswordHasher",
+    "argon2": "memojjang.apps.users.hashers.TunedArgon2PasswordHasher",
+    "pbkdf2": "memojjang.apps.users.hashers.PooledPBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[MEMO_PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != MEMO_PASSWORD_HASHER
+]
+# scrypt 비용 (16MiB, 병렬도는 해시 풀이 대신 제한하므로 1)
+MEMO_SCRYPT_PARAMS = {"work_factor": 2**14, "block_size": 8, "parallelism": 1}
+# argon2id 비용 (memory_cost는 KiB 단위)
+MEMO_ARGON2_PARAMS = {"time_cost": 2, "memory_cost": 19456, "parallelism": 1}
+# 동시에 해시하는 스레드 수와 대기열 길이, 모두 차면 로그인은 503으로 응답
+MEMO_PASSWORD_HASH_WORKERS = 2
+MEMO_PASSWORD_HASH_QUEUE = 16
+
+# 로그인 시도 제한: 범위별 (허용 횟수, 초), None이면 제한 없음
+MEMO_LOGIN_RATE_LIMITS = {"ip": (20, 60), "username": (5, 60)}
+# "memory"(프로세스별 토큰 버킷) 또는 "cache"(CACHES를 공유하는 고정 구간 카운터)
+MEMO_LOGIN_RATE_BACKEND = "memory"
+
+
+# Password validation
+# https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.1/topics/logging/
+# 요청 프로파일 로그(JSON 한 줄)는 INFO, 느린 쿼리는 WARNING으로 콘솔에 출력
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'memojjang.profiling': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.1/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.1/howto/static-files/
+
+STATIC_URL = 'static/'
+STATICFILES_DIRS = [
+    BASE_DIR / 'memojjang' / 'static',
+]
+# collectstatic이 파일을 모으는 디렉터리
+STATIC_ROOT = env("STATIC_ROOT", BASE_DIR / 'staticfiles')
+# STATIC_ROOT가 있으면 StaticFilesMiddleware가 앱 서버에서 정적 파일을 보냄
+# (nginx 등 앞단 서버가 보낸다면 False)
+MEMO_SERVE_STATIC = True
+# 이름에 해시가 없는 정적 파일의 캐시 시간(초), 해시가 붙은 파일은 1년(immutable)
+MEMO_STATIC_MAX_AGE = 60
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# 사용자 정의 모델 설정
+AUTH_USER_MODEL = "users.User"
@@ -0,0 +1,19 @@
+"""개발 설정
+
+    python manage.py runserver
+"""
+from .base import *  # noqa: F401,F403
+from .env import env, env_bool
+
+# SECURITY WARNING: 개발용 키, 운영에서는 prod 프로필이 SECRET_KEY 환경 변수를 요구함
+SECRET_KEY = env(
+    "SECRET_KEY", "django-insecure-zql0%kq=h_*2iyq(@qo!!egu_d25iz4h95sr-bh)ok83_cd2(!"
+)
+
+DEBUG = env_bool("DEBUG", True)
+
+MEMO_ENV = "dev"
+
+# 개발 서버(runserver)가 앱의 static 디렉터리에서 바로 보내므로,
+# 예전에 만든 collectstatic 결과를 보내지 않도록 끔
+MEMO_SERVE_STATIC = False
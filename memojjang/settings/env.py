@@ -0,0 +1,83 @@
+"""환경 변수와 .env 파일 읽기
+
+.env 파일은 한 줄에 KEY=VALUE 하나씩 쓰고, #으로 시작하는 줄은 주석입니다.
+값을 작은따옴표나 큰따옴표로 감쌀 수 있고, 앞에 export를 붙여도 됩니다.
+이미 설정된 환경 변수는 .env 파일의 값으로 덮어쓰지 않습니다.
+"""
+import os
+from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
+
+ENV_FILE = Path(__file__).resolve().parent.parent.parent / ".env"
+TRUE_VALUES = ("1", "true", "yes", "on")
+_MISSING = object()
+
+
+def parse_env_file(path):
+    """.env 파일을 읽어 {이름: 값} 딕셔너리로 반환"""
+    values = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):]
+        name, separator, value = line.partition("=")
+        if not separator:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        values[name.strip()] = value
+    return values
+
+
+def load_env_file(path=None):
+    """.env 파일의 값을 아직 설정되지 않은 환경 변수에만 채움
+
+    경로는 인자, MEMO_ENV_FILE 환경 변수, 프로젝트 루트의 .env 순서로 정합니다.
+    """
+    path = Path(path or os.environ.get("MEMO_ENV_FILE") or ENV_FILE)
+    if not path.is_file():
+        return {}
+    values = parse_env_file(path)
+    for name, value in values.items():
+        os.environ.setdefault(name, value)
+    return values
+
+
+def env(name, default=_MISSING):
+    """환경 변수 값, 없고 기본값도 없으면 ImproperlyConfigured"""
+    value = os.environ.get(name)
+    if value is None:
+        if default is _MISSING:
+            raise ImproperlyConfigured(f"환경 변수 {name}을(를) 설정해야 합니다.")
+        return default
+    return value
+
+
+def env_bool(name, default=False):
+    """1/true/yes/on이면 True"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in TRUE_VALUES
+
+
+def env_int(name, default=0):
+    """정수 환경 변수"""
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ImproperlyConfigured(f"환경 변수 {name}은(는) 정수여야 합니다: {value!r}")
+
+
+def env_list(name, default=None):
+    """쉼표로 구분한 목록 환경 변수"""
+    value = os.environ.get(name)
+    if value is None:
+        return list(default or [])
+    return [item.strip() for item in value.split(",") if item.strip()]
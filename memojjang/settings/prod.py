@@ -0,0 +1,72 @@
+"""운영 설정
+
+SECRET_KEY와 ALLOWED_HOSTS는 환경 변수(또는 .env)로 반드시 지정해야 합니다.
+
+    MEMO_ENV=prod gunicorn memojjang.wsgi
+"""
+import copy
+from django.core.exceptions import ImproperlyConfigured
+from .base import *  # noqa: F401,F403
+from .base import BASE_DIR, CACHES, DATABASES
+from .env import env, env_bool, env_int, env_list
+
+MEMO_ENV = "prod"
+
+SECRET_KEY = env("SECRET_KEY")
+
+DEBUG = False
+
+ALLOWED_HOSTS = env_list("ALLOWED_HOSTS")
+if not ALLOWED_HOSTS:
+    raise ImproperlyConfigured("운영 설정에는 ALLOWED_HOSTS 환경 변수가 필요합니다.")
+
+# 요청마다 연결을 새로 열지 않고 CONN_MAX_AGE초 동안 재사용하고,
+# 재사용하기 전에 연결이 살아 있는지 확인 (끊긴 연결로 요청이 실패하지 않음)
+# base의 딕셔너리를 바꾸지 않도록 복사해서 수정
+DATABASES = copy.deepcopy(DATABASES)
+for _database in DATABASES.values():
+    _database["CONN_MAX_AGE"] = env_int("CONN_MAX_AGE", 600)
+    _database["CONN_HEALTH_CHECKS"] = True
+
+# gunicorn은 워커 프로세스를 여러 개 띄우므로 목록 버전, 사용자 버전, 세션처럼
+# 워커 사이에 맞아야 하는 값을 담는 default 캐시는 모든 워커가 공유하는 백엔드를 씀
+# (프로세스마다 따로인 locmem은 다른 워커의 무효화를 보지 못함)
+# MEMO_CACHE_BACKEND: "file"(기본값, 같은 서버의 워커끼리 공유), "redis"(redis 패키지 필요),
+# "memcached"(pymemcache 패키지 필요), MEMO_CACHE_LOCATION: 디렉터리 또는 서버 주소
+SHARED_CACHE_BACKENDS = {
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+}
+_cache_backend = env("MEMO_CACHE_BACKEND", "file")
+if _cache_backend not in SHARED_CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"MEMO_CACHE_BACKEND는 {', '.join(SHARED_CACHE_BACKENDS)} 중 하나여야 합니다: "
+        f"{_cache_backend!r}"
+    )
+CACHES = copy.deepcopy(CACHES)
+CACHES["default"] = {
+    "BACKEND": SHARED_CACHE_BACKENDS[_cache_backend],
+    "LOCATION": (
+        env("MEMO_CACHE_LOCATION", str(BASE_DIR / "cache"))
+        if _cache_backend == "file" else env("MEMO_CACHE_LOCATION")
+    ),
+}
+if _cache_backend == "file":
+    # 파일 캐시는 항목이 MAX_ENTRIES를 넘으면 일부를 지움 (기본값 300은 목록 페이지에 너무 작음)
+    CACHES["default"]["OPTIONS"] = {"MAX_ENTRIES": env_int("MEMO_CACHE_MAX_ENTRIES", 10000)}
+# templates 캐시는 (pk, updated_at)처럼 내용으로 키가 정해지는 조각만 담으므로 워커별 locmem 유지
+
+# default 캐시를 워커가 공유하므로 세션을 캐시에서 읽고 DB에도 저장 (로그아웃은 모든 워커에 반영)
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
+# 정적 파일 이름에 내용 해시를 붙이고 collectstatic 때 gzip 사본을 만듦
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "memojjang.storage.CompressedManifestStaticFilesStorage"},
+}
+
+# 템플릿은 base의 cached 로더를 그대로 사용 (DEBUG가 아니므로 autoreload도 없음)
+
+SESSION_COOKIE_SECURE = env_bool("SESSION_COOKIE_SECURE", True)
+CSRF_COOKIE_SECURE = env_bool("CSRF_COOKIE_SECURE", True)
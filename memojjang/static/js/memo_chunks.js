@@ -0,0 +1,56 @@
+// 긴 메모 본문의 나머지 청크를 "더 보기" 링크 자리에 하나씩 불러와 붙임
+// 링크가 화면에 가까워지면 자동으로, 또는 클릭하면 불러옴
+(function () {
+    "use strict";
+
+    function load(link) {
+        if (link.dataset.loading) {
+            return;
+        }
+        link.dataset.loading = "1";
+        fetch(link.href, {credentials: "same-origin"})
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error(response.status);
+                }
+                return response.text();
+            })
+            .then(function (html) {
+                link.insertAdjacentHTML("afterend", html);
+                link.remove();
+                observe();
+            })
+            .catch(function () {
+                delete link.dataset.loading;
+            });
+    }
+
+    var observer = "IntersectionObserver" in window
+        ? new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    observer.unobserve(entry.target);
+                    load(entry.target);
+                }
+            });
+        }, {rootMargin: "200px"})
+        : null;
+
+    function observe() {
+        if (!observer) {
+            return;
+        }
+        document.querySelectorAll("a[data-memo-chunk]").forEach(function (link) {
+            observer.observe(link);
+        });
+    }
+
+    document.addEventListener("click", function (event) {
+        var link = event.target.closest("a[data-memo-chunk]");
+        if (link) {
+            event.preventDefault();
+            load(link);
+        }
+    });
+    observe();
+})();
@@ -0,0 +1,138 @@
+"""collectstatic 결과를 앱 서버에서 직접 보내는 미들웨어
+
+별도 웹 서버 없이 gunicorn만으로 배포할 때 STATIC_ROOT의 파일을 보냅니다.
+시작할 때 STATIC_ROOT를 한 번 훑어 파일 목록을 메모리에 두고, 요청마다
+
+- Accept-Encoding에 맞춰 collectstatic이 미리 만든 .br/.gz 사본을 고르고
+- 매니페스트에 있는(이름에 내용 해시가 붙은) 파일은 1년짜리 immutable로,
+  그 밖의 파일은 MEMO_STATIC_MAX_AGE초 동안 캐시하도록 응답합니다.
+
+해시가 붙은 파일은 내용이 바뀌면 이름도 바뀌므로, 브라우저는 재방문 때
+정적 파일을 다시 요청하지 않습니다. collectstatic을 다시 실행하면 워커를 재시작해야 합니다.
+"""
+import json
+import mimetypes
+import os
+from email.utils import formatdate
+from pathlib import Path
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpResponseNotModified
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_MAX_AGE = 60
+MANIFEST_NAME = "staticfiles.json"
+# 선호 순서대로 (Content-Encoding, 사본 확장자)
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class StaticFile:
+    """정적 파일 하나와 미리 압축된 사본들의 응답 정보"""
+
+    def __init__(self, path, immutable, max_age):
+        self.path = path
+        stat = path.stat()
+        self.content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if self.content_type.startswith("text/") or self.content_type in (
+            "application/javascript", "application/json", "image/svg+xml"
+        ):
+            self.content_type += "; charset=utf-8"
+        self.etag = f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.cache_control = (
+            IMMUTABLE_CACHE_CONTROL if immutable else f"public, max-age={max_age}"
+        )
+        self.variants = [
+            (encoding, Path(f"{path}{suffix}"))
+            for encoding, suffix in ENCODINGS
+            if Path(f"{path}{suffix}").is_file()
+        ]
+
+    def choose(self, accept_encoding):
+        """요청이 받을 수 있는 가장 작은 사본의 (경로, Content-Encoding)"""
+        accepted = {
+            value.split(";")[0].strip() for value in accept_encoding.lower().split(",")
+        }
+        for encoding, path in self.variants:
+            if encoding in accepted:
+                return path, encoding
+        return self.path, None
+
+    def response(self, request):
+        """GET/HEAD 요청에 대한 응답 (If-None-Match가 맞으면 304)"""
+        headers = {
+            "Cache-Control": self.cache_control,
+            "ETag": self.etag,
+            "Last-Modified": self.last_modified,
+        }
+        if self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if request.headers.get("If-None-Match") == self.etag:
+            response = HttpResponseNotModified()
+            for name, value in headers.items():
+                response[name] = value
+            return response
+        path, encoding = self.choose(request.headers.get("Accept-Encoding", ""))
+        if request.method == "HEAD":
+            response = FileResponse(b"", content_type=self.content_type)
+        else:
+            response = FileResponse(path.open("rb"), content_type=self.content_type)
+        response["Content-Length"] = str(path.stat().st_size)
+        if encoding:
+            response["Content-Encoding"] = encoding
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+
+def load_files(root, prefix, max_age=DEFAULT_MAX_AGE):
+    """STATIC_ROOT를 훑어 {URL 경로: StaticFile}을 만듦
+
+    압축 사본(.gz/.br)은 원본 항목의 사본으로만 쓰고 따로 등록하지 않습니다.
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return {}
+    hashed = set()
+    manifest = root / MANIFEST_NAME
+    if manifest.is_file():
+        hashed = set(json.loads(manifest.read_text(encoding="utf-8")).get("paths", {}).values())
+    files = {}
+    compressed_suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(directory) / filename
+            name = path.relative_to(root).as_posix()
+            if name == MANIFEST_NAME or name.endswith(compressed_suffixes):
+                continue
+            files[prefix + name] = StaticFile(path, name in hashed, max_age)
+    return files
+
+
+class StaticFilesMiddleware:
+    """STATIC_ROOT의 파일을 캐시 헤더와 함께 보내는 미들웨어 (WhiteNoise 방식)
+
+    SecurityMiddleware 바로 다음에 두어 세션/인증 미들웨어를 거치지 않게 합니다.
+    STATIC_ROOT가 없거나(collectstatic 전, 개발 환경) MEMO_SERVE_STATIC이
+    False이면 사용하지 않습니다.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "MEMO_SERVE_STATIC", True) or not settings.STATIC_ROOT:
+            raise MiddlewareNotUsed
+        prefix = "/" + settings.STATIC_URL.lstrip("/")
+        self.files = load_files(
+            settings.STATIC_ROOT,
+            prefix,
+            getattr(settings, "MEMO_STATIC_MAX_AGE", DEFAULT_MAX_AGE),
+        )
+        if not self.files:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.method in ("GET", "HEAD"):
+            static_file = self.files.get(request.path_info)
+            if static_file is not None:
+                return static_file.response(request)
+        return self.get_response(request)
@@ -0,0 +1,68 @@
+"""정적 파일 저장소
+
+CompressedManifestStaticFilesStorage는 ManifestStaticFilesStorage처럼 파일 이름에
+내용 해시를 붙이고, collectstatic 때 텍스트 파일의 gzip 사본(.gz)과, brotli
+패키지가 설치되어 있으면 brotli 사본(.br)을 함께 만듭니다. StaticFilesMiddleware
+(memojjang/staticfiles.py)가 요청의 Accept-Encoding에 맞는 사본을 그대로 보내므로
+요청마다 압축하지 않습니다.
+"""
+import gzip
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 미리 압축할 파일 확장자 (이미지/폰트처럼 이미 압축된 형식은 제외)
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".map", ".svg", ".txt", ".html", ".json", ".xml")
+# 이보다 작은 파일은 압축해도 헤더 비용 때문에 이득이 없음
+MIN_COMPRESS_SIZE = 256
+
+
+def _compressors():
+    """(확장자, 압축 함수) 목록"""
+    compressors = [(".gz", lambda content: gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        compressors.append((".br", lambda content: brotli.compress(content, quality=11)))
+    return compressors
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """해시를 붙인 파일 옆에 gzip(과 brotli) 사본을 만드는 정적 파일 저장소"""
+
+    def post_process(self, paths, dry_run=False, **options):
+        hashed_names = []
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed_names.append(hashed_name)
+            yield name, hashed_name, processed
+        if dry_run:
+            return
+        for hashed_name in dict.fromkeys(hashed_names):
+            for compressed_name in self.compress(hashed_name):
+                yield hashed_name, compressed_name, True
+
+    def compress(self, name):
+        """압축할 만한 파일이면 압축 사본을 만들고 만든 이름 목록을 반환
+
+        압축해도 작아지지 않는 형식은 사본을 만들지 않습니다.
+        """
+        if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+            return []
+        with self.open(name) as source:
+            content = source.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return []
+        written = []
+        for suffix, compress in _compressors():
+            compressed = compress(content)
+            if len(compressed) >= len(content):
+                continue
+            compressed_name = name + suffix
+            if self.exists(compressed_name):
+                self.delete(compressed_name)
+            self._save(compressed_name, ContentFile(compressed))
+            written.append(compressed_name)
+        return written
@@ -0,0 +1,137 @@
+import json
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+
+class TestMemoApi(TestCase):
+    """메모 JSON API 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(
+            user=self.user, title="첫 메모", content="첫 메모 내용", reminder_date="2030-01-01T09:00:00Z"
+        )
+        other = User.objects.create_user(username="other", password="testpass123")
+        self.other_memo = Memo.objects.create(user=other, title="남의 메모", content="내용")
+        self.detail_url = reverse("api_memo_detail", kwargs={"pk": self.memo.pk})
+
+    def _send(self, method, url, data):
+        """JSON 본문으로 요청"""
+        return getattr(self.client, method)(
+            url, data=json.dumps(data), content_type="application/json"
+        )
+
+    def test_list_returns_only_own_memos(self):
+        """목록은 자신의 메모만 목록용 필드로 반환"""
+        response = self.client.get(reverse("api_memo_list"))
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([memo["title"] for memo in results], ["첫 메모"])
+        self.assertNotIn("content", results[0])
+        self.assertEqual(results[0]["excerpt"], "첫 메모 내용")
+        self.assertIsNone(response.json()["next_cursor"])
+
+    def test_sparse_fieldset_maps_to_only(self):
+        """?fields=로 요청한 컬럼만 조회"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("api_memo_list"), {"fields": "title"})
+        self.assertEqual(response.json()["results"], [{"id": self.memo.pk, "title": "첫 메모"}])
+        sql = next(
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "memos"')
+        )
+        self.assertNotIn('"content"', sql)
+        self.assertNotIn('"excerpt"', sql)
+
+        response = self.client.get(self.detail_url, {"fields": "content,reminder_date"})
+        self.assertEqual(response.json(), {
+            "id": self.memo.pk,
+            "content": "첫 메모 내용",
+            "reminder_date": "2030-01-01T09:00:00+00:00",
+        })
+
+    def test_unknown_field(self):
+        """알 수 없는 필드는 400"""
+        response = self.client.get(reverse("api_memo_list"), {"fields": "title,password"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_pagination(self):
+        """next_cursor로 다음 페이지를 조회"""
+        for i in range(4):
+            Memo.objects.create(user=self.user, title=f"메모 {i}", content="내용")
+        with self.settings(MEMO_LIST_PAGE_SIZE=3):
+            first = self.client.get(reverse("api_memo_list"), {"fields": "title"}).json()
+            second = self.client.get(
+                reverse("api_memo_list"), {"fields": "title", "cursor": first["next_cursor"]}
+            ).json()
+        titles = [memo["title"] for memo in first["results"] + second["results"]]
+        self.assertEqual(titles, ["메모 3", "메모 2", "메모 1", "메모 0", "첫 메모"])
+        self.assertIsNone(second["next_cursor"])
+        response = self.client.get(reverse("api_memo_list"), {"cursor": "!!"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_create(self):
+        """메모 생성은 201과 생성된 메모를 반환"""
+        response = self._send("post", reverse("api_memo_list"), {
+            "title": "새 메모", "content": "새 내용"
+        })
+        self.assertEqual(response.status_code, 201)
+        memo = Memo.objects.get(pk=response.json()["id"])
+        self.assertEqual(memo.user, self.user)
+        self.assertEqual(response.json()["excerpt"], "새 내용")
+
+        response = self._send("post", reverse("api_memo_list"), {"content": "제목 없음"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("title", response.json()["errors"])
+
+    def test_patch_keeps_other_fields(self):
+        """PATCH는 보낸 필드만 수정"""
+        Memo.objects.filter(pk=self.memo.pk).update(is_reminded=True)
+        response = self._send("patch", self.detail_url, {"title": "수정된 제목"})
+        self.assertEqual(response.status_code, 200)
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.title, "수정된 제목")
+        self.assertEqual(self.memo.content, "첫 메모 내용")
+        self.assertIsNotNone(self.memo.reminder_date)
+        self.assertTrue(self.memo.is_reminded)
+
+    def test_put_replaces_fields(self):
+        """PUT은 보내지 않은 선택 필드를 비움"""
+        response = self._send("put", self.detail_url, {"title": "교체", "content": "교체 내용"})
+        self.assertEqual(response.status_code, 200)
+        self.memo.refresh_from_db()
+        self.assertIsNone(self.memo.reminder_date)
+        self.assertEqual(self.memo.excerpt, "교체 내용")
+
+    def test_delete(self):
+        """DELETE는 204를 반환하고 메모를 삭제"""
+        response = self.client.delete(self.detail_url)
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Memo.objects.filter(pk=self.memo.pk).exists())
+
+    def test_other_users_memo(self):
+        """다른 사용자의 메모는 조회, 수정, 삭제 모두 404"""
+        url = reverse("api_memo_detail", kwargs={"pk": self.other_memo.pk})
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self._send("patch", url, {"title": "탈취"}).status_code, 404)
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        self.other_memo.refresh_from_db()
+        self.assertEqual(self.other_memo.title, "남의 메모")
+
+    def test_login_required(self):
+        """로그인하지 않으면 401"""
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse("api_memo_list")).status_code, 401)
+        self.assertEqual(self.client.get(self.detail_url).status_code, 401)
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+from django.contrib.auth import get_user_model
+from asgiref.sync import sync_to_async
+from memojjang.apps.memos import async_views, tags
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+# MEMO_ASYNC_VIEWS = True일 때와 같이 읽기 뷰만 비동기 버전으로 연결한 URL 설정
+urlpatterns = [
+    path("memos/", async_views.memo_list, name="memo_list"),
+    path("memos/<int:pk>/", async_views.memo_detail, name="memo_detail"),
+    path("api/memos/", async_views.memo_collection, name="api_memo_list"),
+    path("api/memos/<int:pk>/", async_views.memo_resource, name="api_memo_detail"),
+    path("", include("memojjang.urls")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TestAsyncViews(TestCase):
+    """비동기 메모 뷰 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.memo = Memo.objects.create(user=self.user, title="첫 메모", content="비동기 내용")
+        other = User.objects.create_user(username="other", password="testpass123")
+        self.other_memo = Memo.objects.create(user=other, title="남의 메모", content="내용")
+
+    def test_views_are_coroutines(self):
+        """읽기 뷰는 모두 코루틴 함수"""
+        for view in (
+            async_views.memo_list, async_views.memo_detail,
+            async_views.memo_collection, async_views.memo_resource,
+        ):
+            self.assertTrue(asyncio.iscoroutinefunction(view))
+
+    async def test_memo_list(self):
+        """목록 렌더링, 캐시 적중, 조건부 GET"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("memo_list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "첫 메모")
+        self.assertContains(response, "로그아웃")
+        # 컨텍스트 프로세서의 메모 통계는 렌더링 전에 비동기로 불러 둠
+        self.assertContains(response, "메모 1개 · 대기 중인 리마인드 0개")
+        self.assertEqual(response["X-Memo-List-Cache"], "miss")
+
+        response = await self.async_client.get(reverse("memo_list"))
+        self.assertEqual(response["X-Memo-List-Cache"], "hit")
+        response = await self.async_client.get(
+            reverse("memo_list"), headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_memo_detail(self):
+        """상세 렌더링, 다른 사용자의 메모는 404"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse("memo_detail", kwargs={"pk": self.memo.pk})
+        )
+        self.assertContains(response, "비동기 내용")
+        response = await self.async_client.get(
+            reverse("memo_detail", kwargs={"pk": self.memo.pk}),
+            headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+        response = await self.async_client.get(
+            reverse("memo_detail", kwargs={"pk": self.other_memo.pk})
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_login_required(self):
+        """로그인하지 않으면 로그인 페이지로, API는 401"""
+        response = await self.async_client.get(reverse("memo_list"))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse("login"), response["Location"])
+        response = await self.async_client.get(reverse("api_memo_list"))
+        self.assertEqual(response.status_code, 401)
+
+    async def test_api_reads(self):
+        """JSON 목록과 상세 조회"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("api_memo_list"), {"fields": "title"})
+        self.assertEqual(response.json(), {
+            "results": [{"id": self.memo.pk, "title": "첫 메모"}],
+            "next_cursor": None,
+        })
+        response = await self.async_client.get(
+            reverse("api_memo_detail", kwargs={"pk": self.memo.pk}), {"fields": "content"}
+        )
+        self.assertEqual(response.json(), {"id": self.memo.pk, "content": "비동기 내용"})
+        response = await self.async_client.get(
+            reverse("api_memo_detail", kwargs={"pk": self.other_memo.pk})
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_tag_filter(self):
+        """목록과 JSON 목록의 태그 필터, 태그 표시"""
+        await self.async_client.aforce_login(self.user)
+        tagged = await Memo.objects.acreate(user=self.user, title="태그 메모", content="내용")
+        await sync_to_async(tags.set_memo_tags)(tagged, ["업무"])
+        response = await self.async_client.get(reverse("memo_list"), {"tag": "업무"})
+        self.assertEqual([memo.title for memo in response.context["memos"]], ["태그 메모"])
+        self.assertContains(response, "#업무")
+        response = await self.async_client.get(
+            reverse("api_memo_list"), {"tag": "업무", "fields": "tags"}
+        )
+        self.assertEqual(response.json()["results"], [{"id": tagged.pk, "tags": ["업무"]}])
+        response = await self.async_client.get(
+            reverse("api_memo_detail", kwargs={"pk": tagged.pk}), {"fields": "tags"}
+        )
+        self.assertEqual(response.json(), {"id": tagged.pk, "tags": ["업무"]})
+
+    async def test_api_writes_use_sync_views(self):
+        """쓰기 요청은 동기 API 뷰로 처리"""
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.patch(
+            reverse("api_memo_detail", kwargs={"pk": self.memo.pk}),
+            data=json.dumps({"title": "수정된 제목"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "수정된 제목")
+        response = await self.async_client.post(
+            reverse("api_memo_list"),
+            data=json.dumps({"title": "새 메모", "content": "내용"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(await Memo.objects.filter(user=self.user).acount(), 2)
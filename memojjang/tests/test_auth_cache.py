@@ -0,0 +1,199 @@
+import tempfile
+import time
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest import mock
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from memojjang.apps.users.backends import CachedModelBackend, UserCache, _version_key, user_cache
+
+User = get_user_model()
+
+
+# prod 프로필처럼 세션을 캐시에서 읽음
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+class TestCachedAuth(TestCase):
+    """캐시된 세션과 사용자 조회 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성 및 로그인"""
+        cache.clear()
+        user_cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+    def _auth_queries(self):
+        """메모 목록을 요청하고 세션/사용자 테이블 조회 쿼리 목록을 반환"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("memo_list"))
+        self.assertEqual(response.status_code, 200)
+        return [
+            query["sql"] for query in queries.captured_queries
+            if 'FROM "users"' in query["sql"] or 'FROM "django_session"' in query["sql"]
+        ]
+
+    def test_warm_request_has_no_auth_queries(self):
+        """캐시가 채워진 뒤에는 세션과 사용자를 조회하지 않음"""
+        self._auth_queries()
+        self.assertEqual(self._auth_queries(), [])
+
+    def test_user_save_invalidates_cache(self):
+        """사용자를 저장하면 다음 요청에서 다시 조회"""
+        self._auth_queries()
+        self.user.first_name = "길동"
+        self.user.save()
+        self.assertEqual(len(self._auth_queries()), 1)
+        self.assertEqual(self._auth_queries(), [])
+
+    def test_cached_user_reflects_update(self):
+        """캐시된 사용자는 저장된 최신 값을 반환"""
+        backend = CachedModelBackend()
+        backend.get_user(self.user.pk)
+        user = User.objects.get(pk=self.user.pk)
+        user.email = "new@example.com"
+        user.save()
+        self.assertEqual(backend.get_user(self.user.pk).email, "new@example.com")
+
+    def test_password_change_logs_out_old_session(self):
+        """비밀번호를 바꾸면 기존 세션은 로그아웃됨"""
+        self._auth_queries()
+        self.user.set_password("newpass456")
+        self.user.save()
+        response = self.client.get(reverse("memo_list"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_inactive_user_is_rejected(self):
+        """비활성 사용자는 반환하지 않음"""
+        backend = CachedModelBackend()
+        self.assertEqual(backend.get_user(self.user.pk), self.user)
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(backend.get_user(self.user.pk))
+        self.assertIsNone(backend.get_user(self.user.pk))
+
+    def test_missing_user(self):
+        """없는 사용자나 잘못된 id는 None"""
+        backend = CachedModelBackend()
+        self.assertIsNone(backend.get_user(self.user.pk + 100))
+        self.assertIsNone(backend.get_user("not-a-number"))
+
+    def test_cached_instances_are_not_shared(self):
+        """캐시 적중마다 새 인스턴스를 반환"""
+        backend = CachedModelBackend()
+        first = backend.get_user(self.user.pk)
+        with self.assertNumQueries(0):
+            second = backend.get_user(str(self.user.pk))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+
+class TestSharedCacheAcrossWorkers(TestCase):
+    """여러 워커가 공유 캐시로 세션과 사용자 변경을 함께 보는지 테스트
+
+    워커마다 따로인 사용자 LRU를 UserCache 인스턴스 두 개로 흉내 내고,
+    default 캐시는 prod 프로필처럼 프로세스 밖(파일)에 둡니다.
+    """
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        caches = {
+            **settings.CACHES,
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": cache_dir.name,
+            },
+        }
+        overrides = override_settings(
+            CACHES=caches, SESSION_ENGINE="django.contrib.sessions.backends.cached_db"
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.workers = [UserCache(), UserCache()]
+
+    def _get_user(self, worker):
+        with mock.patch("memojjang.apps.users.backends.user_cache", self.workers[worker]):
+            return CachedModelBackend().get_user(self.user.pk)
+
+    def test_user_change_reaches_other_worker(self):
+        """한 워커에서 비활성화한 사용자는 다른 워커의 LRU에서도 쓰이지 않음"""
+        self.assertEqual(self._get_user(0), self.user)
+        self.assertEqual(self._get_user(1), self.user)
+        version = cache.get(_version_key(self.user.pk))
+        with mock.patch("memojjang.apps.users.backends.user_cache", self.workers[0]):
+            self.user.is_active = False
+            self.user.save()
+        # 버전은 지우지 않고 새 값으로 올림 (지우면 다른 워커가 옛 행으로 다시 채울 수 있음)
+        self.assertNotIn(cache.get(_version_key(self.user.pk)), (None, version))
+        self.assertIsNone(self._get_user(1))
+        self.assertIsNone(self._get_user(0))
+
+    @override_settings(MEMO_USER_CACHE_TIMEOUT=1)
+    def test_signal_less_deactivation_expires(self):
+        """시그널 없이 비활성화한 사용자도 버전이 만료되면 거부됨"""
+        # setUp에서 저장하며 기본 만료 시간으로 만든 버전을 지워 1초 만료로 새로 만듦
+        cache.delete(_version_key(self.user.pk))
+        self.assertEqual(self._get_user(0), self.user)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        time.sleep(1.1)
+        self.assertIsNone(self._get_user(0))
+
+    def test_logout_reaches_other_worker(self):
+        """한 워커에서 로그아웃한 세션은 다른 워커에서 읽히지 않음"""
+        self.client.login(username="testuser", password="testpass123")
+        session_key = self.client.session.session_key
+        engine = import_module(settings.SESSION_ENGINE)
+        self.assertTrue(engine.SessionStore(session_key).load())
+        self.client.logout()
+        self.assertEqual(engine.SessionStore(session_key).load(), {})
+
+
+class TestUserCache(TestCase):
+    """사용자 LRU 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        """최대 크기를 넘으면 가장 오래 쓰지 않은 사용자를 밀어냄"""
+        users = [
+            User.objects.create_user(username=f"user{i}", password="testpass123")
+            for i in range(3)
+        ]
+        lru = UserCache(maxsize=2)
+        lru.set(users[0].pk, "v0", users[0])
+        lru.set(users[1].pk, "v1", users[1])
+        self.assertIsNotNone(lru.get(users[0].pk, "v0"))
+        lru.set(users[2].pk, "v2", users[2])
+        self.assertEqual(len(lru), 2)
+        self.assertIsNone(lru.get(users[1].pk, "v1"))
+        self.assertEqual(lru.get(users[0].pk, "v0"), users[0])
+        self.assertIsNone(lru.get(users[0].pk, "other"))
+
+
+class TestCleanupSessions(TestCase):
+    """만료 세션 정리 명령 테스트"""
+
+    def test_deletes_expired_sessions_in_batches(self):
+        """만료된 세션만 배치 단위로 삭제"""
+        now = timezone.now()
+        Session.objects.bulk_create(
+            Session(session_key=f"expired{i}", session_data="", expire_date=now - timedelta(days=1))
+            for i in range(5)
+        )
+        Session.objects.create(session_key="active", session_data="", expire_date=now + timedelta(days=1))
+        out = StringIO()
+        call_command("cleanup_sessions", batch_size=2, stdout=out)
+        self.assertEqual(list(Session.objects.values_list("pk", flat=True)), ["active"])
+        self.assertIn("5개", out.getvalue())
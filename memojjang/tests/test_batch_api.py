@@ -0,0 +1,139 @@
+import json
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+
+class TestMemoBatchApi(TestCase):
+    """메모 일괄 처리 API 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 두 명과 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.other = User.objects.create_user(username="other", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+        self.memos = [
+            Memo.objects.create(user=self.user, title=f"메모 {i}", content="내용")
+            for i in range(3)
+        ]
+        self.other_memo = Memo.objects.create(user=self.other, title="남의 메모", content="내용")
+
+    def _post(self, name, data):
+        """JSON 본문으로 POST 요청"""
+        return self.client.post(
+            reverse(name), data=json.dumps(data), content_type="application/json"
+        )
+
+    def test_batch_create_reports_per_item_results(self):
+        """유효한 항목은 생성되고 잘못된 항목은 오류로 보고됨"""
+        response = self._post("api_memo_batch_create", {"memos": [
+            {"title": "새 메모 1", "content": "내용 1"},
+            {"title": "", "content": "제목 없음"},
+            {"title": "새 메모 2", "content": "내용 2", "reminder_date": "2030-01-01T09:00"},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(
+            [result["status"] for result in data["results"]],
+            ["created", "invalid", "created"]
+        )
+        self.assertIn("title", data["results"][1]["errors"])
+        created = Memo.objects.get(pk=data["results"][2]["id"])
+        self.assertEqual(created.user, self.user)
+        self.assertIsNotNone(created.reminder_date)
+
+    def test_batch_create_uses_single_insert(self):
+        """여러 메모를 한 번의 INSERT로 생성"""
+        with CaptureQueriesContext(connection) as queries:
+            self._post("api_memo_batch_create", {"memos": [
+                {"title": f"메모 {i}", "content": "내용"} for i in range(10)
+            ]})
+        inserts = [
+            query for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "memos"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+    def test_batch_delete_is_scoped_to_user(self):
+        """자신의 메모만 삭제되고 나머지는 not_found로 보고됨"""
+        ids = [self.memos[0].pk, self.memos[1].pk, self.other_memo.pk, "abc"]
+        with CaptureQueriesContext(connection) as queries:
+            response = self._post("api_memo_batch_delete", {"ids": ids})
+        data = response.json()
+        self.assertEqual(data["deleted"], 2)
+        self.assertEqual(
+            [result["status"] for result in data["results"]],
+            ["deleted", "deleted", "not_found", "invalid"]
+        )
+        self.assertTrue(Memo.objects.filter(pk=self.other_memo.pk).exists())
+        self.assertEqual(Memo.objects.filter(user=self.user).count(), 1)
+        deletes = [
+            query for query in queries.captured_queries
+            if query["sql"].startswith('DELETE FROM "memos"')
+        ]
+        self.assertEqual(len(deletes), 1)
+
+    def test_batch_update_reminders(self):
+        """리마인드 설정을 일괄 수정"""
+        response = self._post("api_memo_batch_reminders", {"memos": [
+            {"id": self.memos[0].pk, "reminder_date": "2030-01-01T09:00"},
+            {"id": self.memos[1].pk, "reminder_date": "잘못된 날짜"},
+            {"id": self.other_memo.pk, "reminder_date": "2030-01-01T09:00"},
+        ]})
+        data = response.json()
+        self.assertEqual(data["updated"], 1)
+        self.assertEqual(
+            [result["status"] for result in data["results"]],
+            ["updated", "invalid", "not_found"]
+        )
+        self.memos[0].refresh_from_db()
+        self.assertEqual(self.memos[0].reminder_date.year, 2030)
+        self.other_memo.refresh_from_db()
+        self.assertIsNone(self.other_memo.reminder_date)
+
+    def test_batch_update_reminders_keeps_omitted_fields(self):
+        """항목에 없는 필드는 지우지 않고 현재 값을 유지"""
+        self._post("api_memo_batch_reminders", {"memos": [
+            {"id": memo.pk, "reminder_date": "2030-01-01T09:00"} for memo in self.memos[:2]
+        ]})
+        response = self._post("api_memo_batch_reminders", {"memos": [
+            {"id": self.memos[0].pk, "is_reminded": True},
+            {"id": self.memos[1].pk, "reminder_date": None},
+        ]})
+        self.assertEqual(response.json()["updated"], 2)
+        first, second = Memo.objects.filter(pk__in=[m.pk for m in self.memos[:2]]).order_by("pk")
+        self.assertEqual(first.reminder_date.year, 2030)
+        self.assertTrue(first.is_reminded)
+        self.assertIsNone(second.reminder_date)
+        self.assertFalse(second.is_reminded)
+
+    @override_settings(MEMO_BATCH_MAX_ITEMS=2)
+    def test_batch_size_limit(self):
+        """최대 항목 수를 넘으면 400"""
+        response = self._post("api_memo_batch_delete", {"ids": [1, 2, 3]})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.json())
+
+    def test_invalid_json(self):
+        """올바르지 않은 JSON 본문은 400"""
+        response = self.client.post(
+            reverse("api_memo_batch_create"), data="{", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_login_required(self):
+        """로그인하지 않으면 401"""
+        self.client.logout()
+        response = self._post("api_memo_batch_delete", {"ids": [self.memos[0].pk]})
+        self.assertEqual(response.status_code, 401)
+        self.assertTrue(Memo.objects.filter(pk=self.memos[0].pk).exists())
@@ -0,0 +1,288 @@
+import importlib
+import json
+from types import SimpleNamespace
+from unittest import mock
+from django.apps import apps
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from memojjang.apps.memos import chunks, revisions, search
+from memojjang.apps.memos.models import Memo, MemoChunk, MemoRevision, split_content
+
+User = get_user_model()
+
+CHUNK_SIZE = 100
+
+
+def _lines(prefix, count):
+    return "".join(f"{prefix} {i}번째 줄\n" for i in range(count))
+
+
+@override_settings(MEMO_CONTENT_CHUNK_SIZE=CHUNK_SIZE)
+class TestMemoChunks(TestCase):
+    """긴 메모 본문 청크 저장 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 긴 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+        self.content = _lines("본문", 40)
+        self.memo = Memo.objects.create(user=self.user, title="긴 메모", content=self.content)
+
+    def _full_content(self):
+        memo = Memo.objects.get(pk=self.memo.pk)
+        return chunks.full_content(memo.pk, memo.content)
+
+    def test_split_content(self):
+        """청크 크기 이하로, 가능하면 줄바꿈 앞에서 나눔"""
+        pieces = split_content(self.content, CHUNK_SIZE)
+        self.assertEqual("".join(pieces), self.content)
+        self.assertTrue(all(len(piece) <= CHUNK_SIZE for piece in pieces))
+        self.assertTrue(all(piece.startswith("\n") for piece in pieces[1:]))
+        self.assertEqual(split_content("가" * 250, CHUNK_SIZE), ["가" * 100, "가" * 100, "가" * 50])
+        self.assertEqual(split_content("", CHUNK_SIZE), [""])
+
+    def test_long_content_is_stored_in_chunks(self):
+        """긴 본문은 첫 청크만 content에, 나머지는 MemoChunk에 저장"""
+        self.memo.refresh_from_db()
+        self.assertGreater(self.memo.chunk_count, 3)
+        self.assertLessEqual(len(self.memo.content), CHUNK_SIZE)
+        self.assertEqual(self.memo.chunks.count(), self.memo.chunk_count - 1)
+        self.assertEqual(self._full_content(), self.content)
+        self.assertTrue(self.memo.excerpt.startswith("본문 0번째 줄"))
+
+        memos = Memo.objects.bulk_create([
+            Memo(user=self.user, title="일괄 생성", content=self.content),
+            Memo(user=self.user, title="짧은 메모", content="짧은 내용"),
+        ])
+        self.assertEqual(memos[0].chunk_count, self.memo.chunk_count)
+        self.assertEqual(chunks.full_content(memos[0].pk, memos[0].content), self.content)
+        self.assertEqual(memos[1].chunk_count, 1)
+
+    def test_detail_renders_first_chunk_and_links_the_rest(self):
+        """상세는 첫 청크만 렌더링하고 나머지는 청크 엔드포인트로 하나씩 불러옴"""
+        response = self.client.get(reverse("memo_detail", kwargs={"pk": self.memo.pk}))
+        self.assertContains(response, "본문 0번째 줄")
+        self.assertNotContains(response, "본문 39번째 줄")
+        self.assertContains(response, "js/memo_chunks.js")
+        url = reverse("memo_chunk", kwargs={"pk": self.memo.pk, "number": 1})
+        self.assertContains(response, f'href="{url}"')
+
+        html = []
+        number = 1
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotContains(response, "<html")
+            html.append(response.content.decode())
+            number += 1
+            next_url = reverse("memo_chunk", kwargs={"pk": self.memo.pk, "number": number})
+            url = next_url if next_url in html[-1] else None
+        self.assertEqual(number, Memo.objects.get(pk=self.memo.pk).chunk_count)
+        self.assertIn("본문 39번째 줄", html[-1])
+
+        not_modified = self.client.get(
+            reverse("memo_chunk", kwargs={"pk": self.memo.pk, "number": 1}),
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        missing = reverse("memo_chunk", kwargs={"pk": self.memo.pk, "number": number})
+        self.assertEqual(self.client.get(missing).status_code, 404)
+
+    def test_short_memo_has_no_chunk_links(self):
+        """짧은 메모는 청크 링크와 스크립트가 없음"""
+        memo = Memo.objects.create(user=self.user, title="짧은 메모", content="짧은 내용")
+        response = self.client.get(reverse("memo_detail", kwargs={"pk": memo.pk}))
+        self.assertNotContains(response, "data-memo-chunk")
+        self.assertNotContains(response, "memo_chunks.js")
+
+    def test_write_chunk_rewrites_only_that_chunk(self):
+        """청크 하나를 고치면 그 청크 행만 다시 씀"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        original = split_content(self.content, CHUNK_SIZE)
+        with CaptureQueriesContext(connection) as queries:
+            chunks.write_chunk(memo, 2, "\n바뀐 청크")
+        updates = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len([sql for sql in updates if '"memo_chunks"' in sql]), 1)
+        self.assertFalse([sql for sql in updates if '"memos"' in sql and '"content"' in sql])
+        expected = original[:2] + ["\n바뀐 청크"] + original[3:]
+        self.assertEqual(self._full_content(), "".join(expected))
+
+        # 청크 크기보다 길어지면 뒤에 새 청크를 끼워 넣고, 비우면 지움
+        longer = _lines("추가", 12)
+        chunks.write_chunk(memo, 1, longer)
+        expected = original[:1] + split_content(longer, CHUNK_SIZE) + expected[2:]
+        self.assertEqual(self._full_content(), "".join(expected))
+        self.assertEqual(memo.chunk_count, len(expected))
+        chunks.write_chunk(memo, 1, "")
+        del expected[1]
+        self.assertEqual(self._full_content(), "".join(expected))
+        self.assertEqual(
+            list(memo.chunks.values_list("number", flat=True)), list(range(1, len(expected)))
+        )
+        with self.assertRaises(MemoChunk.DoesNotExist):
+            chunks.write_chunk(memo, len(expected), "범위 밖")
+
+    def test_edit_form_changes_first_chunk_only(self):
+        """수정 폼은 첫 청크(content)만 바꾸고 나머지 청크는 그대로 둠"""
+        response = self.client.get(reverse("memo_edit", kwargs={"pk": self.memo.pk}))
+        self.assertContains(response, "첫 부분만 수정합니다")
+        rest = split_content(self.content, CHUNK_SIZE)[1:]
+        self.client.post(reverse("memo_edit", kwargs={"pk": self.memo.pk}), {
+            "title": "긴 메모", "content": "새 첫 부분\n"
+        })
+        self.assertEqual(self._full_content(), "새 첫 부분" + "".join(rest))
+
+    def test_later_chunks_are_searchable(self):
+        """마지막 청크에만 있는 단어도 검색되고, 청크를 고치면 다시 색인됨"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        last = memo.chunk_count - 1
+        self.assertEqual([r.memo.pk for r in search.search_memos(self.user, "본문 39번째")], [memo.pk])
+
+        chunks.write_chunk(memo, last, "\n맨끝단어 줄")
+        self.assertEqual([r.memo.pk for r in search.search_memos(self.user, "맨끝단어")], [memo.pk])
+        self.assertEqual(list(search.search_memos(self.user, "39번째")), [])
+
+        # 일괄 생성과 색인 재생성도 전체 본문을 색인
+        Memo.objects.bulk_create([Memo(user=self.user, title="일괄", content=_lines("일괄본문", 40))])
+        self.assertEqual(len(search.search_memos(self.user, "일괄본문 39번째")), 1)
+        list(search.rebuild_index())
+        self.assertEqual(len(search.search_memos(self.user, "일괄본문 39번째")), 1)
+        self.assertEqual(len(search.search_memos(self.user, "맨끝단어")), 1)
+
+    def test_revisions_cover_later_chunks(self):
+        """뒤쪽 청크를 고치면 기록이 남고, 복원하면 모든 청크가 돌아옴"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        self.assertEqual(revisions.revision_state(memo.pk, 1), ("긴 메모", self.content))
+
+        chunks.write_chunk(memo, memo.chunk_count - 1, "\n바뀐 마지막 청크")
+        edited = self._full_content()
+        self.assertEqual(revisions.revision_state(memo.pk, 2), ("긴 메모", edited))
+
+        # 첫 청크가 길어져 새 청크를 끼워 넣는 저장도 전체 본문을 기록
+        memo.content = _lines("새 앞부분", 12)
+        memo.save()
+        self.assertEqual(revisions.revision_state(memo.pk, 3)[1], self._full_content())
+
+        revisions.restore_revision(memo, 1)
+        memo = Memo.objects.get(pk=self.memo.pk)
+        self.assertEqual(self._full_content(), self.content)
+        self.assertEqual(memo.chunk_count, len(split_content(self.content, CHUNK_SIZE)))
+        self.assertEqual(memo.size, len(self.content.encode()))
+        self.assertEqual(revisions.revision_state(memo.pk, 4), ("긴 메모", self.content))
+        # 다른 버전으로 되돌려도 남아 있던 청크가 섞이지 않음
+        revisions.restore_revision(memo, 2)
+        self.assertEqual(self._full_content(), edited)
+
+    def _history(self, memo):
+        return [
+            revisions.revision_state(memo.pk, number)[1]
+            for number in memo.revisions.order_by("number").values_list("number", flat=True)
+        ]
+
+    def test_chunk_write_never_reads_full_content(self):
+        """청크 쓰기는 전체 본문을 읽지 않고 그 청크만 색인하고 기록함"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        expected = [self._full_content()]
+        with mock.patch.object(Memo, "full_content", side_effect=AssertionError), \
+                mock.patch.object(Memo, "content_chunks", side_effect=AssertionError):
+            chunks.write_chunk(memo, 2, "\n둘째청크단어 줄")
+            expected.append(self._full_content())
+            chunks.write_chunk(memo, 1, _lines("끼운청크", 12))
+            expected.append(self._full_content())
+            chunks.write_chunk(memo, 1, "")
+            expected.append(self._full_content())
+            chunks.write_chunk(memo, 0, "첫청크단어 줄")
+            expected.append(self._full_content())
+            self.client.post(reverse("memo_edit", kwargs={"pk": memo.pk}), {
+                "title": "새 제목", "content": "폼으로 고친 첫 청크\n"
+            })
+            expected.append(self._full_content())
+        self.assertEqual(self._history(memo), expected)
+
+        memo.refresh_from_db()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM memos_fts WHERE memo_id = %s", [memo.pk])
+            self.assertEqual(cursor.fetchone()[0], memo.chunk_count)
+        for text in ("둘째청크단어", "끼운청크 11번째", "새 제목 본문 39번째"):
+            self.assertEqual([r.memo.pk for r in search.search_memos(self.user, text)], [memo.pk])
+        for text in ("첫청크단어", "끼운청크 0번째", "긴 메모"):
+            self.assertEqual(list(search.search_memos(self.user, text)), [])
+
+    @override_settings(MEMO_REVISION_SNAPSHOT_INTERVAL=2)
+    def test_chunk_revisions_take_snapshots(self):
+        """청크 기록도 스냅숏 주기를 지키고, 어느 버전이든 복원됨"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        expected = [self._full_content()]
+        for step, number in enumerate((3, 1, 2, 1)):
+            chunks.write_chunk(memo, number, f"\n{number}번 청크 {step}번째 고침")
+            expected.append(self._full_content())
+        # 같은 내용으로 쓰면 기록을 남기지 않음
+        chunks.write_chunk(memo, 1, "\n1번 청크 3번째 고침")
+        self.assertEqual(self._history(memo), expected)
+        self.assertEqual(
+            list(memo.revisions.order_by("number").values_list("is_snapshot", flat=True)),
+            [True, False, True, False, True],
+        )
+
+    def test_legacy_revisions_get_chunk_boundaries(self):
+        """청크 경계가 없는 예전 스냅숏은 마이그레이션이 경계를 남겨 청크 기록을 이어 감"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        edited = self.content.replace("본문 1번째", "예전 수정")
+        MemoRevision.objects.filter(memo=memo).update(
+            data=revisions.encode({"t": "긴 메모", "c": self.content})
+        )
+        MemoRevision.objects.create(
+            memo=memo, number=2, data=revisions.encode({"d": revisions.make_delta(self.content, edited)})
+        )
+        other = Memo.objects.create(user=self.user, title="다른 메모", content=_lines("다른", 40))
+        MemoRevision.objects.filter(memo=other).update(
+            data=revisions.encode({"t": "다른 메모", "c": _lines("다른", 40)})
+        )
+
+        migration = importlib.import_module(
+            "memojjang.apps.memos.migrations.0015_memo_revision_chunks"
+        )
+        migration.record_chunk_boundaries(apps, SimpleNamespace(connection=connection))
+        # 최신 기록이 현재와 다르면 현재 청크로 스냅숏을 더하고, 같으면 그 스냅숏을 바꿔 씀
+        self.assertEqual(memo.revisions.count(), 3)
+        self.assertEqual(revisions.revision_state(memo.pk, 2)[1], edited)
+        self.assertEqual(revisions.revision_state(memo.pk, 3)[1], self.content)
+        self.assertEqual(other.revisions.count(), 1)
+        self.assertIsInstance(revisions.decode(other.revisions.get().data)["c"], list)
+
+        chunks.write_chunk(memo, 2, "\n새로 고친 청크")
+        self.assertEqual(revisions.revision_state(memo.pk, 4)[1], self._full_content())
+
+    def test_title_change_reaches_every_chunk_row(self):
+        """제목을 바꾸면 뒤쪽 청크 행도 새 제목으로 찾음"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        memo.title = "바뀐제목"
+        memo.save(update_fields=["title"])
+        self.assertEqual(len(search.search_memos(self.user, "바뀐제목 39번째")), 1)
+        self.assertEqual(list(search.search_memos(self.user, "긴 39번째")), [])
+        memo.delete()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM memos_fts WHERE memo_id = %s", [self.memo.pk])
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_export_and_api(self):
+        """내보내기는 전체 본문을, 청크 API는 청크 하나를 읽고 씀"""
+        exported = b"".join(self.client.get(reverse("memo_export")).streaming_content)
+        self.assertEqual(json.loads(exported)["content"], self.content)
+
+        url = reverse("api_memo_chunk", kwargs={"pk": self.memo.pk, "number": 1})
+        data = self.client.get(url).json()
+        self.assertEqual(data["content"], split_content(self.content, CHUNK_SIZE)[1])
+        self.assertEqual(data["chunk_count"], Memo.objects.get(pk=self.memo.pk).chunk_count)
+        response = self.client.put(
+            url, data=json.dumps({"content": "API로 바꾼 청크\n"}), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(url).json()["content"], "API로 바꾼 청크\n")
+        response = self.client.put(url, data="{}", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        missing = reverse("api_memo_chunk", kwargs={"pk": self.memo.pk, "number": 999})
+        self.assertEqual(self.client.get(missing).status_code, 404)
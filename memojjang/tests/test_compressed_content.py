@@ -0,0 +1,95 @@
+from io import StringIO
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from memojjang.apps.memos import fields
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+LARGE_CONTENT = "\n".join(f"2026-10-17 12:00:{i % 60:02d} INFO 요청 {i} 처리 완료" for i in range(500))
+
+
+def _storage(memo):
+    """본문 컬럼의 SQLite 저장 형식과 바이트 수"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT typeof(content), length(CAST(content AS BLOB)) FROM memos WHERE id = %s",
+            [memo.pk],
+        )
+        return cursor.fetchone()
+
+
+class TestCompressedContent(TestCase):
+    """큰 메모 본문 압축 저장 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성 및 로그인"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_large_content_is_compressed(self):
+        """기준 이상인 본문만 압축해 저장하고 읽을 때 풀림"""
+        large = Memo.objects.create(user=self.user, title="로그", content=LARGE_CONTENT)
+        small = Memo.objects.create(user=self.user, title="짧은 메모", content="짧은 내용")
+        storage, size = _storage(large)
+        self.assertEqual(storage, "blob")
+        self.assertLess(size * 5, len(LARGE_CONTENT.encode()))
+        self.assertEqual(_storage(small)[0], "text")
+        self.assertEqual(Memo.objects.get(pk=large.pk).content, LARGE_CONTENT)
+        self.assertTrue(large.excerpt.startswith("2026-10-17"))
+
+        # 수정해서 기준보다 작아지면 다시 텍스트로 저장
+        large.content = "줄인 내용"
+        large.save()
+        self.assertEqual(_storage(large)[0], "text")
+
+    @override_settings(MEMO_CONTENT_COMPRESS_MIN_BYTES=None)
+    def test_compression_can_be_disabled(self):
+        """None이면 압축하지 않음"""
+        memo = Memo.objects.create(user=self.user, title="로그", content=LARGE_CONTENT)
+        self.assertEqual(_storage(memo)[0], "text")
+
+    def test_decompressed_only_when_content_is_read(self):
+        """목록에서는 압축을 풀지 않고 상세/내보내기/검색에서는 원문을 씀"""
+        memo = Memo.objects.create(user=self.user, title="로그", content=LARGE_CONTENT)
+        deleted = Memo.objects.create(user=self.user, title="지울 로그", content=LARGE_CONTENT)
+        with mock.patch.object(fields, "decompress_text", wraps=fields.decompress_text) as spy:
+            self.client.get(reverse("memo_list"))
+            self.client.get(reverse("api_memo_list"))
+            self.client.post(reverse("memo_delete", kwargs={"pk": deleted.pk}))
+            self.assertFalse(spy.called)
+            response = self.client.get(reverse("memo_detail", kwargs={"pk": memo.pk}))
+            self.assertTrue(spy.called)
+        self.assertContains(response, "요청 499 처리 완료")
+
+        exported = b"".join(self.client.get(reverse("memo_export")).streaming_content)
+        self.assertIn("요청 499 처리 완료".encode(), exported)
+        response = self.client.get(reverse("memo_search"), {"q": "요청 499"})
+        self.assertContains(response, "로그")
+
+    def test_compress_command_backfills_existing_memos(self):
+        """명령은 압축하지 않고 저장된 큰 본문만 수정일시를 바꾸지 않고 압축"""
+        with override_settings(MEMO_CONTENT_COMPRESS_MIN_BYTES=None):
+            memos = [
+                Memo.objects.create(user=self.user, title=f"로그 {i}", content=LARGE_CONTENT)
+                for i in range(3)
+            ]
+            small = Memo.objects.create(user=self.user, title="짧은 메모", content="짧은 내용")
+        updated_at = Memo.objects.get(pk=memos[0].pk).updated_at
+
+        out = StringIO()
+        call_command("compress_memo_content", batch_size=2, stdout=out)
+        self.assertIn("본문 압축 완료: 3개", out.getvalue())
+        self.assertEqual([_storage(memo)[0] for memo in memos], ["blob"] * 3)
+        self.assertEqual(_storage(small)[0], "text")
+        memo = Memo.objects.get(pk=memos[0].pk)
+        self.assertEqual(memo.content, LARGE_CONTENT)
+        self.assertEqual(memo.updated_at, updated_at)
+
+        out = StringIO()
+        call_command("compress_memo_content", stdout=out)
+        self.assertIn("본문 압축 완료: 0개", out.getvalue())
@@ -0,0 +1,109 @@
+from unittest import mock
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from memojjang.apps.memos.conditional import list_validators
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+
+class TestConditionalGet(TestCase):
+    """메모 상세/목록의 조건부 GET 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(user=self.user, title="메모", content="내용")
+        self.detail_url = reverse("memo_detail", kwargs={"pk": self.memo.pk})
+
+    def test_detail_returns_validators(self):
+        """상세 응답에 ETag와 Last-Modified가 포함됨"""
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_detail_not_modified_skips_rendering(self):
+        """사본이 최신이면 템플릿 렌더링 없이 304를 반환"""
+        etag = self.client.get(self.detail_url)["ETag"]
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertTemplateNotUsed(response, "memos/memo_detail.html")
+
+    def test_detail_if_modified_since(self):
+        """If-Modified-Since만 보낸 경우에도 304를 반환"""
+        last_modified = self.client.get(self.detail_url)["Last-Modified"]
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_changes_after_edit(self):
+        """메모를 수정하면 ETag가 바뀌어 전체 응답을 반환"""
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.memo.content = "수정된 내용"
+        self.memo.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "수정된 내용")
+
+    def test_detail_of_other_users_memo(self):
+        """다른 사용자의 메모는 검증자 없이 404"""
+        other = User.objects.create_user(username="other", password="testpass123")
+        memo = Memo.objects.create(user=other, title="남의 메모", content="내용")
+        response = self.client.get(reverse("memo_detail", kwargs={"pk": memo.pk}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_not_modified(self):
+        """목록도 변경이 없으면 304를 반환"""
+        etag = self.client.get(reverse("memo_list"))["ETag"]
+        response = self.client.get(reverse("memo_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_changes_after_delete(self):
+        """메모를 삭제하면 목록 ETag가 바뀜"""
+        Memo.objects.create(user=self.user, title="두 번째", content="내용")
+        etag = self.client.get(reverse("memo_list"))["ETag"]
+        self.memo.delete()
+        response = self.client.get(reverse("memo_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_follows_db_not_list_cache(self):
+        """목록 캐시 버전이 그대로인 워커에서도 삭제/수정 후 ETag가 바뀜"""
+        Memo.objects.create(user=self.user, title="두 번째", content="내용")
+        etag = self.client.get(reverse("memo_list"))["ETag"]
+        # 다른 워커의 캐시는 무효화되지 않았다고 가정
+        with mock.patch("memojjang.apps.memos.cache.invalidate_list"):
+            self.memo.delete()
+            deleted = self.client.get(reverse("memo_list"), HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(deleted.status_code, 200)
+            self.assertNotEqual(deleted["ETag"], etag)
+
+            memo = Memo.objects.get(user=self.user)
+            memo.content = "수정된 내용"
+            memo.save()
+            edited = self.client.get(reverse("memo_list"), HTTP_IF_NONE_MATCH=deleted["ETag"])
+            self.assertEqual(edited.status_code, 200)
+
+    def test_list_last_modified_query_uses_index(self):
+        """사용자별 MAX(updated_at) 조회가 인덱스를 사용"""
+        request = RequestFactory().get(reverse("memo_list"))
+        request.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            list_validators(request)
+        sql = next(
+            query["sql"] for query in queries.captured_queries if "MAX" in query["sql"]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql)
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        self.assertIn("memos_user_updated_idx", plan)
@@ -0,0 +1,56 @@
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class TestSqliteTuning(TestCase):
+    """SQLite 연결 설정 테스트"""
+
+    def _pragma(self, cursor, name):
+        """PRAGMA 현재 값을 조회"""
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied(self):
+        """연결마다 PRAGMA가 적용됨"""
+        with connection.cursor() as cursor:
+            self.assertEqual(self._pragma(cursor, "busy_timeout"), 5000)
+            self.assertEqual(self._pragma(cursor, "synchronous"), 1)  # NORMAL
+            self.assertEqual(self._pragma(cursor, "temp_store"), 2)  # MEMORY
+            self.assertEqual(self._pragma(cursor, "cache_size"), -20000)
+
+    @contextmanager
+    def _file_connection(self):
+        """임시 파일 데이터베이스에 같은 설정으로 새 연결을 염"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            wrapper = DatabaseWrapper(
+                {**connection.settings_dict, "NAME": str(Path(tmp_dir) / "tuning.sqlite3")},
+                alias="tuning_test",
+            )
+            connections["tuning_test"] = wrapper
+            try:
+                yield wrapper
+            finally:
+                wrapper.close()
+                del connections["tuning_test"]
+
+    def test_file_database_uses_wal(self):
+        """파일 데이터베이스는 WAL 모드로 열림"""
+        with self._file_connection() as wrapper, wrapper.cursor() as cursor:
+            self.assertEqual(self._pragma(cursor, "journal_mode"), "wal")
+            self.assertEqual(
+                self._pragma(cursor, "mmap_size"), settings.SQLITE_PRAGMAS["mmap_size"]
+            )
+
+    def test_transactions_begin_immediate(self):
+        """트랜잭션은 BEGIN IMMEDIATE로 시작"""
+        with self._file_connection() as wrapper:
+            with CaptureQueriesContext(wrapper) as queries:
+                with transaction.atomic(using="tuning_test"):
+                    pass
+        self.assertIn("BEGIN IMMEDIATE", [query["sql"] for query in queries.captured_queries])
@@ -0,0 +1,81 @@
+from io import StringIO
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from memojjang.apps.memos.models import Memo, make_excerpt
+
+User = get_user_model()
+
+
+class TestMemoExcerpt(TestCase):
+    """메모 요약 필드 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+
+    def test_excerpt_updated_on_save(self):
+        """저장할 때 요약이 생성되고 본문 수정 시 갱신됨"""
+        memo = Memo.objects.create(user=self.user, title="제목", content="짧은 내용")
+        self.assertEqual(memo.excerpt, "짧은 내용")
+
+        memo.content = " ".join(f"단어{i}" for i in range(50))
+        memo.save(update_fields=["content"])
+        memo.refresh_from_db()
+        self.assertEqual(memo.excerpt, make_excerpt(memo.content))
+        self.assertEqual(len(memo.excerpt.split()), 30)
+
+    def test_excerpt_of_large_content(self):
+        """큰 본문은 앞부분만 읽어 요약을 생성"""
+        excerpt = make_excerpt("가" * 100000)
+        self.assertLess(len(excerpt), 3000)
+        self.assertTrue(excerpt.endswith("…"))
+
+    def test_bulk_create_fills_excerpt(self):
+        """bulk_create로 생성한 메모에도 요약이 채워짐"""
+        Memo.objects.bulk_create([
+            Memo(user=self.user, title="제목", content="일괄 생성 내용")
+        ])
+        self.assertEqual(Memo.objects.get().excerpt, "일괄 생성 내용")
+
+    def test_for_list_defers_content(self):
+        """목록 쿼리셋은 본문을 읽지 않음"""
+        Memo.objects.create(user=self.user, title="제목", content="내용")
+        memo = Memo.objects.for_list().get()
+        self.assertIn("content", memo.get_deferred_fields())
+
+    def test_memo_list_view_does_not_select_content(self):
+        """메모 목록 뷰의 메모 조회 쿼리에 content 컬럼이 없음"""
+        Memo.objects.create(user=self.user, title="제목", content="내용")
+        self.client.login(username="testuser", password="testpass123")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("memo_list"))
+        self.assertContains(response, "내용")
+        memo_queries = [
+            query["sql"] for query in queries.captured_queries
+            if 'FROM "memos"' in query["sql"]
+        ]
+        self.assertTrue(memo_queries)
+        for sql in memo_queries:
+            self.assertNotIn('"memos"."content"', sql)
+
+    def test_backfill_command(self):
+        """백필 명령이 비어 있는 요약을 배치 단위로 채움"""
+        for i in range(5):
+            Memo.objects.create(user=self.user, title=f"제목 {i}", content=f"내용 {i}")
+        Memo.objects.update(excerpt="")
+        updated_at = dict(Memo.objects.values_list("pk", "updated_at"))
+
+        out = StringIO()
+        call_command("backfill_memo_excerpts", batch_size=2, stdout=out)
+        self.assertFalse(Memo.objects.filter(excerpt="").exists())
+        self.assertIn("5개", out.getvalue())
+        # 요약을 채워도 수정일시는 그대로
+        self.assertEqual(dict(Memo.objects.values_list("pk", "updated_at")), updated_at)
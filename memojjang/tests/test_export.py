@@ -0,0 +1,108 @@
+import csv
+import gzip
+import io
+import json
+import tracemalloc
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
+from memojjang.apps.memos.models import Memo
+from memojjang.apps.memos.export import export_stream
+
+User = get_user_model()
+
+
+class TestMemoExport(TestCase):
+    """메모 내보내기 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(
+            user=self.user, title="첫 메모", content="줄 1\n줄 2, 쉼표", reminder_date=timezone.now()
+        )
+        Memo.objects.create(user=self.user, title="두 번째", content="내용")
+        other = User.objects.create_user(username="other", password="testpass123")
+        Memo.objects.create(user=other, title="남의 메모", content="내용")
+
+    def _download(self, **params):
+        """내보내기 응답과 전체 본문을 반환"""
+        response = self.client.get(reverse("memo_export"), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    def test_ndjson_export(self):
+        """NDJSON은 메모마다 한 줄이며 자신의 메모만 포함"""
+        response, body = self._download(format="ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual([record["title"] for record in records], ["첫 메모", "두 번째"])
+        self.assertEqual(records[0]["content"], "줄 1\n줄 2, 쉼표")
+        self.assertEqual(records[0]["reminder_date"], self.memo.reminder_date.isoformat())
+
+    def test_csv_export(self):
+        """CSV는 헤더와 메모 행을 포함"""
+        response, body = self._download(format="csv")
+        self.assertIn("attachment", response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["content"], "줄 1\n줄 2, 쉼표")
+
+    def test_gzip_export(self):
+        """gzip 옵션은 압축된 스트림을 반환"""
+        response, body = self._download(format="ndjson", gzip="1")
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertTrue(response["Content-Disposition"].endswith('.ndjson.gz"'))
+        lines = gzip.decompress(body).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+
+    def test_unknown_format(self):
+        """지원하지 않는 형식은 400"""
+        response = self.client.get(reverse("memo_export"), {"format": "xml"})
+        self.assertEqual(response.status_code, 400)
+
+
+class TestMemoExportMemory(TestCase):
+    """대량 메모 내보내기의 메모리 사용량 테스트"""
+
+    ROWS = 100000
+
+    def setUp(self):
+        """10만 개의 메모를 직접 삽입"""
+        self.user = User.objects.create(username="bulkuser")
+        now = timezone.now()
+        content = "메모리 사용량 테스트용 본문입니다. " * 8
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO memos (user_id, title, content, excerpt, is_reminded, "
+                "created_at, updated_at) VALUES (%s, %s, %s, '', %s, %s, %s)",
+                [
+                    (self.user.pk, f"메모 {i}", content, False, now, now)
+                    for i in range(self.ROWS)
+                ]
+            )
+
+    def test_peak_memory_is_bounded(self):
+        """10만 개를 내보내도 최대 메모리 사용량이 전체 출력보다 훨씬 작음"""
+        tracemalloc.start()
+        try:
+            total = 0
+            lines = 0
+            for chunk in export_stream(self.user, "ndjson", chunk_size=1000):
+                total += len(chunk)
+                lines += chunk.count(b"\n")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(lines, self.ROWS)
+        # 출력은 수십 MB이지만 최대 메모리는 청크 몇 개 분량에 머물러야 함
+        self.assertGreater(total, 20 * 1024 * 1024)
+        self.assertLess(peak, 5 * 1024 * 1024)
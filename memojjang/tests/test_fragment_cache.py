@@ -0,0 +1,72 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.template import engines
+from django.template.loader import render_to_string
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test import TestCase
+from django.utils import timezone
+from memojjang.apps.memos.models import Memo
+from memojjang.apps.memos.reminders import release_reminders
+
+User = get_user_model()
+
+
+class TestTemplateCaching(TestCase):
+    """템플릿 로더 캐시와 조각 캐시 테스트"""
+
+    def setUp(self):
+        """조각 캐시를 비우고 테스트 사용자와 메모 생성"""
+        caches["templates"].clear()
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(user=self.user, title="첫 메모", content="내용")
+
+    def _render_items(self, memos):
+        return render_to_string("memos/memo_list_items.html", {"memos": memos})
+
+    def test_templates_use_cached_loader(self):
+        """템플릿은 한 번만 컴파일해 재사용"""
+        engine = engines.all()[0]
+        self.assertIsInstance(engine.engine.template_loaders[0], CachedLoader)
+        self.assertIs(
+            engine.get_template("base.html").template.template,
+            engine.get_template("base.html").template.template,
+        )
+
+    def test_card_is_cached_by_updated_at(self):
+        """updated_at이 같으면 캐시된 카드를, 바뀌면 새로 렌더링한 카드를 사용"""
+        memo = Memo.objects.for_list().get()
+        self.assertIn("첫 메모", self._render_items([memo]))
+        memo.title = "바뀐 제목"
+        self.assertIn("첫 메모", self._render_items([memo]))
+        memo.updated_at += timedelta(seconds=1)
+        html = self._render_items([memo])
+        self.assertIn("바뀐 제목", html)
+        self.assertNotIn("첫 메모", html)
+
+    def test_saved_memo_is_rendered_fresh(self):
+        """메모를 저장하면 목록에 새 내용이 표시됨"""
+        self.client.login(username="testuser", password="testpass123")
+        self.client.get("/memos/")
+        self.memo.title = "수정한 제목"
+        self.memo.save()
+        self.assertContains(self.client.get("/memos/"), "수정한 제목")
+
+    def test_navbar_is_cached_per_login_state(self):
+        """내비게이션 바는 로그인 여부별로 따로 캐시"""
+        anonymous = render_to_string("base.html", {"user": AnonymousUser()})
+        logged_in = render_to_string("base.html", {"user": self.user})
+        self.assertIn("회원가입", anonymous)
+        self.assertNotIn("로그아웃", anonymous)
+        self.assertIn("로그아웃", logged_in)
+        self.assertIn("로그아웃", render_to_string("base.html", {"user": self.user}))
+
+    def test_released_reminder_changes_updated_at(self):
+        """리마인드 선점을 취소하면 updated_at이 바뀌어 카드가 다시 렌더링됨"""
+        Memo.objects.filter(pk=self.memo.pk).update(
+            reminder_date=timezone.now(), is_reminded=True
+        )
+        before = Memo.objects.get().updated_at
+        release_reminders([self.memo])
+        self.assertGreater(Memo.objects.get().updated_at, before)
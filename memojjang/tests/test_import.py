@@ -0,0 +1,211 @@
+import csv
+import gzip
+import io
+import json
+import tempfile
+import tracemalloc
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from memojjang.apps.memos import importer
+from memojjang.apps.memos.export import export_stream
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+
+def ndjson(*records):
+    """레코드들을 NDJSON 바이트로 변환"""
+    return "".join(
+        record if isinstance(record, str) else json.dumps(record, ensure_ascii=False) + "\n"
+        for record in records
+    ).encode()
+
+
+class TestMemoImport(TestCase):
+    """메모 가져오기 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+    def _import(self, data, **kwargs):
+        """바이트 데이터를 가져오기"""
+        export_format = kwargs.pop("export_format", "ndjson")
+        compressed = kwargs.pop("compressed", False)
+        records = importer.read_records(io.BytesIO(data), export_format, compressed)
+        return importer.import_memos(self.user, records, **kwargs)
+
+    def test_ndjson_import_reports_row_errors(self):
+        """유효한 행은 저장되고 잘못된 행은 줄 번호와 함께 보고됨"""
+        result = self._import(ndjson(
+            {"title": "첫 메모", "content": "내용", "reminder_date": "2030-01-01T09:00:00+09:00"},
+            "{깨진 JSON\n",
+            {"title": "", "content": "제목 없음"},
+            "\n",
+            {"title": "완료된 메모", "content": "내용", "is_reminded": True},
+        ))
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.failed, 2)
+        self.assertEqual([error["line"] for error in result.errors], [2, 3])
+        self.assertIn("title", result.errors[1]["errors"])
+        memos = Memo.objects.filter(user=self.user).order_by("pk")
+        self.assertEqual([memo.title for memo in memos], ["첫 메모", "완료된 메모"])
+        self.assertEqual(memos[0].reminder_date.year, 2030)
+        self.assertTrue(memos[1].is_reminded)
+        self.assertEqual(memos[0].excerpt, "내용")
+
+    def test_round_trip_from_export(self):
+        """내보낸 CSV/NDJSON(gzip 포함)을 그대로 가져올 수 있음"""
+        other = User.objects.create_user(username="other", password="testpass123")
+        Memo.objects.create(user=other, title="쉼표, 줄바꿈", content="줄 1\n줄 2", is_reminded=True)
+        Memo.objects.create(user=other, title="두 번째", content="내용")
+        for export_format in importer.FORMATS:
+            for compressed in (False, True):
+                with self.subTest(export_format=export_format, compressed=compressed):
+                    Memo.objects.filter(user=self.user).delete()
+                    data = b"".join(export_stream(other, export_format, compressed))
+                    result = self._import(
+                        data, export_format=export_format, compressed=compressed
+                    )
+                    self.assertEqual((result.created, result.failed), (2, 0))
+                    memo = Memo.objects.filter(user=self.user).order_by("pk").first()
+                    self.assertEqual(memo.title, "쉼표, 줄바꿈")
+                    self.assertEqual(memo.content, "줄 1\n줄 2")
+                    self.assertTrue(memo.is_reminded)
+
+    def test_round_trip_of_long_content(self):
+        """csv 모듈 기본 한도(131072자)보다 긴 본문도 내보낸 그대로 가져옴"""
+        csv.field_size_limit(131072)
+        other = User.objects.create_user(username="other", password="testpass123")
+        content = "긴 본문 " * 40000 + "끝"
+        self.assertGreater(len(content), 131072)
+        Memo.objects.create(user=other, title="긴 메모", content=content)
+        for export_format in importer.FORMATS:
+            with self.subTest(export_format=export_format):
+                Memo.objects.filter(user=self.user).delete()
+                data = b"".join(export_stream(other, export_format, False))
+                result = self._import(data, export_format=export_format)
+                self.assertEqual((result.created, result.failed), (1, 0))
+                self.assertEqual(Memo.objects.get(user=self.user).content, content)
+
+    def test_csv_error_is_reported_as_bad_file(self):
+        """CSV를 읽다 난 오류는 API는 400, 명령은 CommandError로 알림"""
+        data = "title,content\n메모,{}\n".format("가" * 100).encode()
+        limit = csv.field_size_limit()
+        csv.field_size_limit(10)
+        try:
+            with mock.patch.object(importer, "CSV_FIELD_SIZE_LIMIT", 10):
+                response = self.client.post(reverse("api_memo_import"), {
+                    "file": SimpleUploadedFile("memos.csv", data),
+                })
+                self.assertEqual(response.status_code, 400)
+                with tempfile.NamedTemporaryFile(suffix=".csv") as file:
+                    file.write(data)
+                    file.flush()
+                    with self.assertRaisesMessage(CommandError, "파일을 읽을 수 없습니다"):
+                        call_command("import_memos", file.name, user="testuser", stdout=io.StringIO())
+        finally:
+            csv.field_size_limit(limit)
+        self.assertFalse(Memo.objects.filter(user=self.user).exists())
+
+    def test_batches_use_one_insert_each(self):
+        """batch_size개마다 한 번의 INSERT로 저장"""
+        data = ndjson(*({"title": f"메모 {i}", "content": "내용"} for i in range(5)))
+        with CaptureQueriesContext(connection) as queries:
+            result = self._import(data, batch_size=2)
+        inserts = [
+            query for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "memos"')
+        ]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(result.created, 5)
+        self.assertGreater(result.rows_per_second, 0)
+
+    def test_reported_errors_are_capped(self):
+        """보관하는 오류 수는 제한되지만 실패 수는 모두 셈"""
+        result = self._import(b"x\n" * 10, max_errors=3)
+        self.assertEqual(result.failed, 10)
+        self.assertEqual(len(result.errors), 3)
+
+    def test_api_import(self):
+        """업로드한 파일을 가져오고 결과를 JSON으로 반환"""
+        data = gzip.compress(ndjson(
+            {"title": "업로드 메모", "content": "내용"}, {"title": "", "content": "내용"}
+        ))
+        response = self.client.post(reverse("api_memo_import"), {
+            "file": SimpleUploadedFile("memos.ndjson.gz", data),
+        })
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["created"], 1)
+        self.assertEqual(body["failed"], 1)
+        self.assertIn("rows_per_second", body)
+        self.assertTrue(Memo.objects.filter(user=self.user, title="업로드 메모").exists())
+
+    def test_api_rejects_bad_requests(self):
+        """파일이 없거나 읽을 수 없으면 400, 로그인하지 않으면 401"""
+        response = self.client.post(reverse("api_memo_import"))
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(reverse("api_memo_import"), {
+            "file": SimpleUploadedFile("memos.ndjson.gz", b"not gzip"),
+        })
+        self.assertEqual(response.status_code, 400)
+        self.client.logout()
+        response = self.client.post(reverse("api_memo_import"), {
+            "file": SimpleUploadedFile("memos.ndjson", ndjson({"title": "a", "content": "b"})),
+        })
+        self.assertEqual(response.status_code, 401)
+
+    def test_command(self):
+        """import_memos 명령은 파일을 가져오고 처리량과 오류를 출력"""
+        with tempfile.NamedTemporaryFile(suffix=".csv") as file:
+            file.write("title,content\n명령 메모,내용\n,제목 없음\n".encode())
+            file.flush()
+            stdout, stderr = io.StringIO(), io.StringIO()
+            call_command(
+                "import_memos", file.name, user="testuser", stdout=stdout, stderr=stderr
+            )
+        self.assertIn("rows/s", stdout.getvalue())
+        self.assertIn("3번째 줄", stderr.getvalue())
+        self.assertTrue(Memo.objects.filter(user=self.user, title="명령 메모").exists())
+        with self.assertRaises(CommandError):
+            call_command("import_memos", "memos.csv", user="nobody")
+
+
+class TestMemoImportMemory(TestCase):
+    """큰 파일 가져오기의 메모리 사용량 테스트"""
+
+    ROWS = 8000
+
+    def test_peak_memory_is_bounded(self):
+        """파일보다 훨씬 작은 메모리로 가져옴"""
+        user = User.objects.create(username="bulkuser")
+        content = "메모리 사용량 테스트용 본문입니다. " * 100
+        with tempfile.TemporaryFile() as file:
+            for i in range(self.ROWS):
+                file.write(ndjson({"title": f"메모 {i}", "content": content}))
+            size = file.tell()
+            file.seek(0)
+            tracemalloc.start()
+            try:
+                records = importer.read_records(file)
+                result = importer.import_memos(user, records, batch_size=500)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        self.assertEqual(result.created, self.ROWS)
+        self.assertEqual(Memo.objects.filter(user=user).count(), self.ROWS)
+        self.assertGreater(size, 20 * 1024 * 1024)
+        self.assertLess(peak, size // 4)
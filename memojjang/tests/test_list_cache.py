@@ -0,0 +1,158 @@
+import tempfile
+from datetime import timedelta
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
+from memojjang.apps.memos.models import Memo
+from memojjang.apps.memos import cache as list_cache
+from memojjang.apps.memos.reminders import claim_due_reminders
+
+User = get_user_model()
+
+
+class TestMemoListCache(TestCase):
+    """사용자별 메모 목록 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(user=self.user, title="첫 메모", content="내용")
+        list_cache.list_cache_stats.reset()
+
+    def _get_list(self):
+        """목록을 요청하고 (응답, 메모 행 조회 여부)를 반환
+
+        조건부 요청 검증자의 MAX(updated_at) 조회는 캐시와 관계없이 매번 하므로 뺌
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("memo_list"))
+        queried = any(
+            'FROM "memos"' in query["sql"] and "MAX(" not in query["sql"]
+            for query in queries.captured_queries
+        )
+        return response, queried
+
+    def test_second_request_is_served_from_cache(self):
+        """두 번째 요청은 메모를 조회하지 않고 캐시에서 응답"""
+        response, queried = self._get_list()
+        self.assertEqual(response["X-Memo-List-Cache"], "miss")
+        self.assertTrue(queried)
+
+        response, queried = self._get_list()
+        self.assertEqual(response["X-Memo-List-Cache"], "hit")
+        self.assertFalse(queried)
+        self.assertContains(response, "첫 메모")
+        self.assertEqual(
+            list_cache.list_cache_stats.as_dict(),
+            {"hits": 1, "misses": 1, "hit_rate": 0.5}
+        )
+
+    def test_save_and_delete_invalidate(self):
+        """메모 저장과 삭제는 목록 캐시를 무효화"""
+        self._get_list()
+        self.memo.title = "수정된 메모"
+        self.memo.save()
+        response, queried = self._get_list()
+        self.assertTrue(queried)
+        self.assertContains(response, "수정된 메모")
+
+        self.memo.delete()
+        response, queried = self._get_list()
+        self.assertTrue(queried)
+        self.assertNotContains(response, "수정된 메모")
+
+    def test_page_cached_before_commit_is_discarded(self):
+        """커밋 전에 다른 요청이 이전 행으로 캐시한 목록은 커밋 후 쓰이지 않음"""
+        self._get_list()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.memo.title = "커밋된 제목"
+            self.memo.save()
+            # 커밋 전 다른 요청이 아직 이전 제목이 보이는 목록을 새 버전으로 캐시한 경우
+            stale_key = list_cache.list_page_key(self.user.pk)
+            self.client.get(reverse("memo_list"))
+        self.assertNotEqual(list_cache.list_page_key(self.user.pk), stale_key)
+        response, queried = self._get_list()
+        self.assertTrue(queried)
+        self.assertContains(response, "커밋된 제목")
+
+    def test_bulk_operations_invalidate(self):
+        """일괄 생성과 일괄 수정도 목록 캐시를 무효화"""
+        self._get_list()
+        Memo.objects.bulk_create([Memo(user=self.user, title="일괄 메모", content="내용")])
+        response, _ = self._get_list()
+        self.assertContains(response, "일괄 메모")
+
+        self.memo.title = "일괄 수정"
+        Memo.objects.bulk_update([self.memo], ["title"])
+        response, _ = self._get_list()
+        self.assertContains(response, "일괄 수정")
+
+    def test_reminder_dispatch_invalidates(self):
+        """리마인드 발송 후 목록에 완료 상태가 보임"""
+        Memo.objects.filter(pk=self.memo.pk).update(
+            reminder_date=timezone.now() - timedelta(minutes=1)
+        )
+        list_cache.bump_list_version(self.user.pk)
+        self._get_list()
+        claim_due_reminders(limit=10)
+        response, queried = self._get_list()
+        self.assertTrue(queried)
+        self.assertContains(response, "(완료)")
+
+    def test_other_users_cache_is_untouched(self):
+        """다른 사용자의 메모 변경은 내 목록 캐시에 영향이 없음"""
+        other = User.objects.create_user(username="other", password="testpass123")
+        self._get_list()
+        Memo.objects.create(user=other, title="다른 사용자", content="내용")
+        _, queried = self._get_list()
+        self.assertFalse(queried)
+
+    @override_settings(MEMO_LIST_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        """만료 시간이 0이면 캐시를 사용하지 않음"""
+        self._get_list()
+        _, queried = self._get_list()
+        self.assertTrue(queried)
+
+
+class TestMemoListFileCache(TestCase):
+    """파일 기반 캐시 백엔드에서의 목록 캐시 테스트"""
+
+    def setUp(self):
+        """임시 디렉터리를 캐시 위치로 사용"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": self.tmp_dir.name,
+            },
+            "templates": settings.CACHES["templates"],
+        })
+        self.settings_override.enable()
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+
+    def tearDown(self):
+        """설정 복원 및 임시 디렉터리 삭제"""
+        self.settings_override.disable()
+        self.tmp_dir.cleanup()
+
+    def test_hit_and_invalidate(self):
+        """파일 캐시에서도 적중과 무효화가 동작"""
+        self.client.get(reverse("memo_list"))
+        response = self.client.get(reverse("memo_list"))
+        self.assertEqual(response["X-Memo-List-Cache"], "hit")
+
+        Memo.objects.create(user=self.user, title="새 메모", content="내용")
+        response = self.client.get(reverse("memo_list"))
+        self.assertEqual(response["X-Memo-List-Cache"], "miss")
+        self.assertContains(response, "새 메모")
@@ -0,0 +1,178 @@
+import threading
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from memojjang.apps.users.hashers import HashingBusy, hashing_pool
+from memojjang.apps.users.ratelimit import CacheRateLimiter, MemoryRateLimiter, memory_limiter
+
+User = get_user_model()
+
+
+class TestPasswordHashing(TestCase):
+    """비밀번호 해셔 설정과 로그인 시 재해시 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성"""
+        memory_limiter.reset()
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+
+    def _login(self, password="testpass123"):
+        return self.client.post(reverse("login"), {"username": "testuser", "password": password})
+
+    def test_new_passwords_use_tuned_scrypt(self):
+        """새 비밀번호는 설정한 비용의 scrypt로 저장"""
+        self.assertTrue(self.user.password.startswith("scrypt$16384$"))
+        self.assertEqual(self.user.password.split("$")[3:5], ["8", "1"])
+
+    def test_legacy_hash_is_upgraded_on_login(self):
+        """PBKDF2로 저장된 비밀번호는 로그인에 성공하면 scrypt로 다시 저장"""
+        User.objects.filter(pk=self.user.pk).update(
+            password=make_password("testpass123", hasher="pbkdf2_sha256")
+        )
+        self.assertRedirects(self._login(), reverse("memo_list"))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$"))
+
+    def test_failed_login_does_not_upgrade(self):
+        """로그인에 실패하면 예전 해시를 그대로 둠"""
+        legacy = make_password("testpass123", hasher="pbkdf2_sha256")
+        User.objects.filter(pk=self.user.pk).update(password=legacy)
+        self.assertEqual(self._login("wrongpass").status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.password, legacy)
+
+    def test_changed_cost_is_applied_on_login(self):
+        """비용 설정을 바꾸면 다음 로그인에서 새 비용으로 다시 저장"""
+        with override_settings(MEMO_SCRYPT_PARAMS={"work_factor": 2**12, "block_size": 8, "parallelism": 1}):
+            self.assertRedirects(self._login(), reverse("memo_list"))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$4096$"))
+
+
+@override_settings(MEMO_PASSWORD_HASH_WORKERS=1, MEMO_PASSWORD_HASH_QUEUE=0)
+class TestHashingPool(TestCase):
+    """해시 풀 크기 제한 테스트"""
+
+    def setUp(self):
+        """작은 풀을 새로 만들고 테스트 사용자 생성"""
+        memory_limiter.reset()
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        hashing_pool.shutdown()
+        self.addCleanup(hashing_pool.shutdown)
+
+    def _occupy(self):
+        """풀의 유일한 자리를 차지하는 작업을 띄우고 해제 함수를 반환"""
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        thread = threading.Thread(target=hashing_pool.run, args=(block,))
+        thread.start()
+        started.wait(5)
+
+        def stop():
+            release.set()
+            thread.join()
+        return stop
+
+    def test_full_pool_rejects_immediately(self):
+        """풀과 대기열이 차면 기다리지 않고 HashingBusy"""
+        stop = self._occupy()
+        try:
+            with self.assertRaises(HashingBusy):
+                hashing_pool.run(sum, [1, 2])
+        finally:
+            stop()
+        self.assertEqual(hashing_pool.run(sum, [1, 2]), 3)
+
+    def test_login_returns_503_when_busy(self):
+        """해시 풀이 가득 차면 로그인은 503"""
+        stop = self._occupy()
+        try:
+            response = self.client.post(
+                reverse("login"), {"username": "testuser", "password": "testpass123"}
+            )
+        finally:
+            stop()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+
+class TestLoginRateLimit(TestCase):
+    """로그인 시도 제한 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성"""
+        memory_limiter.reset()
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+
+    def _login(self, username="testuser", ip="10.0.0.1"):
+        return self.client.post(
+            reverse("login"), {"username": username, "password": "wrongpass"}, REMOTE_ADDR=ip
+        )
+
+    @override_settings(MEMO_LOGIN_RATE_LIMITS={"ip": None, "username": (2, 60)})
+    def test_username_flood_is_rejected_before_hashing(self):
+        """사용자 이름별 제한을 넘으면 해시하지 않고 429"""
+        self.assertEqual(self._login(ip="10.0.0.1").status_code, 200)
+        self.assertEqual(self._login(username="TestUser", ip="10.0.0.2").status_code, 200)
+        with mock.patch.object(hashing_pool, "run") as run:
+            response = self._login(ip="10.0.0.3")
+        run.assert_not_called()
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        self.assertEqual(self._login(username="other").status_code, 200)
+
+    @override_settings(MEMO_LOGIN_RATE_LIMITS={"ip": (2, 60), "username": None})
+    def test_ip_flood_is_rejected(self):
+        """IP별 제한을 넘으면 다른 사용자 이름이어도 429"""
+        self.assertEqual(self._login(username="a").status_code, 200)
+        self.assertEqual(self._login(username="b").status_code, 200)
+        self.assertEqual(self._login(username="c").status_code, 429)
+        self.assertEqual(self._login(username="c", ip="10.0.0.9").status_code, 200)
+
+    @override_settings(
+        MEMO_LOGIN_RATE_LIMITS={"ip": None, "username": (1, 60)},
+        MEMO_LOGIN_RATE_BACKEND="cache",
+    )
+    def test_cache_backend(self):
+        """cache 백엔드도 같은 방식으로 제한"""
+        self.assertEqual(self._login().status_code, 200)
+        self.assertEqual(self._login().status_code, 429)
+        self.assertEqual(len(memory_limiter._buckets), 0)
+
+
+class TestRateLimiters(TestCase):
+    """토큰 버킷과 캐시 카운터 테스트"""
+
+    def test_token_bucket_refills(self):
+        """토큰은 시간이 지나면 비율에 맞게 다시 참"""
+        limiter = MemoryRateLimiter()
+        with mock.patch("memojjang.apps.users.ratelimit.time.monotonic", return_value=100.0):
+            self.assertIsNone(limiter.hit("key", 2, 60))
+            self.assertIsNone(limiter.hit("key", 2, 60))
+            self.assertEqual(limiter.hit("key", 2, 60), 30)
+        with mock.patch("memojjang.apps.users.ratelimit.time.monotonic", return_value=130.0):
+            self.assertIsNone(limiter.hit("key", 2, 60))
+            self.assertIsNotNone(limiter.hit("key", 2, 60))
+
+    def test_token_bucket_is_bounded(self):
+        """기억하는 키 수는 max_buckets를 넘지 않음"""
+        limiter = MemoryRateLimiter(max_buckets=3)
+        for i in range(10):
+            limiter.hit(f"key{i}", 1, 60)
+        self.assertEqual(len(limiter._buckets), 3)
+
+    def test_cache_counter(self):
+        """캐시 카운터는 구간마다 허용 횟수까지 통과"""
+        cache.clear()
+        limiter = CacheRateLimiter()
+        self.assertIsNone(limiter.hit("key", 2, 60))
+        self.assertIsNone(limiter.hit("key", 2, 60))
+        self.assertGreater(limiter.hit("key", 2, 60), 0)
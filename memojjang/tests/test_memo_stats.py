@@ -0,0 +1,180 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
+from memojjang.apps.memos import chunks, reminders, stats
+from memojjang.apps.memos.models import Memo, MemoStats
+
+User = get_user_model()
+
+
+class TestMemoStats(TestCase):
+    """사용자별 메모 통계 테스트"""
+
+    def setUp(self):
+        """테스트 사용자 생성 및 로그인"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+        self.past = timezone.now() - timedelta(hours=1)
+
+    def _stored(self, user=None):
+        user = user or self.user
+        return tuple(getattr(stats.get_stats(user.pk), field) for field in stats.STAT_FIELDS)
+
+    def assertStats(self, memo_count, pending, content_bytes):
+        """저장된 통계가 기대값이고 memos를 다시 센 값과도 같은지 확인"""
+        expected = (memo_count, pending, content_bytes)
+        self.assertEqual(self._stored(), expected)
+        self.assertEqual(stats.count_stats([self.user.pk]).get(self.user.pk, stats.EMPTY), expected)
+
+    def test_stats_follow_every_write_path(self):
+        """save, 일괄 생성/수정, 리마인드 선점/취소, 삭제가 모두 통계에 반영됨"""
+        self.assertStats(0, 0, 0)
+        memo = Memo.objects.create(user=self.user, title="첫 메모", content="가나다")
+        self.assertStats(1, 0, 9)
+        memo.content = "abc"
+        memo.reminder_date = self.past
+        memo.save()
+        self.assertStats(1, 1, 3)
+        # 제목만 고친 저장은 통계를 바꾸지 않음
+        memo.title = "바뀐 제목"
+        memo.save(update_fields=["title"])
+        self.assertStats(1, 1, 3)
+
+        created = Memo.objects.bulk_create([
+            Memo(user=self.user, title="일괄 1", content="1234", reminder_date=self.past),
+            Memo(user=self.user, title="일괄 2", content="12"),
+        ])
+        self.assertStats(3, 2, 9)
+        for item in created:
+            item.content = "바뀜"
+        Memo.objects.bulk_update(created, ["content"])
+        self.assertStats(3, 2, 15)
+
+        # QuerySet.update로 선점하고 취소해도 트리거가 반영
+        claimed = reminders.claim_due_reminders(10)
+        self.assertEqual(len(claimed), 2)
+        self.assertStats(3, 0, 15)
+        reminders.release_reminders(claimed)
+        self.assertStats(3, 2, 15)
+
+        response = self.client.post(
+            reverse("api_memo_batch_reminders"),
+            data=json.dumps({"memos": [{"id": memo.pk, "reminder_date": None}]}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.json()["updated"], 1)
+        self.assertStats(3, 1, 15)
+
+        memo.delete()
+        self.assertStats(2, 1, 12)
+        Memo.objects.filter(user=self.user).delete()
+        self.assertStats(0, 0, 0)
+
+    @override_settings(MEMO_CONTENT_CHUNK_SIZE=100)
+    def test_size_covers_all_chunks(self):
+        """청크로 나뉜 메모의 크기는 모든 청크의 합, 청크를 고칠 때마다 갱신"""
+        def full_size(memo):
+            memo = Memo.objects.get(pk=memo.pk)
+            self.assertEqual(self._stored()[2], memo.size)
+            return len(chunks.full_content(memo.pk, memo.content).encode())
+
+        content = "".join(f"본문 {i}번째 줄\n" for i in range(40))
+        memo = Memo.objects.create(user=self.user, title="긴 메모", content=content)
+        self.assertGreater(memo.chunk_count, 3)
+        self.assertEqual(memo.size, len(content.encode()))
+        self.assertEqual(full_size(memo), memo.size)
+
+        memo = Memo.objects.get(pk=memo.pk)
+        memo.content = "새 첫 부분"
+        memo.save()
+        self.assertEqual(full_size(memo), memo.size)
+        chunks.write_chunk(memo, 2, "\n바뀐 청크" * 30)
+        self.assertEqual(full_size(memo), memo.size)
+        chunks.write_chunk(memo, 1, "")
+        self.assertEqual(full_size(memo), memo.size)
+        chunks.write_chunk(memo, 0, "첫 청크")
+        self.assertEqual(full_size(memo), memo.size)
+
+    def test_reconcile_command(self):
+        """어긋난 통계를 찾아 보고하고, --dry-run이 아니면 고침"""
+        other = User.objects.create_user(username="other", password="testpass123")
+        Memo.objects.create(user=self.user, title="메모", content="내용", reminder_date=self.past)
+        Memo.objects.create(user=other, title="메모", content="내용")
+        MemoStats.objects.filter(user=self.user).update(memo_count=5, content_bytes=0)
+        MemoStats.objects.filter(user=other).delete()
+
+        output = StringIO()
+        call_command("reconcile_memo_stats", "--dry-run", "--batch-size", "1", stdout=output)
+        self.assertIn(f"사용자 {self.user.pk}: 저장된 값 (5, 1, 0), 실제 값 (1, 1, 6)", output.getvalue())
+        self.assertIn("2명 중 2명 어긋남 (고치지 않음)", output.getvalue())
+        self.assertEqual(self._stored(), (5, 1, 0))
+
+        call_command("reconcile_memo_stats", stdout=StringIO())
+        self.assertEqual(self._stored(), (1, 1, 6))
+        self.assertEqual(self._stored(other), (1, 0, 6))
+        output = StringIO()
+        call_command("reconcile_memo_stats", stdout=output)
+        self.assertIn("2명 중 0명 어긋남", output.getvalue())
+
+    def test_context_processor_reads_one_row(self):
+        """페이지마다 통계 행 하나만 읽고 memos를 세지 않음"""
+        Memo.objects.create(user=self.user, title="메모", content="내용", reminder_date=self.past)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("memo_list"))
+        self.assertContains(response, "메모 1개 · 대기 중인 리마인드 1개 · 사용량 6")
+        stats_queries = [q["sql"] for q in queries.captured_queries if '"memo_stats"' in q["sql"]]
+        self.assertEqual(len(stats_queries), 1)
+        self.assertIn('"memo_stats"."user_id" =', stats_queries[0])
+        self.assertFalse([
+            q for q in queries.captured_queries
+            if 'FROM "memos"' in q["sql"] and ("COUNT(" in q["sql"] or "SUM(" in q["sql"])
+        ])
+
+        # 메모를 만든 적 없는 사용자와 로그인하지 않은 사용자
+        User.objects.create_user(username="new", password="testpass123")
+        self.client.login(username="new", password="testpass123")
+        self.assertContains(self.client.get(reverse("home")), "메모 0개")
+        self.client.logout()
+        response = self.client.get(reverse("home"))
+        self.assertNotIn("memo_stats", response.context)
+
+
+class TestMemoStatsTriggers(TransactionTestCase):
+    """memos 테이블을 다시 만든 뒤의 통계 트리거 테스트"""
+
+    def _triggers(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'memos'"
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_migrate_recreates_triggers_after_table_rebuild(self):
+        """SQLite가 memos를 다시 만들어 트리거가 지워져도 migrate 뒤에 다시 생김"""
+        expected = {"memo_stats_insert", "memo_stats_delete", "memo_stats_update"}
+        self.assertTrue(expected <= self._triggers())
+        try:
+            # 필드를 바꾸는 마이그레이션처럼 테이블을 새로 만들어 복사
+            with connection.schema_editor() as editor:
+                editor._remake_table(Memo)
+            self.assertFalse(expected & self._triggers())
+
+            with self.assertLogs(stats.logger, "WARNING") as logs:
+                call_command("migrate", verbosity=0)
+            self.assertIn("reconcile_memo_stats", logs.output[0])
+            self.assertTrue(expected <= self._triggers())
+        finally:
+            stats.ensure_triggers()
+
+        user = User.objects.create_user(username="testuser", password="testpass123")
+        Memo.objects.create(user=user, title="메모", content="내용")
+        self.assertEqual(stats.get_stats(user.pk).memo_count, 1)
+        # 트리거가 모두 있으면 다시 만들지 않음
+        self.assertEqual(stats.ensure_triggers(), [])
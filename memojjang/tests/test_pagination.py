@@ -0,0 +1,111 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
+from memojjang.apps.memos.models import Memo
+from memojjang.apps.memos.pagination import (
+    CursorPaginator, InvalidCursor, decode_cursor, encode_cursor
+)
+
+User = get_user_model()
+
+
+class TestCursorPaginator(TestCase):
+    """키셋(커서) 페이지네이터 테스트"""
+
+    def setUp(self):
+        """같은 작성 시각을 가진 메모를 포함해 테스트 메모 생성"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        for i in range(7):
+            Memo.objects.create(user=self.user, title=f"메모 {i}", content="내용")
+        # 작성 시각이 같아도 id로 순서가 고정되는지 확인하기 위해 시각을 맞춤
+        Memo.objects.filter(user=self.user).update(created_at=timezone.now())
+
+    def test_pages_cover_all_memos_without_duplicates(self):
+        """모든 페이지를 순회하면 모든 메모를 중복 없이 정렬 순서대로 얻음"""
+        paginator = CursorPaginator(Memo.objects.filter(user=self.user), page_size=3)
+        seen = []
+        cursor = None
+        while True:
+            page = paginator.page(cursor)
+            self.assertLessEqual(len(page), 3)
+            seen.extend(memo.pk for memo in page)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+        expected = list(
+            Memo.objects.filter(user=self.user).values_list("pk", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_first_page(self):
+        """첫 페이지 여부 테스트"""
+        paginator = CursorPaginator(Memo.objects.filter(user=self.user), page_size=10)
+        page = paginator.page()
+        self.assertTrue(page.is_first)
+        self.assertFalse(page.has_next)
+        self.assertEqual(len(page), 7)
+
+    def test_cursor_round_trip(self):
+        """커서 인코딩/디코딩 테스트"""
+        memo = Memo.objects.filter(user=self.user).first()
+        self.assertEqual(
+            decode_cursor(encode_cursor(memo)), (memo.created_at, memo.pk)
+        )
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 InvalidCursor 예외 발생"""
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("not-a-cursor")
+
+    def test_page_query_uses_composite_index(self):
+        """커서 조회가 (user_id, created_at, id) 복합 인덱스를 사용"""
+        paginator = CursorPaginator(Memo.objects.filter(user=self.user))
+        cursor = encode_cursor(Memo.objects.filter(user=self.user).first())
+        sql, params = paginator.get_page_queryset(cursor).query.sql_with_params()
+        with connection.cursor() as db_cursor:
+            db_cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+            plan = " ".join(str(row) for row in db_cursor.fetchall())
+        self.assertIn("memos_user_created_id_idx", plan)
+        # 인덱스 순서대로 읽으므로 별도 정렬 단계가 없어야 함
+        self.assertNotIn("TEMP B-TREE", plan)
+
+
+@override_settings(MEMO_LIST_PAGE_SIZE=2)
+class TestMemoListPagination(TestCase):
+    """메모 목록 뷰 페이지네이션 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        for i in range(3):
+            Memo.objects.create(user=self.user, title=f"메모 {i}", content="내용")
+
+    def test_memo_list_next_page(self):
+        """다음 페이지 커서로 나머지 메모 조회"""
+        response = self.client.get(reverse("memo_list"))
+        self.assertEqual(len(response.context["memos"]), 2)
+        page = response.context["page"]
+        self.assertTrue(page.has_next)
+        self.assertContains(response, "다음 페이지")
+
+        response = self.client.get(reverse("memo_list"), {"cursor": page.next_cursor})
+        self.assertEqual(len(response.context["memos"]), 1)
+        self.assertFalse(response.context["page"].has_next)
+        self.assertContains(response, "처음으로")
+
+    def test_memo_list_invalid_cursor(self):
+        """잘못된 커서는 첫 페이지를 보여줌"""
+        response = self.client.get(reverse("memo_list"), {"cursor": "!!!"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["page"].is_first)
@@ -0,0 +1,82 @@
+import json
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from memojjang.apps.memos import profiling
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+
+@override_settings(MEMO_PROFILING_SAMPLE_RATE=1.0, MEMO_LIST_CACHE_TIMEOUT=0)
+class TestQueryProfilingMiddleware(TestCase):
+    """요청 쿼리 프로파일링 미들웨어 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
+        self.memo = Memo.objects.create(user=self.user, title="메모", content="내용")
+        profiling.request_stats.reset()
+
+    def _get(self, url):
+        """요청하고 (응답, 프로파일 로그)를 반환"""
+        with self.assertLogs("memojjang.profiling", level="INFO") as logs:
+            response = self.client.get(url)
+        records = [json.loads(record.getMessage()) for record in logs.records]
+        return response, records
+
+    def test_server_timing_and_log(self):
+        """Server-Timing 헤더와 JSON 로그에 쿼리 수, DB 시간, 템플릿 시간이 담김"""
+        response, records = self._get(reverse("memo_list"))
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn("tpl;dur=", timing)
+        self.assertIn("total;dur=", timing)
+        record = records[0]
+        self.assertEqual(record["event"], "request_profile")
+        self.assertEqual(record["url_name"], "memo_list")
+        self.assertEqual(record["status"], 200)
+        self.assertGreater(record["queries"], 0)
+        self.assertGreater(record["template_ms"], 0)
+
+    def test_histogram_per_url_name(self):
+        """URL 이름별로 요청이 누적됨"""
+        for _ in range(3):
+            self._get(reverse("memo_list"))
+        self._get(reverse("memo_detail", kwargs={"pk": self.memo.pk}))
+        stats = profiling.request_stats.snapshot()
+        self.assertEqual(stats["memo_list"]["count"], 3)
+        self.assertEqual(stats["memo_detail"]["count"], 1)
+        self.assertEqual(sum(stats["memo_list"]["buckets"].values()), 3)
+
+    @override_settings(MEMO_SLOW_QUERY_MS=0)
+    def test_slow_queries_are_logged(self):
+        """기준보다 느린 쿼리는 WARNING으로 기록"""
+        _, records = self._get(reverse("memo_detail", kwargs={"pk": self.memo.pk}))
+        slow = [record for record in records if record["event"] == "slow_query"]
+        self.assertTrue(slow)
+        self.assertEqual(slow[0]["url_name"], "memo_detail")
+
+    @override_settings(MEMO_PROFILING_SAMPLE_RATE=0)
+    def test_disabled(self):
+        """비율이 0이면 헤더를 붙이지 않음"""
+        response = self.client.get(reverse("memo_list"))
+        self.assertNotIn("Server-Timing", response)
+
+
+class TestRequestProfile(TestCase):
+    """RequestProfile 테스트"""
+
+    def test_repeated_queries_are_reported(self):
+        """같은 SQL이 반복되면 N+1 의심으로 보고"""
+        profile = profiling.RequestProfile()
+        for _ in range(5):
+            profile.record_query('SELECT * FROM "users" WHERE "id" = %s', 0.5)
+        profile.record_query('SELECT * FROM "memos" WHERE "id" IN (%s, %s)', 0.5)
+        profile.record_query('SELECT * FROM "memos" WHERE "id" IN (%s)', 0.5)
+        duplicates = profile.duplicates(threshold=2)
+        self.assertEqual([duplicate["count"] for duplicate in duplicates], [5, 2])
+        self.assertIn("IN (...)", duplicates[1]["sql"])
+        self.assertEqual(profile.queries, 7)
+        self.assertEqual(profile.db_ms, 3.5)
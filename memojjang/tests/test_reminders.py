@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from memojjang.forms import MemoForm
+from memojjang.apps.memos.models import Memo
+from memojjang.apps.memos import reminders
+
+User = get_user_model()
+
+
+class FailingReminderBackend(reminders.BaseReminderBackend):
+    """항상 발송에 실패하는 테스트용 백엔드"""
+
+    def send_reminders(self, memos):
+        raise RuntimeError("발송 실패")
+
+
+class TestReminderDispatch(TestCase):
+    """리마인드 발송 테스트"""
+
+    def setUp(self):
+        """발송 대상, 미래, 완료, 리마인드 없는 메모 생성"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        now = timezone.now()
+        self.due = [
+            Memo.objects.create(
+                user=self.user,
+                title=f"지난 리마인드 {i}",
+                content="내용",
+                reminder_date=now - timedelta(minutes=i + 1)
+            )
+            for i in range(3)
+        ]
+        self.future = Memo.objects.create(
+            user=self.user, title="미래", content="내용",
+            reminder_date=now + timedelta(days=1)
+        )
+        self.done = Memo.objects.create(
+            user=self.user, title="완료", content="내용",
+            reminder_date=now - timedelta(days=1), is_reminded=True
+        )
+        Memo.objects.create(user=self.user, title="리마인드 없음", content="내용")
+
+    def test_claim_marks_only_due_reminders(self):
+        """발송 시각이 지난 미발송 리마인드만 선점"""
+        claimed = reminders.claim_due_reminders(limit=10)
+        self.assertEqual({memo.pk for memo in claimed}, {memo.pk for memo in self.due})
+        self.assertEqual(Memo.objects.filter(is_reminded=False, reminder_date__isnull=False).get(), self.future)
+
+    def test_claim_is_not_repeated(self):
+        """이미 선점된 리마인드는 다시 선점되지 않음"""
+        first = reminders.claim_due_reminders(limit=2)
+        second = reminders.claim_due_reminders(limit=10)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({memo.pk for memo in first} & {memo.pk for memo in second})
+        self.assertEqual(reminders.claim_due_reminders(limit=10), [])
+
+    def test_claim_uses_one_update(self):
+        """배치 크기와 관계없이 UPDATE 한 번으로 선점"""
+        with CaptureQueriesContext(connection) as queries:
+            claimed = reminders.claim_due_reminders(limit=10)
+        self.assertEqual(len(claimed), 3)
+        updates = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"is_reminded"', updates[0].split("WHERE")[1])
+
+    def test_dispatch_with_console_backend(self):
+        """콘솔 백엔드로 배치 단위 발송"""
+        stream = StringIO()
+        backend = reminders.ConsoleReminderBackend(stream=stream)
+        sent = reminders.dispatch_due_reminders(backend=backend, batch_size=2)
+        self.assertEqual(sent, 3)
+        self.assertEqual(stream.getvalue().count("[리마인드] testuser"), 3)
+
+    def test_dispatch_with_file_backend(self):
+        """파일 백엔드는 JSON Lines로 기록"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "reminders.jsonl")
+            backend = reminders.FileReminderBackend(file_path=path)
+            reminders.dispatch_due_reminders(backend=backend)
+            with open(path, encoding="utf-8") as output:
+                records = [json.loads(line) for line in output]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]["username"], "testuser")
+
+    def test_failed_delivery_releases_claim(self):
+        """발송 실패 시 선점이 취소되어 다음에 다시 발송됨"""
+        with self.assertRaises(RuntimeError), self.assertLogs(reminders.logger, "ERROR"):
+            reminders.dispatch_due_reminders(backend=FailingReminderBackend())
+        self.assertEqual(reminders.due_reminders().count(), 3)
+
+    def test_due_query_uses_partial_index(self):
+        """발송 대상 조회가 부분 인덱스를 사용"""
+        sql, params = (
+            reminders.due_reminders().values_list("pk")[:100].query.sql_with_params()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+            plan = " ".join(str(row) for row in cursor.fetchall())
+        self.assertIn("memos_due_reminder_idx", plan)
+
+    def test_dispatch_command(self):
+        """발송 명령 테스트"""
+        out = StringIO()
+        console = StringIO()
+        with redirect_stdout(console):
+            call_command(
+                "dispatch_reminders",
+                backend="memojjang.apps.memos.reminders.ConsoleReminderBackend",
+                stdout=out
+            )
+        self.assertIn("3건 발송", out.getvalue())
+        self.assertEqual(console.getvalue().count("[리마인드]"), 3)
+        self.assertEqual(reminders.due_reminders().count(), 0)
+
+    def test_loop_survives_failed_dispatch(self):
+        """--loop 작업자는 발송이 실패해도 기록하고 다음 확인 때 다시 발송"""
+        command = "memojjang.apps.memos.management.commands.dispatch_reminders"
+        out = StringIO()
+        with mock.patch(
+            f"{command}.reminders.dispatch_due_reminders",
+            side_effect=[RuntimeError("발송 실패"), 3],
+        ) as dispatch, mock.patch(
+            f"{command}.time.sleep", side_effect=[None, KeyboardInterrupt]
+        ), self.assertLogs(command, "ERROR") as logs:
+            call_command("dispatch_reminders", loop=True, interval=0, stdout=out)
+        self.assertEqual(dispatch.call_count, 2)
+        self.assertIn("발송 실패", logs.output[0])
+        self.assertIn("3건 발송", out.getvalue())
+
+        # --loop 없이 한 번 실행할 때는 오류를 그대로 알림
+        with self.assertRaises(RuntimeError), self.assertLogs(reminders.logger, "ERROR"):
+            call_command(
+                "dispatch_reminders",
+                backend="memojjang.tests.test_reminders.FailingReminderBackend",
+                stdout=StringIO(),
+            )
+        self.assertEqual(reminders.due_reminders().count(), 3)
+
+    def test_changing_reminder_date_resets_state(self):
+        """리마인드 일시를 바꾸면 완료 상태가 초기화됨"""
+        form = MemoForm(
+            data={
+                "title": "완료",
+                "content": "내용",
+                "reminder_date": (timezone.now() + timedelta(days=2)).strftime("%Y-%m-%dT%H:%M"),
+            },
+            instance=self.done
+        )
+        self.assertTrue(form.is_valid())
+        self.assertFalse(form.save().is_reminded)
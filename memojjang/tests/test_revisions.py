@@ -0,0 +1,189 @@
+import importlib
+from types import SimpleNamespace
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from memojjang.apps.memos import revisions
+from memojjang.apps.memos.models import Memo, MemoRevision
+
+User = get_user_model()
+
+
+def _paragraphs(count):
+    return "\n".join(f"{i}번째 문단입니다. 메모 본문의 한 줄 내용을 채웁니다." for i in range(count))
+
+
+class TestRevisionDelta(TestCase):
+    """단어 단위 델타 테스트"""
+
+    def test_round_trip(self):
+        """델타를 적용하면 새 내용이 그대로 복원됨"""
+        cases = [
+            ("", ""),
+            ("", "새 내용"),
+            ("지울 내용", ""),
+            ("가 나 다\n라 마", "가 나  다\n\n라 바 마 "),
+            ("  앞 공백과\t탭\r\n", "앞 공백과 탭\n"),
+            (_paragraphs(200), _paragraphs(200).replace("50번째", "오십 번째") + "\n끝"),
+        ]
+        for old, new in cases:
+            with self.subTest(old=old[:20], new=new[:20]):
+                self.assertEqual(revisions.apply_delta(old, revisions.make_delta(old, new)), new)
+
+    def test_delta_grows_with_edit_not_memo(self):
+        """작은 수정의 델타는 메모 크기와 관계없이 작음"""
+        content = _paragraphs(1000)
+        edited = content.replace("500번째", "수정된 500번째")
+        delta = revisions.encode({"d": revisions.make_delta(content, edited)})
+        snapshot = revisions.encode({"t": "", "c": edited})
+        self.assertLess(len(delta), 200)
+        self.assertLess(len(delta) * 20, len(snapshot))
+
+
+class TestMemoRevisions(TestCase):
+    """메모 수정 기록 저장과 복원 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(user=self.user, title="제목", content="첫 내용")
+
+    def _edit(self, title, content):
+        self.memo.title, self.memo.content = title, content
+        self.memo.save()
+
+    def test_create_and_edit_record_revisions(self):
+        """생성은 스냅숏으로, 수정은 델타로 기록하고 내용이 같으면 기록하지 않음"""
+        self._edit("제목", "둘째 내용")
+        self._edit("바뀐 제목", "둘째 내용")
+        self.memo.reminder_date = "2030-01-01T09:00:00Z"
+        self.memo.save(update_fields=["reminder_date"])
+        self.memo.save()
+        rows = list(self.memo.revisions.order_by("number"))
+        self.assertEqual([row.number for row in rows], [1, 2, 3])
+        self.assertEqual([row.is_snapshot for row in rows], [True, False, False])
+        self.assertEqual(revisions.revision_state(self.memo.pk, 1), ("제목", "첫 내용"))
+        self.assertEqual(revisions.revision_state(self.memo.pk, 2), ("제목", "둘째 내용"))
+        self.assertEqual(revisions.revision_state(self.memo.pk, 3), ("바뀐 제목", "둘째 내용"))
+        with self.assertRaises(MemoRevision.DoesNotExist):
+            revisions.revision_state(self.memo.pk, 4)
+
+    @override_settings(MEMO_REVISION_SNAPSHOT_INTERVAL=3)
+    def test_snapshot_interval_bounds_reconstruction(self):
+        """K개마다 스냅숏을 두어 어떤 버전이든 한 번의 쿼리와 K - 1번의 델타로 복원"""
+        history = [("제목", "첫 내용")]
+        for i in range(2, 9):
+            history.append((f"제목 {i}", f"첫 내용 {'추가 ' * i}"))
+            self._edit(*history[-1])
+        snapshots = list(
+            self.memo.revisions.order_by("number").values_list("is_snapshot", flat=True)
+        )
+        self.assertEqual(snapshots, [True, False, False, True, False, False, True, False])
+        for number, state in enumerate(history, 1):
+            with self.assertNumQueries(1):
+                self.assertEqual(revisions.revision_state(self.memo.pk, number), state)
+            self.assertLessEqual(len(revisions._chain(self.memo.pk, number)), 3)
+
+    def test_bulk_created_and_legacy_memos(self):
+        """일괄 생성은 스냅숏을 한 번에 저장하고, 기록이 없는 메모는 다음 저장 때 스냅숏을 만듦"""
+        memos = Memo.objects.bulk_create(
+            Memo(user=self.user, title=f"메모 {i}", content="내용") for i in range(3)
+        )
+        self.assertEqual(
+            MemoRevision.objects.filter(memo__in=memos, number=1, is_snapshot=True).count(), 3
+        )
+        self.memo.revisions.all().delete()
+        self._edit("제목", "새 내용")
+        self.assertEqual(revisions.revision_state(self.memo.pk, 1), ("제목", "새 내용"))
+
+    @override_settings(MEMO_CONTENT_CHUNK_SIZE=100)
+    def test_backfill_keeps_original_of_memos_without_revisions(self):
+        """기록 도입 전 메모는 마이그레이션이 현재 내용을 남겨 첫 수정 후에도 되돌릴 수 있음"""
+        content = "".join(f"본문 {i}번째 줄\n" for i in range(40))
+        long_memo = Memo.objects.create(user=self.user, title="긴 메모", content=content)
+        MemoRevision.objects.all().delete()
+
+        migration = importlib.import_module(
+            "memojjang.apps.memos.migrations.0013_memo_revision_backfill"
+        )
+        # 트랜잭션 안에서는 SQLite 스키마 편집기를 열 수 없어 연결만 넘김
+        migration.backfill_revisions(apps, SimpleNamespace(connection=connection))
+        self.assertEqual(MemoRevision.objects.count(), 2)
+        self.assertEqual(revisions.revision_state(long_memo.pk, 1), ("긴 메모", content))
+
+        self._edit("제목", "고친 내용")
+        history = [
+            revisions.revision_state(self.memo.pk, row.number)
+            for row in self.memo.revisions.order_by("number")
+        ]
+        self.assertEqual(history, [("제목", "첫 내용"), ("제목", "고친 내용")])
+        revisions.restore_revision(self.memo, 1)
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.content, "첫 내용")
+
+    def test_restore_records_new_revision(self):
+        """되돌리면 이전 내용을 새 버전으로 기록"""
+        self._edit("제목", "둘째 내용")
+        revisions.restore_revision(self.memo, 1)
+        self.memo.refresh_from_db()
+        self.assertEqual((self.memo.title, self.memo.content), ("제목", "첫 내용"))
+        self.assertEqual(self.memo.excerpt, "첫 내용")
+        self.assertEqual(self.memo.revisions.count(), 3)
+        self.assertEqual(revisions.revision_state(self.memo.pk, 3), ("제목", "첫 내용"))
+
+    def test_api_endpoints(self):
+        """기록 목록, 버전 조회, 되돌리기 API"""
+        self._edit("제목", "둘째 내용")
+        response = self.client.get(reverse("api_memo_revisions", kwargs={"pk": self.memo.pk}))
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([row["number"] for row in results], [2, 1])
+        self.assertEqual([row["is_snapshot"] for row in results], [False, True])
+        self.assertTrue(all(row["size"] > 0 for row in results))
+        self.assertIsNone(response.json()["next_before"])
+
+        url = reverse("api_memo_revision", kwargs={"pk": self.memo.pk, "number": 1})
+        self.assertEqual(
+            self.client.get(url).json(), {"number": 1, "title": "제목", "content": "첫 내용"}
+        )
+        restore_url = reverse("api_memo_restore", kwargs={"pk": self.memo.pk, "number": 1})
+        response = self.client.post(restore_url)
+        self.assertEqual(response.json()["content"], "첫 내용")
+
+        missing = reverse("api_memo_restore", kwargs={"pk": self.memo.pk, "number": 99})
+        self.assertEqual(self.client.post(missing).status_code, 404)
+        other = User.objects.create_user(username="other", password="testpass123")
+        other_memo = Memo.objects.create(user=other, title="남의 메모", content="내용")
+        response = self.client.get(reverse("api_memo_revisions", kwargs={"pk": other_memo.pk}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_revision_pages(self):
+        """기록 목록은 before 번호로 이전 페이지를 읽음"""
+        for i in range(revisions.PAGE_SIZE + 4):
+            self._edit("제목", f"내용 {i}")
+        url = reverse("api_memo_revisions", kwargs={"pk": self.memo.pk})
+        first = self.client.get(url).json()
+        self.assertEqual(len(first["results"]), revisions.PAGE_SIZE)
+        second = self.client.get(url, {"before": first["next_before"]}).json()
+        self.assertEqual([row["number"] for row in second["results"]], [5, 4, 3, 2, 1])
+        self.assertIsNone(second["next_before"])
+        self.assertEqual(self.client.get(url, {"before": "x"}).status_code, 400)
+
+    def test_html_views(self):
+        """수정 기록 페이지와 되돌리기 폼"""
+        self._edit("제목", "둘째 내용")
+        response = self.client.get(reverse("memo_revisions", kwargs={"pk": self.memo.pk}))
+        self.assertContains(response, "2번째 버전")
+        self.assertContains(response, "현재")
+        restore_url = reverse("memo_restore", kwargs={"pk": self.memo.pk, "number": 1})
+        self.assertContains(response, restore_url)
+        self.assertEqual(self.client.get(restore_url).status_code, 405)
+        response = self.client.post(restore_url)
+        self.assertRedirects(response, reverse("memo_detail", kwargs={"pk": self.memo.pk}))
+        self.memo.refresh_from_db()
+        self.assertEqual(self.memo.content, "첫 내용")
+        missing = reverse("memo_restore", kwargs={"pk": self.memo.pk, "number": 99})
+        self.assertEqual(self.client.post(missing).status_code, 404)
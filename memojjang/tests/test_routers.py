@@ -0,0 +1,92 @@
+from django.db import OperationalError, connections, router, transaction
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from memojjang.apps.memos import routers
+from memojjang.apps.memos.middleware import PIN_COOKIE_NAME
+from memojjang.apps.memos.models import Memo
+
+User = get_user_model()
+
+
+def memo_queries(queries):
+    """캡처한 쿼리 중 memos 테이블을 읽은 쿼리"""
+    return [
+        query for query in queries.captured_queries
+        if 'FROM "memos"' in query["sql"] or "memos_fts" in query["sql"]
+    ]
+
+
+@override_settings(MEMO_READ_REPLICAS=["replica"])
+class TestPrimaryReplicaRouter(TransactionTestCase):
+    """읽기 복제본 라우팅 테스트"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """테스트 사용자와 메모 생성 후 고정 상태 초기화"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.memo = Memo.objects.create(user=self.user, title="복제 메모", content="복제 내용")
+        routers.start_request()
+
+    def tearDown(self):
+        """다른 테스트에 고정 상태가 남지 않도록 초기화"""
+        routers.start_request()
+
+    def test_memo_reads_go_to_replica(self):
+        """메모 읽기는 복제본으로, 다른 앱 모델과 쓰기는 primary로"""
+        self.assertEqual(router.db_for_read(Memo), "replica")
+        self.assertEqual(router.db_for_read(User), "default")
+        self.assertEqual(router.db_for_write(Memo), "default")
+
+    def test_write_pins_to_primary(self):
+        """메모를 쓴 뒤의 읽기는 primary로"""
+        Memo.objects.filter(pk=self.memo.pk).update(title="수정")
+        self.assertTrue(routers.is_pinned())
+        self.assertEqual(router.db_for_read(Memo), "default")
+
+    def test_reads_inside_transaction_use_primary(self):
+        """primary 트랜잭션 안의 읽기는 primary로"""
+        with transaction.atomic():
+            self.assertEqual(router.db_for_read(Memo), "default")
+
+    def test_replica_rejects_writes(self):
+        """복제본 대용 연결은 읽기 전용"""
+        with self.assertRaises(OperationalError):
+            Memo.objects.using("replica").filter(pk=self.memo.pk).update(title="수정")
+
+    def test_objects_from_replica_can_be_saved(self):
+        """복제본에서 읽은 메모도 primary에 저장"""
+        memo = Memo.objects.get(pk=self.memo.pk)
+        self.assertEqual(memo._state.db, "replica")
+        memo.user = self.user
+        memo.title = "저장"
+        memo.save()
+        self.assertEqual(Memo.objects.using("default").get(pk=memo.pk).title, "저장")
+
+    def test_views_pin_after_write(self):
+        """목록과 검색은 복제본에서 읽고, 메모를 쓴 사용자는 잠시 primary에서 읽음"""
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(reverse("memo_list"))
+            self.client.get(reverse("memo_search"), {"q": "복제"})
+        self.assertContains(response, "복제 메모")
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+        self.assertTrue(memo_queries(replica))
+        self.assertTrue(any("memos_fts" in query["sql"] for query in replica.captured_queries))
+
+        response = self.client.post(reverse("memo_create"), {"title": "새 메모", "content": "내용"})
+        self.assertEqual(response.cookies[PIN_COOKIE_NAME]["max-age"], 5)
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(reverse("memo_list"))
+        self.assertContains(response, "새 메모")
+        self.assertFalse(memo_queries(replica))
+
+    @override_settings(MEMO_READ_REPLICAS=[])
+    def test_without_replicas(self):
+        """복제본이 없으면 모두 primary로 가고 쿠키도 붙지 않음"""
+        self.assertIsNone(routers.PrimaryReplicaRouter().db_for_read(Memo))
+        self.client.force_login(self.user)
+        response = self.client.post(reverse("memo_create"), {"title": "새 메모", "content": "내용"})
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
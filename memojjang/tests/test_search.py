@@ -0,0 +1,131 @@
+from io import StringIO
+from unittest import mock
+from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from memojjang.apps.memos.models import Memo
+from memojjang.apps.memos.search import build_match_query, search_memos
+
+User = get_user_model()
+
+
+def _indexed_count():
+    """검색 색인에 들어 있는 행 수"""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM memos_fts")
+        return cursor.fetchone()[0]
+
+
+class TestMemoSearch(TestCase):
+    """메모 전문 검색 테스트"""
+
+    def setUp(self):
+        """두 명의 사용자와 메모 생성"""
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123"
+        )
+        self.other = User.objects.create_user(
+            username="other",
+            email="other@example.com",
+            password="testpass123"
+        )
+        self.memo = Memo.objects.create(
+            user=self.user,
+            title="장보기 목록",
+            content="우유와 계란을 사야 합니다."
+        )
+        self.title_memo = Memo.objects.create(
+            user=self.user,
+            title="우유 가격",
+            content="지난달보다 올랐다."
+        )
+        Memo.objects.create(
+            user=self.other,
+            title="다른 사용자의 우유",
+            content="우유 우유 우유"
+        )
+
+    def test_build_match_query_quotes_terms(self):
+        """검색어는 따옴표로 감싼 접두어 검색으로 변환"""
+        self.assertEqual(build_match_query('우유 "계란'), '"우유"* """계란"*')
+        self.assertEqual(build_match_query("   "), "")
+
+    def test_search_ranks_title_match_first_and_scopes_user(self):
+        """제목 일치가 먼저 오고 다른 사용자의 메모는 제외됨"""
+        page = search_memos(self.user, "우유")
+        self.assertEqual(
+            [result.memo for result in page], [self.title_memo, self.memo]
+        )
+
+    def test_search_highlights_and_escapes(self):
+        """일치 구간은 <mark>로 표시되고 본문 HTML은 이스케이프됨"""
+        Memo.objects.create(
+            user=self.user, title="스크립트", content="<script>경고</script> 주의"
+        )
+        result = search_memos(self.user, "주의").results[0]
+        self.assertIn("<mark>주의</mark>", result.snippet_html)
+        self.assertIn("&lt;script&gt;", result.snippet_html)
+
+    def test_index_follows_save_and_delete(self):
+        """메모 수정과 삭제가 색인에 바로 반영됨"""
+        self.memo.content = "두부를 사야 합니다."
+        self.memo.save()
+        self.assertEqual(len(search_memos(self.user, "계란")), 0)
+        self.assertEqual(len(search_memos(self.user, "두부")), 1)
+
+        self.memo.delete()
+        self.assertEqual(len(search_memos(self.user, "두부")), 0)
+        self.assertEqual(_indexed_count(), 2)
+
+    def test_bulk_created_memos_are_indexed(self):
+        """bulk_create로 만든 메모도 색인됨"""
+        Memo.objects.bulk_create([
+            Memo(user=self.user, title="일괄", content="사과 바나나")
+        ])
+        self.assertEqual(len(search_memos(self.user, "바나나")), 1)
+
+    def test_search_pagination(self):
+        """검색 결과 페이지 나누기"""
+        for i in range(3):
+            Memo.objects.create(user=self.user, title=f"페이지 {i}", content="공통어")
+        first = search_memos(self.user, "공통어", page=1, page_size=2)
+        second = search_memos(self.user, "공통어", page=2, page_size=2)
+        self.assertTrue(first.has_next)
+        self.assertFalse(second.has_next)
+        self.assertEqual(len(first) + len(second), 3)
+
+    def test_out_of_range_page_is_empty(self):
+        """MAX_PAGE보다 뒤의 페이지는 조회하지 않고 비어 있음 (아주 큰 값도 500이 아님)"""
+        with mock.patch("memojjang.apps.memos.search.MAX_PAGE", 1):
+            first = search_memos(self.user, "우유", page=1, page_size=1)
+            self.assertEqual(len(first), 1)
+            self.assertFalse(first.has_next)
+            self.assertEqual(len(search_memos(self.user, "우유", page=2, page_size=1)), 0)
+
+        self.client.login(username="testuser", password="testpass123")
+        response = self.client.get(
+            reverse("memo_search"), {"q": "우유", "page": "9" * 30}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "장보기 목록")
+
+    def test_rebuild_command(self):
+        """색인 재생성 명령이 모든 메모를 다시 색인"""
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM memos_fts")
+        call_command("rebuild_memo_index", batch_size=2, stdout=StringIO())
+        self.assertEqual(_indexed_count(), 3)
+        self.assertEqual(len(search_memos(self.user, "계란")), 1)
+
+    def test_search_view(self):
+        """검색 뷰 테스트"""
+        self.client.login(username="testuser", password="testpass123")
+        response = self.client.get(reverse("memo_search"), {"q": "계란"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "memos/memo_search.html")
+        self.assertContains(response, "장보기 목록")
+        self.assertContains(response, "<mark>계란을</mark>", html=False)
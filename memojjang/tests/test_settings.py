@@ -0,0 +1,248 @@
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from memojjang.apps.memos.management.commands.startup_report import (
+    app_import_costs, parse_import_times
+)
+from memojjang.settings.env import env, env_bool, env_int, env_list, load_env_file
+from memojjang.storage import CompressedManifestStaticFilesStorage
+
+# 새 프로세스에서 설정을 불러와 주요 값을 JSON으로 출력
+PRINT_SETTINGS = """
+import json
+from django.conf import settings
+print(json.dumps({
+    "env": settings.MEMO_ENV,
+    "debug": settings.DEBUG,
+    "hosts": settings.ALLOWED_HOSTS,
+    "conn_max_age": settings.DATABASES["default"].get("CONN_MAX_AGE", 0),
+    "health_checks": settings.DATABASES["default"].get("CONN_HEALTH_CHECKS", False),
+    "database": str(settings.DATABASES["default"]["NAME"]),
+    "loader": settings.TEMPLATES[0]["OPTIONS"]["loaders"][0][0],
+    "staticfiles": settings.STORAGES["staticfiles"]["BACKEND"],
+    "cache": settings.CACHES["default"]["BACKEND"],
+    "cache_location": str(settings.CACHES["default"]["LOCATION"]),
+    "session": settings.SESSION_ENGINE,
+}))
+"""
+
+
+class TestEnvFile(SimpleTestCase):
+    """환경 변수와 .env 파일 읽기 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.env_file = Path(self.tmp_dir.name) / ".env"
+        self.env_file.write_text(
+            "# 주석\n"
+            "\n"
+            "MEMO_TEST_PLAIN=value\n"
+            "export MEMO_TEST_EXPORTED=exported\n"
+            "MEMO_TEST_QUOTED=\"a # b\"\n"
+            "MEMO_TEST_EXISTING=from-file\n"
+            "not a variable\n",
+            encoding="utf-8",
+        )
+
+    def test_load_env_file_keeps_existing_variables(self):
+        """.env의 값은 설정되지 않은 환경 변수만 채움"""
+        with mock.patch.dict(os.environ, {"MEMO_TEST_EXISTING": "from-env"}):
+            values = load_env_file(self.env_file)
+            self.assertEqual(os.environ["MEMO_TEST_PLAIN"], "value")
+            self.assertEqual(os.environ["MEMO_TEST_EXPORTED"], "exported")
+            self.assertEqual(os.environ["MEMO_TEST_QUOTED"], "a # b")
+            self.assertEqual(os.environ["MEMO_TEST_EXISTING"], "from-env")
+        self.assertEqual(values["MEMO_TEST_EXISTING"], "from-file")
+        self.assertNotIn("not a variable", values)
+
+    def test_missing_file_is_ignored(self):
+        """.env 파일이 없으면 아무것도 하지 않음"""
+        self.assertEqual(load_env_file(Path(self.tmp_dir.name) / "missing"), {})
+
+    def test_typed_helpers(self):
+        """불리언, 정수, 목록 변환과 필수 값 확인"""
+        environ = {
+            "MEMO_TEST_BOOL": "Yes", "MEMO_TEST_INT": "42", "MEMO_TEST_LIST": "a.com, b.com,",
+        }
+        with mock.patch.dict(os.environ, environ):
+            self.assertTrue(env_bool("MEMO_TEST_BOOL"))
+            self.assertFalse(env_bool("MEMO_TEST_UNSET"))
+            self.assertEqual(env_int("MEMO_TEST_INT"), 42)
+            self.assertEqual(env_int("MEMO_TEST_UNSET", 7), 7)
+            self.assertEqual(env_list("MEMO_TEST_LIST"), ["a.com", "b.com"])
+            self.assertEqual(env("MEMO_TEST_UNSET", "default"), "default")
+            with self.assertRaises(ImproperlyConfigured):
+                env("MEMO_TEST_UNSET")
+            with mock.patch.dict(os.environ, {"MEMO_TEST_INT": "many"}):
+                with self.assertRaises(ImproperlyConfigured):
+                    env_int("MEMO_TEST_INT")
+
+
+class TestSettingsProfiles(SimpleTestCase):
+    """dev/prod 설정 프로필 테스트"""
+
+    def _load(self, **environ):
+        """새 프로세스에서 설정을 불러와 (종료 코드, 값 또는 stderr)를 반환"""
+        base = {
+            name: value for name, value in os.environ.items()
+            if name not in ("DJANGO_SETTINGS_MODULE", "MEMO_ENV", "SECRET_KEY", "ALLOWED_HOSTS")
+        }
+        result = subprocess.run(
+            [sys.executable, "-c", PRINT_SETTINGS],
+            capture_output=True, text=True, cwd=settings.BASE_DIR,
+            env={
+                **base, "DJANGO_SETTINGS_MODULE": "memojjang.settings",
+                "MEMO_ENV_FILE": os.devnull, **environ,
+            },
+        )
+        if result.returncode:
+            return result.returncode, result.stderr
+        return 0, json.loads(result.stdout)
+
+    def test_dev_is_default(self):
+        """MEMO_ENV가 없으면 dev 프로필"""
+        code, values = self._load()
+        self.assertEqual(code, 0, values)
+        self.assertEqual(values["env"], "dev")
+        self.assertTrue(values["debug"])
+        self.assertEqual(values["conn_max_age"], 0)
+        # 한 프로세스로 실행하는 개발 서버는 locmem 캐시
+        self.assertEqual(values["cache"], "django.core.cache.backends.locmem.LocMemCache")
+        self.assertEqual(values["session"], "django.contrib.sessions.backends.db")
+
+    def test_prod_profile(self):
+        """prod 프로필은 DEBUG를 끄고 연결 재사용, cached 로더, 압축 정적 파일을 사용"""
+        code, values = self._load(
+            MEMO_ENV="prod", SECRET_KEY="prod-secret", ALLOWED_HOSTS="memo.example.com",
+            MEMO_SQLITE_PATH="/tmp/memo-prod.sqlite3",
+        )
+        self.assertEqual(code, 0, values)
+        self.assertEqual(values["env"], "prod")
+        self.assertFalse(values["debug"])
+        self.assertEqual(values["hosts"], ["memo.example.com"])
+        self.assertEqual(values["conn_max_age"], 600)
+        self.assertTrue(values["health_checks"])
+        self.assertEqual(values["database"], "/tmp/memo-prod.sqlite3")
+        self.assertEqual(values["loader"], "django.template.loaders.cached.Loader")
+        self.assertEqual(
+            values["staticfiles"], "memojjang.storage.CompressedManifestStaticFilesStorage"
+        )
+        # 여러 워커가 무효화를 함께 보도록 default 캐시는 프로세스 밖에 둠
+        self.assertEqual(
+            values["cache"], "django.core.cache.backends.filebased.FileBasedCache"
+        )
+        self.assertEqual(values["session"], "django.contrib.sessions.backends.cached_db")
+
+    def test_prod_shared_cache_backend(self):
+        """prod의 default 캐시는 환경 변수로 고르는 공유 캐시, locmem은 고를 수 없음"""
+        prod_env = {
+            "MEMO_ENV": "prod", "SECRET_KEY": "prod-secret", "ALLOWED_HOSTS": "memo.example.com",
+        }
+        code, values = self._load(
+            **prod_env, MEMO_CACHE_BACKEND="redis", MEMO_CACHE_LOCATION="redis://cache:6379/1"
+        )
+        self.assertEqual(code, 0, values)
+        self.assertEqual(values["cache"], "django.core.cache.backends.redis.RedisCache")
+        self.assertEqual(values["cache_location"], "redis://cache:6379/1")
+        code, stderr = self._load(**prod_env, MEMO_CACHE_BACKEND="redis")
+        self.assertNotEqual(code, 0)
+        self.assertIn("MEMO_CACHE_LOCATION", stderr)
+        code, stderr = self._load(**prod_env, MEMO_CACHE_BACKEND="locmem")
+        self.assertNotEqual(code, 0)
+        self.assertIn("MEMO_CACHE_BACKEND", stderr)
+
+    def test_prod_requires_secret_key(self):
+        """prod 프로필은 SECRET_KEY가 없으면 시작하지 않음"""
+        code, stderr = self._load(MEMO_ENV="prod", ALLOWED_HOSTS="memo.example.com")
+        self.assertNotEqual(code, 0)
+        self.assertIn("SECRET_KEY", stderr)
+
+    def test_unknown_profile(self):
+        """알 수 없는 프로필 이름은 오류"""
+        code, stderr = self._load(MEMO_ENV="staging")
+        self.assertNotEqual(code, 0)
+        self.assertIn("MEMO_ENV", stderr)
+
+    def test_live_settings_unchanged_by_prod_import(self):
+        """prod 모듈을 불러와도 현재 설정의 DATABASES는 바뀌지 않음"""
+        with mock.patch.dict(os.environ, {"SECRET_KEY": "x", "ALLOWED_HOSTS": "a.com"}):
+            from memojjang.settings import prod
+        self.assertEqual(prod.DATABASES["default"]["CONN_MAX_AGE"], 600)
+        self.assertEqual(settings.DATABASES["default"].get("CONN_MAX_AGE", 0), 0)
+
+
+class TestCompressedStaticFiles(SimpleTestCase):
+    """정적 파일 해시와 gzip 사본 테스트"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_compress_writes_gzip_copy(self):
+        """충분히 큰 텍스트 파일은 .gz 사본을 만들고 작은 파일은 건너뜀"""
+        storage = CompressedManifestStaticFilesStorage(location=self.tmp_dir.name)
+        content = b"body { color: black; }\n" * 100
+        storage.save("big.css", StringIO(content.decode()))
+        storage.save("small.css", StringIO("a{}"))
+        self.assertIn("big.css.gz", storage.compress("big.css"))
+        with storage.open("big.css.gz") as compressed:
+            self.assertEqual(gzip.decompress(compressed.read()), content)
+        self.assertEqual(storage.compress("small.css"), [])
+        self.assertEqual(storage.compress("image.png"), [])
+
+    def test_collectstatic_fingerprints_and_compresses(self):
+        """collectstatic이 해시를 붙인 파일과 그 gzip 사본을 만듦"""
+        with override_settings(
+            STATIC_ROOT=self.tmp_dir.name,
+            STORAGES={
+                **settings.STORAGES,
+                "staticfiles": {"BACKEND": "memojjang.storage.CompressedManifestStaticFilesStorage"},
+            },
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+        root = Path(self.tmp_dir.name)
+        manifest = json.loads((root / "staticfiles.json").read_text())
+        self.assertRegex(manifest["paths"]["css/style.css"], r"^css/style\.[0-9a-f]{12}\.css$")
+        hashed = manifest["paths"]["admin/css/base.css"]
+        self.assertTrue((root / f"{hashed}.gz").exists())
+
+
+class TestStartupReport(SimpleTestCase):
+    """시작 비용 측정 명령 테스트"""
+
+    def test_parse_import_times(self):
+        """하위 모듈의 상위 모듈과 앱별 비용을 계산"""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |     dep\n"
+            "import time:        50 |        150 |   app.models\n"
+            "import time:        10 |        160 | app\n"
+            "import time:        20 |         20 | other\n"
+        )
+        entries = parse_import_times(output)
+        self.assertEqual(entries[0], ("dep", 100, 100, "app.models"))
+        self.assertEqual(entries[1], ("app.models", 50, 150, "app"))
+        self.assertEqual(entries[2], ("app", 10, 160, None))
+        costs = app_import_costs(entries, ["app", "other"])
+        self.assertEqual(costs["app"], (60, 160))
+        self.assertEqual(costs["other"], (20, 20))
+
+    def test_report(self):
+        """setup 시간과 설치된 앱별 비용을 출력"""
+        out = StringIO()
+        call_command("startup_report", repeat=1, top=3, stdout=out)
+        output = out.getvalue()
+        self.assertIn("django.setup()", output)
+        self.assertIn("memojjang.apps.memos", output)
+        self.assertIn("시작 비용 측정 완료", output)
@@ -0,0 +1,113 @@
+import gzip
+import re
+import tempfile
+from pathlib import Path
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from memojjang.staticfiles import IMMUTABLE_CACHE_CONTROL, StaticFilesMiddleware
+
+User = get_user_model()
+
+BOOTSTRAP_CSS = "vendor/bootstrap-5.1.3/css/bootstrap.min.css"
+STATIC_URL_PATTERN = re.compile(r'(?:href|src)="(/static/[^"]+)"')
+
+
+class TestStaticPipeline(TestCase):
+    """정적 파일 해시, 미리 압축, 캐시 헤더 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.overrides = override_settings(
+            STATIC_ROOT=cls.tmp_dir.name,
+            MEMO_SERVE_STATIC=True,
+            STORAGES={
+                **settings.STORAGES,
+                "staticfiles": {"BACKEND": "memojjang.storage.CompressedManifestStaticFilesStorage"},
+            },
+        )
+        cls.overrides.enable()
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.overrides.disable()
+        cls.tmp_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = StaticFilesMiddleware(lambda request: HttpResponse("app"))
+
+    def _get(self, path, method="get", **headers):
+        return self.middleware(getattr(self.factory, method)(path, headers=headers))
+
+    def _hashed_url(self, name):
+        from django.templatetags.static import static
+        return static(name)
+
+    def test_hashed_file_is_immutable_and_precompressed(self):
+        """해시가 붙은 파일은 immutable로, gzip을 받으면 미리 압축된 사본으로 응답"""
+        url = self._hashed_url(BOOTSTRAP_CSS)
+        self.assertRegex(url, r"bootstrap\.min\.[0-9a-f]{12}\.css$")
+        response = self._get(url, accept_encoding="gzip, deflate")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertTrue(response["Content-Type"].startswith("text/css"))
+        body = b"".join(response.streaming_content)
+        self.assertEqual(int(response["Content-Length"]), len(body))
+        hashed_name = url[len(settings.STATIC_URL):]
+        original = (Path(self.tmp_dir.name) / hashed_name).read_bytes()
+        self.assertEqual(gzip.decompress(body), original)
+        self.assertLess(len(body), len(original) / 4)
+
+    def test_identity_and_conditional_requests(self):
+        """압축을 받지 않으면 원본, ETag가 같으면 304, HEAD는 본문 없음"""
+        url = self._hashed_url(BOOTSTRAP_CSS)
+        response = self._get(url)
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(b"".join(response.streaming_content)[:9], b"@charset ")
+        not_modified = self._get(url, if_none_match=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+        head = self._get(url, method="head")
+        self.assertEqual(b"".join(head.streaming_content), b"")
+        self.assertEqual(head["Content-Length"], response["Content-Length"])
+
+    def test_unhashed_file_gets_short_max_age(self):
+        """해시 없는 원래 이름은 짧게 캐시하고, 정적 파일이 아니면 앱으로 넘김"""
+        response = self._get("/static/css/style.css")
+        self.assertEqual(response["Cache-Control"], "public, max-age=60")
+        self.assertEqual(self._get("/memos/").content, b"app")
+        self.assertEqual(self._get("/static/missing.css").content, b"app")
+
+    def test_pages_reference_only_local_immutable_assets(self):
+        """페이지의 모든 정적 파일은 로컬이고 immutable로 캐시됨 (재방문 시 요청 없음)"""
+        user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.force_login(user)
+        html = self.client.get("/memos/").content.decode()
+        self.assertNotIn("cdn.jsdelivr.net", html)
+        urls = STATIC_URL_PATTERN.findall(html)
+        self.assertEqual(len(urls), 3)
+        for url in urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(response["Cache-Control"], IMMUTABLE_CACHE_CONTROL, url)
+
+
+class TestStaticMiddlewareDisabled(TestCase):
+    """정적 파일 미들웨어 비활성화 테스트"""
+
+    def test_not_used_without_collected_files(self):
+        """STATIC_ROOT가 비어 있으면 미들웨어를 쓰지 않음"""
+        from django.core.exceptions import MiddlewareNotUsed
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with override_settings(STATIC_ROOT=tmp_dir, MEMO_SERVE_STATIC=True):
+                with self.assertRaises(MiddlewareNotUsed):
+                    StaticFilesMiddleware(lambda request: HttpResponse())
@@ -0,0 +1,241 @@
+import json
+from unittest import mock
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, transaction
+from memojjang.apps.memos import tags
+from memojjang.apps.memos.models import Memo, Tag
+from memojjang.forms import MemoForm
+
+User = get_user_model()
+
+
+def _counts(user):
+    """사용자의 {태그 이름: memo_count}"""
+    return dict(Tag.objects.filter(user=user).values_list("name", "memo_count"))
+
+
+def _group_by_counts(user):
+    """memo_tags를 직접 세어 본 {태그 이름: 메모 수}"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tags.name, COUNT(memo_tags.memo_id) FROM tags "
+            "LEFT JOIN memo_tags ON memo_tags.tag_id = tags.id "
+            "WHERE tags.user_id = %s GROUP BY tags.id",
+            [user.pk],
+        )
+        return dict(cursor.fetchall())
+
+
+class TestTags(TestCase):
+    """메모 태그 테스트"""
+
+    def setUp(self):
+        """테스트 사용자와 태그가 붙은 메모 생성 및 로그인"""
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        self.client.login(username="testuser", password="testpass123")
+        self.memos = {}
+        for title, names in (
+            ("회의록", ["업무", "회의"]),
+            ("보고서", ["업무"]),
+            ("장보기", ["개인"]),
+            ("주간 회의", ["업무", "회의", "정기"]),
+            ("태그 없음", []),
+        ):
+            memo = Memo.objects.create(user=self.user, title=title, content=f"{title} 내용")
+            tags.set_memo_tags(memo, names)
+            self.memos[title] = memo
+
+    def _titles(self, queryset):
+        return sorted(queryset.values_list("title", flat=True))
+
+    def test_memo_tags_has_compound_primary_key(self):
+        """memo_tags는 id 없이 (memo_id, tag_id)가 기본 키"""
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA table_info(memo_tags)")
+            columns = {row[1]: row[5] for row in cursor.fetchall()}
+        self.assertEqual(columns, {"memo_id": 1, "tag_id": 2})
+        tag_id = Tag.objects.get(user=self.user, name="개인").pk
+        with self.assertRaises(IntegrityError), transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO memo_tags (memo_id, tag_id) VALUES (%s, %s)",
+                [self.memos["장보기"].pk, tag_id],
+            )
+
+    def test_memo_tags_schema_after_migrate(self):
+        """Django 상태 밖에서 만든 memo_tags의 외래 키, 인덱스, 트리거가 마이그레이션 뒤에 있음"""
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA foreign_key_list(memo_tags)")
+            foreign_keys = {(row[3], row[2], row[4], row[6]) for row in cursor.fetchall()}
+            cursor.execute("PRAGMA index_list(memo_tags)")
+            indexes = {row[1] for row in cursor.fetchall()}
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'memo_tags'"
+            )
+            triggers = {row[0] for row in cursor.fetchall()}
+        self.assertEqual(foreign_keys, {
+            ("memo_id", "memos", "id", "CASCADE"),
+            ("tag_id", "tags", "id", "CASCADE"),
+        })
+        self.assertIn("memo_tags_tag_memo_idx", indexes)
+        self.assertEqual(triggers, {"memo_tags_count_insert", "memo_tags_count_delete"})
+
+    def test_memo_count_is_maintained_incrementally(self):
+        """태그를 붙이고 떼고 메모를 지울 때마다 memo_count가 맞게 바뀜"""
+        self.assertEqual(_counts(self.user), {"업무": 3, "회의": 2, "개인": 1, "정기": 1})
+        tags.set_memo_tags(self.memos["보고서"], ["개인", "보고"])
+        self.assertEqual(_counts(self.user), {"업무": 2, "회의": 2, "개인": 2, "정기": 1, "보고": 1})
+        self.memos["주간 회의"].delete()
+        Memo.objects.filter(pk=self.memos["회의록"].pk).delete()
+        self.assertEqual(_counts(self.user), {"업무": 0, "회의": 0, "개인": 2, "정기": 0, "보고": 1})
+        self.assertEqual(_counts(self.user), _group_by_counts(self.user))
+
+        # 0개가 된 태그는 요약에서 빠짐
+        summary = [(tag.name, tag.memo_count) for tag in tags.tag_summary(self.user)]
+        self.assertEqual(summary, [("개인", 2), ("보고", 1)])
+
+    def test_tag_summary_does_not_group_by(self):
+        """목록 페이지의 태그 요약은 미리 세어 둔 값을 읽음"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("memo_list"))
+        self.assertContains(response, "#업무")
+        self.assertEqual(
+            [tag.name for tag in response.context["tag_summary"]], ["업무", "회의", "개인", "정기"]
+        )
+        self.assertFalse([q for q in queries.captured_queries if "GROUP BY" in q["sql"]])
+        self.assertFalse([q for q in queries.captured_queries if "COUNT(" in q["sql"]])
+
+    def test_filter_all_and_any(self):
+        """모두 일치와 하나라도 일치 필터, 두 실행 계획의 결과가 같음"""
+        cases = (
+            (["업무"], True, ["보고서", "주간 회의", "회의록"]),
+            (["업무", "회의"], True, ["주간 회의", "회의록"]),
+            (["업무", "회의", "정기"], True, ["주간 회의"]),
+            (["업무", "개인"], True, []),
+            (["회의", "개인"], False, ["장보기", "주간 회의", "회의록"]),
+            (["회의", "없는 태그"], True, []),
+            (["회의", "없는 태그"], False, ["주간 회의", "회의록"]),
+            (["없는 태그"], False, []),
+        )
+        for drive_max in (0, 1000):
+            with mock.patch.object(tags, "DRIVE_MAX_MEMOS", drive_max):
+                for names, match_all, expected in cases:
+                    with self.subTest(names=names, match_all=match_all, drive_max=drive_max):
+                        queryset = tags.tagged_memos(self.user, names, match_all)
+                        self.assertEqual(self._titles(queryset), expected)
+
+        other = User.objects.create_user(username="other", password="testpass123")
+        self.assertEqual(self._titles(tags.tagged_memos(other, ["업무"])), [])
+
+    def test_filter_uses_indexes(self):
+        """많은 태그는 목록 인덱스를, 적은 태그는 memo_tags 인덱스에서 출발"""
+        def plan(queryset):
+            sql, params = queryset.for_list()[:31].query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                return " / ".join(row[3] for row in cursor.fetchall())
+
+        with mock.patch.object(tags, "DRIVE_MAX_MEMOS", 0):
+            walk = plan(tags.tagged_memos(self.user, ["업무", "회의"]))
+        self.assertIn("memos_user_created_id_idx", walk)
+        self.assertIn("memo_tags USING PRIMARY KEY", walk)
+        drive = plan(tags.tagged_memos(self.user, ["업무", "회의"]))
+        self.assertIn("memo_tags_tag_memo_idx", drive)
+        self.assertNotIn("memos_user_created_id_idx", drive)
+
+    def test_list_view_filters_and_paginates(self):
+        """목록 뷰 태그 필터와 다음 페이지 링크의 필터 유지"""
+        with self.settings(MEMO_LIST_PAGE_SIZE=1):
+            response = self.client.get(reverse("memo_list"), {"tag": ["업무", "회의"]})
+            self.assertEqual([memo.title for memo in response.context["memos"]], ["주간 회의"])
+            self.assertContains(
+                response, "tag=%EC%97%85%EB%AC%B4&amp;tag=%ED%9A%8C%EC%9D%98&cursor="
+            )
+            response = self.client.get(
+                reverse("memo_list"),
+                {"tag": ["업무", "회의"], "cursor": response.context["page"].next_cursor},
+            )
+            self.assertEqual([memo.title for memo in response.context["memos"]], ["회의록"])
+
+        response = self.client.get(reverse("memo_list"), {"tag": ["회의", "개인"], "match": "any"})
+        self.assertEqual(
+            [memo.title for memo in response.context["memos"]], ["주간 회의", "장보기", "회의록"]
+        )
+        self.assertContains(response, "모두 붙은 메모 보기")
+        # 필터마다 캐시와 ETag가 따로임
+        response = self.client.get(reverse("memo_list"), {"tag": "개인"})
+        self.assertEqual(response["X-Memo-List-Cache"], "miss")
+        self.assertEqual([memo.title for memo in response.context["memos"]], ["장보기"])
+        unfiltered = self.client.get(reverse("memo_list"))
+        self.assertNotEqual(unfiltered["ETag"], response["ETag"])
+
+    def test_form_saves_and_shows_tags(self):
+        """작성/수정 폼으로 태그를 저장하고 목록과 상세에 표시"""
+        self.client.post(reverse("memo_create"), {
+            "title": "새 메모", "content": "내용", "tags": "#업무, 새 태그 ,업무"
+        })
+        memo = Memo.objects.get(title="새 메모")
+        self.assertEqual(tags.memo_tag_names([memo.pk])[memo.pk], ["새 태그", "업무"])
+        response = self.client.get(reverse("memo_detail", kwargs={"pk": memo.pk}))
+        self.assertContains(response, "#새 태그")
+
+        response = self.client.get(reverse("memo_edit", kwargs={"pk": memo.pk}))
+        self.assertContains(response, 'value="새 태그, 업무"')
+        self.client.post(reverse("memo_edit", kwargs={"pk": memo.pk}), {
+            "title": "새 메모", "content": "내용", "tags": "새 태그"
+        })
+        self.assertEqual(tags.memo_tag_names([memo.pk])[memo.pk], ["새 태그"])
+        self.assertEqual(_counts(self.user)["업무"], 3)
+
+        response = self.client.get(reverse("memo_list"))
+        self.assertContains(response, "#새 태그")
+
+        too_many = ",".join(str(i) for i in range(21))
+        form = MemoForm(data={"title": "제목", "content": "내용", "tags": too_many})
+        self.assertFalse(form.is_valid())
+        self.assertIn("tags", form.errors)
+
+    def test_api(self):
+        """API 태그 필터, 태그 필드, PATCH/PUT, 일괄 생성, 태그 요약"""
+        response = self.client.get(
+            reverse("api_memo_list"), {"tag": ["회의", "개인"], "match": "any", "fields": "title,tags"}
+        )
+        self.assertEqual(response.json()["results"], [
+            {"id": self.memos["주간 회의"].pk, "title": "주간 회의", "tags": ["업무", "정기", "회의"]},
+            {"id": self.memos["장보기"].pk, "title": "장보기", "tags": ["개인"]},
+            {"id": self.memos["회의록"].pk, "title": "회의록", "tags": ["업무", "회의"]},
+        ])
+
+        url = reverse("api_memo_detail", kwargs={"pk": self.memos["보고서"].pk})
+        self.assertEqual(self.client.get(url).json()["tags"], ["업무"])
+        response = self.client.patch(
+            url, data=json.dumps({"title": "새 보고서"}), content_type="application/json"
+        )
+        self.assertEqual(response.json()["tags"], ["업무"])
+        response = self.client.patch(
+            url, data=json.dumps({"tags": ["보고", "업무"]}), content_type="application/json"
+        )
+        self.assertEqual(response.json()["tags"], ["보고", "업무"])
+        response = self.client.put(
+            url, data=json.dumps({"title": "보고서", "content": "내용"}), content_type="application/json"
+        )
+        self.assertEqual(response.json()["tags"], [])
+
+        response = self.client.post(
+            reverse("api_memo_batch_create"),
+            data=json.dumps({"memos": [
+                {"title": "일괄 1", "content": "내용", "tags": ["일괄", "업무"]},
+                {"title": "일괄 2", "content": "내용"},
+            ]}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(
+            self._titles(tags.tagged_memos(self.user, ["일괄"])), ["일괄 1"]
+        )
+
+        response = self.client.get(reverse("api_tag_list"))
+        self.assertEqual(response.json()["results"][0], {"name": "업무", "memo_count": 3})
+        self.assertEqual(_counts(self.user), _group_by_counts(self.user))
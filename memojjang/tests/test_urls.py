@@ -1,7 +1,7 @@
 from django.test import TestCase
 from django.urls import reverse, resolve
 from memojjang.apps.memos.views import (
-    home, memo_list, memo_create, memo_detail, memo_edit, memo_delete,
+    home, memo_list, memo_search, memo_create, memo_detail, memo_edit, memo_delete,
     login_view, logout_view, register
 )
 
@@ -19,6 +19,11 @@ class TestUrls(TestCase):
         url = reverse("memo_list")
         self.assertEqual(resolve(url).func, memo_list)
 
+    def test_memo_search_url_resolves(self):
+        """메모 검색 URL 테스트"""
+        url = reverse("memo_search")
+        self.assertEqual(resolve(url).func, memo_search)
+
     def test_memo_create_url_resolves(self):
         """메모 생성 URL 테스트"""
         url = reverse("memo_create")
@@ -0,0 +1,115 @@
+import json
+import logging
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from django.conf import settings
+from django.db import connections
+from django.template import engines
+from django.test import SimpleTestCase, TestCase
+from memojjang import warmup
+
+# 새 프로세스에서 (예열 여부에 따라) 첫 요청 전의 예열 상태와 첫 요청 상태 코드를 출력
+FIRST_REQUEST = """
+import json, sys
+import django
+django.setup()
+from django.db import connections
+from django.template import engines
+from django.test import Client
+from django.urls import get_resolver
+if sys.argv[1] == "warm":
+    from memojjang.warmup import warm_up
+    warm_up()
+state = {
+    "urls": get_resolver()._populated,
+    "templates": sorted(engines.all()[0].engine.template_loaders[0].get_template_cache),
+    "database": connections["default"].connection is not None,
+}
+state["status"] = Client().get("/login/").status_code
+print(json.dumps(state))
+"""
+
+
+class TestWarmUp(TestCase):
+    """워커 예열 테스트"""
+
+    databases = {"default", "replica"}
+
+    def test_templates_are_compiled(self):
+        """템플릿 디렉터리의 모든 템플릿이 cached 로더에 들어감"""
+        engine = engines.all()[0]
+        names = warmup.template_names(engine.dirs[0])
+        self.assertIn("memos/memo_list_items.html", names)
+        self.assertEqual(warmup.warm_templates(), len(names))
+        cached = engine.engine.template_loaders[0].get_template_cache
+        self.assertTrue(set(names) <= set(cached))
+
+    def test_urls_and_requests(self):
+        """URL 리졸버를 구성하고 내부 요청이 성공"""
+        self.assertGreater(warmup.warm_urls(), 0)
+        self.assertEqual(warmup.warm_requests(["/login/"]), {"/login/": 200})
+
+    def test_warm_up_opens_connections_last(self):
+        """데이터베이스 연결은 요청 예열 뒤에 열려 있음"""
+        timings = warmup.warm_up()
+        self.assertEqual(list(timings), ["urls", "templates", "requests", "databases"])
+        for alias in settings.DATABASES:
+            self.assertIsNotNone(connections[alias].connection)
+        self.assertNotIn("databases", warmup.warm_up(databases=False))
+        self.assertEqual(list(warmup.warm_up(code=False)), ["databases"])
+
+
+class TestGunicornConfig(TestCase):
+    """gunicorn 설정 모듈 테스트"""
+
+    databases = {"default", "replica"}
+
+    def test_hooks(self):
+        """preload_app 기본값과 워커 예열 훅"""
+        config = runpy.run_path(str(settings.BASE_DIR / "gunicorn.conf.py"))
+        self.assertTrue(config["preload_app"])
+        worker = SimpleNamespace(pid=os.getpid(), log=logging.getLogger("gunicorn.test"))
+        with self.assertLogs("gunicorn.test", "INFO") as logs:
+            config["post_worker_init"](worker)
+        self.assertIn("예열 완료", logs.output[0])
+        # preload이면 URL과 템플릿은 마스터가 예열하므로 워커는 연결만 엶
+        self.assertIn("'databases'", logs.output[0])
+        self.assertNotIn("'urls'", logs.output[0])
+        server = SimpleNamespace(log=logging.getLogger("gunicorn.test"))
+        config["post_fork"](server, worker)
+
+
+class TestWarmUpInNewProcess(SimpleTestCase):
+    """새 프로세스(새 워커)에서 첫 요청 전에 예열이 끝나 있는지 확인"""
+
+    def _first_request(self, mode, db_path):
+        environ = {
+            **os.environ, "DJANGO_SETTINGS_MODULE": "memojjang.settings",
+            "MEMO_ENV_FILE": os.devnull, "MEMO_SQLITE_PATH": db_path,
+            "ALLOWED_HOSTS": "testserver", "PYTHONPATH": str(settings.BASE_DIR),
+        }
+        result = subprocess.run(
+            [sys.executable, "-c", FIRST_REQUEST, mode],
+            capture_output=True, text=True, env=environ, cwd=settings.BASE_DIR,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_warm_up_runs_before_first_request(self):
+        """예열하면 URL 리졸버, 템플릿, 데이터베이스 연결이 첫 요청 전에 준비됨"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = str(Path(tmp_dir) / "warmup.sqlite3")
+            cold = self._first_request("cold", db_path)
+            warm = self._first_request("warm", db_path)
+        self.assertEqual(cold["status"], 200)
+        self.assertEqual(warm["status"], 200)
+        self.assertEqual((cold["urls"], cold["templates"], cold["database"]), (False, [], False))
+        self.assertTrue(warm["urls"])
+        self.assertTrue(warm["database"])
+        names = warmup.template_names(engines.all()[0].dirs[0])
+        self.assertTrue(set(names) <= set(warm["templates"]))
@@ -14,18 +14,65 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
-from .apps.memos import views
+from .apps.memos import api, async_views, views
+
+# ASGI로 배포할 때는 메모 읽기 뷰를 비동기 버전으로 연결
+if getattr(settings, "MEMO_ASYNC_VIEWS", False):
+    memo_views = memo_api = async_views
+else:
+    memo_views, memo_api = views, api
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", views.home, name="home"),
-    path("memos/", views.memo_list, name="memo_list"),
+    path("memos/", memo_views.memo_list, name="memo_list"),
+    path("memos/search/", views.memo_search, name="memo_search"),
+    path("memos/export/", views.memo_export, name="memo_export"),
     path("memos/create/", views.memo_create, name="memo_create"),
-    path("memos/<int:pk>/", views.memo_detail, name="memo_detail"),
+    path("memos/<int:pk>/", memo_views.memo_detail, name="memo_detail"),
+    path("memos/<int:pk>/chunks/<int:number>/", views.memo_chunk, name="memo_chunk"),
     path("memos/<int:pk>/edit/", views.memo_edit, name="memo_edit"),
     path("memos/<int:pk>/delete/", views.memo_delete, name="memo_delete"),
+    path("memos/<int:pk>/revisions/", views.memo_revisions, name="memo_revisions"),
+    path(
+        "memos/<int:pk>/revisions/<int:number>/restore/",
+        views.memo_restore,
+        name="memo_restore"
+    ),
+    path("api/memos/", memo_api.memo_collection, name="api_memo_list"),
+    path("api/memos/<int:pk>/", memo_api.memo_resource, name="api_memo_detail"),
+    path(
+        "api/memos/<int:pk>/chunks/<int:number>/",
+        api.memo_chunk,
+        name="api_memo_chunk"
+    ),
+    path(
+        "api/memos/<int:pk>/revisions/",
+        api.memo_revisions,
+        name="api_memo_revisions"
+    ),
+    path(
+        "api/memos/<int:pk>/revisions/<int:number>/",
+        api.memo_revision,
+        name="api_memo_revision"
+    ),
+    path(
+        "api/memos/<int:pk>/revisions/<int:number>/restore/",
+        api.restore_revision,
+        name="api_memo_restore"
+    ),
+    path("api/tags/", api.tag_list, name="api_tag_list"),
+    path("api/memos/batch/create/", api.batch_create, name="api_memo_batch_create"),
+    path("api/memos/batch/delete/", api.batch_delete, name="api_memo_batch_delete"),
+    path(
+        "api/memos/batch/reminders/",
+        api.batch_update_reminders,
+        name="api_memo_batch_reminders"
+    ),
+    path("api/memos/import/", api.import_memos, name="api_memo_import"),
     path("login/", views.login_view, name="login"),
     path("logout/", views.logout_view, name="logout"),
     path("register/", views.register, name="register"),
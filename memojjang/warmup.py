@@ -0,0 +1,117 @@
+"""워커 예열
+
+워커가 요청을 받기 전에 첫 요청이 치르던 비용을 미리 치릅니다.
+
+- URL 설정(memojjang.urls와 뷰 모듈) import와 URL 리졸버 구성
+- 템플릿 디렉터리(memojjang/templates)의 모든 템플릿을 cached 로더로 컴파일
+- MEMO_WARMUP_PATHS에 내부 GET 요청을 보내 미들웨어, 컨텍스트 프로세서,
+  세션 엔진처럼 요청을 처리하면서 지연 import되는 모듈 불러오기
+- 모든 데이터베이스 별칭의 연결 열기 (SQLite PRAGMA 적용 포함)
+
+gunicorn.conf.py가 preload_app이면 마스터에서 URL과 템플릿을 예열해 워커들이
+fork로 물려받게 하고, 데이터베이스 연결은 fork 뒤 워커마다 따로 엽니다.
+"""
+import logging
+import time
+from pathlib import Path
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.template import engines
+from django.test import RequestFactory
+from django.urls import get_resolver, resolve, Resolver404
+
+logger = logging.getLogger("memojjang.warmup")
+
+TEMPLATE_SUFFIXES = (".html", ".txt")
+DEFAULT_PATHS = ("/", "/login/")
+
+
+def warm_urls():
+    """URL 설정을 불러오고 reverse용 테이블까지 만들어 둠, 패턴 수를 반환"""
+    resolver = get_resolver()
+    resolver.reverse_dict
+    try:
+        resolve("/")
+    except Resolver404:
+        pass
+    return len(resolver.url_patterns)
+
+
+def template_names(directory):
+    """디렉터리 아래 템플릿의 로더 기준 이름 목록"""
+    directory = Path(directory)
+    return sorted(
+        path.relative_to(directory).as_posix()
+        for path in directory.rglob("*")
+        if path.is_file() and path.suffix in TEMPLATE_SUFFIXES
+    )
+
+
+def warm_templates():
+    """템플릿 엔진의 DIRS에 있는 모든 템플릿을 컴파일, 컴파일한 수를 반환
+
+    앱 디렉터리(admin 등)의 템플릿은 양이 많고 자주 쓰이지 않아 제외합니다.
+    """
+    count = 0
+    for engine in engines.all():
+        for directory in getattr(engine, "dirs", []):
+            for name in template_names(directory):
+                engine.get_template(name)
+                count += 1
+    return count
+
+
+def _warmup_host():
+    """ALLOWED_HOSTS를 통과하는 Host 헤더 값"""
+    for host in settings.ALLOWED_HOSTS:
+        if host == "*":
+            return "localhost"
+        return host.lstrip(".")
+    return "localhost"
+
+
+def warm_requests(paths=None):
+    """로그인 없이 볼 수 있는 경로에 내부 GET 요청을 보냄, 경로별 상태 코드를 반환
+
+    request_started 시그널을 보내지 않으므로 접속 로그나 연결 정리가 일어나지 않습니다.
+    """
+    if paths is None:
+        paths = getattr(settings, "MEMO_WARMUP_PATHS", DEFAULT_PATHS)
+    handler = WSGIHandler()
+    factory = RequestFactory(HTTP_HOST=_warmup_host())
+    statuses = {}
+    for path in paths:
+        response = handler.get_response(factory.get(path))
+        statuses[path] = response.status_code
+        response.close()
+    return statuses
+
+
+def warm_databases():
+    """모든 데이터베이스 별칭의 연결을 열어 둠, 연 별칭 목록을 반환"""
+    aliases = []
+    for connection in connections.all():
+        connection.ensure_connection()
+        aliases.append(connection.alias)
+    return aliases
+
+
+def warm_up(databases=True, code=True):
+    """(code가 True이면) URL, 템플릿, 요청 경로와 (databases가 True이면)
+    데이터베이스를 예열하고 단계별 시간(ms)을 반환
+
+    요청을 마칠 때 오래된 연결이 닫히므로 데이터베이스 연결은 마지막에 엽니다.
+    """
+    timings = {}
+    steps = []
+    if code:
+        steps += [("urls", warm_urls), ("templates", warm_templates), ("requests", warm_requests)]
+    if databases:
+        steps.append(("databases", warm_databases))
+    for name, step in steps:
+        started = time.perf_counter()
+        result = step()
+        timings[name] = round((time.perf_counter() - started) * 1000, 2)
+        logger.info("warm-up %s: %s (%.1fms)", name, result, timings[name])
+    return timings